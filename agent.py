@@ -49,6 +49,9 @@ Examples:
 
     # Recover to a specific phase and resume
     python agent.py --config validator --job-id abc123 --recover-phase 2 --resume
+
+    # Show where cold start time goes (import profile of agent.py and the API app)
+    python agent.py --startup-profile
 """
 import argparse
 import asyncio
@@ -361,6 +364,13 @@ def parse_args():
         help="Recover to phase N before resuming (requires --job-id and --resume)",
     )
 
+    # Diagnostics
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Print the import time profile of agent.py and the API app, then exit",
+    )
+
     return parser.parse_args()
 
 
@@ -628,6 +638,12 @@ def run_server(config_path: str, host: str, port: int):
 def main():
     """Main entry point."""
     args = parse_args()
+
+    if args.startup_profile:
+        from src.utils.import_profile import print_startup_report
+        print_startup_report(["agent", "src.api.app"])
+        return
+
     setup_logging()
 
     logger = logging.getLogger(__name__)
@@ -80,6 +80,7 @@ export interface LLMRequest {
     messages: LLMMessage[];
     message_count: number;
     tools?: LLMToolSchema[];
+    tool_schema_hash?: string;
     tool_count?: number;
     model_kwargs?: Record<string, unknown>;
   };
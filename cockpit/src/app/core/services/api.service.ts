@@ -39,10 +39,13 @@ import { environment } from '../environment';
  */
 export interface BulkAuditResponse {
   entries: AuditEntry[];
-  total: number;
+  /** Total count; null when the page was fetched without includeTotal. */
+  total: number | null;
   offset: number;
   limit: number;
   hasMore: boolean;
+  /** Continuation token for the next page (null on the last page). */
+  nextCursor: string | null;
 }
 
 /**
@@ -50,10 +53,13 @@ export interface BulkAuditResponse {
  */
 export interface BulkChatResponse {
   entries: ChatEntry[];
-  total: number;
+  /** Total count; null when the page was fetched without includeTotal. */
+  total: number | null;
   offset: number;
   limit: number;
   hasMore: boolean;
+  /** Continuation token for the next page (null on the last page). */
+  nextCursor: string | null;
 }
 
 /**
@@ -61,10 +67,13 @@ export interface BulkChatResponse {
  */
 export interface BulkGraphResponse {
   deltas: GraphDelta[];
-  total: number;
+  /** Total count; null when the page was fetched without includeTotal. */
+  total: number | null;
   offset: number;
   limit: number;
   hasMore: boolean;
+  /** Continuation token for the next page (null on the last page). */
+  nextCursor: string | null;
 }
 
 /**
@@ -268,15 +277,17 @@ export class ApiService {
   /**
    * Get bulk audit entries for caching in IndexedDB.
    * Returns large batches (up to 5000 entries) for efficient caching.
+   * Pass the previous response's nextCursor to fetch the following page.
    */
   getJobAuditBulk(
     jobId: string,
-    offset: number = 0,
+    cursor: string | null = null,
     limit: number = 5000,
   ): Observable<BulkAuditResponse> {
-    const params = new HttpParams()
-      .set('offset', offset.toString())
-      .set('limit', limit.toString());
+    let params = new HttpParams().set('limit', limit.toString());
+    if (cursor) {
+      params = params.set('cursor', cursor);
+    }
 
     return this.http
       .get<BulkAuditResponse>(`${this.baseUrl}/jobs/${jobId}/audit/bulk`, { params })
@@ -286,9 +297,10 @@ export class ApiService {
           return of({
             entries: [],
             total: 0,
-            offset,
+            offset: 0,
             limit,
             hasMore: false,
+            nextCursor: null,
           });
         }),
       );
@@ -299,12 +311,13 @@ export class ApiService {
    */
   getChatHistoryBulk(
     jobId: string,
-    offset: number = 0,
+    cursor: string | null = null,
     limit: number = 5000,
   ): Observable<BulkChatResponse> {
-    const params = new HttpParams()
-      .set('offset', offset.toString())
-      .set('limit', limit.toString());
+    let params = new HttpParams().set('limit', limit.toString());
+    if (cursor) {
+      params = params.set('cursor', cursor);
+    }
 
     return this.http
       .get<BulkChatResponse>(`${this.baseUrl}/jobs/${jobId}/chat/bulk`, { params })
@@ -314,9 +327,10 @@ export class ApiService {
           return of({
             entries: [],
             total: 0,
-            offset,
+            offset: 0,
             limit,
             hasMore: false,
+            nextCursor: null,
           });
         }),
       );
@@ -327,12 +341,13 @@ export class ApiService {
    */
   getGraphDeltasBulk(
     jobId: string,
-    offset: number = 0,
+    cursor: string | null = null,
     limit: number = 5000,
   ): Observable<BulkGraphResponse> {
-    const params = new HttpParams()
-      .set('offset', offset.toString())
-      .set('limit', limit.toString());
+    let params = new HttpParams().set('limit', limit.toString());
+    if (cursor) {
+      params = params.set('cursor', cursor);
+    }
 
     return this.http
       .get<BulkGraphResponse>(`${this.baseUrl}/jobs/${jobId}/graph/bulk`, { params })
@@ -342,9 +357,10 @@ export class ApiService {
           return of({
             deltas: [],
             total: 0,
-            offset,
+            offset: 0,
             limit,
             hasMore: false,
+            nextCursor: null,
           });
         }),
       );
@@ -305,7 +305,7 @@ describe('DataService', () => {
       await service.loadJob(jobId);
 
       expect(service.currentJobId()).toBe(jobId);
-      expect(mockApiService.getJobAuditBulk).toHaveBeenCalledWith(jobId, 0, 5000);
+      expect(mockApiService.getJobAuditBulk).toHaveBeenCalledWith(jobId, null, 5000);
       expect(mockDbService.cacheAuditEntries).toHaveBeenCalledWith(jobId, mockEntries, 0);
     });
 
@@ -332,16 +332,18 @@ describe('DataService', () => {
           offset: 0,
           limit: 5000,
           hasMore: true,
+          nextCursor: 'cursor-5000',
         }),
       );
       // Second batch
       (mockApiService.getJobAuditBulk as ReturnType<typeof vi.fn>).mockReturnValueOnce(
         of({
           entries: createMockAuditEntries(2000, 5000),
-          total: 7000,
+          total: null,
           offset: 5000,
           limit: 5000,
           hasMore: false,
+          nextCursor: null,
         }),
       );
       (mockApiService.getChatHistoryBulk as ReturnType<typeof vi.fn>).mockReturnValue(
@@ -354,7 +356,9 @@ describe('DataService', () => {
       await service.loadJob(jobId);
 
       expect(mockApiService.getJobAuditBulk).toHaveBeenCalledTimes(2);
+      expect(mockApiService.getJobAuditBulk).toHaveBeenLastCalledWith(jobId, 'cursor-5000', 5000);
       expect(mockDbService.cacheAuditEntries).toHaveBeenCalledTimes(2);
+      expect(mockDbService.cacheAuditEntries).toHaveBeenLastCalledWith(jobId, expect.any(Array), 5000);
     });
   });
 
@@ -489,55 +489,55 @@ export class DataService {
    */
   private async fetchAndCacheJob(jobId: string): Promise<void> {
     let totalFetched = 0;
-    let hasMore = true;
-    let offset = 0;
+    let total: number | null = null;
+    let cursor: string | null = null;
 
-    // Fetch audit entries in chunks
-    while (hasMore) {
+    // Fetch audit entries in chunks, following the keyset cursor
+    do {
       const response = await firstValueFrom(
-        this.api.getJobAuditBulk(jobId, offset, this.BULK_FETCH_SIZE),
+        this.api.getJobAuditBulk(jobId, cursor, this.BULK_FETCH_SIZE),
       );
+      total = response.total ?? total;
 
       if (response.entries.length > 0) {
-        await this.db.cacheAuditEntries(jobId, response.entries, offset);
+        await this.db.cacheAuditEntries(jobId, response.entries, totalFetched);
         totalFetched += response.entries.length;
-        this.loadingProgress.set(Math.min(90, (totalFetched / response.total) * 90));
+        if (total) {
+          this.loadingProgress.set(Math.min(90, (totalFetched / total) * 90));
+        }
       }
 
-      hasMore = response.hasMore;
-      offset += response.entries.length;
+      cursor = response.hasMore ? response.nextCursor : null;
 
       // Update max index as we fetch
       this._maxIndex.set(totalFetched - 1);
-    }
+    } while (cursor);
 
     // Fetch chat entries
-    offset = 0;
-    hasMore = true;
-    while (hasMore) {
-      const response = await firstValueFrom(this.api.getChatHistoryBulk(jobId, offset, this.BULK_FETCH_SIZE));
+    do {
+      const response = await firstValueFrom(
+        this.api.getChatHistoryBulk(jobId, cursor, this.BULK_FETCH_SIZE),
+      );
 
       if (response.entries.length > 0) {
         await this.db.cacheChatEntries(jobId, response.entries);
       }
 
-      hasMore = response.hasMore;
-      offset += response.entries.length;
-    }
+      cursor = response.hasMore ? response.nextCursor : null;
+    } while (cursor);
 
     // Fetch graph deltas
-    offset = 0;
-    hasMore = true;
-    while (hasMore) {
-      const response = await firstValueFrom(this.api.getGraphDeltasBulk(jobId, offset, this.BULK_FETCH_SIZE));
+    do {
+      const response = await firstValueFrom(
+        this.api.getGraphDeltasBulk(jobId, cursor, this.BULK_FETCH_SIZE),
+      );
 
       if (response.deltas.length > 0) {
         await this.db.cacheGraphDeltas(jobId, response.deltas);
       }
 
-      hasMore = response.hasMore;
-      offset += response.deltas.length;
-    }
+      cursor = response.hasMore ? response.nextCursor : null;
+    } while (cursor);
 
     this.loadingProgress.set(100);
 
@@ -32,7 +32,7 @@ Example:
 """
 
 from .postgres import PostgresDB, ALLOWED_TABLES, PG_TYPE_MAP, SCHEMA_FILE, REQUIRED_TABLES
-from .mongodb import MongoDB, FILTER_MAPPINGS, FilterCategory
+from .mongodb import MongoDB, FILTER_MAPPINGS, FilterCategory, InvalidCursorError
 
 __all__ = [
     # PostgreSQL
@@ -45,4 +45,5 @@ __all__ = [
     'MongoDB',
     'FILTER_MAPPINGS',
     'FilterCategory',
+    'InvalidCursorError',
 ]
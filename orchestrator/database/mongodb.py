@@ -4,18 +4,23 @@ This module provides the canonical async MongoDB interface using motor with:
 - Async connection with lazy initialization
 - Paginated audit trail queries
 - Chat history retrieval
-- Bulk fetch endpoints for client-side caching
+- Bulk fetch endpoints for client-side caching (keyset pagination)
+- Streamed bulk export for one-request cache hydration
 - Graph delta tracking
+- Per-job tool execution profiles
 
 MongoDB is optional - the system gracefully degrades if unavailable.
 This is the canonical database layer for the orchestrator.
 """
 
+import base64
+import binascii
+import json
 import math
 import os
 import logging
 from datetime import datetime as dt, timezone
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, AsyncIterator, Tuple
 
 
 def _to_iso_utc(timestamp: Any) -> str:
@@ -59,6 +64,91 @@ FILTER_MAPPINGS: Dict[str, List[str]] = {
 
 FilterCategory = Literal["all", "messages", "tools", "errors"]
 
+# Maximum entries returned by a single bulk request
+BULK_MAX_LIMIT = 5000
+
+# Query selecting graph deltas (execute_cypher_query tool calls) for a job
+_GRAPH_DELTA_FILTER: Dict[str, Any] = {
+    "step_type": "tool",
+    "tool.name": "execute_cypher_query",
+}
+
+# Compound indexes backing the keyset queries: (collection, keys, name)
+KEYSET_INDEXES: List[Tuple[str, List[Tuple[str, int]], str]] = [
+    ("agent_audit", [("job_id", 1), ("step_number", 1), ("_id", 1)], "job_step_keyset"),
+    (
+        "agent_audit",
+        [("job_id", 1), ("step_type", 1), ("tool.name", 1), ("step_number", 1), ("_id", 1)],
+        "job_tool_step_keyset",
+    ),
+    ("chat_history", [("job_id", 1), ("sequence_number", 1), ("_id", 1)], "job_sequence_keyset"),
+]
+
+
+def _percentile(ordered: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _slow_call_entry(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool audit document -> entry of a tool profile's slowest calls."""
+    tool = doc.get("tool") or {}
+    return {
+        "id": str(doc["_id"]),
+        "stepNumber": doc.get("step_number"),
+        "timestamp": _to_iso_utc(doc["timestamp"]) if doc.get("timestamp") else None,
+        "tool": tool.get("name") or "unknown",
+        "callId": tool.get("call_id"),
+        "latencyMs": doc["latency_ms"],
+        "cpuMs": tool.get("cpu_ms"),
+        "resultBytes": tool.get("result_size_bytes"),
+        "errorClass": tool.get("error_class"),
+    }
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation token cannot be decoded."""
+
+
+def encode_cursor(job_id: str, sort_value: Any, last_id: Any, index: int) -> str:
+    """Encode a keyset position as an opaque continuation token.
+
+    The token records the job, the sort key and ``_id`` of the last returned
+    document (the ``_id`` breaks ties between equal sort keys), and the
+    running position so callers can keep absolute indexes without counting.
+    """
+    payload = {"j": job_id, "k": sort_value, "id": str(last_id), "i": index}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, job_id: str) -> Dict[str, Any]:
+    """Decode a continuation token produced by :func:`encode_cursor`.
+
+    Args:
+        token: Opaque token from a previous response's ``nextCursor``
+        job_id: Job the request is for; tokens are not portable across jobs
+
+    Returns:
+        Dict with ``k`` (sort value), ``id`` (last ObjectId string) and ``i`` (index)
+
+    Raises:
+        InvalidCursorError: If the token is malformed or belongs to another job
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}") from e
+
+    if not isinstance(payload, dict) or not {"j", "k", "id", "i"} <= payload.keys():
+        raise InvalidCursorError("Malformed cursor: missing fields")
+    if payload["j"] != job_id:
+        raise InvalidCursorError("Cursor belongs to a different job")
+    return payload
+
 
 class MongoDB:
     """Async MongoDB manager for audit queries using motor.
@@ -77,8 +167,9 @@ class MongoDB:
         # Get chat history
         chat = await db.get_chat_history("abc-123")
 
-        # Bulk fetch for client-side caching
-        bulk = await db.get_job_audit_bulk("abc-123", offset=0, limit=5000)
+        # Bulk fetch for client-side caching (follow nextCursor for more)
+        bulk = await db.get_job_audit_bulk("abc-123", limit=5000)
+        more = await db.get_job_audit_bulk("abc-123", cursor=bulk["nextCursor"])
 
         # Get cache invalidation version
         version = await db.get_job_version("abc-123")
@@ -139,6 +230,7 @@ class MongoDB:
             self._db = self._client.get_database("graphrag_logs")
             self._available = True
             logger.info("MongoDB connected: graphrag_logs")
+            await self.ensure_indexes()
         except Exception as e:
             logger.warning(f"MongoDB connection failed: {e}")
             self._available = False
@@ -277,6 +369,14 @@ class MongoDB:
         if doc is None:
             return None
 
+        # Tool schemas are stored once per tool set and referenced by hash
+        request = doc.get("request") or {}
+        schema_hash = request.get("tool_schema_hash")
+        if schema_hash and "tools" not in request:
+            tool_schemas = await self._db["tool_schemas"].find_one({"_id": schema_hash})
+            if tool_schemas is not None:
+                request["tools"] = tool_schemas.get("tools", [])
+
         # Convert ObjectId to string for JSON serialization
         doc["_id"] = str(doc["_id"])
         return doc
@@ -318,6 +418,80 @@ class MongoDB:
 
         return {"start": start_str, "end": end_str}
 
+    async def get_tool_profile(self, job_id: str, top: int = 10) -> Dict[str, Any]:
+        """Aggregate per-call tool timings of a job into a profile.
+
+        Uses the per-call measurements the agent writes to tool audit
+        documents (latency_ms, tool.cpu_ms, tool.result_size_bytes,
+        tool.error_class). Calls still running are skipped.
+
+        Args:
+            job_id: The job UUID to query
+            top: Number of slowest calls to include
+
+        Returns:
+            Dict with totals, per-tool stats (calls, errors by class,
+            p50/p95/max wall time, CPU time, result bytes; slowest p95
+            first) and the slowest individual calls
+        """
+        profile: Dict[str, Any] = {
+            "jobId": job_id,
+            "calls": 0,
+            "errors": 0,
+            "totalMs": 0,
+            "cpuMs": 0,
+            "tools": [],
+            "slowest": [],
+        }
+        if not self._available or self._db is None:
+            return profile
+
+        cursor = self._db["agent_audit"].find(
+            {"job_id": job_id, "step_type": "tool"},
+            {"step_number": 1, "timestamp": 1, "latency_ms": 1, "tool": 1},
+        )
+        calls = [doc for doc in await cursor.to_list(length=None) if doc.get("latency_ms") is not None]
+
+        by_tool: Dict[str, List[Dict[str, Any]]] = {}
+        for doc in calls:
+            by_tool.setdefault((doc.get("tool") or {}).get("name") or "unknown", []).append(doc)
+
+        tools = []
+        for name, docs in by_tool.items():
+            latencies = sorted(doc["latency_ms"] for doc in docs)
+            errors: Dict[str, int] = {}
+            for doc in docs:
+                tool = doc.get("tool") or {}
+                if tool.get("success") is False:
+                    error_class = tool.get("error_class") or "ToolError"
+                    errors[error_class] = errors.get(error_class, 0) + 1
+            result_bytes = [(doc.get("tool") or {}).get("result_size_bytes") or 0 for doc in docs]
+            tools.append({
+                "name": name,
+                "calls": len(docs),
+                "errors": sum(errors.values()),
+                "errorClasses": errors,
+                "totalMs": sum(latencies),
+                "p50Ms": _percentile(latencies, 0.5),
+                "p95Ms": _percentile(latencies, 0.95),
+                "maxMs": latencies[-1],
+                "cpuMs": sum((doc.get("tool") or {}).get("cpu_ms") or 0 for doc in docs),
+                "resultBytes": sum(result_bytes),
+                "maxResultBytes": max(result_bytes),
+            })
+        tools.sort(key=lambda t: (t["p95Ms"], t["totalMs"]), reverse=True)
+
+        slowest = sorted(calls, key=lambda doc: doc["latency_ms"], reverse=True)[:max(0, top)]
+        profile.update({
+            "calls": len(calls),
+            "errors": sum(t["errors"] for t in tools),
+            "totalMs": sum(t["totalMs"] for t in tools),
+            "cpuMs": sum(t["cpuMs"] for t in tools),
+            "tools": tools,
+            "slowest": [_slow_call_entry(doc) for doc in slowest],
+        })
+        return profile
+
     async def get_page_for_timestamp(
         self,
         job_id: str,
@@ -446,189 +620,394 @@ class MongoDB:
     # BULK FETCH ENDPOINTS FOR CLIENT-SIDE CACHING
     # =========================================================================
 
+    async def ensure_indexes(self) -> None:
+        """Create the compound indexes used by keyset pagination.
+
+        Idempotent; existing indexes are left untouched. Failures (e.g. a
+        read-only user) are logged and ignored since queries still work,
+        just without index support.
+        """
+        if not self._available or self._db is None:
+            return
+
+        for collection_name, keys, name in KEYSET_INDEXES:
+            try:
+                await self._db[collection_name].create_index(keys, name=name, background=True)
+            except Exception as e:
+                logger.warning(f"Failed to ensure index {name} on {collection_name}: {e}")
+
+    async def _fetch_keyset_page(
+        self,
+        collection_name: str,
+        query: Dict[str, Any],
+        sort_field: str,
+        job_id: str,
+        offset: int,
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Fetch one page ordered by ``(sort_field, _id)``.
+
+        When ``cursor`` is given the page starts strictly after the encoded
+        position, so the server walks the index instead of skipping. Without
+        a cursor, ``offset`` is honoured via skip for backward compatibility.
+        One extra document is read to determine ``hasMore`` without counting.
+
+        Returns:
+            Tuple of (raw documents, pagination info dict with total, offset,
+            limit, hasMore and nextCursor)
+        """
+        collection = self._db[collection_name]
+        limit = min(limit, BULK_MAX_LIMIT)
+
+        page_query = dict(query)
+        skip = offset
+        if cursor:
+            position = decode_cursor(cursor, job_id)
+            try:
+                last_id = ObjectId(position["id"])
+            except (InvalidId, TypeError) as e:
+                raise InvalidCursorError(f"Malformed cursor: {e}") from e
+            page_query["$or"] = [
+                {sort_field: {"$gt": position["k"]}},
+                {sort_field: position["k"], "_id": {"$gt": last_id}},
+            ]
+            offset = position["i"]
+            skip = 0
+
+        find_cursor = collection.find(page_query).sort([(sort_field, 1), ("_id", 1)])
+        if skip:
+            find_cursor = find_cursor.skip(skip)
+        docs = await find_cursor.limit(limit + 1).to_list(length=limit + 1)
+
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+
+        next_cursor = None
+        if has_more and docs:
+            last = docs[-1]
+            next_cursor = encode_cursor(job_id, last.get(sort_field), last["_id"], offset + len(docs))
+
+        total = await collection.count_documents(query) if include_total else None
+
+        return docs, {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "hasMore": has_more,
+            "nextCursor": next_cursor,
+        }
+
+    @staticmethod
+    def _serialize_bulk_entry(doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Make an audit/chat document JSON-friendly for the bulk endpoints."""
+        doc["_id"] = str(doc["_id"])
+        if "timestamp" in doc:
+            doc["timestamp"] = _to_iso_utc(doc["timestamp"])
+        return doc
+
+    @staticmethod
+    def _graph_delta_from_doc(doc: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Build a graph delta record from an execute_cypher_query audit entry."""
+        query_text = doc.get("tool", {}).get("arguments", {}).get("query", "")
+        timestamp = doc.get("timestamp")
+        timestamp = _to_iso_utc(timestamp) if timestamp else None
+
+        return {
+            "toolCallIndex": index,
+            "timestamp": timestamp,
+            "cypherQuery": query_text,
+            "toolCallId": str(doc["_id"]),
+            "stepNumber": doc.get("step_number"),
+        }
+
+    @staticmethod
+    def _empty_bulk_response(key: str, offset: int, limit: int) -> Dict[str, Any]:
+        """Response returned by bulk queries when MongoDB is unavailable."""
+        return {
+            key: [],
+            "total": 0,
+            "offset": offset,
+            "limit": limit,
+            "hasMore": False,
+            "nextCursor": None,
+        }
+
     async def get_job_audit_bulk(
         self,
         job_id: str,
         offset: int = 0,
         limit: int = 5000,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """Get bulk audit entries for caching in IndexedDB.
 
-        Uses offset/limit instead of page/pageSize for efficient bulk fetching.
+        Pages are ordered by ``(step_number, _id)``. Pass the previous
+        response's ``nextCursor`` to continue without server-side skipping;
+        ``offset`` is only used when no cursor is given.
 
         Args:
             job_id: The job UUID to query
-            offset: Number of entries to skip
+            offset: Number of entries to skip (ignored when cursor is set)
             limit: Maximum entries to return (up to 5000)
+            cursor: Continuation token from a previous page
+            include_total: Whether to run a count query for ``total``
 
         Returns:
-            Dict with entries, total count, offset, limit, hasMore
+            Dict with entries, total (None if not requested), offset, limit,
+            hasMore and nextCursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or for another job
         """
         if not self._available or self._db is None:
-            return {
-                "entries": [],
-                "total": 0,
-                "offset": offset,
-                "limit": limit,
-                "hasMore": False,
-            }
+            return self._empty_bulk_response("entries", offset, limit)
 
-        collection = self._db["agent_audit"]
-        query = {"job_id": job_id}
-
-        # Get total count
-        total = await collection.count_documents(query)
+        docs, info = await self._fetch_keyset_page(
+            "agent_audit", {"job_id": job_id}, "step_number",
+            job_id, offset, limit, cursor, include_total,
+        )
+        return {"entries": [self._serialize_bulk_entry(doc) for doc in docs], **info}
 
-        # Clamp limit to prevent abuse
-        limit = min(limit, 5000)
+    async def get_chat_history_bulk(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = 5000,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Dict[str, Any]:
+        """Get bulk chat history entries for caching in IndexedDB.
 
-        # Check if there are more entries
-        has_more = (offset + limit) < total
+        Pages are ordered by ``(sequence_number, _id)``; see
+        :meth:`get_job_audit_bulk` for cursor semantics.
 
-        # Fetch entries sorted by step_number
-        cursor = collection.find(query).sort("step_number", 1).skip(offset).limit(limit)
+        Args:
+            job_id: The job UUID to query
+            offset: Number of entries to skip (ignored when cursor is set)
+            limit: Maximum entries to return (up to 5000)
+            cursor: Continuation token from a previous page
+            include_total: Whether to run a count query for ``total``
 
-        entries = []
-        async for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            # Convert timestamp to ISO string
-            if "timestamp" in doc:
-                doc["timestamp"] = _to_iso_utc(doc["timestamp"])
-            entries.append(doc)
+        Returns:
+            Dict with entries, total (None if not requested), offset, limit,
+            hasMore and nextCursor
+        """
+        if not self._available or self._db is None:
+            return self._empty_bulk_response("entries", offset, limit)
 
-        return {
-            "entries": entries,
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": has_more,
-        }
+        docs, info = await self._fetch_keyset_page(
+            "chat_history", {"job_id": job_id}, "sequence_number",
+            job_id, offset, limit, cursor, include_total,
+        )
+        return {"entries": [self._serialize_bulk_entry(doc) for doc in docs], **info}
 
-    async def get_chat_history_bulk(
+    async def get_graph_deltas_bulk(
         self,
         job_id: str,
         offset: int = 0,
         limit: int = 5000,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
-        """Get bulk chat history entries for caching in IndexedDB.
+        """Get bulk graph deltas (execute_cypher_query tool calls) for caching.
+
+        ``toolCallIndex`` stays absolute across pages: the cursor carries the
+        running index so no count is needed to continue.
 
         Args:
             job_id: The job UUID to query
-            offset: Number of entries to skip
-            limit: Maximum entries to return (up to 5000)
+            offset: Number of deltas to skip (ignored when cursor is set)
+            limit: Maximum deltas to return (up to 5000)
+            cursor: Continuation token from a previous page
+            include_total: Whether to run a count query for ``total``
 
         Returns:
-            Dict with entries, total count, offset, limit, hasMore
+            Dict with deltas, total (None if not requested), offset, limit,
+            hasMore and nextCursor
         """
         if not self._available or self._db is None:
-            return {
-                "entries": [],
-                "total": 0,
-                "offset": offset,
-                "limit": limit,
-                "hasMore": False,
-            }
+            return self._empty_bulk_response("deltas", offset, limit)
 
-        collection = self._db["chat_history"]
-        query = {"job_id": job_id}
+        docs, info = await self._fetch_keyset_page(
+            "agent_audit", {"job_id": job_id, **_GRAPH_DELTA_FILTER}, "step_number",
+            job_id, offset, limit, cursor, include_total,
+        )
+        start = info["offset"]
+        deltas = [self._graph_delta_from_doc(doc, start + i) for i, doc in enumerate(docs)]
+        return {"deltas": deltas, **info}
 
-        # Get total count
-        total = await collection.count_documents(query)
+    async def iter_job_bulk(
+        self,
+        job_id: str,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every audit entry, chat entry and graph delta for a job.
 
-        # Clamp limit
-        limit = min(limit, 5000)
+        Each collection is read with a single index-ordered cursor, so a full
+        job is exported in one pass without pagination round trips. Records
+        are yielded as ``{"type": "audit" | "chat" | "graph", "data": ...}``
+        followed by one ``{"type": "end", "counts": {...}}`` record.
 
-        # Check if there are more entries
-        has_more = (offset + limit) < total
+        Args:
+            job_id: The job UUID to export
+            batch_size: Documents fetched per MongoDB round trip
+        """
+        counts = {"audit": 0, "chat": 0, "graph": 0}
+
+        if self._available and self._db is not None:
+            audit = self._db["agent_audit"]
+            async for doc in audit.find({"job_id": job_id}).sort(
+                [("step_number", 1), ("_id", 1)]
+            ).batch_size(batch_size):
+                is_graph_delta = (
+                    doc.get("step_type") == "tool"
+                    and doc.get("tool", {}).get("name") == "execute_cypher_query"
+                )
+                if is_graph_delta:
+                    yield {"type": "graph", "data": self._graph_delta_from_doc(doc, counts["graph"])}
+                    counts["graph"] += 1
+                yield {"type": "audit", "index": counts["audit"], "data": self._serialize_bulk_entry(doc)}
+                counts["audit"] += 1
+
+            chat = self._db["chat_history"]
+            async for doc in chat.find({"job_id": job_id}).sort(
+                [("sequence_number", 1), ("_id", 1)]
+            ).batch_size(batch_size):
+                yield {"type": "chat", "data": self._serialize_bulk_entry(doc)}
+                counts["chat"] += 1
+
+        yield {"type": "end", "counts": counts}
 
-        # Fetch entries sorted by sequence_number
-        cursor = collection.find(query).sort("sequence_number", 1).skip(offset).limit(limit)
+    # =========================================================================
+    # LIVE EVENT SOURCES
+    # =========================================================================
 
-        entries = []
-        async for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            if "timestamp" in doc:
-                doc["timestamp"] = _to_iso_utc(doc["timestamp"])
-            entries.append(doc)
+    async def supports_change_streams(self) -> bool:
+        """Check whether the server accepts change streams (replica set/sharded).
 
-        return {
-            "entries": entries,
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": has_more,
-        }
+        Returns:
+            True if a change stream could be opened, False otherwise
+        """
+        if not self._available or self._db is None:
+            return False
 
-    async def get_graph_deltas_bulk(
+        try:
+            async with self._db.watch([], max_await_time_ms=1) as stream:
+                await stream.try_next()
+            return True
+        except Exception as e:
+            logger.info(f"MongoDB change streams unavailable: {e}")
+            return False
+
+    async def get_last_position(
         self,
+        collection_name: str,
         job_id: str,
-        offset: int = 0,
-        limit: int = 5000,
-    ) -> Dict[str, Any]:
-        """Get bulk graph deltas (execute_cypher_query tool calls) for caching.
+        sort_field: str,
+    ) -> Optional[Tuple[Any, str]]:
+        """Get the keyset position of a job's newest entry in a collection.
 
         Args:
+            collection_name: ``agent_audit`` or ``chat_history``
             job_id: The job UUID to query
-            offset: Number of deltas to skip
-            limit: Maximum deltas to return (up to 5000)
+            sort_field: ``step_number`` or ``sequence_number``
 
         Returns:
-            Dict with deltas, total count, offset, limit, hasMore
+            ``(sort_value, object_id_str)`` or None if the job has no entries
         """
         if not self._available or self._db is None:
-            return {
-                "deltas": [],
-                "total": 0,
-                "offset": offset,
-                "limit": limit,
-                "hasMore": False,
-            }
+            return None
 
-        collection = self._db["agent_audit"]
+        doc = await self._db[collection_name].find_one(
+            {"job_id": job_id},
+            sort=[(sort_field, -1), ("_id", -1)],
+            projection={sort_field: 1},
+        )
+        if doc is None:
+            return None
+        return (doc.get(sort_field), str(doc["_id"]))
 
-        # Query for execute_cypher_query tool calls
-        query = {
-            "job_id": job_id,
-            "step_type": "tool",
-            "tool.name": "execute_cypher_query",
-        }
+    async def get_entries_after(
+        self,
+        collection_name: str,
+        job_id: str,
+        sort_field: str,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """Get a job's entries strictly after a keyset position.
 
-        # Get total count
-        total = await collection.count_documents(query)
+        Used to tail a collection and to backfill live-event subscribers on
+        resume. Results are ordered by ``(sort_field, _id)`` and serialized
+        like the bulk endpoints.
+
+        Args:
+            collection_name: ``agent_audit`` or ``chat_history``
+            job_id: The job UUID to query
+            sort_field: ``step_number`` or ``sequence_number``
+            after: ``(sort_value, object_id_str)`` of the last seen entry, or None
+            limit: Maximum entries to return
 
-        # Clamp limit
-        limit = min(limit, 5000)
+        Returns:
+            List of serialized documents, empty if MongoDB unavailable
+        """
+        if not self._available or self._db is None:
+            return []
 
-        # Check if there are more
-        has_more = (offset + limit) < total
+        query: Dict[str, Any] = {"job_id": job_id}
+        if after is not None:
+            value, last_id = after
+            query["$or"] = [
+                {sort_field: {"$gt": value}},
+                {sort_field: value, "_id": {"$gt": ObjectId(last_id)}},
+            ]
+
+        docs = await (
+            self._db[collection_name]
+            .find(query)
+            .sort([(sort_field, 1), ("_id", 1)])
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        return [self._serialize_bulk_entry(doc) for doc in docs]
 
-        # Fetch sorted by step_number
-        cursor = collection.find(query).sort("step_number", 1).skip(offset).limit(limit)
+    async def watch_inserts(
+        self,
+        collection_names: List[str],
+        resume_after: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """Watch the database for inserts into the given collections.
 
-        deltas = []
-        index = offset
-        async for doc in cursor:
-            # Extract relevant data for graph delta
-            query_text = doc.get("tool", {}).get("arguments", {}).get("query", "")
-            timestamp = doc.get("timestamp")
-            timestamp = _to_iso_utc(timestamp) if timestamp else None
-
-            deltas.append({
-                "toolCallIndex": index,
-                "timestamp": timestamp,
-                "cypherQuery": query_text,
-                "toolCallId": str(doc["_id"]),
-                "stepNumber": doc.get("step_number"),
-            })
-            index += 1
+        Opens a single MongoDB change stream (requires a replica set or
+        sharded cluster). Raises ``pymongo.errors.OperationFailure`` on
+        standalone servers so callers can fall back to tailing.
 
-        return {
-            "deltas": deltas,
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": has_more,
-        }
+        Args:
+            collection_names: Collections whose inserts should be reported
+            resume_after: Change stream resume token to continue from
+
+        Yields:
+            Tuples of (collection name, serialized document, resume token)
+        """
+        if not self._available or self._db is None:
+            return
+
+        pipeline = [{
+            "$match": {
+                "operationType": "insert",
+                "ns.coll": {"$in": collection_names},
+            }
+        }]
+        async with self._db.watch(pipeline, resume_after=resume_after) as stream:
+            async for change in stream:
+                yield (
+                    change["ns"]["coll"],
+                    self._serialize_bulk_entry(change["fullDocument"]),
+                    change["_id"],
+                )
 
     async def get_job_version(self, job_id: str) -> Dict[str, Any] | None:
         """Get job data version info for cache invalidation.
@@ -658,8 +1037,7 @@ class MongoDB:
         # Count graph deltas (execute_cypher_query tool calls)
         graph_count = await audit_collection.count_documents({
             "job_id": job_id,
-            "step_type": "tool",
-            "tool.name": "execute_cypher_query",
+            **_GRAPH_DELTA_FILTER,
         })
 
         # Get last audit entry timestamp
@@ -780,4 +1158,11 @@ class MongoDB:
         return self._db
 
 
-__all__ = ['MongoDB', 'FILTER_MAPPINGS', 'FilterCategory']
+__all__ = [
+    'MongoDB',
+    'FILTER_MAPPINGS',
+    'FilterCategory',
+    'InvalidCursorError',
+    'encode_cursor',
+    'decode_cursor',
+]
@@ -1207,6 +1207,86 @@ class PostgresDB:
             return int(result.split()[1])
         return 0
 
+    async def flush_heartbeats(self, heartbeats: List[Dict[str, Any]]) -> int:
+        """Write a batch of buffered heartbeats in a single statement.
+
+        Only ``last_heartbeat`` and merged ``metadata`` are written; status
+        transitions are expected to go through :meth:`heartbeat` directly.
+
+        Args:
+            heartbeats: Dicts with ``agent_id``, ``last_heartbeat`` (datetime)
+                and optional ``metrics`` to merge into metadata
+
+        Returns:
+            Number of agent rows updated
+        """
+        ids: List[UUID] = []
+        timestamps: List[datetime] = []
+        metrics: List[str] = []
+        for hb in heartbeats:
+            try:
+                ids.append(UUID(hb["agent_id"]))
+            except ValueError:
+                continue
+            timestamps.append(hb["last_heartbeat"])
+            metrics.append(json.dumps(hb.get("metrics") or {}))
+
+        if not ids:
+            return 0
+
+        async with self.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE agents AS a
+                SET last_heartbeat = GREATEST(a.last_heartbeat, v.ts),
+                    metadata = a.metadata || v.metrics
+                FROM unnest($1::uuid[], $2::timestamptz[], $3::jsonb[]) AS v(id, ts, metrics)
+                WHERE a.id = v.id
+                """,
+                ids,
+                timestamps,
+                metrics,
+            )
+
+        if result.startswith("UPDATE "):
+            return int(result.split()[1])
+        return 0
+
+    async def mark_agents_offline(self, agent_ids: List[str]) -> List[str]:
+        """Mark specific agents offline (used by the deadline-based detector).
+
+        Agents already offline or failed are left untouched.
+
+        Args:
+            agent_ids: Agent UUIDs as strings
+
+        Returns:
+            IDs of agents that were actually marked offline
+        """
+        ids = []
+        for agent_id in agent_ids:
+            try:
+                ids.append(UUID(agent_id))
+            except ValueError:
+                continue
+
+        if not ids:
+            return []
+
+        async with self.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                UPDATE agents
+                SET status = 'offline'
+                WHERE id = ANY($1::uuid[])
+                  AND status NOT IN ('offline', 'failed')
+                RETURNING id
+                """,
+                ids,
+            )
+
+        return [str(row["id"]) for row in rows]
+
     async def get_ready_agents(self) -> List[Dict[str, Any]]:
         """Get all agents with 'ready' status.
 
@@ -1215,6 +1295,348 @@ class PostgresDB:
         """
         return await self.list_agents(status="ready")
 
+    # =========================================================================
+    # JOB QUEUE OPERATIONS
+    # =========================================================================
+
+    async def enqueue_job(
+        self,
+        job_id: str,
+        priority: int = 0,
+        submitted_by: str | None = None,
+    ) -> bool:
+        """Put a 'created' job into the scheduler queue.
+
+        Re-enqueueing keeps the original queue position but resets the
+        retry state.
+
+        Args:
+            job_id: Job UUID as string
+            priority: Higher values are dispatched first
+            submitted_by: Submitter identity used for fair sharing
+
+        Returns:
+            True if queued, False if not found or not in 'created' status
+        """
+        try:
+            uuid_val = UUID(job_id)
+        except ValueError:
+            return False
+
+        async with self.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE jobs
+                SET queued_at = COALESCE(queued_at, CURRENT_TIMESTAMP),
+                    priority = $2,
+                    submitted_by = COALESCE($3, submitted_by),
+                    dispatch_attempts = 0,
+                    next_dispatch_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = $1 AND status = 'created'
+                """,
+                uuid_val,
+                priority,
+                submitted_by,
+            )
+
+        return result == "UPDATE 1"
+
+    async def dequeue_job(self, job_id: str) -> bool:
+        """Remove a job from the scheduler queue without changing its status.
+
+        Args:
+            job_id: Job UUID as string
+
+        Returns:
+            True if the job was queued and has been removed
+        """
+        try:
+            uuid_val = UUID(job_id)
+        except ValueError:
+            return False
+
+        async with self.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE jobs
+                SET queued_at = NULL,
+                    next_dispatch_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = $1 AND queued_at IS NOT NULL
+                """,
+                uuid_val,
+            )
+
+        return result == "UPDATE 1"
+
+    async def claim_next_job(
+        self,
+        exclude_agent_ids: List[str] | None = None,
+        allow_any_config: bool = False,
+    ) -> Dict[str, Any] | None:
+        """Atomically pair the next queued job with a ready agent.
+
+        Both rows are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent
+        schedulers (or orchestrator replicas) never claim the same job or
+        agent. Jobs are ordered by priority, then by how many jobs the same
+        submitter already has running (fair share), then by queue time.
+
+        On success the job moves to 'processing' and the agent to 'working';
+        the caller must either confirm the dispatch or call
+        :meth:`release_job_claim`.
+
+        Args:
+            exclude_agent_ids: Agents to skip (e.g. cooling down after a rejection)
+            allow_any_config: If True, a job may run on an agent with a
+                different config_name when no exact match is ready
+
+        Returns:
+            Dict with job_id, agent_id, config_name, priority, submitted_by,
+            queued_at, dispatch_attempts and the agent row, or None if no
+            job/agent pair is available
+        """
+        excluded = []
+        for agent_id in exclude_agent_ids or []:
+            try:
+                excluded.append(UUID(agent_id))
+            except ValueError:
+                continue
+
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                configs = await conn.fetch(
+                    """
+                    SELECT DISTINCT config_name
+                    FROM agents
+                    WHERE status = 'ready'
+                      AND pod_ip IS NOT NULL
+                      AND NOT (id = ANY($1::uuid[]))
+                    """,
+                    excluded,
+                )
+                if not configs:
+                    return None
+
+                job = await conn.fetchrow(
+                    """
+                    WITH running AS (
+                        SELECT submitted_by, COUNT(*) AS n
+                        FROM jobs
+                        WHERE status = 'processing'
+                        GROUP BY submitted_by
+                    )
+                    SELECT j.id, j.config_name, j.priority, j.submitted_by,
+                           j.queued_at, j.dispatch_attempts
+                    FROM jobs j
+                    LEFT JOIN running r ON r.submitted_by IS NOT DISTINCT FROM j.submitted_by
+                    WHERE j.status = 'created'
+                      AND j.queued_at IS NOT NULL
+                      AND (j.next_dispatch_at IS NULL OR j.next_dispatch_at <= CURRENT_TIMESTAMP)
+                      AND ($2 OR j.config_name = ANY($1::text[]))
+                    ORDER BY j.priority DESC, COALESCE(r.n, 0), j.queued_at
+                    LIMIT 1
+                    FOR UPDATE OF j SKIP LOCKED
+                    """,
+                    [row["config_name"] for row in configs],
+                    allow_any_config,
+                )
+                if job is None:
+                    return None
+
+                agent = await conn.fetchrow(
+                    """
+                    SELECT id, config_name, hostname, pod_ip, pod_port
+                    FROM agents
+                    WHERE status = 'ready'
+                      AND pod_ip IS NOT NULL
+                      AND NOT (id = ANY($2::uuid[]))
+                      AND ($3 OR config_name = $1)
+                    ORDER BY (config_name = $1) DESC, last_heartbeat DESC
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                    """,
+                    job["config_name"],
+                    excluded,
+                    allow_any_config,
+                )
+                if agent is None:
+                    return None
+
+                await conn.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'processing',
+                        creator_status = 'pending',
+                        assigned_agent_id = $2,
+                        queued_at = NULL,
+                        dispatch_attempts = dispatch_attempts + 1,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = $1
+                    """,
+                    job["id"],
+                    agent["id"],
+                )
+                await conn.execute(
+                    """
+                    UPDATE agents
+                    SET status = 'working',
+                        current_job_id = $2
+                    WHERE id = $1
+                    """,
+                    agent["id"],
+                    job["id"],
+                )
+
+        return {
+            "job_id": str(job["id"]),
+            "agent_id": str(agent["id"]),
+            "config_name": job["config_name"],
+            "priority": job["priority"],
+            "submitted_by": job["submitted_by"],
+            "queued_at": job["queued_at"],
+            "dispatch_attempts": job["dispatch_attempts"] + 1,
+            "agent": dict(agent),
+        }
+
+    async def release_job_claim(
+        self,
+        job_id: str,
+        agent_id: str,
+        queued_at: datetime | None,
+        retry_at: datetime | None = None,
+        error_message: str | None = None,
+    ) -> bool:
+        """Undo a claim after the agent rejected or could not be reached.
+
+        The agent returns to 'ready'. The job is either put back in the queue
+        at its original position (not before ``retry_at``) or, when
+        ``retry_at`` is None, marked as failed.
+
+        Args:
+            job_id: Job UUID as string
+            agent_id: Agent UUID as string
+            queued_at: Original queue time returned by :meth:`claim_next_job`
+            retry_at: Earliest time the job may be dispatched again
+            error_message: Stored on the job when it is marked failed
+
+        Returns:
+            True if the job claim was released
+        """
+        try:
+            job_uuid = UUID(job_id)
+            agent_uuid = UUID(agent_id)
+        except ValueError:
+            return False
+
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                if retry_at is None:
+                    result = await conn.execute(
+                        """
+                        UPDATE jobs
+                        SET status = 'failed',
+                            error_message = $3,
+                            queued_at = NULL,
+                            next_dispatch_at = NULL,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = $1 AND status = 'processing' AND assigned_agent_id = $2
+                        """,
+                        job_uuid,
+                        agent_uuid,
+                        error_message,
+                    )
+                else:
+                    result = await conn.execute(
+                        """
+                        UPDATE jobs
+                        SET status = 'created',
+                            assigned_agent_id = NULL,
+                            queued_at = COALESCE($3, CURRENT_TIMESTAMP),
+                            next_dispatch_at = $4,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = $1 AND status = 'processing' AND assigned_agent_id = $2
+                        """,
+                        job_uuid,
+                        agent_uuid,
+                        queued_at,
+                        retry_at,
+                    )
+                await conn.execute(
+                    """
+                    UPDATE agents
+                    SET status = 'ready',
+                        current_job_id = NULL
+                    WHERE id = $1 AND status = 'working' AND current_job_id = $2
+                    """,
+                    agent_uuid,
+                    job_uuid,
+                )
+
+        return result == "UPDATE 1"
+
+    async def get_job_queue(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """List queued jobs in dispatch order (ignoring fair-share).
+
+        Args:
+            limit: Maximum jobs to return
+
+        Returns:
+            List of queued job dicts including ``wait_seconds``
+        """
+        async with self.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, description, config_name, priority, submitted_by,
+                       queued_at, dispatch_attempts, next_dispatch_at,
+                       EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - queued_at))::float AS wait_seconds
+                FROM jobs
+                WHERE status = 'created' AND queued_at IS NOT NULL
+                ORDER BY priority DESC, queued_at
+                LIMIT $1
+                """,
+                limit,
+            )
+
+        return [dict(row) for row in rows]
+
+    async def get_queue_depth(self) -> List[Dict[str, Any]]:
+        """Queue depth and oldest wait per config_name.
+
+        Returns:
+            List of dicts with config_name, depth, ready_agents and
+            oldest_wait_seconds
+        """
+        async with self.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH queued AS (
+                    SELECT config_name,
+                           COUNT(*) AS depth,
+                           EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - MIN(queued_at)))::float
+                               AS oldest_wait_seconds
+                    FROM jobs
+                    WHERE status = 'created' AND queued_at IS NOT NULL
+                    GROUP BY config_name
+                ),
+                ready AS (
+                    SELECT config_name, COUNT(*) AS ready_agents
+                    FROM agents
+                    WHERE status = 'ready'
+                    GROUP BY config_name
+                )
+                SELECT COALESCE(q.config_name, r.config_name) AS config_name,
+                       COALESCE(q.depth, 0) AS depth,
+                       COALESCE(r.ready_agents, 0) AS ready_agents,
+                       q.oldest_wait_seconds
+                FROM queued q
+                FULL OUTER JOIN ready r ON r.config_name = q.config_name
+                ORDER BY config_name
+                """
+            )
+
+        return [dict(row) for row in rows]
+
     # =========================================================================
     # DATASOURCE OPERATIONS
     # =========================================================================
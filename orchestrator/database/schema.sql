@@ -77,6 +77,17 @@ CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_jobs_config_name ON jobs(config_name);
 CREATE INDEX IF NOT EXISTS idx_jobs_assigned_agent ON jobs(assigned_agent_id);
 
+-- Job queue (automatic scheduling onto ready agents).
+-- A job is queued while status = 'created' and queued_at IS NOT NULL.
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS submitted_by VARCHAR(255);
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS queued_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS dispatch_attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS next_dispatch_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs(priority DESC, queued_at)
+    WHERE status = 'created' AND queued_at IS NOT NULL;
+
 -- ============================================================================
 -- 2. AGENTS TABLE
 -- Tracks registered agent pods for orchestration
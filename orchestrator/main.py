@@ -24,15 +24,19 @@ from uuid import UUID  # noqa: E402
 
 import asyncpg  # noqa: E402
 import yaml  # noqa: E402
-from fastapi import FastAPI, HTTPException, Query  # noqa: E402
+from fastapi import FastAPI, Header, HTTPException, Query, Request  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
 
 from pydantic import BaseModel, Field  # noqa: E402
 
-from database import PostgresDB, MongoDB, ALLOWED_TABLES, FilterCategory  # noqa: E402
+from database import PostgresDB, MongoDB, ALLOWED_TABLES, FilterCategory, InvalidCursorError  # noqa: E402
 from services.workspace import workspace_service  # noqa: E402
 from services.gitea import GiteaClient  # noqa: E402
+from services.live_events import JobEventBroker  # noqa: E402
+from services.response_cache import ResponseCache  # noqa: E402
+from services.heartbeats import HeartbeatTable  # noqa: E402
+from services.scheduler import JobDispatchError, JobScheduler  # noqa: E402
 from services.builder_tools import (  # noqa: E402
     BUILDER_TOOLS,
     SERVER_SIDE_TOOLS,
@@ -57,39 +61,70 @@ logger = logging.getLogger(__name__)
 postgres_db = PostgresDB()
 mongodb = MongoDB()
 gitea_client = GiteaClient()
+event_broker = JobEventBroker(mongodb)
+response_cache = ResponseCache()
 
 
-# =============================================================================
-# Background Tasks
-# =============================================================================
+def _invalidate_job_caches(job_id: str | None = None) -> None:
+    """Drop cached responses that depend on job state."""
+    tags = ["jobs"]
+    if job_id:
+        tags += [f"job:{job_id}", f"repo:{job_id}"]
+    response_cache.invalidate(*tags)
 
-# Flag to signal shutdown to background tasks
-_shutdown_event: asyncio.Event | None = None
+
+def _is_commit_sha(ref: str | None) -> bool:
+    """True if a git ref is a full commit SHA (immutable, safe to cache long)."""
+    return bool(ref) and len(ref) == 40 and all(c in "0123456789abcdef" for c in ref.lower())
 
 
-async def stale_agent_detector(shutdown_event: asyncio.Event) -> None:
-    """Background task that marks agents as offline if no heartbeat received.
+def _on_agent_state_change(
+    agent_id: str,
+    previous: tuple[str, str | None] | None,
+    current: tuple[str, str | None],
+) -> None:
+    """Invalidate cached responses when an agent's status or job changes.
 
-    Runs every 60 seconds and marks agents as offline if they haven't sent
-    a heartbeat in the last 3 minutes.
+    Also wakes the job scheduler when an agent becomes ready.
     """
-    logger.info("Stale agent detector started")
-    while not shutdown_event.is_set():
-        try:
-            count = await postgres_db.mark_stale_agents_offline(timeout_minutes=3)
-            if count > 0:
-                logger.info(f"Marked {count} agent(s) as offline due to missed heartbeats")
-        except Exception as e:
-            logger.error(f"Error in stale agent detector: {e}")
+    response_cache.invalidate("agents")
+    for job_id in {previous[1] if previous else None, current[1]}:
+        if job_id:
+            _invalidate_job_caches(job_id)
+    if current[0] == "ready":
+        job_scheduler.notify()
+
+
+async def _dispatch_scheduled_job(claim: dict[str, Any]) -> None:
+    """Start a job claimed by the scheduler on its agent."""
+    job = await postgres_db.get_job(claim["job_id"])
+    if not job:
+        raise JobDispatchError("Job no longer exists")
+
+    await _send_job_to_agent(claim["job_id"], job, claim["agent"])
+
+    await heartbeat_table.record(
+        agent_id=claim["agent_id"],
+        status="working",
+        current_job_id=claim["job_id"],
+    )
+    _invalidate_job_caches(claim["job_id"])
 
-        # Wait 60 seconds or until shutdown
-        try:
-            await asyncio.wait_for(shutdown_event.wait(), timeout=60.0)
-            break  # Shutdown signaled
-        except asyncio.TimeoutError:
-            pass  # Continue loop
 
-    logger.info("Stale agent detector stopped")
+heartbeat_table = HeartbeatTable(postgres_db, on_change=_on_agent_state_change)
+job_scheduler = JobScheduler(
+    postgres_db,
+    dispatch=_dispatch_scheduled_job,
+    on_job_change=_invalidate_job_caches,
+)
+
+
+# =============================================================================
+# Background Tasks
+# =============================================================================
+
+# Flag to signal shutdown to background tasks
+_shutdown_event: asyncio.Event | None = None
 
 
 # =============================================================================
@@ -171,6 +206,16 @@ class JobCreate(BaseModel):
     instructions: str | None = Field(None, description="Additional inline instructions for the agent")
     datasource_ids: list[str] | None = Field(None, description="Global datasource IDs to clone as job-scoped")
     builder_session_id: str | None = Field(None, description="Builder session ID to link to this job")
+    enqueue: bool = Field(False, description="Queue the job for automatic assignment to a ready agent")
+    priority: int = Field(0, description="Queue priority (higher is dispatched first)")
+    submitted_by: str | None = Field(None, description="Submitter identity for fair scheduling")
+
+
+class JobEnqueueRequest(BaseModel):
+    """Request body for queueing a job for automatic assignment."""
+
+    priority: int = Field(0, description="Queue priority (higher is dispatched first)")
+    submitted_by: str | None = Field(None, description="Submitter identity for fair scheduling")
 
 
 class JobStartRequest(BaseModel):
@@ -257,15 +302,26 @@ async def lifespan(app: FastAPI):
     # Initialize Gitea workspace delivery (graceful if unavailable)
     await gitea_client.ensure_initialized()
 
+    # Start live audit/chat event fan-out (graceful if MongoDB unavailable)
+    await event_broker.start()
+
     # Start background tasks
     _shutdown_event = asyncio.Event()
-    stale_detector_task = asyncio.create_task(stale_agent_detector(_shutdown_event))
+    try:
+        await heartbeat_table.load()
+    except Exception as e:
+        logger.error(f"Failed to load agent heartbeat table: {e}")
+    heartbeat_task = asyncio.create_task(heartbeat_table.run(_shutdown_event))
+    scheduler_task = asyncio.create_task(job_scheduler.run(_shutdown_event))
 
     yield
 
     # Signal shutdown to background tasks
     _shutdown_event.set()
-    await stale_detector_task
+    job_scheduler.notify()
+    await scheduler_task
+    await heartbeat_task
+    await event_broker.stop()
 
     # Cleanup clients
     await gitea_client.close()
@@ -501,6 +557,16 @@ async def create_job(job: JobCreate) -> dict[str, Any]:
             except Exception as e:
                 logger.warning(f"Failed to link builder session {job.builder_session_id}: {e}")
 
+        # Queue for automatic assignment to a ready agent
+        if job.enqueue:
+            result["queued"] = await postgres_db.enqueue_job(
+                str(result["id"]),
+                priority=job.priority,
+                submitted_by=job.submitted_by,
+            )
+            job_scheduler.notify()
+
+        _invalidate_job_caches()
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -513,6 +579,7 @@ async def delete_job(job_id: str) -> dict[str, str]:
         success = await postgres_db.delete_job(job_id)
         if not success:
             raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+        _invalidate_job_caches(job_id)
         return {"status": "deleted"}
     except HTTPException:
         raise
@@ -545,7 +612,7 @@ async def cancel_job(job_id: str) -> dict[str, str]:
                     async with httpx.AsyncClient(timeout=10.0) as client:
                         response = await client.post(
                             agent_url,
-                            json={"reason": "Cancelled via cockpit"},
+                            json={"job_id": job_id, "reason": "Cancelled via cockpit"},
                         )
                         if response.status_code == 200:
                             logger.info(f"Agent confirmed cancel for job {job_id}")
@@ -563,6 +630,7 @@ async def cancel_job(job_id: str) -> dict[str, str]:
                 status_code=400,
                 detail="Job cannot be cancelled (already completed or cancelled)",
             )
+        _invalidate_job_caches(job_id)
         return {"status": "cancelled"}
     except HTTPException:
         raise
@@ -708,12 +776,14 @@ async def resume_job(job_id: str, request: JobResumeRequest | None = None) -> di
         )
 
         # Update agent status via heartbeat simulation
-        await postgres_db.heartbeat(
-            agent_id=agent_id,
+        await heartbeat_table.record(
+            agent_id=str(agent_id),
             status="working",
             current_job_id=job_id,
         )
 
+        _invalidate_job_caches(job_id)
+
         return {"status": "resumed", "job_id": job_id, "agent_id": str(agent_id)}
 
     except HTTPException:
@@ -830,6 +900,7 @@ async def approve_job(job_id: str, request: JobApproveRequest | None = None) ->
             )
 
         logger.info(f"Job {job_id} approved (gitea={wrote_to_gitea})")
+        _invalidate_job_caches(job_id)
 
         return {
             "status": "approved",
@@ -951,6 +1022,38 @@ async def get_job_audit(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/api/jobs/{job_id}/audit/profile")
+async def get_job_tool_profile(
+    job_id: str,
+    top: int = Query(default=10, ge=0, le=100),
+) -> dict[str, Any]:
+    """Get the tool execution profile of a job.
+
+    Aggregates the per-call tool timings recorded in the audit trail:
+    per-tool call/error counts, p50/p95/max latency, CPU time and result
+    size, plus the slowest individual calls.
+
+    Query params:
+        top: Number of slowest calls to include (max 100)
+    """
+    if not mongodb.is_available:
+        return {
+            "jobId": job_id,
+            "calls": 0,
+            "errors": 0,
+            "totalMs": 0,
+            "cpuMs": 0,
+            "tools": [],
+            "slowest": [],
+            "error": "MongoDB not available",
+        }
+
+    try:
+        return await mongodb.get_tool_profile(job_id, top=top)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.get("/api/requests/{doc_id}")
 async def get_request(doc_id: str) -> dict[str, Any]:
     """Get a single LLM request by MongoDB document ID.
@@ -1039,6 +1142,12 @@ async def get_job_chat_history(
 
 
 @app.get("/api/jobs/{job_id}/repo/contents")
+@response_cache.cached(
+    "repo_contents",
+    ttl=15,
+    tags=lambda job_id, **_: [f"repo:{job_id}"],
+    ttl_for=lambda ref=None, **_: 3600 if _is_commit_sha(ref) else 15,
+)
 async def list_repo_contents(
     job_id: str,
     path: str = Query(default="", description="Directory path within the repo"),
@@ -1103,6 +1212,14 @@ async def get_repo_file(
 
 
 @app.get("/api/jobs/{job_id}/repo/commits")
+@response_cache.cached(
+    "repo_commits",
+    ttl=15,
+    tags=lambda job_id, **_: [f"repo:{job_id}"],
+    ttl_for=lambda sha, since_ref=None, **_: (
+        3600 if _is_commit_sha(sha) and (since_ref is None or _is_commit_sha(since_ref)) else 15
+    ),
+)
 async def list_repo_commits(
     job_id: str,
     sha: str = Query(default="main", description="Branch, tag, or commit SHA to list from"),
@@ -1169,6 +1286,7 @@ async def get_repo_diff(
 
 
 @app.get("/api/jobs/{job_id}/repo/tags")
+@response_cache.cached("repo_tags", ttl=15, tags=lambda job_id: [f"repo:{job_id}"])
 async def list_repo_tags(job_id: str) -> list[dict[str, Any]]:
     """List tags in a job's repository.
 
@@ -1294,37 +1412,52 @@ async def get_archived_todos(job_id: str, filename: str) -> dict[str, Any]:
 # =============================================================================
 
 
+def _bulk_unavailable(key: str, offset: int, limit: int) -> dict[str, Any]:
+    """Bulk response returned when MongoDB is not available."""
+    return {
+        key: [],
+        "total": 0,
+        "offset": offset,
+        "limit": limit,
+        "hasMore": False,
+        "nextCursor": None,
+        "error": "MongoDB not available",
+    }
+
+
 @app.get("/api/jobs/{job_id}/audit/bulk")
 async def get_job_audit_bulk(
     job_id: str,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=5000, ge=1, le=5000),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None, alias="includeTotal"),
 ) -> dict[str, Any]:
     """Get bulk audit entries for caching in IndexedDB.
 
-    Uses offset/limit instead of page/pageSize for efficient bulk fetching.
-    Returns up to 5000 entries per request.
+    Uses keyset pagination: follow ``nextCursor`` from each response to fetch
+    the next page without server-side skipping. Returns up to 5000 entries
+    per request.
 
     Query params:
-        offset: Number of entries to skip (default 0)
+        offset: Number of entries to skip when no cursor is given (default 0)
         limit: Maximum entries to return (max 5000)
+        cursor: Continuation token (``nextCursor`` from the previous page)
+        includeTotal: Count total entries (defaults to true on the first page only)
     """
     if not mongodb.is_available:
-        return {
-            "entries": [],
-            "total": 0,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": False,
-            "error": "MongoDB not available",
-        }
+        return _bulk_unavailable("entries", offset, limit)
 
     try:
         return await mongodb.get_job_audit_bulk(
             job_id=job_id,
             offset=offset,
             limit=limit,
+            cursor=cursor,
+            include_total=cursor is None if include_total is None else include_total,
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -1334,32 +1467,33 @@ async def get_job_chat_bulk(
     job_id: str,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=5000, ge=1, le=5000),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None, alias="includeTotal"),
 ) -> dict[str, Any]:
     """Get bulk chat history entries for caching in IndexedDB.
 
-    Uses offset/limit for efficient bulk fetching.
+    Uses keyset pagination via ``nextCursor``.
     Returns up to 5000 entries per request.
 
     Query params:
-        offset: Number of entries to skip (default 0)
+        offset: Number of entries to skip when no cursor is given (default 0)
         limit: Maximum entries to return (max 5000)
+        cursor: Continuation token (``nextCursor`` from the previous page)
+        includeTotal: Count total entries (defaults to true on the first page only)
     """
     if not mongodb.is_available:
-        return {
-            "entries": [],
-            "total": 0,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": False,
-            "error": "MongoDB not available",
-        }
+        return _bulk_unavailable("entries", offset, limit)
 
     try:
         return await mongodb.get_chat_history_bulk(
             job_id=job_id,
             offset=offset,
             limit=limit,
+            cursor=cursor,
+            include_total=cursor is None if include_total is None else include_total,
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -1369,6 +1503,8 @@ async def get_job_graph_bulk(
     job_id: str,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=5000, ge=1, le=5000),
+    cursor: str | None = Query(default=None),
+    include_total: bool | None = Query(default=None, alias="includeTotal"),
 ) -> dict[str, Any]:
     """Get bulk graph deltas (execute_cypher_query tool calls) for caching.
 
@@ -1376,29 +1512,97 @@ async def get_job_graph_bulk(
     Use /api/graph/changes/{job_id} for full graph timeline with snapshots.
 
     Query params:
-        offset: Number of deltas to skip (default 0)
+        offset: Number of deltas to skip when no cursor is given (default 0)
         limit: Maximum deltas to return (max 5000)
+        cursor: Continuation token (``nextCursor`` from the previous page)
+        includeTotal: Count total deltas (defaults to true on the first page only)
     """
     if not mongodb.is_available:
-        return {
-            "deltas": [],
-            "total": 0,
-            "offset": offset,
-            "limit": limit,
-            "hasMore": False,
-            "error": "MongoDB not available",
-        }
+        return _bulk_unavailable("deltas", offset, limit)
 
     try:
         return await mongodb.get_graph_deltas_bulk(
             job_id=job_id,
             offset=offset,
             limit=limit,
+            cursor=cursor,
+            include_total=cursor is None if include_total is None else include_total,
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/api/jobs/{job_id}/bulk/stream")
+async def stream_job_bulk(job_id: str) -> StreamingResponse:
+    """Stream a job's full audit trail, chat history and graph deltas as NDJSON.
+
+    Lets the cockpit hydrate its IndexedDB cache in a single request. Each
+    line is one JSON record: ``{"type": "audit", "index": n, "data": {...}}``,
+    ``{"type": "chat", "data": {...}}`` or ``{"type": "graph", "data": {...}}``,
+    terminated by ``{"type": "end", "counts": {...}}``. If the stream fails
+    midway an ``{"type": "error", "detail": ...}`` record is emitted instead.
+    """
+    if not mongodb.is_available:
+        raise HTTPException(status_code=503, detail="MongoDB not available")
+
+    async def generate():
+        try:
+            async for record in mongodb.iter_job_bulk(job_id):
+                yield json.dumps(record, cls=CustomJSONEncoder, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logger.error(f"Bulk stream for job {job_id} failed: {e}")
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    resume: str | None = Query(default=None),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Server-sent events for new audit and chat entries of a job.
+
+    Emits ``audit`` and ``chat`` events whose data is the same entry shape
+    as the bulk endpoints. All viewers of a job share one upstream MongoDB
+    subscription. Browsers reconnect automatically with ``Last-Event-ID``;
+    entries missed while disconnected are backfilled before live delivery.
+
+    Query params:
+        resume: Event id to resume after (alternative to the Last-Event-ID header)
+    """
+    if not event_broker.is_enabled:
+        raise HTTPException(status_code=503, detail="MongoDB not available")
+
+    async def generate():
+        yield "retry: 3000\n\n"
+        async with event_broker.subscribe(job_id, resume or last_event_id) as subscription:
+            async for event in subscription.events():
+                if await request.is_disconnected():
+                    break
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(event["data"], cls=CustomJSONEncoder, ensure_ascii=False)
+                yield f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events/stats")
+async def get_event_stats() -> dict[str, Any]:
+    """Get live event broker mode, watched jobs and viewer counts."""
+    return event_broker.get_stats()
+
+
 @app.get("/api/jobs/{job_id}/version")
 async def get_job_version(job_id: str) -> dict[str, Any] | None:
     """Get job data version info for cache invalidation.
@@ -1517,6 +1721,77 @@ def _build_datasources_payload(resolved_ds: list[dict[str, Any]]) -> list[dict[s
     return payload or None
 
 
+async def _send_job_to_agent(job_id: str, job: dict[str, Any], agent: dict[str, Any]) -> None:
+    """Build the JobStartRequest for a job and send it to the agent's pod.
+
+    Used by manual assignment and by the job scheduler.
+
+    Raises:
+        JobDispatchError: If the agent rejects the job or cannot be reached
+    """
+    import httpx
+
+    # Extract upload IDs from context if present
+    job_context = job.get("context") or {}
+    if isinstance(job_context, str):
+        import json as json_module
+        job_context = json_module.loads(job_context)
+    upload_id = job_context.get("upload_id")
+    config_upload_id = job_context.get("config_upload_id")
+    instructions_upload_id = job_context.get("instructions_upload_id")
+    instructions = job_context.get("instructions")
+    git_remote_url = job_context.get("git_remote_url")
+
+    # Parse config_override if stored as string
+    config_override = job.get("config_override")
+    if isinstance(config_override, str):
+        import json as json_module
+        config_override = json_module.loads(config_override)
+
+    # Build remaining context (fields not extracted as dedicated params)
+    extracted_keys = {"upload_id", "config_upload_id", "instructions_upload_id", "instructions", "git_remote_url"}
+    remaining_context = {k: v for k, v in job_context.items() if k not in extracted_keys}
+
+    # Resolve datasources for this job (job-specific > global fallback)
+    resolved_ds = await postgres_db.resolve_datasources_for_job(job_id)
+    datasources_payload = _build_datasources_payload(resolved_ds)
+
+    # Apply datasource-driven tool override (inject/strip db tool categories)
+    if resolved_ds:
+        config_override = _build_datasource_tool_override(resolved_ds, config_override)
+
+    # Build job start request - use job's config, not agent's
+    job_start = JobStartRequest(
+        job_id=job_id,
+        description=job["description"],
+        upload_id=upload_id,
+        config_upload_id=config_upload_id,
+        instructions_upload_id=instructions_upload_id,
+        instructions=instructions,
+        document_path=job.get("document_path"),
+        config_name=job.get("config_name", "default"),
+        config_override=config_override,
+        git_remote_url=git_remote_url,
+        context=remaining_context if remaining_context else None,
+        datasources=datasources_payload,
+    )
+
+    # Send request to agent pod
+    agent_url = f"http://{agent['pod_ip']}:{agent['pod_port']}/job/start"
+
+    try:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(
+                agent_url,
+                json=job_start.model_dump(exclude_none=True),
+            )
+    except httpx.RequestError as e:
+        raise JobDispatchError(f"Failed to connect to agent: {str(e)}") from e
+
+    if response.status_code not in (200, 202):
+        raise JobDispatchError(f"Agent rejected job: {response.text}")
+
+
 @app.post("/api/jobs/{job_id}/assign/{agent_id}")
 async def assign_job_to_agent(job_id: str, agent_id: str) -> dict[str, str]:
     """Assign a job to an agent.
@@ -1530,8 +1805,6 @@ async def assign_job_to_agent(job_id: str, agent_id: str) -> dict[str, str]:
     Returns:
         Status message indicating assignment result
     """
-    import httpx
-
     try:
         # Get job details
         job = await postgres_db.get_job(job_id)
@@ -1561,65 +1834,13 @@ async def assign_job_to_agent(job_id: str, agent_id: str) -> dict[str, str]:
                 detail="Agent has no pod IP configured",
             )
 
-        # Extract upload IDs from context if present
-        job_context = job.get("context") or {}
-        if isinstance(job_context, str):
-            import json as json_module
-            job_context = json_module.loads(job_context)
-        upload_id = job_context.get("upload_id")
-        config_upload_id = job_context.get("config_upload_id")
-        instructions_upload_id = job_context.get("instructions_upload_id")
-        instructions = job_context.get("instructions")
-        git_remote_url = job_context.get("git_remote_url")
-
-        # Parse config_override if stored as string
-        config_override = job.get("config_override")
-        if isinstance(config_override, str):
-            import json as json_module
-            config_override = json_module.loads(config_override)
-
-        # Build remaining context (fields not extracted as dedicated params)
-        extracted_keys = {"upload_id", "config_upload_id", "instructions_upload_id", "instructions", "git_remote_url"}
-        remaining_context = {k: v for k, v in job_context.items() if k not in extracted_keys}
-
-        # Resolve datasources for this job (job-specific > global fallback)
-        resolved_ds = await postgres_db.resolve_datasources_for_job(job_id)
-        datasources_payload = _build_datasources_payload(resolved_ds)
-
-        # Apply datasource-driven tool override (inject/strip db tool categories)
-        if resolved_ds:
-            config_override = _build_datasource_tool_override(resolved_ds, config_override)
-
-        # Build job start request - use job's config, not agent's
-        job_start = JobStartRequest(
-            job_id=job_id,
-            description=job["description"],
-            upload_id=upload_id,
-            config_upload_id=config_upload_id,
-            instructions_upload_id=instructions_upload_id,
-            instructions=instructions,
-            document_path=job.get("document_path"),
-            config_name=job.get("config_name", "default"),
-            config_override=config_override,
-            git_remote_url=git_remote_url,
-            context=remaining_context if remaining_context else None,
-            datasources=datasources_payload,
-        )
-
-        # Send request to agent pod
-        agent_url = f"http://{agent['pod_ip']}:{agent['pod_port']}/job/start"
+        # Take the job out of the scheduler queue before dispatching manually
+        await postgres_db.dequeue_job(job_id)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                agent_url,
-                json=job_start.model_dump(exclude_none=True),
-            )
-
-        if response.status_code not in (200, 202):
-            raise HTTPException(
-                status_code=502,
-                detail=f"Agent rejected job: {response.text}",
-            )
+        try:
+            await _send_job_to_agent(job_id, job, agent)
+        except JobDispatchError as e:
+            raise HTTPException(status_code=502, detail=str(e)) from e
 
         # Update job status and assign to agent
         await postgres_db.update_job_status(
@@ -1630,25 +1851,74 @@ async def assign_job_to_agent(job_id: str, agent_id: str) -> dict[str, str]:
         )
 
         # Update agent status via heartbeat simulation
-        await postgres_db.heartbeat(
-            agent_id=agent_id,
+        await heartbeat_table.record(
+            agent_id=str(agent_id),
             status="working",
             current_job_id=job_id,
         )
 
+        _invalidate_job_caches(job_id)
+
         return {"status": "assigned", "agent_id": agent_id, "job_id": job_id}
 
     except HTTPException:
         raise
-    except httpx.RequestError as e:
-        raise HTTPException(
-            status_code=502,
-            detail=f"Failed to connect to agent: {str(e)}",
-        ) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+# =============================================================================
+# Job Queue Endpoints
+# =============================================================================
+
+
+@app.post("/api/jobs/{job_id}/enqueue")
+async def enqueue_job(job_id: str, request: JobEnqueueRequest | None = None) -> dict[str, str]:
+    """Queue a 'created' job for automatic assignment to a ready agent.
+
+    The scheduler picks queued jobs by priority, fair share across
+    submitters and queue time, and only assigns them to agents with a
+    matching config_name.
+    """
+    request = request or JobEnqueueRequest()
+    job = await postgres_db.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+
+    queued = await postgres_db.enqueue_job(
+        job_id,
+        priority=request.priority,
+        submitted_by=request.submitted_by,
+    )
+    if not queued:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job cannot be queued (status: {job['status']})",
+        )
+
+    job_scheduler.notify()
+    _invalidate_job_caches(job_id)
+    return {"status": "queued", "job_id": job_id}
+
+
+@app.delete("/api/jobs/{job_id}/enqueue")
+async def dequeue_job(job_id: str) -> dict[str, str]:
+    """Remove a job from the scheduler queue (it stays in 'created')."""
+    if not await postgres_db.dequeue_job(job_id):
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' is not queued")
+
+    _invalidate_job_caches(job_id)
+    return {"status": "dequeued", "job_id": job_id}
+
+
+@app.get("/api/scheduler/queue")
+async def get_job_queue(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum jobs to return"),
+) -> list[dict[str, Any]]:
+    """List queued jobs in priority/queue-time order."""
+    return await postgres_db.get_job_queue(limit=limit)
+
+
 # =============================================================================
 # Datasource Endpoints
 # =============================================================================
@@ -1827,6 +2097,7 @@ async def test_datasource(datasource_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/stats/jobs")
+@response_cache.cached("stats_jobs", ttl=10, tags=lambda **_: ["jobs"])
 async def get_job_statistics() -> dict[str, int]:
     """Get overall job statistics."""
     try:
@@ -1836,6 +2107,7 @@ async def get_job_statistics() -> dict[str, int]:
 
 
 @app.get("/api/stats/daily")
+@response_cache.cached("stats_daily", ttl=60, tags=lambda **_: ["jobs"])
 async def get_daily_statistics(
     days: int = Query(default=7, ge=1, le=90),
 ) -> list[dict[str, Any]]:
@@ -1847,6 +2119,7 @@ async def get_daily_statistics(
 
 
 @app.get("/api/stats/agents")
+@response_cache.cached("stats_agents", ttl=10, tags=lambda **_: ["agents"])
 async def get_agent_statistics() -> dict[str, Any]:
     """Get agent workforce summary."""
     try:
@@ -1873,6 +2146,31 @@ async def get_agent_statistics() -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/api/stats/cache")
+async def get_cache_statistics() -> dict[str, Any]:
+    """Get response cache hit/miss counters per route."""
+    return response_cache.get_stats()
+
+
+@app.get("/api/stats/heartbeats")
+async def get_heartbeat_statistics() -> dict[str, Any]:
+    """Get heartbeat absorption, flush and timeout counters."""
+    return heartbeat_table.get_stats()
+
+
+@app.get("/api/stats/scheduler")
+async def get_scheduler_statistics() -> dict[str, Any]:
+    """Job queue depth per config, queue wait and dispatch latency.
+
+    Intended as the scaling signal for agent pods: a growing depth or
+    oldest wait for a config_name means more agents of that config are needed.
+    """
+    stats = job_scheduler.get_stats()
+    stats["queues"] = await postgres_db.get_queue_depth()
+    stats["queued_jobs"] = sum(q["depth"] for q in stats["queues"])
+    return stats
+
+
 @app.get("/api/stats/stuck")
 async def get_stuck_jobs(
     threshold_minutes: int = Query(default=60, ge=1, le=1440),
@@ -2134,6 +2432,7 @@ async def get_source_tags(job_id: str, source_id: int) -> list[str]:
 
 
 @app.get("/api/jobs/{job_id}/citations/stats")
+@response_cache.cached("citation_stats", ttl=30, tags=lambda job_id: [f"job:{job_id}"])
 async def get_citation_stats(job_id: str) -> dict[str, Any]:
     """Get citation statistics for a job."""
     try:
@@ -2307,6 +2606,8 @@ async def register_agent(registration: AgentRegistration) -> AgentRegistrationRe
             pod_port=registration.pod_port,
             pid=registration.pid,
         )
+        heartbeat_table.register(result["agent_id"])
+        result["heartbeat_interval_seconds"] = int(heartbeat_table.interval_seconds)
         return AgentRegistrationResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -2316,11 +2617,13 @@ async def register_agent(registration: AgentRegistration) -> AgentRegistrationRe
 async def agent_heartbeat(agent_id: str, heartbeat: AgentHeartbeat) -> dict[str, str]:
     """Update agent heartbeat and status.
 
-    Agents call this every 60 seconds to report their status.
-    The orchestrator uses this to track agent health and current job state.
+    Agents call this at the interval returned by registration. Beats are
+    absorbed by the in-memory heartbeat table: status/job transitions are
+    written through to PostgreSQL, plain liveness beats are flushed in
+    batches, and missed deadlines mark the agent offline.
     """
     try:
-        success = await postgres_db.heartbeat(
+        success = await heartbeat_table.record(
             agent_id=agent_id,
             status=heartbeat.status,
             current_job_id=heartbeat.current_job_id,
@@ -2376,6 +2679,8 @@ async def delete_agent(agent_id: str) -> dict[str, str]:
         success = await postgres_db.delete_agent(agent_id)
         if not success:
             raise HTTPException(status_code=404, detail=f"Agent '{agent_id}' not found")
+        heartbeat_table.forget(agent_id)
+        response_cache.invalidate("agents")
         return {"status": "deleted"}
     except HTTPException:
         raise
@@ -2474,6 +2779,7 @@ _experts_cache: list[ExpertInfo] | None = None
 
 
 @app.get("/api/experts")
+@response_cache.cached("experts", ttl=300, tags=lambda **_: ["experts"])
 async def list_experts() -> list[dict[str, Any]]:
     """List available expert configurations.
 
@@ -2491,6 +2797,7 @@ async def reload_experts() -> dict[str, Any]:
     """Force reload of expert configurations cache."""
     global _experts_cache
     _experts_cache = _scan_experts()
+    response_cache.invalidate("experts")
     return {"status": "reloaded", "count": len(_experts_cache)}
 
 
@@ -134,6 +134,23 @@ class CockpitClient:
         resp.raise_for_status()
         return resp.json()
 
+    def get_tool_profile(self, job_id: str, top: int = 10) -> dict[str, Any]:
+        """Get the tool execution profile of a job.
+
+        Args:
+            job_id: Job UUID
+            top: Number of slowest calls to include (0-100)
+
+        Returns:
+            Dict with calls, errors, totalMs, cpuMs, per-tool stats and
+            the slowest calls
+        """
+        resp = self._client.get(
+            f"/api/jobs/{job_id}/audit/profile", params={"top": top}
+        )
+        resp.raise_for_status()
+        return resp.json()
+
     def get_audit_time_range(self, job_id: str) -> dict[str, str] | None:
         """Get first and last timestamps for job audit entries.
 
@@ -498,6 +515,24 @@ class AsyncCockpitClient:
         resp.raise_for_status()
         return resp.json()
 
+    @_create_retry_decorator()
+    async def get_tool_profile(self, job_id: str, top: int = 10) -> dict[str, Any]:
+        """Get the tool execution profile of a job.
+
+        Args:
+            job_id: Job UUID
+            top: Number of slowest calls to include (0-100)
+
+        Returns:
+            Dict with calls, errors, totalMs, cpuMs, per-tool stats and
+            the slowest calls
+        """
+        resp = await self._client.get(
+            f"/api/jobs/{job_id}/audit/profile", params={"top": top}
+        )
+        resp.raise_for_status()
+        return resp.json()
+
     @_create_retry_decorator()
     async def get_audit_time_range(self, job_id: str) -> dict[str, str] | None:
         """Get first and last timestamps for job audit entries.
@@ -108,17 +108,21 @@ async def get_audit_trail(
     page: int = 1,
     page_size: int = 20,
     filter: Literal["all", "messages", "tools", "errors"] = "all",
+    include_profile: bool = False,
 ) -> str:
     """Get paginated audit entries for a job's execution.
 
     Shows LLM messages, tool calls, and errors.
     Use filter to narrow results. Page -1 returns the last page.
+    Set include_profile to append the job's tool execution profile
+    (slowest tools with p50/p95 latency, CPU time, errors).
 
     Args:
         job_id: Job UUID to get audit for
         page: Page number (1-indexed, -1 for last page)
         page_size: Entries per page (max 200, default 20)
         filter: Filter category (all, messages, tools, errors)
+        include_profile: Append the per-job tool profile
 
     Returns:
         Formatted audit trail entries
@@ -135,7 +139,11 @@ async def get_audit_trail(
         page_size=page_size,
         filter_category=filter,
     )
-    return _format_audit(audit)
+    result = _format_audit(audit)
+    if include_profile:
+        profile = await client.get_tool_profile(job_id)
+        result += "\n\n" + _format_tool_profile(profile)
+    return result
 
 
 @mcp.tool
@@ -1247,6 +1255,18 @@ def _format_audit(audit: dict[str, Any]) -> str:
                 result += "..."
             lines.append(f"[{step_num}] Tool Result ({tool_name}): {result}")
 
+        elif step_type == "tool":
+            tool = entry.get("tool", {})
+            tool_name = tool.get("name", "unknown")
+            if entry.get("latency_ms") is None:
+                lines.append(f"[{step_num}] Tool: {tool_name} (running)")
+            else:
+                status = "ok" if tool.get("success") else tool.get("error_class") or "error"
+                lines.append(
+                    f"[{step_num}] Tool: {tool_name} ({status}, {entry['latency_ms']}ms, "
+                    f"cpu {tool.get('cpu_ms') or 0}ms, {tool.get('result_size_bytes') or 0} bytes)"
+                )
+
         elif step_type == "error":
             error = entry.get("error", "Unknown error")
             lines.append(f"[{step_num}] ERROR: {error}")
@@ -1260,6 +1280,44 @@ def _format_audit(audit: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _format_tool_profile(profile: dict[str, Any]) -> str:
+    """Format a job's tool execution profile."""
+    if profile.get("error"):
+        return f"Tool profile unavailable: {profile['error']}"
+
+    tools = profile.get("tools", [])
+    if not tools:
+        return "No completed tool calls to profile."
+
+    lines = [
+        f"Tool profile: {profile.get('calls', 0)} calls, {profile.get('errors', 0)} errors, "
+        f"{profile.get('totalMs', 0)}ms wall, {profile.get('cpuMs', 0)}ms CPU\n",
+        "By tool (slowest p95 first):",
+    ]
+    for tool in tools:
+        line = (
+            f"- {tool['name']}: {tool['calls']} calls, p50 {tool['p50Ms']}ms, "
+            f"p95 {tool['p95Ms']}ms, max {tool['maxMs']}ms, cpu {tool['cpuMs']}ms, "
+            f"{tool['resultBytes']} bytes"
+        )
+        if tool.get("errors"):
+            classes = ", ".join(f"{name} x{count}" for name, count in tool["errorClasses"].items())
+            line += f", errors: {classes}"
+        lines.append(line)
+
+    slowest = profile.get("slowest", [])
+    if slowest:
+        lines.append("\nSlowest calls:")
+        for call in slowest:
+            status = f" [{call['errorClass']}]" if call.get("errorClass") else ""
+            lines.append(
+                f"[{call.get('stepNumber', '?')}] {call['tool']}: {call['latencyMs']}ms "
+                f"(cpu {call.get('cpuMs') or 0}ms){status}"
+            )
+
+    return "\n".join(lines)
+
+
 def _format_chat_history(chat: dict[str, Any]) -> str:
     """Format chat history entries."""
     entries = chat.get("entries", [])
@@ -0,0 +1,380 @@
+"""In-memory agent heartbeat table with batched persistence.
+
+Provides a HeartbeatTable that absorbs agent heartbeats in memory instead of
+issuing one ``UPDATE agents`` per beat:
+
+- Status or current-job transitions are written through immediately, since
+  other code (job assignment, the cockpit) reads them from PostgreSQL.
+- Plain "still alive" beats only touch memory; changed rows are flushed to
+  PostgreSQL in one batched statement every flush interval.
+- Liveness deadlines live in a min-heap. The detector sleeps until the
+  earliest deadline (or until woken), so an agent is marked offline as soon
+  as its timeout elapses instead of on the next 60 s sweep.
+
+Configuration:
+    AGENT_HEARTBEAT_INTERVAL_SECONDS: Interval handed to agents at registration (default 60)
+    AGENT_HEARTBEAT_TIMEOUT_SECONDS: Silence before an agent is marked offline (default 180)
+    AGENT_HEARTBEAT_FLUSH_SECONDS: How often buffered beats are persisted (default 10)
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from database import PostgresDB
+
+logger = logging.getLogger(__name__)
+
+AgentState = Tuple[str, Optional[str]]
+ChangeCallback = Callable[[str, Optional[AgentState], AgentState], None]
+
+# Statuses that never expire: the agent is already considered gone
+_TERMINAL_STATUSES = ("offline", "failed")
+
+
+@dataclass(eq=False)
+class _AgentEntry:
+    """Live state of one agent."""
+
+    agent_id: str
+    status: str
+    current_job_id: Optional[str]
+    last_seen: datetime
+    deadline: float
+    generation: int = 0
+    dirty: bool = False
+    pending_metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+class HeartbeatTable:
+    """Absorbs heartbeats in memory and detects stale agents by deadline.
+
+    Example:
+        ```python
+        table = HeartbeatTable(postgres_db, on_change=invalidate_caches)
+        await table.load()
+        task = asyncio.create_task(table.run(shutdown_event))
+
+        found = await table.record(agent_id, "working", job_id, metrics)
+        ```
+    """
+
+    def __init__(
+        self,
+        postgres_db: "PostgresDB",
+        interval_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        flush_seconds: Optional[float] = None,
+        on_change: Optional[ChangeCallback] = None,
+    ) -> None:
+        """Initialize the table.
+
+        Args:
+            postgres_db: Shared PostgresDB instance
+            interval_seconds: Heartbeat interval advertised to agents
+            timeout_seconds: Silence before an agent is considered offline
+            flush_seconds: Interval between batched heartbeat writes
+            on_change: Called with (agent_id, previous_state, new_state) on
+                status/current-job transitions, including detector timeouts
+        """
+        self._db = postgres_db
+        self.interval_seconds = interval_seconds or float(
+            os.getenv("AGENT_HEARTBEAT_INTERVAL_SECONDS", "60")
+        )
+        self.timeout_seconds = timeout_seconds or float(
+            os.getenv("AGENT_HEARTBEAT_TIMEOUT_SECONDS", "180")
+        )
+        self.flush_seconds = flush_seconds or float(
+            os.getenv("AGENT_HEARTBEAT_FLUSH_SECONDS", "10")
+        )
+        self._on_change = on_change
+        self._agents: Dict[str, _AgentEntry] = {}
+        self._deadlines: List[Tuple[float, int, str]] = []
+        self._wakeup = asyncio.Event()
+        self._stats = {
+            "heartbeats": 0,
+            "write_through": 0,
+            "flushes": 0,
+            "flushed_rows": 0,
+            "timeouts": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # State
+    # -------------------------------------------------------------------------
+
+    def _schedule(self, entry: _AgentEntry) -> None:
+        """Push a fresh deadline; older heap items for the agent go stale."""
+        entry.generation += 1
+        if entry.status in _TERMINAL_STATUSES:
+            return
+        entry.deadline = time.monotonic() + self.timeout_seconds
+        heapq.heappush(self._deadlines, (entry.deadline, entry.generation, entry.agent_id))
+
+    def _notify(self, agent_id: str, previous: Optional[AgentState], current: AgentState) -> None:
+        """Invoke the change callback, never letting it break heartbeat handling."""
+        if self._on_change is None:
+            return
+        try:
+            self._on_change(agent_id, previous, current)
+        except Exception as e:
+            logger.warning(f"Heartbeat change callback failed for agent {agent_id}: {e}")
+
+    async def load(self) -> int:
+        """Seed the table from PostgreSQL.
+
+        Agents that are not offline get a full timeout from now, so agents
+        that died while the orchestrator was down are detected after one
+        timeout period.
+
+        Returns:
+            Number of agents loaded
+        """
+        agents = await self._db.list_agents(limit=10000)
+        now = datetime.now(timezone.utc)
+        for agent in agents:
+            agent_id = str(agent["id"])
+            job_id = agent.get("current_job_id")
+            entry = _AgentEntry(
+                agent_id=agent_id,
+                status=agent["status"],
+                current_job_id=str(job_id) if job_id else None,
+                last_seen=agent.get("last_heartbeat") or now,
+                deadline=0.0,
+            )
+            self._agents[agent_id] = entry
+            self._schedule(entry)
+        self._wakeup.set()
+        logger.info(f"Heartbeat table loaded {len(agents)} agent(s)")
+        return len(agents)
+
+    def register(self, agent_id: str) -> None:
+        """Track a freshly (re-)registered agent, which starts as 'booting'."""
+        previous = self._agents.get(agent_id)
+        entry = _AgentEntry(
+            agent_id=agent_id,
+            status="booting",
+            current_job_id=None,
+            last_seen=datetime.now(timezone.utc),
+            deadline=0.0,
+        )
+        if previous is not None:
+            entry.generation = previous.generation
+        self._agents[agent_id] = entry
+        self._schedule(entry)
+        self._notify(
+            agent_id,
+            (previous.status, previous.current_job_id) if previous else None,
+            ("booting", None),
+        )
+
+    def forget(self, agent_id: str) -> None:
+        """Stop tracking a deregistered agent."""
+        self._agents.pop(agent_id, None)
+
+    async def record(
+        self,
+        agent_id: str,
+        status: str,
+        current_job_id: Optional[str] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Absorb a heartbeat.
+
+        Transitions are persisted immediately via ``PostgresDB.heartbeat``;
+        unchanged beats are buffered for the next batch flush.
+
+        Returns:
+            True if the agent exists, False otherwise
+        """
+        self._stats["heartbeats"] += 1
+        now = datetime.now(timezone.utc)
+        entry = self._agents.get(agent_id)
+        previous = (entry.status, entry.current_job_id) if entry else None
+        current = (status, current_job_id)
+
+        if entry is None or previous != current:
+            if not await self._db.heartbeat(
+                agent_id=agent_id,
+                status=status,
+                current_job_id=current_job_id,
+                metrics=metrics,
+            ):
+                self._agents.pop(agent_id, None)
+                return False
+            self._stats["write_through"] += 1
+            if entry is None:
+                entry = _AgentEntry(agent_id, status, current_job_id, now, 0.0)
+                self._agents[agent_id] = entry
+            entry.status, entry.current_job_id = current
+            entry.dirty = False
+            entry.pending_metrics.clear()
+            entry.last_seen = now
+            self._schedule(entry)
+            self._notify(agent_id, previous, current)
+            return True
+
+        entry.last_seen = now
+        entry.dirty = True
+        if metrics:
+            entry.pending_metrics.update(metrics)
+        self._schedule(entry)
+        return True
+
+    def is_alive(self, agent_id: str) -> bool:
+        """True if the agent is tracked and its deadline has not passed."""
+        entry = self._agents.get(agent_id)
+        return (
+            entry is not None
+            and entry.status not in _TERMINAL_STATUSES
+            and entry.deadline > time.monotonic()
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for heartbeats absorbed versus rows written."""
+        return {
+            **self._stats,
+            "tracked_agents": len(self._agents),
+            "dirty_agents": sum(1 for e in self._agents.values() if e.dirty),
+            "interval_seconds": self.interval_seconds,
+            "timeout_seconds": self.timeout_seconds,
+            "flush_seconds": self.flush_seconds,
+        }
+
+    # -------------------------------------------------------------------------
+    # Background work
+    # -------------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Persist buffered heartbeats in one batched statement.
+
+        Returns:
+            Number of agent rows written
+        """
+        batch = []
+        for entry in self._agents.values():
+            if entry.dirty:
+                batch.append({
+                    "agent_id": entry.agent_id,
+                    "last_heartbeat": entry.last_seen,
+                    "metrics": dict(entry.pending_metrics),
+                })
+                entry.dirty = False
+                entry.pending_metrics.clear()
+
+        if not batch:
+            return 0
+
+        try:
+            written = await self._db.flush_heartbeats(batch)
+        except Exception:
+            # Re-mark so the next flush retries (newer beats keep their data)
+            for hb in batch:
+                entry = self._agents.get(hb["agent_id"])
+                if entry is not None and not entry.dirty:
+                    entry.dirty = True
+                    entry.pending_metrics = {**hb["metrics"], **entry.pending_metrics}
+            raise
+
+        self._stats["flushes"] += 1
+        self._stats["flushed_rows"] += written
+        return written
+
+    async def expire_due(self) -> List[str]:
+        """Mark every agent whose deadline has passed as offline.
+
+        Returns:
+            IDs of agents marked offline
+        """
+        now = time.monotonic()
+        expired: List[_AgentEntry] = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, generation, agent_id = heapq.heappop(self._deadlines)
+            entry = self._agents.get(agent_id)
+            if entry is None or entry.generation != generation:
+                continue  # Superseded by a later heartbeat
+            expired.append(entry)
+
+        if not expired:
+            return []
+
+        try:
+            marked = await self._db.mark_agents_offline([e.agent_id for e in expired])
+        except Exception:
+            # Put the deadlines back so the next detector pass retries
+            for entry in expired:
+                heapq.heappush(
+                    self._deadlines, (entry.deadline, entry.generation, entry.agent_id)
+                )
+            raise
+        marked_set = set(marked)
+        for entry in expired:
+            previous = (entry.status, entry.current_job_id)
+            entry.status = "offline"
+            entry.generation += 1
+            if entry.agent_id in marked_set:
+                self._notify(entry.agent_id, previous, ("offline", entry.current_job_id))
+
+        self._stats["timeouts"] += len(marked)
+        if marked:
+            logger.info(f"Marked {len(marked)} agent(s) as offline due to missed heartbeats")
+        return marked
+
+    async def _run_detector(self, shutdown_event: asyncio.Event) -> None:
+        """Sleep until the earliest deadline, then expire due agents."""
+        while not shutdown_event.is_set():
+            failed = False
+            try:
+                await self.expire_due()
+            except Exception as e:
+                logger.error(f"Error in stale agent detector: {e}")
+                failed = True
+
+            delay = self.timeout_seconds
+            if self._deadlines:
+                delay = max(0.0, self._deadlines[0][0] - time.monotonic())
+            if failed:
+                # Expired deadlines were put back; don't retry in a tight loop
+                delay = max(delay, min(self.flush_seconds, self.timeout_seconds))
+            self._wakeup.clear()
+            await _wait_any(shutdown_event, self._wakeup, timeout=delay)
+
+    async def _run_flusher(self, shutdown_event: asyncio.Event) -> None:
+        """Flush buffered heartbeats periodically and once more at shutdown."""
+        while not shutdown_event.is_set():
+            await _wait_any(shutdown_event, timeout=self.flush_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush heartbeats: {e}")
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Run the deadline detector and batch flusher until shutdown."""
+        logger.info(
+            f"Heartbeat table started (timeout={self.timeout_seconds}s, "
+            f"flush={self.flush_seconds}s)"
+        )
+        await asyncio.gather(
+            self._run_detector(shutdown_event),
+            self._run_flusher(shutdown_event),
+        )
+        logger.info("Heartbeat table stopped")
+
+
+async def _wait_any(*events: asyncio.Event, timeout: float) -> None:
+    """Wait until any event is set or the timeout elapses."""
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+__all__ = ['HeartbeatTable']
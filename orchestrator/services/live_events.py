@@ -0,0 +1,455 @@
+"""Live audit and chat event fan-out for the cockpit.
+
+Provides a JobEventBroker that turns new ``agent_audit`` and ``chat_history``
+documents (written by the agent's LLMArchiver) into per-job event streams.
+Each watched job costs the database one upstream subscription regardless
+of how many viewers are attached:
+
+- On replica sets a single MongoDB change stream covers every job and is
+  resumed from its last token after errors.
+- On standalone servers one tailing task per watched job polls for entries
+  after the last seen ``(step_number|sequence_number, _id)`` position.
+
+Events carry an opaque id encoding the viewer's position in both
+collections. Reconnecting with that id (SSE ``Last-Event-ID``) backfills
+anything missed before switching back to live delivery.
+"""
+
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+try:
+    from bson import ObjectId
+except ImportError:
+    ObjectId = None
+
+if TYPE_CHECKING:
+    from database import MongoDB
+
+logger = logging.getLogger(__name__)
+
+# Event stream name -> (collection, sort field)
+STREAMS: Dict[str, Tuple[str, str]] = {
+    "audit": ("agent_audit", "step_number"),
+    "chat": ("chat_history", "sequence_number"),
+}
+COLLECTION_STREAMS: Dict[str, str] = {coll: name for name, (coll, _) in STREAMS.items()}
+
+Position = Tuple[Any, str]
+
+# Position before a stream's first entry (the stream was empty at subscribe time)
+STREAM_START: Position = (None, "")
+
+
+def encode_event_id(positions: Dict[str, Optional[Position]]) -> str:
+    """Encode per-stream positions as an opaque SSE event id."""
+    payload = {name: list(pos) for name, pos in positions.items() if pos is not None}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_event_id(token: str) -> Dict[str, Optional[Position]]:
+    """Decode an event id from :func:`encode_event_id`.
+
+    Unknown or malformed tokens decode to no positions, which makes the
+    subscriber start from live events only. The same goes for a stream
+    whose position is neither :data:`STREAM_START` nor a numeric sort value
+    and an ObjectId.
+    """
+    positions: Dict[str, Optional[Position]] = {name: None for name in STREAMS}
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        logger.warning("Ignoring malformed live event id")
+        return positions
+
+    if isinstance(payload, dict):
+        for name in STREAMS:
+            pos = payload.get(name)
+            if _is_valid_position(pos):
+                positions[name] = (pos[0], pos[1])
+            elif pos is not None:
+                logger.warning(f"Ignoring invalid {name} position in live event id")
+    return positions
+
+
+def _is_valid_position(pos: Any) -> bool:
+    """Whether a decoded position can be used in a keyset query."""
+    if not isinstance(pos, list) or len(pos) != 2:
+        return False
+    if tuple(pos) == STREAM_START:
+        return True
+    value, last_id = pos
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        return False
+    if not isinstance(last_id, str):
+        return False
+    if ObjectId is None:
+        return len(last_id) == 24 and all(c in "0123456789abcdefABCDEF" for c in last_id)
+    return ObjectId.is_valid(last_id)
+
+
+def _position_of(stream: str, doc: Dict[str, Any]) -> Position:
+    """Keyset position of a serialized document within its stream."""
+    _, sort_field = STREAMS[stream]
+    return (doc.get(sort_field), doc["_id"])
+
+
+def _is_after(position: Position, last: Optional[Position]) -> bool:
+    """Whether ``position`` comes strictly after ``last``.
+
+    ObjectId hex strings have fixed width, so string comparison preserves
+    their ordering.
+    """
+    if last is None or last == STREAM_START:
+        return True
+    try:
+        return position > last
+    except TypeError:
+        return True
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    """A single viewer attached to a job channel."""
+
+    queue: asyncio.Queue
+    closed: bool = False
+
+
+@dataclass
+class _JobChannel:
+    """Fan-out point for one job: its viewers and upstream tail task."""
+
+    job_id: str
+    subscribers: Set[_Subscriber] = field(default_factory=set)
+    tail_task: Optional[asyncio.Task] = None
+
+
+class Subscription:
+    """A viewer's handle on a job's live event stream.
+
+    Obtain via :meth:`JobEventBroker.subscribe`. Iterate :meth:`events` to
+    receive ``{"id", "event", "data"}`` dicts; ``None`` is yielded as a
+    keep-alive tick when nothing arrived within the keep-alive interval.
+    """
+
+    def __init__(
+        self,
+        broker: "JobEventBroker",
+        job_id: str,
+        subscriber: _Subscriber,
+        positions: Dict[str, Optional[Position]],
+    ) -> None:
+        self._broker = broker
+        self._job_id = job_id
+        self._subscriber = subscriber
+        self._positions = positions
+
+    def _make_event(self, stream: str, doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Advance this viewer's position and build the event, or skip duplicates."""
+        position = _position_of(stream, doc)
+        if not _is_after(position, self._positions[stream]):
+            return None
+        self._positions[stream] = position
+        return {"id": encode_event_id(self._positions), "event": stream, "data": doc}
+
+    async def events(self, keepalive: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield events until the broker stops or this viewer falls behind.
+
+        A viewer whose queue overflows is disconnected; reconnecting with the
+        last received event id backfills the gap from MongoDB. Every event id
+        carries a position for each stream, so all streams are backfilled.
+        """
+        for stream in STREAMS:
+            if self._positions[stream] is None:
+                continue
+            async for doc in self._broker._backfill(self._job_id, stream, self._positions[stream]):
+                event = self._make_event(stream, doc)
+                if event is not None:
+                    yield event
+
+        queue = self._subscriber.queue
+        while not self._subscriber.closed:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if item is None:
+                break
+            stream, doc = item
+            event = self._make_event(stream, doc)
+            if event is not None:
+                yield event
+
+
+class JobEventBroker:
+    """Single-upstream, many-viewer broker for job audit and chat events.
+
+    Example:
+        ```python
+        broker = JobEventBroker(mongodb)
+        await broker.start()
+
+        async with broker.subscribe("abc-123", last_event_id=None) as sub:
+            async for event in sub.events():
+                ...
+
+        await broker.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        mongodb: "MongoDB",
+        poll_interval: Optional[float] = None,
+        queue_size: int = 1000,
+    ) -> None:
+        """Initialize the broker.
+
+        Args:
+            mongodb: Shared MongoDB instance
+            poll_interval: Seconds between tail polls in fallback mode.
+                Falls back to LIVE_EVENTS_POLL_INTERVAL env var (default 1.0).
+            queue_size: Buffered events per viewer before it is disconnected
+        """
+        self._mongodb = mongodb
+        self._poll_interval = poll_interval or float(os.getenv("LIVE_EVENTS_POLL_INTERVAL", "1.0"))
+        self._queue_size = queue_size
+        self._channels: Dict[str, _JobChannel] = {}
+        self._mode = "disabled"
+        self._change_stream_task: Optional[asyncio.Task] = None
+        self._resume_token: Optional[Dict[str, Any]] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def mode(self) -> str:
+        """Upstream mode: ``change_stream``, ``tail`` or ``disabled``."""
+        return self._mode
+
+    @property
+    def is_enabled(self) -> bool:
+        """True if live events can be served."""
+        return self._mode != "disabled"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current mode, watched jobs and viewer counts."""
+        return {
+            "mode": self._mode,
+            "watched_jobs": len(self._channels),
+            "viewers": sum(len(c.subscribers) for c in self._channels.values()),
+            "upstream_subscriptions": (
+                1 if self._change_stream_task is not None
+                else sum(1 for c in self._channels.values() if c.tail_task is not None)
+            ),
+        }
+
+    async def start(self) -> None:
+        """Select the upstream mode and start the change stream if supported."""
+        self._stopping.clear()
+        if not self._mongodb.is_available:
+            self._mode = "disabled"
+            logger.info("Live events disabled (MongoDB not available)")
+            return
+
+        if await self._mongodb.supports_change_streams():
+            self._mode = "change_stream"
+            self._change_stream_task = asyncio.create_task(self._run_change_stream())
+        else:
+            self._mode = "tail"
+        logger.info(f"Live events started (mode={self._mode})")
+
+    async def stop(self) -> None:
+        """Stop upstream tasks and disconnect all viewers."""
+        self._stopping.set()
+
+        tasks = [c.tail_task for c in self._channels.values() if c.tail_task is not None]
+        if self._change_stream_task is not None:
+            tasks.append(self._change_stream_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._change_stream_task = None
+
+        for channel in self._channels.values():
+            for subscriber in channel.subscribers:
+                self._close_subscriber(subscriber)
+        self._channels.clear()
+        logger.info("Live events stopped")
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        job_id: str,
+        last_event_id: Optional[str] = None,
+    ) -> AsyncIterator[Subscription]:
+        """Attach a viewer to a job's event stream.
+
+        Streams without a position in ``last_event_id`` start from their
+        newest entry at subscribe time, so every event id carries a position
+        for each stream and a later reconnect resumes all of them. These
+        positions are taken before the viewer is registered, and the viewer
+        is registered before any backfill runs, so no event can fall between
+        the backfill and live delivery; duplicates are dropped by position.
+
+        Args:
+            job_id: Job to watch
+            last_event_id: Event id to resume after (SSE ``Last-Event-ID``)
+
+        Yields:
+            Subscription to iterate
+        """
+        positions = decode_event_id(last_event_id) if last_event_id else {name: None for name in STREAMS}
+        for stream in STREAMS:
+            if positions[stream] is None:
+                positions[stream] = await self._current_position(job_id, stream)
+
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = _JobChannel(job_id=job_id)
+            self._channels[job_id] = channel
+
+        subscriber = _Subscriber(queue=asyncio.Queue(maxsize=self._queue_size))
+        channel.subscribers.add(subscriber)
+
+        if self._mode == "tail" and channel.tail_task is None:
+            channel.tail_task = asyncio.create_task(self._run_tail(channel))
+
+        try:
+            yield Subscription(self, job_id, subscriber, positions)
+        finally:
+            channel.subscribers.discard(subscriber)
+            if not channel.subscribers and self._channels.get(job_id) is channel:
+                del self._channels[job_id]
+                if channel.tail_task is not None:
+                    channel.tail_task.cancel()
+
+    # -------------------------------------------------------------------------
+    # Fan-out
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _close_subscriber(subscriber: _Subscriber) -> None:
+        """Mark a viewer closed and wake it if it is waiting."""
+        subscriber.closed = True
+        try:
+            subscriber.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    def _publish(self, job_id: str, stream: str, doc: Dict[str, Any]) -> None:
+        """Deliver a document to every viewer of a job."""
+        channel = self._channels.get(job_id)
+        if channel is None:
+            return
+        for subscriber in list(channel.subscribers):
+            if subscriber.closed:
+                continue
+            try:
+                subscriber.queue.put_nowait((stream, doc))
+            except asyncio.QueueFull:
+                logger.warning(f"Live event viewer for job {job_id} fell behind, disconnecting")
+                subscriber.closed = True
+
+    async def _current_position(self, job_id: str, stream: str) -> Optional[Position]:
+        """Position of a stream's newest entry, STREAM_START if it has none.
+
+        Returns None (no backfill for the stream) if the lookup fails.
+        """
+        collection, sort_field = STREAMS[stream]
+        try:
+            position = await self._mongodb.get_last_position(collection, job_id, sort_field)
+        except Exception as e:
+            logger.warning(f"Could not read {stream} position for job {job_id}: {e}")
+            return None
+        return position if position is not None else STREAM_START
+
+    async def _backfill(
+        self,
+        job_id: str,
+        stream: str,
+        after: Optional[Position],
+        batch_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a stream's entries after a position, in order."""
+        collection, sort_field = STREAMS[stream]
+        if after == STREAM_START:
+            after = None
+        while True:
+            docs = await self._mongodb.get_entries_after(collection, job_id, sort_field, after, batch_size)
+            for doc in docs:
+                yield doc
+            if len(docs) < batch_size:
+                return
+            after = _position_of(stream, docs[-1])
+
+    # -------------------------------------------------------------------------
+    # Upstream sources
+    # -------------------------------------------------------------------------
+
+    async def _run_change_stream(self) -> None:
+        """Consume the shared change stream, reconnecting from the last token."""
+        backoff = 1.0
+        while not self._stopping.is_set():
+            try:
+                async for collection, doc, token in self._mongodb.watch_inserts(
+                    list(COLLECTION_STREAMS), resume_after=self._resume_token
+                ):
+                    self._resume_token = token
+                    backoff = 1.0
+                    self._publish(doc.get("job_id"), COLLECTION_STREAMS[collection], doc)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Live event change stream interrupted: {e}")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                backoff = min(backoff * 2, 30.0)
+
+    async def _run_tail(self, channel: _JobChannel) -> None:
+        """Poll one job's collections for new entries while it has viewers."""
+        positions: Dict[str, Optional[Position]] = {}
+        try:
+            for stream, (collection, sort_field) in STREAMS.items():
+                positions[stream] = await self._mongodb.get_last_position(
+                    collection, channel.job_id, sort_field
+                )
+
+            while channel.subscribers and not self._stopping.is_set():
+                for stream in STREAMS:
+                    async for doc in self._backfill(channel.job_id, stream, positions[stream]):
+                        positions[stream] = _position_of(stream, doc)
+                        self._publish(channel.job_id, stream, doc)
+
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Live event tail for job {channel.job_id} failed: {e}")
+            for subscriber in channel.subscribers:
+                self._close_subscriber(subscriber)
+        finally:
+            channel.tail_task = None
+
+
+__all__ = [
+    'JobEventBroker',
+    'STREAM_START',
+    'Subscription',
+    'encode_event_id',
+    'decode_event_id',
+]
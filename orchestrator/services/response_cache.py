@@ -0,0 +1,340 @@
+"""Response cache for read-heavy orchestrator endpoints.
+
+Provides a ResponseCache that memoizes endpoint results with per-route
+TTLs, tag-based invalidation and request coalescing: concurrent identical
+requests share a single in-flight backend query. Storage is pluggable via
+CacheBackend; the default InMemoryCacheBackend is a size-bounded LRU.
+
+Typical use on a FastAPI route:
+
+    ```python
+    response_cache = ResponseCache()
+
+    @app.get("/api/stats/jobs")
+    @response_cache.cached("stats_jobs", ttl=10, tags=lambda **_: ["jobs"])
+    async def get_job_statistics() -> dict[str, int]:
+        ...
+
+    # Somewhere a job changes status
+    response_cache.invalidate("jobs")
+    ```
+
+Only successful results are stored; exceptions (including HTTPException)
+propagate to every coalesced caller and are not cached.
+
+Configuration:
+    RESPONSE_CACHE_ENABLED: Set to "false" to bypass caching entirely.
+    RESPONSE_CACHE_MAX_ENTRIES: LRU bound for the in-memory backend (default 2048).
+"""
+
+import asyncio
+import copy
+import functools
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached responses.
+
+    Backends that drop entries on their own (LRU eviction, expiry) call
+    ``on_evict`` with each dropped key, so the cache can forget its tags.
+    """
+
+    on_evict: Optional[Callable[[CacheKey], None]] = None
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for a key, honouring expiry."""
+
+    @abstractmethod
+    def set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+
+    @abstractmethod
+    def delete(self, key: CacheKey) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all keys."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries (expired entries may be included)."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._evicted(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: CacheKey, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._evicted(evicted)
+
+    def delete(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evicted(self, key: CacheKey) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+
+class ResponseCache:
+    """TTL response cache with tag invalidation and request coalescing."""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend. Defaults to an in-memory LRU sized by
+                RESPONSE_CACHE_MAX_ENTRIES.
+            enabled: Whether caching is active. Falls back to
+                RESPONSE_CACHE_ENABLED env var (default true).
+        """
+        if backend is None:
+            backend = InMemoryCacheBackend(int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048")))
+        if enabled is None:
+            enabled = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+        self._backend = backend
+        self._backend.on_evict = self._forget_key
+        self._enabled = enabled
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._tag_keys: Dict[str, Set[CacheKey]] = defaultdict(set)
+        self._key_tags: Dict[CacheKey, Set[str]] = defaultdict(set)
+        # Bumped on invalidation so results computed before it are not stored
+        self._tag_generations: Dict[str, int] = defaultdict(int)
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+        )
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if responses are being cached."""
+        return self._enabled
+
+    async def get_or_compute(
+        self,
+        route: str,
+        key: CacheKey,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """Return a cached value or compute it once for all concurrent callers.
+
+        Args:
+            route: Route name used for statistics and as key prefix
+            key: Request-specific key parts (e.g. query parameters)
+            compute: Coroutine factory producing the response
+            ttl: Seconds to keep the result
+            tags: Invalidation tags the result depends on
+
+        Returns:
+            The (possibly cached) response. Callers receive a deep copy so
+            mutating it cannot corrupt the cache.
+        """
+        stats = self._stats[route]
+        if not self._enabled or ttl <= 0:
+            stats["misses"] += 1
+            return await compute()
+
+        full_key: CacheKey = (route, *key)
+        found, value = self._backend.get(full_key)
+        if found:
+            stats["hits"] += 1
+            return copy.deepcopy(value)
+
+        inflight = self._inflight.get(full_key)
+        if inflight is not None:
+            stats["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        stats["misses"] += 1
+        tags = tuple(tags)
+        generations = {tag: self._tag_generations[tag] for tag in tags}
+        task = asyncio.ensure_future(
+            self._compute_and_store(route, full_key, compute, ttl, generations)
+        )
+        task.add_done_callback(_mark_retrieved)
+        self._inflight[full_key] = task
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _compute_and_store(
+        self,
+        route: str,
+        full_key: CacheKey,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        generations: Dict[str, int],
+    ) -> Any:
+        """Compute a response once for every coalesced caller and store it.
+
+        Runs as its own task, so a caller that disconnects (including the
+        one that started it) does not cancel the others.
+        """
+        try:
+            value = await compute()
+        except Exception:
+            self._stats[route]["errors"] += 1
+            raise
+        finally:
+            self._inflight.pop(full_key, None)
+
+        if all(self._tag_generations[tag] == gen for tag, gen in generations.items()):
+            self._backend.set(full_key, value, ttl)
+            for tag in generations:
+                self._tag_keys[tag].add(full_key)
+                self._key_tags[full_key].add(tag)
+        return value
+
+    def cached(
+        self,
+        route: str,
+        ttl: float,
+        tags: Optional[Callable[..., Iterable[str]]] = None,
+        ttl_for: Optional[Callable[..., float]] = None,
+    ) -> Callable:
+        """Decorator caching an async endpoint by its keyword arguments.
+
+        The wrapped function keeps its signature so FastAPI still resolves
+        query and path parameters from it.
+
+        Args:
+            route: Route name for statistics and keys
+            ttl: Default TTL in seconds
+            tags: Callable receiving the endpoint kwargs, returning tags
+            ttl_for: Optional callable receiving the kwargs, returning a TTL
+                that overrides ``ttl`` (e.g. longer for immutable refs)
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())) + tuple(args)
+                return await self.get_or_compute(
+                    route,
+                    key,
+                    lambda: func(*args, **kwargs),
+                    ttl=ttl_for(**kwargs) if ttl_for else ttl,
+                    tags=tags(**kwargs) if tags else (),
+                )
+            return wrapper
+        return decorator
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every cached response carrying any of the given tags.
+
+        Also prevents in-flight computations started before the call from
+        storing their (possibly stale) result.
+
+        Returns:
+            Number of cache entries removed
+        """
+        removed = 0
+        for tag in tags:
+            self._tag_generations[tag] += 1
+            for key in self._tag_keys.pop(tag, set()):
+                self._backend.delete(key)
+                self._forget_key(key)
+                removed += 1
+        if removed:
+            self._invalidations += removed
+            logger.debug(f"Response cache invalidated {removed} entries for tags {tags}")
+        return removed
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        for tag in list(self._tag_keys):
+            self._tag_generations[tag] += 1
+        self._tag_keys.clear()
+        self._key_tags.clear()
+        self._backend.clear()
+
+    def _forget_key(self, key: CacheKey) -> None:
+        """Remove a key that left the backend from its tag sets."""
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per route and overall."""
+        routes = {route: dict(counts) for route, counts in self._stats.items()}
+        hits = sum(c["hits"] + c["coalesced"] for c in routes.values())
+        misses = sum(c["misses"] for c in routes.values())
+        return {
+            "enabled": self._enabled,
+            "entries": len(self._backend),
+            "inflight": len(self._inflight),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            "invalidations": self._invalidations,
+            "routes": routes,
+        }
+
+
+def _mark_retrieved(task: asyncio.Future) -> None:
+    """Keep failures nobody waited for out of the unretrieved-exception log."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a request argument into a hashable key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+__all__ = [
+    'CacheBackend',
+    'InMemoryCacheBackend',
+    'ResponseCache',
+]
@@ -0,0 +1,315 @@
+"""Automatic job scheduler for ready agents.
+
+Provides a JobScheduler that drains the job queue (jobs in 'created' status
+with ``queued_at`` set) onto ready agents:
+
+- Claims pair one job with one agent atomically via
+  ``PostgresDB.claim_next_job`` (``FOR UPDATE SKIP LOCKED``), so several
+  schedulers can run against the same database.
+- Jobs are ordered by priority, then by fair share across submitters
+  (fewest running jobs first), then by queue time. Agents must share the
+  job's config_name unless JOB_SCHEDULER_ALLOW_ANY_CONFIG is set.
+- If the agent rejects the job or is unreachable, the claim is released:
+  the job goes back to the queue with exponential backoff and the agent is
+  skipped for a cooldown period. After too many attempts the job fails.
+- The scheduler wakes on enqueue and whenever an agent becomes ready, with a
+  periodic poll as a safety net for backoff expiry.
+
+Queue wait and dispatch latency are tracked so agent pods can be scaled to
+demand (see ``get_stats`` and ``PostgresDB.get_queue_depth``).
+
+Configuration:
+    JOB_SCHEDULER_ENABLED: Set to "false" to disable automatic dispatch (default true)
+    JOB_SCHEDULER_POLL_SECONDS: Safety-net poll interval (default 5)
+    JOB_SCHEDULER_MAX_ATTEMPTS: Dispatch attempts before a job fails (default 5)
+    JOB_SCHEDULER_RETRY_BASE_SECONDS: First retry delay, doubled per attempt (default 5)
+    JOB_SCHEDULER_RETRY_MAX_SECONDS: Retry delay cap (default 300)
+    JOB_SCHEDULER_AGENT_COOLDOWN_SECONDS: How long a rejecting agent is skipped (default 60)
+    JOB_SCHEDULER_ALLOW_ANY_CONFIG: Allow config_name mismatches as fallback (default false)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+if TYPE_CHECKING:
+    from database import PostgresDB
+
+logger = logging.getLogger(__name__)
+
+DispatchCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Upper bound on claims per scheduling pass, so one pass cannot starve the loop
+_MAX_CLAIMS_PER_PASS = 50
+
+
+class JobDispatchError(Exception):
+    """Raised by the dispatch callback when an agent does not accept a job."""
+
+
+class _LatencyWindow:
+    """Running count/mean/max plus percentiles over recent samples."""
+
+    def __init__(self, size: int = 500) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def _percentile(self, fraction: float) -> Optional[float]:
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": self._percentile(0.5),
+            "p95": self._percentile(0.95),
+            "max": round(self.max, 3) if self.count else None,
+        }
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() not in ("0", "false", "no")
+
+
+class JobScheduler:
+    """Dispatches queued jobs to ready agents.
+
+    Example:
+        ```python
+        scheduler = JobScheduler(postgres_db, dispatch=start_job_on_agent)
+        task = asyncio.create_task(scheduler.run(shutdown_event))
+
+        await postgres_db.enqueue_job(job_id, priority=1, submitted_by="alice")
+        scheduler.notify()
+        ```
+    """
+
+    def __init__(
+        self,
+        postgres_db: "PostgresDB",
+        dispatch: DispatchCallback,
+        enabled: Optional[bool] = None,
+        poll_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        retry_max_seconds: Optional[float] = None,
+        agent_cooldown_seconds: Optional[float] = None,
+        allow_any_config: Optional[bool] = None,
+        on_job_change: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            postgres_db: Shared PostgresDB instance
+            dispatch: Coroutine receiving a claim dict (see
+                ``PostgresDB.claim_next_job``) that starts the job on the
+                agent. Must raise JobDispatchError if the agent refuses.
+            enabled: Whether to dispatch at all
+            poll_seconds: Safety-net poll interval
+            max_attempts: Dispatch attempts before a job is failed
+            retry_base_seconds: First retry delay (doubled per attempt)
+            retry_max_seconds: Cap for the retry delay
+            agent_cooldown_seconds: How long a rejecting agent is skipped
+            allow_any_config: Allow config_name mismatch as fallback
+            on_job_change: Called with the job ID when a claim changes a
+                job's status outside the dispatch callback (claim, release)
+        """
+        self._db = postgres_db
+        self._dispatch = dispatch
+        self.enabled = enabled if enabled is not None else _env_bool("JOB_SCHEDULER_ENABLED", True)
+        self.poll_seconds = poll_seconds or float(os.getenv("JOB_SCHEDULER_POLL_SECONDS", "5"))
+        self.max_attempts = max_attempts or int(os.getenv("JOB_SCHEDULER_MAX_ATTEMPTS", "5"))
+        self.retry_base_seconds = retry_base_seconds or float(
+            os.getenv("JOB_SCHEDULER_RETRY_BASE_SECONDS", "5")
+        )
+        self.retry_max_seconds = retry_max_seconds or float(
+            os.getenv("JOB_SCHEDULER_RETRY_MAX_SECONDS", "300")
+        )
+        self.agent_cooldown_seconds = agent_cooldown_seconds or float(
+            os.getenv("JOB_SCHEDULER_AGENT_COOLDOWN_SECONDS", "60")
+        )
+        self.allow_any_config = (
+            allow_any_config
+            if allow_any_config is not None
+            else _env_bool("JOB_SCHEDULER_ALLOW_ANY_CONFIG", False)
+        )
+
+        self._on_job_change = on_job_change
+        self._wakeup = asyncio.Event()
+        self._cooldowns: Dict[str, float] = {}
+        self._inflight: Set[asyncio.Task] = set()
+        self._queue_wait = _LatencyWindow()
+        self._dispatch_latency = _LatencyWindow()
+        self._stats = {
+            "passes": 0,
+            "claims": 0,
+            "dispatched": 0,
+            "rejected": 0,
+            "retried": 0,
+            "failed": 0,
+        }
+
+    def notify(self) -> None:
+        """Wake the scheduler (a job was queued or an agent became ready)."""
+        self._wakeup.set()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next dispatch attempt after ``attempts`` failures."""
+        return min(self.retry_base_seconds * (2 ** max(0, attempts - 1)), self.retry_max_seconds)
+
+    def _excluded_agents(self) -> list:
+        now = time.monotonic()
+        for agent_id in [a for a, until in self._cooldowns.items() if until <= now]:
+            del self._cooldowns[agent_id]
+        return list(self._cooldowns)
+
+    async def schedule_once(self) -> int:
+        """Claim as many job/agent pairs as are available and dispatch them.
+
+        Dispatches run as background tasks so a slow agent does not hold up
+        the others.
+
+        Returns:
+            Number of jobs claimed
+        """
+        self._stats["passes"] += 1
+        claimed = 0
+        while claimed < _MAX_CLAIMS_PER_PASS:
+            claim = await self._db.claim_next_job(
+                exclude_agent_ids=self._excluded_agents(),
+                allow_any_config=self.allow_any_config,
+            )
+            if claim is None:
+                break
+            claimed += 1
+            self._stats["claims"] += 1
+            self._job_changed(claim["job_id"])
+
+            queued_at = claim.get("queued_at")
+            if queued_at is not None:
+                wait = (datetime.now(timezone.utc) - queued_at).total_seconds()
+                self._queue_wait.add(max(0.0, wait))
+
+            task = asyncio.create_task(self._dispatch_claim(claim))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+        return claimed
+
+    async def _dispatch_claim(self, claim: Dict[str, Any]) -> None:
+        """Start a claimed job on its agent, releasing the claim on failure."""
+        job_id, agent_id = claim["job_id"], claim["agent_id"]
+        started = time.monotonic()
+        try:
+            await self._dispatch(claim)
+        except Exception as e:
+            self._stats["rejected"] += 1
+            self._cooldowns[agent_id] = time.monotonic() + self.agent_cooldown_seconds
+            await self._release(claim, e)
+            return
+
+        self._dispatch_latency.add(time.monotonic() - started)
+        self._stats["dispatched"] += 1
+        logger.info(
+            f"Scheduled job {job_id} on agent {agent_id} "
+            f"(attempt {claim['dispatch_attempts']}, config={claim['config_name']})"
+        )
+
+    async def _release(self, claim: Dict[str, Any], error: Exception) -> None:
+        """Requeue with backoff, or fail the job once attempts are exhausted."""
+        job_id, agent_id = claim["job_id"], claim["agent_id"]
+        attempts = claim["dispatch_attempts"]
+        if attempts >= self.max_attempts:
+            retry_at = None
+            message = f"Dispatch failed after {attempts} attempt(s): {error}"
+            self._stats["failed"] += 1
+            logger.error(f"Job {job_id}: {message}")
+        else:
+            delay = self.retry_delay(attempts)
+            retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            message = None
+            self._stats["retried"] += 1
+            logger.warning(
+                f"Agent {agent_id} did not accept job {job_id} ({error}); "
+                f"retrying in {delay:.0f}s"
+            )
+
+        try:
+            await self._db.release_job_claim(
+                job_id=job_id,
+                agent_id=agent_id,
+                queued_at=claim.get("queued_at"),
+                retry_at=retry_at,
+                error_message=message,
+            )
+        except Exception as e:
+            logger.error(f"Failed to release claim for job {job_id}: {e}")
+        self._job_changed(job_id)
+
+    def _job_changed(self, job_id: str) -> None:
+        """Invoke the job change callback, never letting it break scheduling."""
+        if self._on_job_change is None:
+            return
+        try:
+            self._on_job_change(job_id)
+        except Exception as e:
+            logger.warning(f"Job change callback failed for job {job_id}: {e}")
+
+    async def run(self, shutdown_event: asyncio.Event) -> None:
+        """Schedule until shutdown, then wait for in-flight dispatches."""
+        if not self.enabled:
+            logger.info("Job scheduler disabled")
+            return
+
+        logger.info(
+            f"Job scheduler started (poll={self.poll_seconds}s, "
+            f"max_attempts={self.max_attempts}, allow_any_config={self.allow_any_config})"
+        )
+        while not shutdown_event.is_set():
+            self._wakeup.clear()
+            try:
+                await self.schedule_once()
+            except Exception as e:
+                logger.error(f"Error in job scheduler: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        logger.info("Job scheduler stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """In-process scheduler counters and latency summaries (seconds)."""
+        return {
+            **self._stats,
+            "enabled": self.enabled,
+            "inflight_dispatches": len(self._inflight),
+            "cooling_down_agents": len(self._excluded_agents()),
+            "queue_wait_seconds": self._queue_wait.summary(),
+            "dispatch_latency_seconds": self._dispatch_latency.summary(),
+        }
+
+
+__all__ = [
+    'JobDispatchError',
+    'JobScheduler',
+]
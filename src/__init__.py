@@ -2,81 +2,62 @@
 Graph-RAG Requirement Analysis System
 
 Universal Agent architecture for requirement extraction and validation.
-"""
-
-__version__ = "2.0.0"
-
-# Universal Agent
-from .agent import UniversalAgent
-from .core.state import UniversalAgentState
-from .api.app import create_app
 
-# Shared utilities
-from .core.workspace import WorkspaceManager
-from .core.context import ContextManager
-
-# Managers package (nested loop architecture)
-from .managers import (
-    TodoManager,
-    TodoItem,
-    TodoStatus,
-    PlanManager,
-    MemoryManager,
-)
-
-# Context management exports (for tests)
-from .core.context import (
-    ContextConfig,
-    ContextManagementState,
-    ToolRetryManager,
-    count_tokens_tiktoken,
-    count_tokens_approximate,
-    get_token_counter,
-    write_error_to_workspace,
-)
+The exports below are imported on first access, so that importing one
+subpackage (``src.tools``, ``src.core.workspace``, ...) does not load the
+agent, the graph and the API app with all their dependencies.
+"""
 
-# Graph exports
-from .graph import (
-    build_nested_loop_graph,
-    run_graph_with_streaming,
-    get_managers_from_workspace,
-)
+import importlib
+from typing import Any
 
-# Loader exports
-from .core.loader import (
-    load_summarization_prompt,
-    get_all_tool_names,
-    AgentConfig,
-)
+__version__ = "2.0.0"
 
-__all__ = [
+# Exported name -> module defining it
+_EXPORTS = {
     # Universal Agent
-    'UniversalAgent',
-    'UniversalAgentState',
-    'create_app',
+    'UniversalAgent': 'agent',
+    'UniversalAgentState': 'core.state',
+    'create_app': 'api.app',
     # Managers (nested loop architecture)
-    'TodoManager',
-    'TodoItem',
-    'TodoStatus',
-    'PlanManager',
-    'MemoryManager',
+    'TodoManager': 'managers',
+    'TodoItem': 'managers',
+    'TodoStatus': 'managers',
+    'PlanManager': 'managers',
+    'MemoryManager': 'managers',
     # Shared utilities
-    'WorkspaceManager',
-    'ContextManager',
+    'WorkspaceManager': 'core.workspace',
+    'ContextManager': 'core.context',
     # Context management
-    'ContextConfig',
-    'ContextManagementState',
-    'ToolRetryManager',
-    'count_tokens_tiktoken',
-    'count_tokens_approximate',
-    'get_token_counter',
-    'write_error_to_workspace',
+    'ContextConfig': 'core.context',
+    'ContextManagementState': 'core.context',
+    'ToolRetryManager': 'core.context',
+    'count_tokens_tiktoken': 'core.context',
+    'count_tokens_approximate': 'core.context',
+    'get_token_counter': 'core.context',
+    'write_error_to_workspace': 'core.context',
     # Graph
-    'build_nested_loop_graph',
-    'run_graph_with_streaming',
-    'get_managers_from_workspace',
+    'build_nested_loop_graph': 'graph',
+    'run_graph_with_streaming': 'graph',
+    'get_managers_from_workspace': 'graph',
     # Loader
-    'load_summarization_prompt',
-    'get_all_tool_names',
-    'AgentConfig',
-]
+    'load_summarization_prompt': 'core.loader',
+    'get_all_tool_names': 'core.loader',
+    'AgentConfig': 'core.loader',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
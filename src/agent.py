@@ -12,13 +12,19 @@ Key Features:
 - Simplified 4-node LangGraph workflow
 """
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
 import shutil
+import time
 import zipfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import aiosqlite
 from langchain_core.language_models import BaseChatModel
@@ -26,6 +32,14 @@ from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 from .core.workspace import WorkspaceManager, WorkspaceManagerConfig, get_checkpoints_path
 from .core.phase_snapshot import PhaseSnapshotManager
+from .core import metrics
+from .core.graph_templates import (
+    JOB_BINDINGS_KEY,
+    GraphTemplate,
+    GraphTemplatePool,
+    JobBindings,
+    template_key,
+)
 from .core.loader import get_project_root
 from .managers import TodoManager
 from .tools import ToolContext, load_tools
@@ -33,13 +47,19 @@ from .core.state import UniversalAgentState, create_initial_state
 from .core.loader import (
     AgentConfig,
     load_agent_config,
-    create_llm,
+    get_llm,
     load_instructions,
     get_all_tool_names,
     resolve_config_path,
 )
 from .tools.description_manager import generate_workspace_tool_docs, apply_description_overrides
-from .graph import build_phase_alternation_graph, run_graph_with_streaming
+from .graph import (
+    build_graph_template,
+    create_context_manager,
+    create_retry_manager,
+    prepare_tools,
+    run_graph_with_streaming,
+)
 
 
 class _AiosqliteConnectionWrapper:
@@ -63,6 +83,9 @@ class _AiosqliteConnectionWrapper:
 
 logger = logging.getLogger(__name__)
 
+# Configs resolved from per-job overrides kept for reuse
+MAX_CACHED_JOB_CONFIGS = 32
+
 
 class UniversalAgent:
     """
@@ -102,6 +125,18 @@ class UniversalAgent:
         self._checkpointer: Optional[AsyncSqliteSaver] = None
         self._checkpoint_conn: Optional[aiosqlite.Connection] = None
 
+        # Reused across jobs (shared with job contexts): compiled graph
+        # templates, and configs resolved from per-job overrides
+        self._graph_templates = GraphTemplatePool()
+        self._job_configs: "OrderedDict[Tuple[str, ...], AgentConfig]" = OrderedDict()
+        self._graph_template: Optional[GraphTemplate] = None
+        self._job_bindings: Optional[JobBindings] = None
+
+        # Agent that owns shared resources and metrics (self, or the parent
+        # of a per-job context created via create_job_context())
+        self._owner: "UniversalAgent" = self
+        self._active_jobs: Dict[str, "UniversalAgent"] = {}
+
         # Phase-specific LLMs (created if phase overrides configured)
         self._strategic_llm: Optional[BaseChatModel] = None
         self._tactical_llm: Optional[BaseChatModel] = None
@@ -127,11 +162,68 @@ class UniversalAgent:
         # Metrics
         self._jobs_processed = 0
         self._start_time = datetime.utcnow()
+        self._job_started_at: Optional[float] = None
 
         logger.info(
             f"Created {config.display_name} (agent_id={config.agent_id})"
         )
 
+    def create_job_context(self) -> "UniversalAgent":
+        """Create an isolated execution context for one job.
+
+        The context shares this agent's initialized resources (PostgreSQL
+        connection, phase LLMs, base config, graph templates) but gets its
+        own workspace, todo manager, tools, tool context, checkpointer and
+        datasource connections, so several jobs can run concurrently in
+        one process. Jobs processed by the context are counted on this
+        agent.
+
+        Returns:
+            UniversalAgent to call process_job() on for a single job
+        """
+        job_agent = copy.copy(self)
+        job_agent._owner = self
+        job_agent._active_jobs = {}
+        job_agent.config = self._base_config
+        job_agent._llm_with_tools = None
+        job_agent._strategic_llm_with_tools = None
+        job_agent._tactical_llm_with_tools = None
+        job_agent._tools = None
+        job_agent._graph = None
+        job_agent._graph_template = None
+        job_agent._job_bindings = None
+        job_agent._checkpointer = None
+        job_agent._checkpoint_conn = None
+        job_agent._tool_context = None
+        job_agent._workspace_manager = None
+        job_agent._todo_manager = None
+        job_agent._current_job_id = None
+        job_agent._job_metadata = None
+        job_agent._datasource_connections = {}
+        job_agent._datasource_clients = {}
+        return job_agent
+
+    def _job_started(self, job_id: str) -> None:
+        """Track a job as active on the owning agent."""
+        self._current_job_id = job_id
+        self._job_started_at = time.monotonic()
+        self._owner._active_jobs[job_id] = self
+
+    def _job_finished(self, job_id: str, processed: bool = False, cancelled: bool = False) -> None:
+        """Clear per-job tracking; count the job if it ran to completion."""
+        self._current_job_id = None
+        if self._owner._active_jobs.get(job_id) is self:
+            del self._owner._active_jobs[job_id]
+        if processed:
+            self._owner._jobs_processed += 1
+
+        outcome = "completed" if processed else "cancelled" if cancelled else "failed"
+        metrics.JOBS.inc(outcome=outcome)
+        if self._job_started_at is not None:
+            metrics.JOB_SECONDS.observe(time.monotonic() - self._job_started_at)
+            self._job_started_at = None
+        metrics.JOB_ITERATION.remove(job_id=job_id)
+
     @property
     def agent_id(self) -> str:
         """Get the agent ID."""
@@ -209,7 +301,7 @@ class UniversalAgent:
             tactical_config = llm_config.get_phase_config("tactical")
             summarization_config = llm_config.get_phase_config("summarization")
 
-            self._strategic_llm = create_llm(strategic_config, limits=limits)
+            self._strategic_llm = get_llm(strategic_config, limits=limits)
             logger.info(f"Created strategic LLM: {strategic_config.model}")
 
             # Optimization: reuse LLM if same config
@@ -217,7 +309,7 @@ class UniversalAgent:
                 self._tactical_llm = self._strategic_llm
                 logger.info(f"Tactical LLM: reusing strategic ({tactical_config.model})")
             else:
-                self._tactical_llm = create_llm(tactical_config, limits=limits)
+                self._tactical_llm = get_llm(tactical_config, limits=limits)
                 logger.info(f"Created tactical LLM: {tactical_config.model}")
 
             if not llm_config.summarization:
@@ -232,14 +324,14 @@ class UniversalAgent:
                 self._summarization_llm = self._tactical_llm
                 logger.info(f"Summarization LLM: reusing tactical ({summarization_config.model})")
             else:
-                self._summarization_llm = create_llm(summarization_config, limits=limits)
+                self._summarization_llm = get_llm(summarization_config, limits=limits)
                 logger.info(f"Created summarization LLM: {summarization_config.model}")
 
             # Base LLM defaults to strategic for backwards compatibility
             self._llm = self._strategic_llm
         else:
             # No phase overrides - single LLM for all phases
-            self._llm = create_llm(llm_config, limits=limits)
+            self._llm = get_llm(llm_config, limits=limits)
             self._strategic_llm = self._llm
             self._tactical_llm = self._llm
             self._summarization_llm = self._llm
@@ -305,7 +397,7 @@ class UniversalAgent:
         # Reset config to base snapshot before applying per-job overrides
         self.config = self._base_config
 
-        self._current_job_id = job_id
+        self._job_started(job_id)
         self._job_metadata = metadata or {}
         self._datasource_connections = {}
         self._datasource_clients = {}
@@ -351,23 +443,9 @@ class UniversalAgent:
             # Create snapshot manager for phase recovery
             snapshot_manager = PhaseSnapshotManager(job_id)
 
-            # Build graph for this job
-            workspace_template = self._load_workspace_template()
-
-            self._graph = build_phase_alternation_graph(
-                strategic_llm_with_tools=self._strategic_llm_with_tools,
-                tactical_llm_with_tools=self._tactical_llm_with_tools,
-                tools=self._tools,
-                config=self.config,
-                workspace=self._workspace_manager,
-                todo_manager=self._todo_manager,
-                workspace_template=workspace_template,
-                checkpointer=self._checkpointer,
-                summarization_llm=self._summarization_llm,
-                snapshot_manager=snapshot_manager,
-                tool_context=self._tool_context,
-                postgres_db=self.postgres_conn,
-            )
+            # Check out a compiled graph for this config and tool set, and
+            # bind this job's objects to it
+            self._acquire_graph(snapshot_manager)
 
             # Execute graph
             # Use job_id as thread_id (new format), with fallback to legacy format for old jobs
@@ -482,6 +560,11 @@ class UniversalAgent:
                     metadata=updated_metadata,
                 )
 
+            # The graph's nodes and tool calls resolve this job's objects here
+            thread_config["configurable"][JOB_BINDINGS_KEY] = self._job_bindings
+            if self._job_started_at is not None:
+                metrics.JOB_SETUP_SECONDS.observe(time.monotonic() - self._job_started_at)
+
             # Inject feedback into graph state via aupdate_state
             # This sets resume_feedback so route_entry routes to restore_from_feedback
             if resume and feedback and graph_input is None:
@@ -499,25 +582,32 @@ class UniversalAgent:
 
             if stream:
                 # For streaming, cleanup happens inside the generator
-                return self._process_job_streaming(graph_input, thread_config)
+                return self._process_job_streaming(job_id, graph_input, thread_config)
             else:
+                processed = False
+                cancelled = False
                 try:
                     final_state = await self._graph.ainvoke(
                         graph_input,
                         config=thread_config,
                     )
-                    self._jobs_processed += 1
+                    processed = True
                     return dict(final_state)
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
                 finally:
-                    self._current_job_id = None
+                    self._job_finished(job_id, processed=processed, cancelled=cancelled)
                     self._close_datasource_connections()
                     await self._cleanup_checkpointer()
+                    self._release_graph(job_id)
 
         except Exception as e:
             logger.error(f"Job {job_id} failed: {e}", exc_info=True)
             self._close_datasource_connections()
             await self._cleanup_checkpointer()
-            self._current_job_id = None
+            self._release_graph(job_id)
+            self._job_finished(job_id)
             error_state = {
                 "job_id": job_id,
                 "error": {
@@ -532,6 +622,57 @@ class UniversalAgent:
                 return self._yield_error_state(error_state)
             return error_state
 
+    def _acquire_graph(self, snapshot_manager: PhaseSnapshotManager) -> None:
+        """Check out a graph template for this job and bind the job to it.
+
+        Templates are keyed by the resolved config, the tool set and the
+        workspace template, and are shared by all job contexts of the owning
+        agent. The job's workspace, managers and tools are passed to the
+        graph per run (see core.graph_templates); only the checkpointer is
+        set on the job's copy of the graph.
+        """
+        workspace_template = self._load_workspace_template()
+        tool_names = [tool.name for tool in self._tools]
+        key = template_key(self.config, tool_names, workspace_template)
+
+        def build() -> GraphTemplate:
+            return build_graph_template(
+                key,
+                strategic_llm=self._strategic_llm,
+                tactical_llm=self._tactical_llm,
+                tools=self._tools,
+                config=self.config,
+                workspace_template=workspace_template,
+                summarization_llm=self._summarization_llm,
+                postgres_db=self.postgres_conn,
+            )
+
+        template = self._owner._graph_templates.acquire(key, build)
+        self._graph_template = template
+        self._strategic_llm_with_tools = template.strategic_llm_with_tools
+        self._tactical_llm_with_tools = template.tactical_llm_with_tools
+        self._llm_with_tools = self._strategic_llm_with_tools
+
+        self._job_bindings = JobBindings(
+            workspace=self._workspace_manager,
+            todo_manager=self._todo_manager,
+            tool_context=self._tool_context,
+            context_mgr=create_context_manager(self.config),
+            retry_manager=create_retry_manager(self.config),
+            snapshot_manager=snapshot_manager,
+            tools={tool.name: tool for tool in prepare_tools(self._tools, self.config)},
+        )
+        self._graph = template.graph.copy(update={"checkpointer": self._checkpointer})
+
+    def _release_graph(self, job_id: str) -> None:
+        """Cancel the job's background summary and return its graph template for reuse."""
+        if self._job_bindings is not None:
+            self._job_bindings.context_mgr.cancel_background_summary(job_id)
+        template, self._graph_template = self._graph_template, None
+        self._job_bindings = None
+        if template is not None:
+            self._owner._graph_templates.release(template)
+
     async def _cleanup_checkpointer(self) -> None:
         """Clean up checkpointer connection."""
         if self._checkpoint_conn:
@@ -548,27 +689,35 @@ class UniversalAgent:
 
     async def _process_job_streaming(
         self,
+        job_id: str,
         graph_input: Optional[UniversalAgentState],
         config: Dict[str, Any],
     ) -> AsyncIterator[Dict[str, Any]]:
         """Process job with streaming state updates.
 
         Args:
+            job_id: Job being processed
             graph_input: Initial state for new jobs, or None to resume from checkpoint
             config: LangGraph config with thread_id
         """
+        processed = False
+        cancelled = False
         try:
             async for state in run_graph_with_streaming(
                 self._graph, graph_input, config
             ):
                 yield state
 
-            self._jobs_processed += 1
+            processed = True
+        except (asyncio.CancelledError, GeneratorExit):
+            cancelled = True
+            raise
         finally:
             # Clean up after streaming completes (or errors)
-            self._current_job_id = None
+            self._job_finished(job_id, processed=processed, cancelled=cancelled)
             self._close_datasource_connections()
             await self._cleanup_checkpointer()
+            self._release_graph(job_id)
 
     def _load_workspace_template(self) -> str:
         """Load the workspace.md template for the nested loop graph.
@@ -639,6 +788,41 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
         except Exception as e:
             logger.warning(f"Failed to inject repo context into workspace.md: {e}")
 
+    @staticmethod
+    def _config_digest(data: bytes) -> str:
+        """Short content hash used in job config cache keys."""
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def _cached_job_config(
+        self,
+        key: Tuple[str, ...],
+        load: Callable[[], AgentConfig],
+    ) -> AgentConfig:
+        """Resolve a per-job config once and reuse it for later jobs.
+
+        Resolved configs are treated as read-only, so jobs with the same
+        override share one AgentConfig (and with it the same LLMs and graph
+        template).
+        """
+        configs = self._owner._job_configs
+        config = configs.get(key)
+        if config is None:
+            config = load()
+            configs[key] = config
+            while len(configs) > MAX_CACHED_JOB_CONFIGS:
+                configs.popitem(last=False)
+        configs.move_to_end(key)
+        return config
+
+    def _uploaded_job_config(self, path: Path, digest: str) -> AgentConfig:
+        """AgentConfig of an uploaded config file merged with the defaults."""
+        from .core.loader import load_uploaded_config, load_agent_config_from_dict
+
+        return self._cached_job_config(
+            ("upload", digest),
+            lambda: load_agent_config_from_dict(load_uploaded_config(path)),
+        )
+
     async def _setup_job_workspace(
         self,
         job_id: str,
@@ -664,13 +848,13 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
             Updated metadata with workspace-relative paths
         """
         metadata = metadata or {}
+        config_source = "base"
 
         # Handle config upload - load and merge with defaults BEFORE workspace setup
         # This must happen first since config affects workspace settings
         if metadata.get("config_upload_id"):
             config_upload_id = metadata["config_upload_id"]
             from .core.workspace import get_workspace_base_path
-            from .core.loader import load_uploaded_config, load_agent_config_from_dict
             import tempfile
 
             config_loaded = False
@@ -691,11 +875,10 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
                         uploaded_config_path = yaml_files[0]
                         logger.info(f"Loading uploaded config (HTTP): {uploaded_config_path.name}")
 
-                        # Load and merge with defaults
-                        merged_config_data = load_uploaded_config(uploaded_config_path)
-
-                        # Create new config object (replaces self.config for this job)
-                        self.config = load_agent_config_from_dict(merged_config_data)
+                        # Load and merge with defaults (replaces self.config for this job)
+                        digest = self._config_digest(uploaded_config_path.read_bytes())
+                        self.config = self._uploaded_job_config(uploaded_config_path, digest)
+                        config_source = f"upload:{digest}"
                         logger.info("Applied uploaded config overrides")
                         config_loaded = True
 
@@ -712,11 +895,10 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
                         uploaded_config_path = yaml_files[0]
                         logger.info(f"Loading uploaded config (local): {uploaded_config_path.name}")
 
-                        # Load and merge with defaults
-                        merged_config_data = load_uploaded_config(uploaded_config_path)
-
-                        # Create new config object (replaces self.config for this job)
-                        self.config = load_agent_config_from_dict(merged_config_data)
+                        # Load and merge with defaults (replaces self.config for this job)
+                        digest = self._config_digest(uploaded_config_path.read_bytes())
+                        self.config = self._uploaded_job_config(uploaded_config_path, digest)
+                        config_source = f"upload:{digest}"
                         logger.info("Applied uploaded config overrides")
                     else:
                         logger.warning(
@@ -733,15 +915,21 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
             config_override = metadata["config_override"]
             logger.info(f"Applying inline config override: {list(config_override.keys())}")
 
-            # Convert current config to dict, merge, and reload
-            current_config_dict = dataclasses.asdict(self.config)
-            merged_config_data = deep_merge(current_config_dict, config_override)
-            self.config = load_agent_config_from_dict(merged_config_data)
+            # Convert current config to dict, merge, and reload (once per
+            # distinct override; the orchestrator's datasource override repeats)
+            current_config = self.config
+            override_json = json.dumps(config_override, sort_keys=True, default=str)
+            self.config = self._cached_job_config(
+                ("override", config_source, override_json),
+                lambda: load_agent_config_from_dict(
+                    deep_merge(dataclasses.asdict(current_config), config_override)
+                ),
+            )
             logger.info("Applied inline config overrides")
 
         # Recreate LLMs if config was modified for this job
         if metadata.get("config_upload_id") or metadata.get("config_override"):
-            logger.info("Config changed for this job — recreating LLMs")
+            logger.info("Config changed for this job — selecting phase LLMs")
             self._create_phase_llms()
 
         # Create workspace manager
@@ -753,6 +941,7 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
                 git_versioning=self.config.workspace.git_versioning,
                 git_ignore_patterns=self.config.workspace.git_ignore_patterns,
                 git_remote_url=metadata.get("git_remote_url"),
+                git_commit_batch_seconds=self.config.workspace.git_commit_batch_seconds,
             )
         )
 
@@ -1171,13 +1360,8 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
         # Domain tools get short descriptions; agent reads full docs from workspace
         self._tools = apply_description_overrides(self._tools)
 
-        # Bind tools to phase-specific LLMs
-        self._strategic_llm_with_tools = self._strategic_llm.bind_tools(self._tools)
-        self._tactical_llm_with_tools = self._tactical_llm.bind_tools(self._tools)
-
-        # Keep _llm_with_tools for backwards compatibility
-        self._llm_with_tools = self._strategic_llm_with_tools
-
+        # Tools are bound to the phase LLMs by the graph template (see
+        # _acquire_graph), which is reused by later jobs with the same tool set
         logger.debug(f"Loaded {len(self._tools)} tools")
 
         # Auto-register input documents as CitationEngine sources
@@ -1674,7 +1858,8 @@ curl -s -X POST "{gitea_api_base}/repos/{owner_repo}/pulls" \\
             "display_name": self.config.display_name,
             "initialized": self._initialized,
             "shutdown_requested": self._shutdown_requested,
-            "current_job": self._current_job_id,
+            "current_job": self._current_job_id or next(reversed(self._active_jobs), None),
+            "active_jobs": list(self._active_jobs),
             "jobs_processed": self._jobs_processed,
             "uptime_seconds": uptime,
             "connections": {
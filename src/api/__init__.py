@@ -4,6 +4,7 @@ FastAPI application and Pydantic models for HTTP interface.
 """
 
 from .app import create_app, set_config_path
+from .job_slots import JobSlots
 from .models import (
     JobStatus,
     HealthStatus,
@@ -17,6 +18,7 @@ from .models import (
 __all__ = [
     "create_app",
     "set_config_path",
+    "JobSlots",
     "JobStatus",
     "HealthStatus",
     "JobSubmitRequest",
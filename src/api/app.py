@@ -2,9 +2,13 @@
 
 Provides HTTP endpoints for health checks, agent status, and orchestrator
 integration. Jobs are received from the orchestrator via /job/start endpoint.
+
+Up to AGENT_MAX_CONCURRENT_JOBS jobs (default 1) run concurrently in one
+process, each in its own job context (see UniversalAgent.create_job_context).
 """
 
 import asyncio
+import contextvars
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -13,8 +17,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import PlainTextResponse
 
 from ..agent import UniversalAgent
+from ..core import metrics as agent_metrics
+from ..core.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics
 from ..core.loader import resolve_config_path
 from ..core.workspace import get_logs_path
 from .models import (
@@ -29,6 +36,7 @@ from .models import (
     JobCancelByOrchestratorRequest,
     JobResumeRequest,
 )
+from .job_slots import JobSlots
 from .orchestrator_client import OrchestratorClient, create_orchestrator_client_from_env
 
 logger = logging.getLogger(__name__)
@@ -41,8 +49,12 @@ _config_path: Optional[str] = None
 # Orchestrator integration state
 _orchestrator_client: Optional[OrchestratorClient] = None
 _heartbeat_task: Optional[asyncio.Task] = None
-_current_job_id: Optional[str] = None
-_current_job_task: Optional[asyncio.Task] = None
+_job_slots: Optional[JobSlots] = None
+
+# Job being processed by the current task (routes log records to job log files)
+_log_job_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "log_job_id", default=None
+)
 
 
 def set_config_path(path: str) -> None:
@@ -119,26 +131,40 @@ async def lifespan(app: FastAPI):
         await _orchestrator_client.deregister()
         await _orchestrator_client.close()
 
-    # Cancel any running job task
-    if _current_job_task and not _current_job_task.done():
-        _current_job_task.cancel()
-        try:
-            await _current_job_task
-        except asyncio.CancelledError:
-            pass
+    # Cancel any running job tasks
+    await _get_job_slots().cancel_all()
 
     if _agent:
         await _agent.shutdown()
 
+    from ..tools.research.utils.browser_pool import close_browser_pool
+    from ..tools.research.utils.network import close_research_sessions
+    from ..core.tool_executor import close_tool_thread_pool
+    await close_browser_pool()
+    await close_research_sessions()
+    close_tool_thread_pool()
+
     logger.info("Universal Agent application shutdown complete")
 
 
+def _get_job_slots() -> JobSlots:
+    """Get the job slot registry (created on first use)."""
+    global _job_slots
+    if _job_slots is None:
+        _job_slots = JobSlots()
+    return _job_slots
+
+
 def _get_agent_status_for_heartbeat() -> str:
-    """Get current agent status for heartbeat reporting."""
+    """Get current agent status for heartbeat reporting.
+
+    The agent reports 'ready' while it has a free job slot, so the
+    orchestrator keeps assigning work until every slot is taken.
+    """
     if _agent is None:
         return "booting"
 
-    if _current_job_id is not None:
+    if _get_job_slots().is_full():
         return "working"
 
     status = _agent.get_status()
@@ -149,26 +175,61 @@ def _get_agent_status_for_heartbeat() -> str:
 
 
 def _get_current_job_id() -> Optional[str]:
-    """Get current job ID for heartbeat reporting."""
-    return _current_job_id
+    """Get the most recently started job ID for heartbeat reporting."""
+    return _get_job_slots().latest_job_id()
 
 
 def _get_agent_metrics() -> Optional[Dict[str, Any]]:
     """Get agent metrics for heartbeat reporting."""
+    slots = _get_job_slots()
+    metrics: Dict[str, Any] = {
+        "job_slots": slots.max_jobs,
+        "job_slots_free": slots.free,
+        "active_jobs": slots.active_job_ids,
+    }
     try:
         import psutil
 
         process = psutil.Process()
-        return {
-            "memory_mb": process.memory_info().rss / (1024 * 1024),
-            "cpu_percent": process.cpu_percent(),
-        }
+        metrics["memory_mb"] = process.memory_info().rss / (1024 * 1024)
+        metrics["cpu_percent"] = process.cpu_percent()
     except ImportError:
         # psutil not installed
-        return None
+        pass
     except Exception as e:
         logger.debug(f"Failed to collect metrics: {e}")
-        return None
+    return metrics
+
+
+def _report_slot_change() -> None:
+    """Send a heartbeat right away after a job takes or frees a slot.
+
+    Without this the orchestrator would only learn about a freed slot on
+    the next periodic heartbeat.
+    """
+    if _orchestrator_client is None or not _orchestrator_client.agent_id:
+        return
+
+    async def _send() -> None:
+        try:
+            await _orchestrator_client.heartbeat(
+                _get_agent_status_for_heartbeat(),
+                _get_current_job_id(),
+                _get_agent_metrics(),
+            )
+        except Exception as e:
+            logger.debug(f"Slot heartbeat failed: {e}")
+
+    try:
+        asyncio.get_running_loop().create_task(_send())
+    except RuntimeError:
+        pass  # No running loop (shutdown)
+
+
+def _finish_job_slot(job_id: str) -> None:
+    """Release the current task's job slot and report the change."""
+    _get_job_slots().release(job_id, asyncio.current_task())
+    _report_slot_change()
 
 
 class _FlushingFileHandler(logging.FileHandler):
@@ -179,6 +240,22 @@ class _FlushingFileHandler(logging.FileHandler):
         self.flush()
 
 
+class _JobLogFilter(logging.Filter):
+    """Keep other concurrent jobs' records out of a job's log file.
+
+    Records logged outside any job context (shared services, startup) are
+    kept, as they were before jobs could run concurrently.
+    """
+
+    def __init__(self, job_id: str):
+        super().__init__()
+        self.job_id = job_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        current = _log_job_id.get()
+        return current is None or current == self.job_id
+
+
 def _setup_job_file_logging(job_id: str) -> Path:
     """Set up file logging for a specific job in server mode.
 
@@ -205,6 +282,7 @@ def _setup_job_file_logging(job_id: str) -> Path:
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     ))
+    file_handler.addFilter(_JobLogFilter(job_id))
 
     # Add to root logger
     root_logger = logging.getLogger()
@@ -247,14 +325,15 @@ async def _process_orchestrator_job(
 
     This runs in the background after accepting a job from the orchestrator.
     Uses streaming mode with iteration logging and per-job file logging.
+    The job runs in its own job context, isolated from other running jobs.
     """
-    global _current_job_id
-
     if _agent is None:
         logger.error("Cannot process job - agent not initialized")
+        _finish_job_slot(job_id)
         return
 
     # Set up per-job file logging for crash safety
+    _log_job_id.set(job_id)
     _setup_job_file_logging(job_id)
 
     try:
@@ -285,7 +364,8 @@ async def _process_orchestrator_job(
 
         # Process the job with streaming for iteration logging
         final_state = None
-        streaming_gen = await _agent.process_job(job_id, metadata, stream=True)
+        job_agent = _agent.create_job_context()
+        streaming_gen = await job_agent.process_job(job_id, metadata, stream=True)
         async for state in streaming_gen:
             final_state = state
             if isinstance(state, dict):
@@ -302,8 +382,26 @@ async def _process_orchestrator_job(
     except Exception as e:
         logger.error(f"Orchestrator job {job_id} failed: {e}", exc_info=True)
     finally:
-        _current_job_id = None
         _cleanup_job_file_handler(job_id)
+        _finish_job_slot(job_id)
+
+
+def _reserve_job_slot(job_id: str) -> None:
+    """Reserve a job slot or raise 409 Conflict."""
+    slots = _get_job_slots()
+    if slots.has_job(job_id):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job {job_id} is already running on this agent",
+        )
+    if not slots.reserve(job_id):
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"Agent is busy: all {slots.max_jobs} job slot(s) in use "
+                f"({', '.join(slots.active_job_ids)})"
+            ),
+        )
 
 
 def create_app(config_path: Optional[str] = None) -> FastAPI:
@@ -393,42 +491,42 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         status = _agent.get_status()
         return AgentStatusResponse(**status)
 
-    # Metrics endpoint
+    # Metrics endpoints
+
+    @app.get("/metrics", response_class=PlainTextResponse, tags=["Monitoring"])
+    async def get_metrics() -> PlainTextResponse:
+        """Prometheus metrics for the agent's hot paths.
+
+        LLM latency and tokens, tool latency, context compaction, archiver
+        writes, git commits, snapshots and job outcomes, all collected in
+        process (no database queries).
+        """
+        return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
 
-    @app.get("/metrics", response_model=MetricsResponse, tags=["Monitoring"])
-    async def get_metrics() -> MetricsResponse:
-        """Get agent metrics for monitoring."""
+    @app.get("/metrics/summary", response_model=MetricsResponse, tags=["Monitoring"])
+    async def get_metrics_summary() -> MetricsResponse:
+        """JSON summary of job metrics collected by this process."""
         if _agent is None:
             raise HTTPException(status_code=503, detail="Agent not initialized")
 
         status = _agent.get_status()
+        job_durations = agent_metrics.JOB_SECONDS.totals()
+        iterations = agent_metrics.JOB_ITERATION.values().values()
 
-        # Get job statistics from database
-        jobs_success = 0
-        jobs_failed = 0
-
-        if _agent.postgres_conn:
-            try:
-                success_count = await _agent.postgres_conn.fetchval(
-                    "SELECT COUNT(*) FROM jobs WHERE status = 'complete'"
-                )
-                failed_count = await _agent.postgres_conn.fetchval(
-                    "SELECT COUNT(*) FROM jobs WHERE status = 'failed'"
-                )
-                jobs_success = success_count or 0
-                jobs_failed = failed_count or 0
-            except Exception as e:
-                logger.warning(f"Error fetching metrics: {e}")
+        from ..tools.research.utils.network import get_session_pool
 
         return MetricsResponse(
             agent_id=status["agent_id"],
             timestamp=datetime.utcnow(),
             jobs_total=status["jobs_processed"],
-            jobs_success=jobs_success,
-            jobs_failed=jobs_failed,
-            average_duration_seconds=None,  # TODO: Calculate from job history
-            current_iterations=0,  # Would need to track in agent
+            jobs_success=int(agent_metrics.JOBS.value(outcome="completed")),
+            jobs_failed=int(agent_metrics.JOBS.value(outcome="failed")),
+            average_duration_seconds=(
+                job_durations["sum"] / job_durations["count"] if job_durations["count"] else None
+            ),
+            current_iterations=int(max(iterations, default=0)),
             uptime_seconds=status["uptime_seconds"],
+            research_http=get_session_pool().get_stats(),
         )
 
     # =========================================================================
@@ -441,7 +539,7 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         status_code=202,
         tags=["Orchestrator"],
         responses={
-            409: {"model": ErrorResponse, "description": "Agent is busy"},
+            409: {"model": ErrorResponse, "description": "No free job slot or job already running"},
             503: {"model": ErrorResponse, "description": "Agent not initialized"},
         },
     )
@@ -453,25 +551,15 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
 
         This endpoint is called by the orchestrator to assign a job to this agent.
         The job is processed in the background and the endpoint returns immediately
-        with a 202 Accepted status.
+        with a 202 Accepted status. Rejected with 409 when every job slot is taken.
         """
-        global _current_job_id, _current_job_task
-
         if _agent is None:
             raise HTTPException(status_code=503, detail="Agent not initialized")
 
-        # Check if already processing a job
-        if _current_job_id is not None:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Agent is busy processing job {_current_job_id}",
-            )
-
-        # Accept the job
-        _current_job_id = request.job_id
+        _reserve_job_slot(request.job_id)
 
         # Start processing in background
-        _current_job_task = asyncio.create_task(
+        task = asyncio.create_task(
             _process_orchestrator_job(
                 job_id=request.job_id,
                 description=request.description,
@@ -487,8 +575,13 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
                 datasources=request.datasources,
             )
         )
+        _get_job_slots().attach(request.job_id, task)
+        _report_slot_change()
 
-        logger.info(f"Accepted job {request.job_id} from orchestrator")
+        logger.info(
+            f"Accepted job {request.job_id} from orchestrator "
+            f"({_get_job_slots().busy}/{_get_job_slots().max_jobs} slots busy)"
+        )
 
         return JobStartResponse(
             job_id=request.job_id,
@@ -500,38 +593,43 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         "/job/cancel",
         tags=["Orchestrator"],
         responses={
+            400: {"model": ErrorResponse, "description": "job_id required"},
             404: {"model": ErrorResponse, "description": "No job running"},
         },
     )
     async def cancel_current_job(
         request: JobCancelByOrchestratorRequest,
     ) -> Dict[str, Any]:
-        """Cancel the currently running job.
+        """Cancel a running job.
 
         This endpoint is called by the orchestrator to gracefully cancel
-        the current job processing.
+        a job. Other jobs running in this process are not affected.
+        ``job_id`` may be omitted when exactly one job is running.
         """
-        global _current_job_id, _current_job_task
+        slots = _get_job_slots()
+        job_id = request.job_id
+        if job_id is None:
+            active = slots.active_job_ids
+            if not active:
+                raise HTTPException(
+                    status_code=404,
+                    detail="No job currently running",
+                )
+            if len(active) > 1:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Several jobs are running ({', '.join(active)}); specify job_id",
+                )
+            job_id = active[0]
+
+        reason = request.reason or "Cancelled by orchestrator"
 
-        if _current_job_id is None:
+        if not await slots.cancel(job_id):
             raise HTTPException(
                 status_code=404,
-                detail="No job currently running",
+                detail=f"Job {job_id} is not running on this agent",
             )
-
-        job_id = _current_job_id
-        reason = request.reason or "Cancelled by orchestrator"
-
-        # Cancel the job task
-        if _current_job_task and not _current_job_task.done():
-            _current_job_task.cancel()
-            try:
-                await _current_job_task
-            except asyncio.CancelledError:
-                pass
-
-        _current_job_id = None
-        _current_job_task = None
+        _report_slot_change()
 
         logger.info(f"Cancelled job {job_id}: {reason}")
 
@@ -547,7 +645,7 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         status_code=202,
         tags=["Orchestrator"],
         responses={
-            409: {"model": ErrorResponse, "description": "Agent is busy"},
+            409: {"model": ErrorResponse, "description": "No free job slot or job already running"},
             503: {"model": ErrorResponse, "description": "Agent not initialized"},
         },
     )
@@ -560,8 +658,6 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         This endpoint resumes a previously started job from its last phase snapshot.
         Optional feedback can be injected before resuming.
         """
-        global _current_job_id, _current_job_task
-
         if _agent is None:
             raise HTTPException(status_code=503, detail="Agent not initialized")
 
@@ -572,15 +668,7 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
                 f"Will attempt to discover correct checkpoint."
             )
 
-        # Check if already processing a job
-        if _current_job_id is not None:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Agent is busy processing job {_current_job_id}",
-            )
-
-        # Accept the resume request
-        _current_job_id = request.job_id
+        _reserve_job_slot(request.job_id)
 
         # Capture for closure
         feedback = request.feedback
@@ -597,9 +685,10 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
 
         # Start processing in background
         async def _resume_job():
-            global _current_job_id
+            _log_job_id.set(request.job_id)
             try:
-                result = await _agent.process_job(
+                job_agent = _agent.create_job_context()
+                result = await job_agent.process_job(
                     request.job_id,
                     metadata=resume_metadata if resume_metadata else None,
                     resume=True,
@@ -613,9 +702,10 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
             except Exception as e:
                 logger.error(f"Resumed job {request.job_id} failed: {e}", exc_info=True)
             finally:
-                _current_job_id = None
+                _finish_job_slot(request.job_id)
 
-        _current_job_task = asyncio.create_task(_resume_job())
+        _get_job_slots().attach(request.job_id, asyncio.create_task(_resume_job()))
+        _report_slot_change()
 
         logger.info(f"Accepted resume request for job {request.job_id}")
 
@@ -627,10 +717,18 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
 
     @app.get("/job/current", tags=["Orchestrator"])
     async def get_current_job() -> Dict[str, Any]:
-        """Get information about the currently running job."""
+        """Get information about running jobs and job slots.
+
+        ``job_id`` is the most recently started job; ``is_busy`` means no
+        slot is free for another job.
+        """
+        slots = _get_job_slots()
         return {
-            "job_id": _current_job_id,
-            "is_busy": _current_job_id is not None,
+            "job_id": slots.latest_job_id(),
+            "is_busy": slots.is_full(),
+            "active_jobs": slots.active_job_ids,
+            "job_slots": slots.max_jobs,
+            "job_slots_free": slots.free,
         }
 
     return app
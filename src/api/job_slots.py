@@ -0,0 +1,136 @@
+"""Job slot tracking for running several jobs in one agent process.
+
+Jobs spend most of their time waiting on LLM responses, so a single pod can
+interleave several of them on one event loop. JobSlots bounds how many run
+at once and keeps the asyncio task of each running job so it can be
+cancelled individually.
+
+Configuration:
+    AGENT_MAX_CONCURRENT_JOBS: Number of job slots (default 1)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobSlots:
+    """Bounded registry of running jobs and their tasks.
+
+    Slots are reserved before the job task exists (so two concurrent start
+    requests cannot both take the last slot) and released by the task's
+    done callback.
+
+    Example:
+        ```python
+        slots = JobSlots(max_jobs=4)
+
+        if not slots.reserve(job_id):
+            raise HTTPException(status_code=409, detail="No free job slots")
+        slots.attach(job_id, asyncio.create_task(run_job(job_id)))
+
+        await slots.cancel(job_id)
+        ```
+    """
+
+    def __init__(self, max_jobs: Optional[int] = None) -> None:
+        """Initialize the slot registry.
+
+        Args:
+            max_jobs: Number of concurrent jobs. Defaults to
+                AGENT_MAX_CONCURRENT_JOBS or 1.
+        """
+        if max_jobs is None:
+            max_jobs = int(os.getenv("AGENT_MAX_CONCURRENT_JOBS", "1"))
+        self.max_jobs = max(1, max_jobs)
+        # Insertion-ordered: job_id -> task (None while the job is starting)
+        self._jobs: Dict[str, Optional[asyncio.Task]] = {}
+
+    @property
+    def active_job_ids(self) -> List[str]:
+        """IDs of jobs holding a slot, oldest first."""
+        return list(self._jobs)
+
+    @property
+    def busy(self) -> int:
+        """Number of occupied slots."""
+        return len(self._jobs)
+
+    @property
+    def free(self) -> int:
+        """Number of free slots."""
+        return max(0, self.max_jobs - len(self._jobs))
+
+    def is_full(self) -> bool:
+        """Whether every slot is occupied."""
+        return self.free == 0
+
+    def has_job(self, job_id: str) -> bool:
+        """Whether the job currently holds a slot."""
+        return job_id in self._jobs
+
+    def latest_job_id(self) -> Optional[str]:
+        """The most recently started job, or None when idle."""
+        return next(reversed(self._jobs), None) if self._jobs else None
+
+    def reserve(self, job_id: str) -> bool:
+        """Reserve a slot for a job.
+
+        Returns:
+            False if the job already holds a slot or no slot is free
+        """
+        if job_id in self._jobs or self.is_full():
+            return False
+        self._jobs[job_id] = None
+        return True
+
+    def attach(self, job_id: str, task: asyncio.Task) -> None:
+        """Bind the job's task to its slot; the slot frees when the task ends."""
+        self._jobs[job_id] = task
+        task.add_done_callback(lambda _: self.release(job_id, task))
+
+    def release(self, job_id: str, task: Optional[asyncio.Task] = None) -> None:
+        """Free a job's slot.
+
+        Args:
+            job_id: Job to release
+            task: If given, only release while the slot still belongs to
+                this task (guards against a restarted job losing its slot)
+        """
+        current = self._jobs.get(job_id)
+        if task is not None and current is not None and current is not task:
+            return
+        self._jobs.pop(job_id, None)
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a running job and wait for it to stop.
+
+        Returns:
+            False if the job does not hold a slot
+        """
+        if job_id not in self._jobs:
+            return False
+        task = self._jobs.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Job {job_id} raised while cancelling: {e}")
+        self.release(job_id)
+        return True
+
+    async def cancel_all(self) -> None:
+        """Cancel every running job (used on shutdown)."""
+        for job_id in self.active_job_ids:
+            await self.cancel(job_id)
+
+
+__all__ = [
+    "JobSlots",
+]
@@ -167,6 +167,9 @@ class AgentStatusResponse(BaseModel):
     display_name: str = Field(..., description="Display name")
     initialized: bool = Field(..., description="Whether agent is initialized")
     current_job: Optional[str] = Field(None, description="Currently processing job")
+    active_jobs: List[str] = Field(
+        default_factory=list, description="All jobs currently running in this process"
+    )
     jobs_processed: int = Field(..., description="Total jobs processed")
     uptime_seconds: float = Field(..., description="Uptime in seconds")
     connections: Dict[str, bool] = Field(..., description="Connection status")
@@ -231,6 +234,9 @@ class MetricsResponse(BaseModel):
     )
     current_iterations: int = Field(default=0, description="Iterations in current job")
     uptime_seconds: float = Field(..., description="Agent uptime")
+    research_http: Optional[Dict[str, Any]] = Field(
+        None, description="Research HTTP pool stats (connection reuse, per-host latency)"
+    )
 
 
 # =============================================================================
@@ -311,8 +317,12 @@ class JobStartResponse(BaseModel):
 
 
 class JobCancelByOrchestratorRequest(BaseModel):
-    """Request from orchestrator to cancel current job."""
+    """Request from orchestrator to cancel a running job."""
 
+    job_id: Optional[str] = Field(
+        default=None,
+        description="Job to cancel (may be omitted when only one job is running)",
+    )
     reason: Optional[str] = Field(
         default=None,
         description="Reason for cancellation",
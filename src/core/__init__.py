@@ -3,45 +3,57 @@
 Contains state management, context handling, workspace operations,
 and supporting infrastructure.
 
+Exports are imported on first access, so that importing a single module
+(``src.core.workspace``, ``src.core.metrics``) does not load the LLM
+clients and LangGraph.
+
 NOTE: For TodoManager, use src.agent.managers.TodoManager instead.
 """
 
-from .state import UniversalAgentState, create_initial_state
-from .loader import (
-    AgentConfig,
-    load_agent_config,
-    create_llm,
-    load_instructions,
-    get_all_tool_names,
-    resolve_config_path,
-)
-from .context import (
-    ContextConfig,
-    ContextManager,
-    ToolRetryManager,
-)
-from .workspace import WorkspaceManager, WorkspaceManagerConfig
-from .archiver import get_archiver, LLMArchiver
-
-__all__ = [
+import importlib
+from typing import Any
+
+# Exported name -> (submodule, attribute)
+_EXPORTS = {
     # State
-    "UniversalAgentState",
-    "create_initial_state",
+    "UniversalAgentState": ("state", "UniversalAgentState"),
+    "create_initial_state": ("state", "create_initial_state"),
     # Loader
-    "AgentConfig",
-    "load_agent_config",
-    "create_llm",
-    "load_instructions",
-    "get_all_tool_names",
-    "resolve_config_path",
+    "AgentConfig": ("loader", "AgentConfig"),
+    "load_agent_config": ("loader", "load_agent_config"),
+    "create_llm": ("loader", "create_llm"),
+    "get_llm": ("loader", "get_llm"),
+    "load_instructions": ("loader", "load_instructions"),
+    "get_all_tool_names": ("loader", "get_all_tool_names"),
+    "resolve_config_path": ("loader", "resolve_config_path"),
     # Context
-    "ContextConfig",
-    "ContextManager",
-    "ToolRetryManager",
+    "ContextConfig": ("context", "ContextConfig"),
+    "ContextManager": ("context", "ContextManager"),
+    "ToolRetryManager": ("context", "ToolRetryManager"),
     # Workspace
-    "WorkspaceManager",
-    "WorkspaceManagerConfig",
+    "WorkspaceManager": ("workspace", "WorkspaceManager"),
+    "WorkspaceManagerConfig": ("workspace", "WorkspaceManagerConfig"),
     # Archiver
-    "get_archiver",
-    "LLMArchiver",
-]
+    "get_archiver": ("archiver", "get_archiver"),
+    "LLMArchiver": ("archiver", "LLMArchiver"),
+    # Metrics
+    "METRICS_REGISTRY": ("metrics", "REGISTRY"),
+    "render_metrics": ("metrics", "render_metrics"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = target
+    value = getattr(importlib.import_module(f".{module}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -37,11 +37,12 @@ Usage:
     audit_trail = archiver.get_job_audit_trail(job_id="job-123")
 """
 
+import functools
 import logging
 import os
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, TypeVar
 
 from langchain_core.messages import (
     AIMessage,
@@ -51,8 +52,23 @@ from langchain_core.messages import (
     ToolMessage,
 )
 
+from .metrics import ARCHIVER_WRITE_SECONDS
+
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _timed_write(method: F) -> F:
+    """Record the write latency of an archiver method in the metrics registry."""
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ARCHIVER_WRITE_SECONDS.time(operation=method.__name__):
+            return method(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 def _serialize_for_mongo(obj: Any) -> Any:
     """Recursively serialize objects for MongoDB storage.
@@ -144,10 +160,12 @@ class LLMArchiver:
         self._collection = None
         self._audit_collection = None
         self._chat_history_collection = None
+        self._tool_schemas_collection = None
         self._connected = False
         self._connection_attempted = False
         self._step_counters: Dict[str, int] = {}  # Per-job step counters
         self._chat_sequence_counters: Dict[str, int] = {}  # Per-job chat sequence
+        self._stored_tool_schemas: Set[str] = set()  # Tool schema hashes already written
 
     @classmethod
     def from_env(cls) -> Optional["LLMArchiver"]:
@@ -200,6 +218,7 @@ class LLMArchiver:
             self._collection = self._mongo_db.db[self._collection_name]
             self._audit_collection = self._mongo_db.db[self._audit_collection_name]
             self._chat_history_collection = self._mongo_db.db["chat_history"]
+            self._tool_schemas_collection = self._mongo_db.db["tool_schemas"]
             self._connected = True
 
             logger.info(f"LLM Archiver connected to MongoDB: {self._database_name}")
@@ -259,6 +278,7 @@ class LLMArchiver:
             return s
         return s[:max_length] + "... [truncated]"
 
+    @_timed_write
     def archive(
         self,
         job_id: str,
@@ -273,6 +293,7 @@ class LLMArchiver:
         phase_number: Optional[int] = None,
         tool_schemas: Optional[List[Dict[str, Any]]] = None,
         model_kwargs: Optional[Dict[str, Any]] = None,
+        tool_schema_hash: Optional[str] = None,
     ) -> Optional[str]:
         """Archive an LLM request/response.
 
@@ -289,6 +310,10 @@ class LLMArchiver:
             phase_number: Current phase number
             tool_schemas: Tool definition schemas sent to the LLM (OpenAI format)
             model_kwargs: Model parameters (temperature, tool_choice, etc.)
+            tool_schema_hash: Content hash of tool_schemas (see
+                src/llm/tool_schemas.py). If given, the schemas are stored
+                once in the tool_schemas collection and the request only
+                references them.
 
         Returns:
             Inserted document ID, or None if archiving failed.
@@ -303,7 +328,10 @@ class LLMArchiver:
                 "message_count": len(messages),
             }
             if tool_schemas:
-                request_data["tools"] = tool_schemas
+                if tool_schema_hash and self._store_tool_schemas(tool_schema_hash, tool_schemas):
+                    request_data["tool_schema_hash"] = tool_schema_hash
+                else:
+                    request_data["tools"] = tool_schemas
                 request_data["tool_count"] = len(tool_schemas)
             if model_kwargs:
                 request_data["model_kwargs"] = model_kwargs
@@ -377,6 +405,32 @@ class LLMArchiver:
             logger.warning(f"Failed to archive LLM request: {e}")
             return None
 
+    def _store_tool_schemas(self, schema_hash: str, tool_schemas: List[Dict[str, Any]]) -> bool:
+        """Store a tool set in the tool_schemas collection (once per hash).
+
+        Returns:
+            True if the tool set is stored and can be referenced by hash
+        """
+        if schema_hash in self._stored_tool_schemas:
+            return True
+        if self._tool_schemas_collection is None:
+            return False
+        try:
+            self._tool_schemas_collection.update_one(
+                {"_id": schema_hash},
+                {"$setOnInsert": {
+                    "tools": tool_schemas,
+                    "tool_count": len(tool_schemas),
+                    "created_at": datetime.now(timezone.utc),
+                }},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store tool schemas {schema_hash}: {e}")
+            return False
+        self._stored_tool_schemas.add(schema_hash)
+        return True
+
     def get_conversation(
         self,
         job_id: str,
@@ -601,6 +655,7 @@ class LLMArchiver:
     # Agent Audit Methods - Complete execution history tracking
     # =========================================================================
 
+    @_timed_write
     def audit_step(
         self,
         job_id: str,
@@ -675,6 +730,7 @@ class LLMArchiver:
             logger.warning(f"Failed to audit step: {e}")
             return None
 
+    @_timed_write
     def audit_tool_call(
         self,
         job_id: str,
@@ -731,6 +787,8 @@ class LLMArchiver:
                     "result_size_bytes": None,
                     "success": None,
                     "error": None,
+                    "error_class": None,
+                    "cpu_ms": None,
                 },
                 "started_at": datetime.now(timezone.utc),
                 "completed_at": None,
@@ -740,6 +798,7 @@ class LLMArchiver:
             phase_number=phase_number,
         )
 
+    @_timed_write
     def update_tool_result(
         self,
         audit_doc_id: str,
@@ -747,6 +806,9 @@ class LLMArchiver:
         success: bool,
         latency_ms: int,
         error: Optional[str] = None,
+        cpu_ms: Optional[int] = None,
+        result_size_bytes: Optional[int] = None,
+        error_class: Optional[str] = None,
     ) -> bool:
         """Update a tool audit document with execution result.
 
@@ -754,8 +816,11 @@ class LLMArchiver:
             audit_doc_id: The document ID returned by audit_tool_call()
             result: Tool result content
             success: Whether tool succeeded
-            latency_ms: Tool execution time
+            latency_ms: Tool execution (wall) time
             error: Error message if failed
+            cpu_ms: CPU time spent in the tool
+            result_size_bytes: UTF-8 size of the result (defaults to len(result))
+            error_class: Exception class, or "ToolError" for reported failures
 
         Returns:
             True if update succeeded, False otherwise.
@@ -768,13 +833,20 @@ class LLMArchiver:
 
             update_data = {
                 "tool.result_preview": self._truncate_string(result, 500),
-                "tool.result_size_bytes": len(result) if result else 0,
+                "tool.result_size_bytes": (
+                    result_size_bytes if result_size_bytes is not None
+                    else len(result) if result else 0
+                ),
                 "tool.success": success,
                 "completed_at": datetime.now(timezone.utc),
                 "latency_ms": latency_ms,
             }
+            if cpu_ms is not None:
+                update_data["tool.cpu_ms"] = cpu_ms
             if error:
                 update_data["tool.error"] = self._truncate_string(error, 500)
+            if error_class:
+                update_data["tool.error_class"] = error_class
 
             result_obj = self._audit_collection.update_one(
                 {"_id": ObjectId(audit_doc_id)},
@@ -792,6 +864,7 @@ class LLMArchiver:
             logger.warning(f"Failed to update tool result: {e}")
             return False
 
+    @_timed_write
     def audit_llm_call(
         self,
         job_id: str,
@@ -803,6 +876,7 @@ class LLMArchiver:
         metadata: Optional[Dict[str, Any]] = None,
         phase: Optional[str] = None,
         phase_number: Optional[int] = None,
+        tool_schema_hash: Optional[str] = None,
     ) -> Optional[str]:
         """Audit an LLM call before execution.
 
@@ -817,6 +891,7 @@ class LLMArchiver:
             input_message_count: Number of messages sent to LLM
             state_message_count: Total messages in conversation state
             metadata: Additional metadata
+            tool_schema_hash: Hash of the tool set offered to the LLM
 
         Returns:
             Inserted document ID, or None if audit failed.
@@ -831,6 +906,7 @@ class LLMArchiver:
                 "llm": {
                     "model": model,
                     "input_message_count": input_message_count,
+                    "tool_schema_hash": tool_schema_hash,
                     # Response fields - null until update_llm_response() is called
                     "request_id": None,
                     "response_content_preview": None,
@@ -848,6 +924,7 @@ class LLMArchiver:
             phase_number=phase_number,
         )
 
+    @_timed_write
     def update_llm_response(
         self,
         audit_doc_id: str,
@@ -1040,6 +1117,7 @@ def archive_llm_request(
     phase_number: Optional[int] = None,
     tool_schemas: Optional[List[Dict[str, Any]]] = None,
     model_kwargs: Optional[Dict[str, Any]] = None,
+    tool_schema_hash: Optional[str] = None,
 ) -> Optional[str]:
     """Convenience function to archive an LLM request using default archiver.
 
@@ -1060,5 +1138,6 @@ def archive_llm_request(
             phase_number=phase_number,
             tool_schemas=tool_schemas,
             model_kwargs=model_kwargs,
+            tool_schema_hash=tool_schema_hash,
         )
     return None
@@ -8,17 +8,36 @@ Key strategies (in order of preference):
 2. Message trimming - Keep recent messages, trim older ones
 3. Summarization - Use LLM to compress history when needed
 
+Summarization can also start early: above a soft threshold the older,
+stable part of the history is summarized in a background task while the
+agent keeps working, and the summary is swapped in on a later turn. The
+blocking inline summarization remains the fallback when the hard
+threshold is reached first.
+
+Summaries form a hierarchy, so a compaction only recomputes the tier that
+overflows instead of re-summarizing everything before it:
+- recent turns stay verbatim
+- older turns of each phase are condensed into a per-phase summary; a
+  compaction extends the current phase's summary and leaves the others as
+  they are
+- once the earlier phases' summaries outgrow summary_digest_tokens, they are
+  folded into a single job-level digest
+
 References:
 - Anthropic: "one of the safest, lightest touch forms of compaction"
 - Phil Schmid: Context Engineering Part 2
 - LangGraph: Manage Conversation History
 """
 
+import asyncio
+import functools
 import logging
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import (
@@ -31,8 +50,86 @@ from langchain_core.messages import (
 )
 from pydantic import BaseModel, Field, field_validator
 
+from .metrics import COMPACTIONS, COMPACTION_SECONDS, SUMMARY_INPUT_TOKENS
+from .tool_results import get_result_handle, recall_hint
+
 logger = logging.getLogger(__name__)
 
+# Content prefix of the SystemMessages that carry conversation summaries
+SUMMARY_PREFIX = "[Summary of prior work]"
+
+# Per-message token counts kept by a ContextManager (least recently used evicted)
+TOKEN_CACHE_SIZE = 50_000
+
+# Summary tiers, recorded in the summary message's additional_kwargs:
+# - phase: summary of one phase's older turns, extended while the phase runs
+# - digest: compact job-level digest of phases that no longer fit as phase summaries
+SUMMARY_TIER_KEY = "summary_tier"
+SUMMARY_PHASE_KEY = "summary_phase"
+PHASE_SUMMARY = "phase"
+JOB_DIGEST = "digest"
+
+
+def is_summary_message(message: BaseMessage) -> bool:
+    """Whether a message is a conversation summary SystemMessage."""
+    return (
+        isinstance(message, SystemMessage)
+        and isinstance(message.content, str)
+        and message.content.startswith(SUMMARY_PREFIX)
+    )
+
+
+def summary_tier(message: BaseMessage) -> Tuple[str, Optional[int]]:
+    """Tier and phase number of a summary message.
+
+    Summaries written before tiers existed are rolling summaries of
+    everything before them, so they count as the job digest.
+    """
+    tier = message.additional_kwargs.get(SUMMARY_TIER_KEY, JOB_DIGEST)
+    if tier == PHASE_SUMMARY:
+        return tier, message.additional_kwargs.get(SUMMARY_PHASE_KEY)
+    return tier, None
+
+
+def make_summary_message(
+    summary: str,
+    tier: str = PHASE_SUMMARY,
+    phase_number: Optional[int] = None,
+    id: Optional[str] = None,
+) -> SystemMessage:
+    """Summary SystemMessage of a tier (see summary_tier())."""
+    if tier == JOB_DIGEST:
+        heading = f"{SUMMARY_PREFIX} (job digest)"
+    elif phase_number is not None:
+        heading = f"{SUMMARY_PREFIX} (phase {phase_number})"
+    else:
+        heading = SUMMARY_PREFIX
+    additional_kwargs: Dict[str, Any] = {SUMMARY_TIER_KEY: tier}
+    if tier == PHASE_SUMMARY:
+        additional_kwargs[SUMMARY_PHASE_KEY] = phase_number
+    return SystemMessage(
+        content=f"{heading}\n{summary}",
+        additional_kwargs=additional_kwargs,
+        id=id,
+    )
+
+
+def _split_summaries(
+    messages: List[BaseMessage],
+    phase_number: Optional[int],
+) -> Tuple[List[BaseMessage], List[BaseMessage]]:
+    """Summaries of the given phase, and all other summaries (history order)."""
+    phase_summaries: List[BaseMessage] = []
+    other_summaries: List[BaseMessage] = []
+    for msg in messages:
+        if not is_summary_message(msg):
+            continue
+        if summary_tier(msg) == (PHASE_SUMMARY, phase_number):
+            phase_summaries.append(msg)
+        else:
+            other_summaries.append(msg)
+    return phase_summaries, other_summaries
+
 
 class ConversationSummary(BaseModel):
     """Structured summary — forces the model to stop after valid JSON."""
@@ -215,11 +312,17 @@ class ContextConfig:
         keep_recent_messages: Number of recent messages to preserve
         max_tool_result_length: Max chars for truncated tool results
         placeholder_text: Text to use when replacing cleared tool results
+        spilled_preview_chars: Preview length kept when clearing a spilled result
         tool_retry_count: Number of retries for failed tool calls
         tool_retry_delay_seconds: Delay between retries
         model_max_context_tokens: Hard limit for model context window
         summarization_safe_limit: Max input tokens for summarization LLM
         summarization_chunk_size: Chunk size for recursive summarization
+        background_summarization_ratio: Start background summarization when
+            the summarization thresholds are exceeded at this fraction
+            (0 disables background summarization)
+        summary_digest_tokens: Fold the summaries of earlier phases into the
+            job digest once they exceed this many tokens
     """
     compaction_threshold_tokens: int = 100_000
     summarization_threshold_tokens: int = 100_000
@@ -229,12 +332,50 @@ class ContextConfig:
     keep_recent_messages: int = 10
     max_tool_result_length: int = 5000
     placeholder_text: str = "[Result processed - see workspace if needed]"
+    spilled_preview_chars: int = 300
     tool_retry_count: int = 3
     tool_retry_delay_seconds: float = 1.0
     # Safety layer constants
     model_max_context_tokens: int = 128_000
     summarization_safe_limit: int = 100_000
     summarization_chunk_size: int = 80_000
+    background_summarization_ratio: float = 0.0
+    summary_digest_tokens: int = 8_000
+
+
+@dataclass
+class _BackgroundSummary:
+    """A summarization of the older message prefix running in the background."""
+    # Resolves to (phase summary, job digest or None)
+    task: "asyncio.Task[Tuple[str, Optional[SystemMessage]]]"
+    # IDs of the summarized messages (phase summary first, then history order)
+    summarized_ids: List[str]
+    summarized_tokens: int
+    started_at: float
+    phase_number: Optional[int] = None
+    # IDs of the other summaries offered for folding into the job digest
+    fold_ids: List[str] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[Any]:
+    """tiktoken encoding for a model, resolved once (None if unavailable)."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    # Strip provider prefix (e.g., "openai/gpt-oss-120b" -> "gpt-oss-120b")
+    model_name = model.split("/")[-1] if "/" in model else model
+    try:
+        try:
+            enc = tiktoken.encoding_for_model(model_name)
+            logger.debug(f"Using tiktoken encoding for model {model_name}: {enc.name}")
+        except KeyError:
+            # Fall back to cl100k_base (used by GPT-4)
+            enc = tiktoken.get_encoding("cl100k_base")
+            logger.debug(f"Model {model_name} not found in tiktoken, using cl100k_base")
+        return enc
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, using approximate token counting: {e}")
+        return None
 
 
 def count_tokens_tiktoken(messages: List[BaseMessage], model: str = "gpt-4") -> int:
@@ -250,18 +391,11 @@ def count_tokens_tiktoken(messages: List[BaseMessage], model: str = "gpt-4") ->
     if not TIKTOKEN_AVAILABLE:
         return count_tokens_approximate(messages)
 
-    try:
-        # Try to get encoding for specific model
-        # Strip provider prefix (e.g., "openai/gpt-oss-120b" -> "gpt-oss-120b")
-        model_name = model.split("/")[-1] if "/" in model else model
-        try:
-            enc = tiktoken.encoding_for_model(model_name)
-            logger.debug(f"Using tiktoken encoding for model {model_name}: {enc.name}")
-        except KeyError:
-            # Fall back to cl100k_base (used by GPT-4)
-            enc = tiktoken.get_encoding("cl100k_base")
-            logger.debug(f"Model {model_name} not found in tiktoken, using cl100k_base")
+    enc = _get_encoding(model)
+    if enc is None:
+        return count_tokens_approximate(messages)
 
+    try:
         total = 0
         debug_details = []
         for i, msg in enumerate(messages):
@@ -335,6 +469,43 @@ def get_token_counter(model: str = "gpt-4") -> Callable[[List[BaseMessage]], int
     return count_tokens_approximate
 
 
+_MESSAGE_KINDS = frozenset({"remove", "system", "ai", "tool", "human"})
+
+
+def _message_kind(message: BaseMessage) -> str:
+    """Kind of a message by class (for subclasses with their own type)."""
+    if isinstance(message, RemoveMessage):
+        return "remove"
+    if isinstance(message, SystemMessage):
+        return "system"
+    if isinstance(message, AIMessage):
+        return "ai"
+    if isinstance(message, ToolMessage):
+        return "tool"
+    return "other"
+
+
+@dataclass
+class PreparedHistory:
+    """Message history split up for an LLM request.
+
+    Attributes:
+        history: Messages without RemoveMessage markers (the state view)
+        remove_markers: RemoveMessage markers from compaction
+        messages: History with old tool results cleared and orphaned
+            ToolMessages dropped
+        summaries: Summary SystemMessages from ``messages`` (sent first)
+        conversation: Non-system messages from ``messages``
+        type_counts: Message counts by class name (only when debug logging)
+    """
+    history: List[BaseMessage] = field(default_factory=list)
+    remove_markers: List[RemoveMessage] = field(default_factory=list)
+    messages: List[BaseMessage] = field(default_factory=list)
+    summaries: List[BaseMessage] = field(default_factory=list)
+    conversation: List[BaseMessage] = field(default_factory=list)
+    type_counts: Dict[str, int] = field(default_factory=dict)
+
+
 class ContextManager:
     """Manages context window for the Universal Agent.
 
@@ -373,14 +544,66 @@ class ContextManager:
             model: Model name for token counting
         """
         self.config = config or ContextConfig()
-        self.token_counter = get_token_counter(model)
+        # Counts are cached per message content, so repeated counts over a
+        # long history only tokenize new or changed messages
+        self._encoding = _get_encoding(model)
+        self._token_cache: "OrderedDict[Tuple[int, int, int], int]" = OrderedDict()
+        self._token_breakdown = os.getenv("DEBUG_TOKEN_BREAKDOWN", "").strip() in ("1", "true")
+        self._model = model
+        self.token_counter = self._count_tokens_cached
+        # Cleared copies of old tool results by message ID (original, copy)
+        self._cleared_results: Dict[str, Tuple[ToolMessage, ToolMessage]] = {}
         self._state = ContextManagementState()
+        # Background summaries by key (job ID)
+        self._background: Dict[str, _BackgroundSummary] = {}
 
     @property
     def state(self) -> ContextManagementState:
         """Get current context management state."""
         return self._state
 
+    def _message_tokens(self, message: BaseMessage) -> int:
+        """Token count of one message (chars when counting approximately)."""
+        content = message.content
+        if type(content) is not str:
+            content = str(content)
+        # Only AI messages have tool calls (getattr on other message models is slow)
+        kind = message.type
+        if kind not in _MESSAGE_KINDS:
+            kind = _message_kind(message)
+        tool_calls = message.tool_calls if kind == "ai" else None
+        calls = str(tool_calls) if tool_calls else ""
+        # String hashes are cached on the string objects, so keys of messages
+        # already in the history are cheap to compute
+        key = (hash(content), len(content), hash(calls))
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self._token_cache.move_to_end(key)
+            return cached
+
+        if self._encoding is not None:
+            count = len(self._encoding.encode(content, disallowed_special=()))
+            if calls:
+                count += len(self._encoding.encode(calls, disallowed_special=()))
+            count += 4  # Approximate overhead per message (role, etc.)
+        else:
+            count = len(content) + len(calls)
+
+        self._token_cache[key] = count
+        if len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return count
+
+    def _count_tokens_cached(self, messages: List[BaseMessage]) -> int:
+        """Token counter with per-message caching (same counts as get_token_counter)."""
+        if self._token_breakdown:
+            return count_tokens_tiktoken(messages, self._model)
+        total = sum(self._message_tokens(m) for m in messages)
+        if self._encoding is None:
+            # ~4 chars per token on average
+            return total // 4
+        return total
+
     def get_token_count(self, messages: List[BaseMessage]) -> int:
         """Get current token count for messages.
 
@@ -441,7 +664,8 @@ class ContextManager:
         """Replace old tool results with placeholder text.
 
         This is the "safest, lightest touch form of compaction" per Anthropic.
-        The agent can always re-read files from workspace if needed.
+        The agent can always re-read files from workspace if needed, and
+        spilled results can be read back with ``recall_tool_result``.
 
         Args:
             messages: Message list to process
@@ -470,10 +694,10 @@ class ContextManager:
 
         for i, msg in enumerate(messages):
             if i in indices_to_clear:
-                # Replace with placeholder
+                # Replace with placeholder (spilled results keep a handle and preview)
                 result.append(
                     ToolMessage(
-                        content=self.config.placeholder_text,
+                        content=self._cleared_content(msg),
                         tool_call_id=msg.tool_call_id,
                     )
                 )
@@ -487,6 +711,21 @@ class ContextManager:
 
         return result
 
+    def _cleared_content(self, message: ToolMessage) -> str:
+        """Placeholder for a cleared tool result."""
+        handle = get_result_handle(message)
+        if not handle or not isinstance(message.content, str):
+            return self.config.placeholder_text
+        preview_chars = self.config.spilled_preview_chars
+        preview = message.content[:preview_chars]
+        if len(message.content) > preview_chars:
+            preview += "..."
+        return (
+            f"[Result cleared from context - stored as {handle} "
+            f"({len(message.content)} chars), use {recall_hint(handle)} to read it]\n"
+            f"{preview}"
+        )
+
     def truncate_long_tool_results(
         self,
         messages: List[BaseMessage],
@@ -524,9 +763,15 @@ class ContextManager:
         for i, msg in enumerate(messages):
             if isinstance(msg, ToolMessage) and i not in recent_indices:
                 if len(msg.content) > max_length:
+                    omitted = len(msg.content) - max_length
+                    handle = get_result_handle(msg)
+                    if handle:
+                        hint = f"use {recall_hint(handle, start=max_length)} to read the rest"
+                    else:
+                        hint = "see workspace"
                     truncated = (
                         msg.content[:max_length] +
-                        f"\n\n[TRUNCATED - {len(msg.content) - max_length} chars omitted, see workspace]"
+                        f"\n\n[TRUNCATED - {omitted} chars omitted, {hint}]"
                     )
                     result.append(
                         ToolMessage(
@@ -584,6 +829,113 @@ class ContextManager:
 
         return messages
 
+    def prepare_history(
+        self,
+        messages: List[BaseMessage],
+        keep_recent: Optional[int] = None,
+    ) -> PreparedHistory:
+        """Split and clean the history for an LLM request in a single pass.
+
+        Equivalent to filtering out RemoveMessage markers, then
+        ``clear_old_tool_results``, ``sanitize_message_history`` and picking
+        out summary and non-system messages, without building the
+        intermediate lists. Cleared copies of old tool results are reused
+        across calls while the original message is unchanged.
+
+        Args:
+            messages: Message list, possibly with RemoveMessage markers
+            keep_recent: Number of recent tool results to keep (default from config)
+
+        Returns:
+            PreparedHistory
+        """
+        keep_recent = keep_recent or self.config.keep_recent_tool_results
+        count_types = logger.isEnabledFor(logging.DEBUG)
+        prepared = PreparedHistory()
+        history = prepared.history
+        remove_markers = prepared.remove_markers
+        cleaned = prepared.messages
+        summaries = prepared.summaries
+        conversation = prepared.conversation
+        type_counts = prepared.type_counts
+
+        valid_tool_call_ids = set()
+        # (index in cleaned, index in conversation) of each ToolMessage
+        tool_positions: List[Tuple[int, int]] = []
+        # ToolMessages answering a call not seen earlier in the history
+        unmatched: List[ToolMessage] = []
+
+        for msg in messages:
+            if count_types:
+                msg_type = type(msg).__name__
+                type_counts[msg_type] = type_counts.get(msg_type, 0) + 1
+            # The type field is much cheaper to check than isinstance() on
+            # message models; chunks and custom types take the slow path
+            kind = msg.type
+            if kind not in _MESSAGE_KINDS:
+                kind = _message_kind(msg)
+            if kind == "remove":
+                remove_markers.append(msg)
+                continue
+            history.append(msg)
+            if kind == "system":
+                if is_summary_message(msg):
+                    summaries.append(msg)
+                cleaned.append(msg)
+                continue
+            if kind == "ai":
+                if msg.tool_calls:
+                    for tc in msg.tool_calls:
+                        tc_id = tc.get("id")
+                        if tc_id:
+                            valid_tool_call_ids.add(tc_id)
+            elif kind == "tool":
+                tool_positions.append((len(cleaned), len(conversation)))
+                if msg.tool_call_id and msg.tool_call_id not in valid_tool_call_ids:
+                    unmatched.append(msg)
+            cleaned.append(msg)
+            conversation.append(msg)
+
+        # Clear all but the most recent tool results
+        num_to_clear = max(0, len(tool_positions) - keep_recent)
+        if num_to_clear:
+            cleared_results: Dict[str, Tuple[ToolMessage, ToolMessage]] = {}
+            for cleaned_idx, conversation_idx in tool_positions[:num_to_clear]:
+                original = cleaned[cleaned_idx]
+                cached = self._cleared_results.get(original.id) if original.id else None
+                if cached is not None and cached[0] is original:
+                    copy = cached[1]
+                else:
+                    copy = ToolMessage(
+                        content=self._cleared_content(original),
+                        tool_call_id=original.tool_call_id,
+                    )
+                if original.id:
+                    cleared_results[original.id] = (original, copy)
+                cleaned[cleaned_idx] = copy
+                conversation[conversation_idx] = copy
+            self._cleared_results = cleared_results
+            self._state.total_tool_results_cleared += num_to_clear
+            logger.debug(f"Cleared {num_to_clear} old tool results")
+
+        # Drop ToolMessages whose call is not in the history at all
+        orphaned_call_ids = {
+            m.tool_call_id for m in unmatched if m.tool_call_id not in valid_tool_call_ids
+        }
+        if orphaned_call_ids:
+            def keep(m: BaseMessage) -> bool:
+                return not (isinstance(m, ToolMessage) and m.tool_call_id in orphaned_call_ids)
+
+            orphaned_count = len(conversation)
+            prepared.messages = [m for m in cleaned if keep(m)]
+            prepared.conversation = [m for m in conversation if keep(m)]
+            orphaned_count -= len(prepared.conversation)
+            logger.warning(
+                f"Removed {orphaned_count} orphaned ToolMessages from message history"
+            )
+
+        return prepared
+
     def trim_messages(
         self,
         messages: List[BaseMessage],
@@ -647,6 +999,7 @@ class ContextManager:
         oss_reasoning_level: str = "high",
         max_summary_length: int = 10000,
         force: bool = False,
+        phase_number: Optional[int] = None,
     ) -> List[BaseMessage]:
         """Ensure messages are within configured limits, summarizing if needed.
 
@@ -660,6 +1013,7 @@ class ContextManager:
             oss_reasoning_level: Reasoning level for OSS models
             max_summary_length: Max length for summary
             force: If True, summarize even if thresholds not exceeded
+            phase_number: Current phase (its summary is the one extended)
 
         Returns:
             Messages (possibly compacted) guaranteed to be within limits
@@ -669,14 +1023,235 @@ class ContextManager:
                 f"Context compaction triggered: {len(messages)} messages, "
                 f"{self.get_token_count(messages)} tokens"
             )
-            return await self.summarize_and_compact(
-                messages,
+            COMPACTIONS.inc(trigger="forced" if force else "threshold")
+            started = time.perf_counter()
+            try:
+                return await self.summarize_and_compact(
+                    messages,
+                    llm,
+                    summarization_prompt,
+                    oss_reasoning_level,
+                    max_summary_length,
+                    phase_number=phase_number,
+                )
+            finally:
+                COMPACTION_SECONDS.observe(time.perf_counter() - started)
+        return messages
+
+    def should_start_background_summary(self, messages: List[BaseMessage]) -> bool:
+        """Check if the soft (background) summarization threshold is exceeded.
+
+        Same triggers as should_summarize(), with the thresholds scaled by
+        background_summarization_ratio.
+
+        Args:
+            messages: Current message history
+
+        Returns:
+            True if background summarization should start
+        """
+        ratio = self.config.background_summarization_ratio
+        if ratio <= 0:
+            return False
+
+        token_count = self.token_counter(messages)
+        if token_count > self.config.summarization_threshold_tokens * ratio:
+            return True
+        return (
+            len(messages) > self.config.message_count_threshold * ratio
+            and token_count > self.config.message_count_min_tokens * ratio
+        )
+
+    def start_background_summary(
+        self,
+        key: str,
+        messages: List[BaseMessage],
+        llm: BaseChatModel,
+        summarization_prompt: Optional[str] = None,
+        oss_reasoning_level: str = "high",
+        max_summary_length: int = 10000,
+        phase_number: Optional[int] = None,
+    ) -> bool:
+        """Start summarizing the stable older prefix in a background task.
+
+        The current phase's summary and all conversation messages except the
+        most recent keep_recent_messages are summarized into a new summary
+        of the phase. Summaries of other phases are left alone until they
+        exceed summary_digest_tokens, as in summarize_and_compact(); then the
+        same task folds them into the job digest. The result is applied by
+        take_background_summary() on a later turn.
+
+        Args:
+            key: Owner of the summary (job ID); one task per key
+            messages: Current message history (state messages, with IDs)
+            llm: LLM for summarization
+            summarization_prompt: Optional custom prompt
+            oss_reasoning_level: Reasoning level for OSS models
+            max_summary_length: Max length for summary
+            phase_number: Current phase
+
+        Returns:
+            True if a background summarization was started
+        """
+        if key in self._background or not self.should_start_background_summary(messages):
+            return False
+
+        from src.core.workspace_injection import is_workspace_injection_message
+
+        messages = [m for m in messages if not is_workspace_injection_message(m)]
+        phase_summaries, other_summaries = _split_summaries(messages, phase_number)
+        conversation = [m for m in messages if not isinstance(m, SystemMessage)]
+
+        keep_recent = self.config.keep_recent_messages
+        safe_start = find_safe_slice_start(conversation, len(conversation) - keep_recent)
+        # Not worth a summarization round for a handful of messages
+        if safe_start < max(keep_recent, 1):
+            return False
+
+        to_summarize = phase_summaries + conversation[:safe_start]
+        if any(not m.id for m in to_summarize):
+            # Messages without IDs cannot be removed from state
+            return False
+
+        # Summaries without IDs cannot be replaced by a digest
+        to_fold = other_summaries if all(m.id for m in other_summaries) else []
+
+        task = asyncio.create_task(
+            self._summarize_in_background(
+                to_summarize,
+                to_fold,
                 llm,
                 summarization_prompt,
                 oss_reasoning_level,
                 max_summary_length,
             )
-        return messages
+        )
+        self._background[key] = _BackgroundSummary(
+            task=task,
+            summarized_ids=[m.id for m in to_summarize],
+            summarized_tokens=self.token_counter(to_summarize),
+            started_at=time.perf_counter(),
+            phase_number=phase_number,
+            fold_ids=[m.id for m in to_fold],
+        )
+        SUMMARY_INPUT_TOKENS.inc(self._background[key].summarized_tokens, tier=PHASE_SUMMARY)
+        logger.info(
+            f"Background summarization started: {len(to_summarize)} of {len(messages)} messages"
+        )
+        return True
+
+    async def _summarize_in_background(
+        self,
+        to_summarize: List[BaseMessage],
+        to_fold: List[BaseMessage],
+        llm: BaseChatModel,
+        summarization_prompt: Optional[str],
+        oss_reasoning_level: str,
+        max_summary_length: int,
+    ) -> Tuple[str, Optional[SystemMessage]]:
+        """Phase summary of a background task, and the job digest if one was due."""
+        summary = await self.summarize_conversation(
+            to_summarize,
+            llm,
+            summarization_prompt,
+            oss_reasoning_level,
+            max_summary_length,
+        )
+        if summary.startswith("[Summarization failed"):
+            return summary, None
+        digest_msg = await self._fold_into_digest(
+            to_fold,
+            llm,
+            summarization_prompt,
+            oss_reasoning_level,
+            max_summary_length,
+        )
+        return summary, digest_msg
+
+    async def take_background_summary(
+        self,
+        key: str,
+        messages: List[BaseMessage],
+        wait: bool = False,
+    ) -> List[BaseMessage]:
+        """Swap in a finished background summary.
+
+        The summary takes the place (and ID) of the first summarized message;
+        the rest of the summarized range is removed. A job digest built by the
+        same task likewise takes the place of the first summary it folded.
+        Recent messages are left untouched.
+
+        Args:
+            key: Owner of the summary (job ID)
+            messages: Current message history (state messages)
+            wait: Wait for a summary still running (hard limit reached)
+
+        Returns:
+            State update (RemoveMessage markers and the summary message), or
+            an empty list if no summary is ready or it no longer applies
+        """
+        pending = self._background.get(key)
+        if pending is None:
+            return []
+        if not pending.task.done():
+            if not wait:
+                return []
+            logger.info("Hard context limit reached, waiting for background summarization")
+            await asyncio.wait({pending.task})
+        del self._background[key]
+
+        if pending.task.cancelled():
+            return []
+        if pending.task.exception() is not None:
+            logger.warning(f"Background summarization failed: {pending.task.exception()}")
+            return []
+
+        summary, digest_msg = pending.task.result()
+        if summary.startswith("[Summarization failed"):
+            logger.warning(f"Background summarization failed: {summary}")
+            return []
+
+        present = {m.id for m in messages}
+        if not all(msg_id in present for msg_id in pending.summarized_ids):
+            logger.info("Discarding background summary: summarized messages were compacted meanwhile")
+            return []
+
+        summary_msg = make_summary_message(
+            summary,
+            PHASE_SUMMARY,
+            pending.phase_number,
+            id=pending.summarized_ids[0],
+        )
+        summary_tokens = self.token_counter([summary_msg])
+        if summary_tokens > pending.summarized_tokens:
+            logger.error(
+                f"Background summary ({summary_tokens} tokens) larger than original "
+                f"({pending.summarized_tokens} tokens) — discarding"
+            )
+            return []
+
+        update: List[BaseMessage] = []
+        if digest_msg is not None:
+            if all(msg_id in present for msg_id in pending.fold_ids):
+                digest_msg.id = pending.fold_ids[0]
+                update = [RemoveMessage(id=msg_id) for msg_id in pending.fold_ids[1:]] + [digest_msg]
+                logger.info(f"Swapped in job digest of {len(pending.fold_ids)} summaries")
+            else:
+                logger.info("Discarding job digest: folded summaries were compacted meanwhile")
+
+        COMPACTIONS.inc(trigger="background")
+        logger.info(
+            f"Swapped in background summary of {len(pending.summarized_ids)} messages "
+            f"({pending.summarized_tokens} -> {summary_tokens} tokens, "
+            f"ready after {time.perf_counter() - pending.started_at:.1f}s)"
+        )
+        return update + [RemoveMessage(id=msg_id) for msg_id in pending.summarized_ids[1:]] + [summary_msg]
+
+    def cancel_background_summary(self, key: str) -> None:
+        """Cancel the background summary of a key (e.g. after inline compaction)."""
+        pending = self._background.pop(key, None)
+        if pending is not None and not pending.task.done():
+            pending.task.cancel()
 
     def _format_messages_for_summary(self, messages: List[BaseMessage]) -> List[str]:
         """Format messages into text parts for summarization.
@@ -698,7 +1273,7 @@ class ContextManager:
             if isinstance(msg, SystemMessage):
                 # Include prior summaries in the new summarization so context is preserved
                 # Skip other system messages (like the main system prompt)
-                if "[Summary of prior work]" in msg.content:
+                if is_summary_message(msg):
                     formatted_parts.append(f"Prior Summary: {msg.content}")
                 continue
             elif isinstance(msg, HumanMessage):
@@ -981,20 +1556,29 @@ Conversation:
         summarization_prompt: Optional[str] = None,
         oss_reasoning_level: str = "high",
         max_summary_length: int = 10000,
+        phase_number: Optional[int] = None,
     ) -> List[BaseMessage]:
         """Summarize older messages and compact the conversation.
 
         This is the most aggressive context management strategy.
         Used when other strategies aren't sufficient.
 
+        The older messages are merged into the current phase's summary only;
+        summaries of other phases are kept as they are until together they
+        exceed summary_digest_tokens, at which point they are folded into the
+        job digest. Summarization input is therefore bounded by the length of
+        a phase, not of the job.
+
         Args:
             messages: Full message history
             llm: LLM for summarization
             summarization_prompt: Optional custom prompt
             oss_reasoning_level: Reasoning level for OSS models (low/medium/high)
+            max_summary_length: Max length for summary
+            phase_number: Current phase (its summary is the one extended)
 
         Returns:
-            Compacted message list with summary prepended
+            Compacted message list with summaries prepended
         """
         from src.core.workspace_injection import is_workspace_injection_message
 
@@ -1004,16 +1588,13 @@ Conversation:
 
         # Separate system messages into:
         # 1. Regular system messages (keep in output)
-        # 2. Old summary messages (incorporate into new summary, then discard)
-        # Old summaries are identified by the "[Summary of prior work]" prefix
+        # 2. The current phase's summary (incorporate into its new summary, then discard)
+        # 3. Summaries of other phases and the job digest (kept, or folded into a new digest)
         system_msgs = [
             m for m in messages
-            if isinstance(m, SystemMessage) and "[Summary of prior work]" not in m.content
-        ]
-        old_summaries = [
-            m for m in messages
-            if isinstance(m, SystemMessage) and "[Summary of prior work]" in m.content
+            if isinstance(m, SystemMessage) and not is_summary_message(m)
         ]
+        phase_summaries, other_summaries = _split_summaries(messages, phase_number)
         conversation = [m for m in messages if not isinstance(m, SystemMessage)]
 
         if len(conversation) <= self.config.keep_recent_messages:
@@ -1027,9 +1608,10 @@ Conversation:
         messages_to_summarize = conversation[:safe_start]
         recent_messages = conversation[safe_start:]
 
-        # Include old summaries at the start so their context is incorporated
-        # into the new summary (rolling summary pattern)
-        messages_for_summarization = old_summaries + messages_to_summarize
+        # Include the phase's previous summary so its context is carried over
+        messages_for_summarization = phase_summaries + messages_to_summarize
+        original_tokens = self.get_token_count(messages_for_summarization)
+        SUMMARY_INPUT_TOKENS.inc(original_tokens, tier=PHASE_SUMMARY)
 
         # Generate summary
         summary = await self.summarize_conversation(
@@ -1040,29 +1622,43 @@ Conversation:
             max_summary_length,
         )
 
+        # Create summary as SystemMessage (best practice per OpenAI/LangChain)
+        # SystemMessage signals "background context" rather than user dialogue
+        summary_msg = make_summary_message(summary, PHASE_SUMMARY, phase_number)
+
         # Guard: if summary is larger than what we're replacing, skip compaction
-        summary_tokens = self.get_token_count([SystemMessage(content=summary)])
-        original_tokens = self.get_token_count(messages_for_summarization)
+        summary_tokens = self.get_token_count([summary_msg])
         if summary_tokens > original_tokens:
             logger.error(
                 f"Summary ({summary_tokens} tokens) larger than original ({original_tokens} tokens) — skipping compaction"
             )
             return messages
 
-        # Create summary as SystemMessage (best practice per OpenAI/LangChain)
-        # SystemMessage signals "background context" rather than user dialogue
-        summary_msg = SystemMessage(
-            content=f"[Summary of prior work]\n{summary}"
+        # Fold the other summaries into the job digest once they outgrow
+        # their budget; until then they are reused as they are
+        replaced_summaries = phase_summaries
+        kept_summaries = other_summaries
+        new_summaries = [summary_msg]
+        digest_msg = await self._fold_into_digest(
+            other_summaries,
+            llm,
+            summarization_prompt,
+            oss_reasoning_level,
+            max_summary_length,
         )
+        if digest_msg is not None:
+            replaced_summaries = phase_summaries + other_summaries
+            kept_summaries = []
+            new_summaries = [digest_msg, summary_msg]
 
         # Generate removal markers for:
         # 1. ALL conversation messages (summarized + recent) - recent are re-added as fresh copies
-        # 2. Old summary messages - they've been incorporated into the new summary
+        # 2. Replaced summary messages - they've been incorporated into the new summaries
         removal_markers = []
         messages_without_ids = 0
 
-        # Remove old summaries (they've been merged into the new summary)
-        for msg in old_summaries:
+        # Remove replaced summaries (they've been merged into the new ones)
+        for msg in replaced_summaries:
             if hasattr(msg, 'id') and msg.id:
                 removal_markers.append(RemoveMessage(id=msg.id))
             else:
@@ -1099,16 +1695,73 @@ Conversation:
                 # For any other message type, try to preserve it
                 fresh_recent.append(msg)
 
-        merged_summaries_info = f", merged {len(old_summaries)} prior summaries" if old_summaries else ""
+        merged_summaries_info = f", merged {len(replaced_summaries)} prior summaries" if replaced_summaries else ""
+        kept_summaries_info = f", kept {len(kept_summaries)} summaries" if kept_summaries else ""
         logger.info(
-            f"Compacted {len(messages)} messages to {len(system_msgs) + 1 + len(fresh_recent)} "
-            f"(summarized {len(messages_to_summarize)} messages{merged_summaries_info}, "
-            f"removing {len(removal_markers)}, {messages_without_ids} without IDs)"
+            f"Compacted {len(messages)} messages to "
+            f"{len(system_msgs) + len(kept_summaries) + len(new_summaries) + len(fresh_recent)} "
+            f"(summarized {len(messages_to_summarize)} messages{merged_summaries_info}"
+            f"{kept_summaries_info}, removing {len(removal_markers)}, {messages_without_ids} without IDs)"
         )
 
-        # Return: removal markers + system messages + summary + fresh recent
-        # Order matters: summary comes BEFORE recent messages
-        return removal_markers + system_msgs + [summary_msg] + fresh_recent
+        # Return: removal markers + system messages + summaries (oldest tier first) + fresh recent
+        # Order matters: summaries come BEFORE recent messages. Kept summaries
+        # keep their IDs, so they stay in place in the state.
+        return removal_markers + system_msgs + kept_summaries + new_summaries + fresh_recent
+
+    async def _fold_into_digest(
+        self,
+        summaries: List[BaseMessage],
+        llm: BaseChatModel,
+        summarization_prompt: Optional[str],
+        oss_reasoning_level: str,
+        max_summary_length: int,
+    ) -> Optional[SystemMessage]:
+        """Summarize the job digest and earlier phase summaries into a new digest.
+
+        Only done once the phase summaries among them push the total over
+        summary_digest_tokens.
+
+        Args:
+            summaries: Summaries other than the current phase's
+            llm: LLM for summarization
+            summarization_prompt: Optional custom prompt
+            oss_reasoning_level: Reasoning level for OSS models
+            max_summary_length: Max length for summary
+
+        Returns:
+            The new digest, or None if the summaries are kept as they are
+        """
+        if not any(summary_tier(m)[0] == PHASE_SUMMARY for m in summaries):
+            return None
+        summaries_tokens = self.get_token_count(summaries)
+        if summaries_tokens <= self.config.summary_digest_tokens:
+            return None
+
+        logger.info(
+            f"Folding {len(summaries)} summaries ({summaries_tokens} tokens) into the job digest"
+        )
+        SUMMARY_INPUT_TOKENS.inc(summaries_tokens, tier=JOB_DIGEST)
+        digest = await self.summarize_conversation(
+            summaries,
+            llm,
+            summarization_prompt,
+            oss_reasoning_level,
+            max_summary_length,
+        )
+        if digest.startswith("[Summarization failed"):
+            logger.warning(f"Job digest not updated: {digest}")
+            return None
+
+        digest_msg = make_summary_message(digest, JOB_DIGEST)
+        digest_tokens = self.get_token_count([digest_msg])
+        if digest_tokens > summaries_tokens:
+            logger.error(
+                f"Job digest ({digest_tokens} tokens) larger than the summaries it replaces "
+                f"({summaries_tokens} tokens) — keeping them"
+            )
+            return None
+        return digest_msg
 
     def create_pre_model_hook(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """Create a pre-model hook for LangGraph integration.
@@ -0,0 +1,189 @@
+"""Compiled graph templates reused across jobs.
+
+A long-lived agent runs many jobs with the same configuration and tool set.
+Compiling the StateGraph, binding the tool schemas to the phase LLMs and
+wrapping the tools for the ToolNode is the same work every time, so the
+compiled graph is kept as a template and reused by later jobs.
+
+A template holds no job objects. The workspace, todo manager, tool context,
+context manager, ... of the job it runs for are passed per run in
+``configurable["job"]`` as :class:`JobBindings`, and the graph's nodes reach
+them through :class:`JobBound` proxies. Tool calls are dispatched to the
+job's own tool instances by name.
+
+Nodes still keep a little per-run bookkeeping (scheduler plans and call
+profiles by tool call ID), so a template is checked out by one job at a
+time; concurrent jobs with the same key each get their own.
+
+Usage:
+    pool = GraphTemplatePool()
+    template = pool.acquire(key, build=lambda: GraphTemplate(key, graph, ...))
+    try:
+        graph = template.graph.copy(update={"checkpointer": checkpointer})
+        await graph.ainvoke(state, {"configurable": {"thread_id": job_id, JOB_BINDINGS_KEY: bindings}})
+    finally:
+        pool.release(template)
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from langgraph.config import get_config
+
+from . import metrics
+
+if TYPE_CHECKING:
+    from ..managers import TodoManager
+    from ..tools.context import ToolContext
+    from .context import ContextManager, ToolRetryManager
+    from .phase_snapshot import PhaseSnapshotManager
+    from .workspace import WorkspaceManager
+
+logger = logging.getLogger(__name__)
+
+# configurable key under which a run's JobBindings are passed
+JOB_BINDINGS_KEY = "job"
+
+# Idle templates kept across all keys
+DEFAULT_MAX_IDLE = 8
+
+
+@dataclass
+class JobBindings:
+    """Job-specific objects a template graph resolves at run time."""
+
+    workspace: "WorkspaceManager"
+    todo_manager: "TodoManager"
+    tool_context: "ToolContext"
+    context_mgr: "ContextManager"
+    retry_manager: "ToolRetryManager"
+    snapshot_manager: Optional["PhaseSnapshotManager"] = None
+    tools: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+def current_job_bindings() -> Optional[JobBindings]:
+    """JobBindings of the run being executed, or None outside a bound run."""
+    try:
+        config = get_config()
+    except RuntimeError:
+        return None
+    return (config.get("configurable") or {}).get(JOB_BINDINGS_KEY)
+
+
+class JobBound:
+    """Proxy for one of the JobBindings of the run being executed.
+
+    Attribute reads and writes go to the bound object, so node code written
+    against a WorkspaceManager or TodoManager works unchanged.
+    """
+
+    __slots__ = ("_field",)
+
+    def __init__(self, field: str) -> None:
+        object.__setattr__(self, "_field", field)
+
+    def _target(self) -> Any:
+        bindings = current_job_bindings()
+        if bindings is None:
+            raise RuntimeError(f"No job bound to this run (needed for {self._field})")
+        return getattr(bindings, self._field)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target(), name, value)
+
+    def __bool__(self) -> bool:
+        return bool(self._target())
+
+    def __repr__(self) -> str:
+        return f"JobBound({self._field!r})"
+
+
+def template_key(config: Any, tool_names: Iterable[str], *extra: str) -> str:
+    """Key of the template for a resolved config and tool set.
+
+    Args:
+        config: Resolved AgentConfig of the job (after per-job overrides)
+        tool_names: Names of the tools the job loaded
+        extra: Other build inputs (e.g. the workspace template text)
+    """
+    payload = json.dumps(
+        {
+            "config": dataclasses.asdict(config),
+            "tools": sorted(tool_names),
+            "extra": list(extra),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class GraphTemplate:
+    """A compiled graph (without checkpointer) and the LLMs bound for it."""
+
+    key: str
+    graph: Any
+    strategic_llm_with_tools: Any
+    tactical_llm_with_tools: Any
+
+
+class GraphTemplatePool:
+    """Idle graph templates by key, checked out by one job at a time."""
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE) -> None:
+        self._max_idle = max_idle
+        self._idle: "OrderedDict[str, List[GraphTemplate]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, build: Callable[[], GraphTemplate]) -> GraphTemplate:
+        """Check out an idle template for ``key``, building one if there is none."""
+        with self._lock:
+            idle = self._idle.get(key)
+            template = idle.pop() if idle else None
+            if idle is not None and not idle:
+                del self._idle[key]
+        if template is not None:
+            metrics.GRAPH_TEMPLATES.inc(result="hit")
+            logger.debug(f"Reusing graph template {key}")
+            return template
+
+        metrics.GRAPH_TEMPLATES.inc(result="miss")
+        logger.info(f"Building graph template {key}")
+        return build()
+
+    def release(self, template: GraphTemplate) -> None:
+        """Return a template for reuse by later jobs."""
+        with self._lock:
+            self._idle.setdefault(template.key, []).append(template)
+            self._idle.move_to_end(template.key)
+            while sum(len(idle) for idle in self._idle.values()) > self._max_idle:
+                oldest_key, oldest = next(iter(self._idle.items()))
+                oldest.pop(0)
+                if not oldest:
+                    del self._idle[oldest_key]
+
+    def idle_count(self) -> int:
+        """Number of idle templates."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+
+__all__ = [
+    "GraphTemplate",
+    "GraphTemplatePool",
+    "JOB_BINDINGS_KEY",
+    "JobBindings",
+    "JobBound",
+    "current_job_bindings",
+    "template_key",
+]
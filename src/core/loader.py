@@ -6,15 +6,14 @@ loading the appropriate tools based on configuration.
 
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from langchain_core.language_models import BaseChatModel
 
-from src.llm.reasoning_chat import ReasoningChatOpenAI
-
 
 logger = logging.getLogger(__name__)
 
@@ -319,6 +318,7 @@ class WorkspaceConfig:
     git_ignore_patterns: List[str] = field(
         default_factory=lambda: ["*.db", "*.log", "__pycache__/", ".DS_Store", "*.pyc", "documents/"]
     )
+    git_commit_batch_seconds: float = 2.0  # Coalescing window for todo commits (0 = synchronous)
 
 
 @dataclass
@@ -366,6 +366,31 @@ class ContextManagementConfig:
     summarization_template: str = "summarization_prompt.txt"
     reasoning_level: str = "high"
     max_summary_length: int = 10000
+    # Start summarizing older history in the background at this fraction of
+    # the summarization thresholds (0 disables)
+    background_summarization_ratio: float = 0.75
+    # Spill tool results of at least this many characters to the job's tool
+    # result store, so compaction can point at recall_tool_result (0 disables)
+    tool_result_spill_chars: int = 2000
+    # Fold the summaries of earlier phases into one job digest once they
+    # exceed this many tokens
+    summary_digest_tokens: int = 8000
+
+
+@dataclass
+class ToolExecutionConfig:
+    """Parallel tool execution configuration."""
+
+    # Threads running sync tools (process-wide pool)
+    max_workers: int = 8
+    # Maximum concurrent calls per tool category (categories not listed,
+    # or 0, are unlimited)
+    category_concurrency: Dict[str, int] = field(
+        default_factory=lambda: {"research": 4, "graph": 2, "sql": 2, "mongodb": 2, "git": 1, "coding": 1}
+    )
+    # Answer repeated read-only calls with unchanged inputs within a phase
+    # with a reference to the earlier call instead of re-running them
+    memoize_results: bool = True
 
 
 @dataclass
@@ -397,6 +422,7 @@ class AgentConfig:
     context_management: ContextManagementConfig = field(
         default_factory=ContextManagementConfig
     )
+    tool_execution: ToolExecutionConfig = field(default_factory=ToolExecutionConfig)
     phase_settings: PhaseSettings = field(default_factory=PhaseSettings)
 
     # Additional agent-specific config (preserved from JSON)
@@ -535,6 +561,7 @@ def load_agent_config(
             "git_ignore_patterns",
             ["*.db", "*.log", "__pycache__/", ".DS_Store", "*.pyc", "documents/"]
         ),
+        git_commit_batch_seconds=float(workspace_data.get("git_commit_batch_seconds", 2.0)),
     )
 
     tools_data = data.get("tools", {})
@@ -576,6 +603,20 @@ def load_agent_config(
         ),
         reasoning_level=context_data.get("reasoning_level", "high"),
         max_summary_length=context_data.get("max_summary_length", 10000),
+        background_summarization_ratio=context_data.get("background_summarization_ratio", 0.75),
+        tool_result_spill_chars=context_data.get("tool_result_spill_chars", 2000),
+        summary_digest_tokens=context_data.get("summary_digest_tokens", 8000),
+    )
+
+    execution_data = data.get("tool_execution", {})
+    default_execution = ToolExecutionConfig()
+    execution_config = ToolExecutionConfig(
+        max_workers=execution_data.get("max_workers", default_execution.max_workers),
+        category_concurrency={
+            **default_execution.category_concurrency,
+            **execution_data.get("category_concurrency", {}),
+        },
+        memoize_results=execution_data.get("memoize_results", default_execution.memoize_results),
     )
 
     phase_data = data.get("phase_settings", {})
@@ -588,7 +629,7 @@ def load_agent_config(
     known_fields = {
         "$schema", "agent_id", "display_name", "description", "llm", "workspace",
         "tools", "connections", "polling", "limits", "context_management",
-        "phase_settings"
+        "tool_execution", "phase_settings"
     }
     extra = {k: v for k, v in data.items() if k not in known_fields}
 
@@ -602,6 +643,7 @@ def load_agent_config(
         connections=connections_config,
         limits=limits_config,
         context_management=context_config,
+        tool_execution=execution_config,
         phase_settings=phase_config,
         extra=extra,
         _deployment_dir=deployment_dir,
@@ -655,6 +697,7 @@ def load_agent_config_from_dict(
             "git_ignore_patterns",
             ["*.db", "*.log", "__pycache__/", ".DS_Store", "*.pyc", "documents/"]
         ),
+        git_commit_batch_seconds=float(workspace_data.get("git_commit_batch_seconds", 2.0)),
     )
 
     tools_data = data.get("tools", {})
@@ -696,6 +739,20 @@ def load_agent_config_from_dict(
         ),
         reasoning_level=context_data.get("reasoning_level", "high"),
         max_summary_length=context_data.get("max_summary_length", 10000),
+        background_summarization_ratio=context_data.get("background_summarization_ratio", 0.75),
+        tool_result_spill_chars=context_data.get("tool_result_spill_chars", 2000),
+        summary_digest_tokens=context_data.get("summary_digest_tokens", 8000),
+    )
+
+    execution_data = data.get("tool_execution", {})
+    default_execution = ToolExecutionConfig()
+    execution_config = ToolExecutionConfig(
+        max_workers=execution_data.get("max_workers", default_execution.max_workers),
+        category_concurrency={
+            **default_execution.category_concurrency,
+            **execution_data.get("category_concurrency", {}),
+        },
+        memoize_results=execution_data.get("memoize_results", default_execution.memoize_results),
     )
 
     phase_data = data.get("phase_settings", {})
@@ -708,7 +765,7 @@ def load_agent_config_from_dict(
     known_fields = {
         "$schema", "agent_id", "display_name", "description", "llm", "workspace",
         "tools", "connections", "polling", "limits", "context_management",
-        "phase_settings"
+        "tool_execution", "phase_settings"
     }
     extra = {k: v for k, v in data.items() if k not in known_fields}
 
@@ -722,6 +779,7 @@ def load_agent_config_from_dict(
         connections=connections_config,
         limits=limits_config,
         context_management=context_config,
+        tool_execution=execution_config,
         phase_settings=phase_config,
         extra=extra,
         _deployment_dir=deployment_dir,
@@ -839,6 +897,57 @@ def create_llm(
         return _create_openai_llm(config, limits)
 
 
+# Shared LLM clients by (provider, base URL, model, client settings)
+_llm_pool: Dict[Tuple[Any, ...], BaseChatModel] = {}
+_llm_pool_lock = threading.Lock()
+
+
+def get_llm(
+    config: LLMConfig,
+    limits: Optional[LimitsConfig] = None,
+) -> BaseChatModel:
+    """Get a shared LLM instance for a configuration.
+
+    Like ``create_llm``, but jobs and phases with the same provider, base
+    URL, model and client settings share one instance, and with it its HTTP
+    connection pool. LLM instances hold no per-request state, so they are
+    safe to share; per-job tool bindings are made with ``bind_tools``.
+
+    Args:
+        config: LLM configuration
+        limits: Optional limits configuration for context token limit.
+
+    Returns:
+        Configured LLM instance
+    """
+    provider = _detect_provider(config.model, config.provider)
+    key = (
+        provider,
+        config.base_url,
+        config.model,
+        config.temperature,
+        config.reasoning_level,
+        config.api_key,
+        config.timeout,
+        config.max_retries,
+        limits.model_max_context_tokens if limits else None,
+    )
+    with _llm_pool_lock:
+        llm = _llm_pool.get(key)
+        if llm is None:
+            llm = create_llm(config, limits=limits)
+            _llm_pool[key] = llm
+        else:
+            logger.debug(f"Reusing pooled LLM: provider={provider}, model={config.model}")
+    return llm
+
+
+def clear_llm_pool() -> None:
+    """Drop the shared LLM instances (new ones are created on next use)."""
+    with _llm_pool_lock:
+        _llm_pool.clear()
+
+
 def _create_openai_llm(
     config: LLMConfig,
     limits: Optional[LimitsConfig] = None,
@@ -890,6 +999,8 @@ def _create_openai_llm(
     if max_context_tokens:
         llm_kwargs["max_context_tokens"] = max_context_tokens
 
+    from src.llm.reasoning_chat import ReasoningChatOpenAI
+
     llm = ReasoningChatOpenAI(**llm_kwargs)
 
     logger.info(
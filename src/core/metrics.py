@@ -0,0 +1,478 @@
+"""In-process metrics for agent hot paths, exported in Prometheus text format.
+
+Counters, gauges and histograms are updated where the work happens (LLM
+calls, tool execution, context compaction, archiving, git commits, phase
+snapshots, job completion) and rendered by the ``/metrics`` endpoint. No
+database queries are needed to serve them.
+
+The registry is process-wide and thread-safe (git commits run on a worker
+thread). Label values should stay low-cardinality: phase, model, tool name,
+operation — never job IDs, except for the per-active-job iteration gauge
+whose series are removed when the job ends.
+
+Usage:
+    from src.core.metrics import LLM_REQUEST_SECONDS, render_metrics
+
+    LLM_REQUEST_SECONDS.observe(1.7, phase="tactical", model="gpt-4o")
+    text = render_metrics()
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Seconds: 5ms .. 5min
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+# Bytes: 64KiB .. 1GiB
+SIZE_BUCKETS: Tuple[float, ...] = tuple(float(2 ** n) for n in range(16, 31, 2))
+# Bytes: 256B .. 4MiB (tool results)
+RESULT_BUCKETS: Tuple[float, ...] = tuple(float(2 ** n) for n in range(8, 23, 2))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class: name, help text, label names and a lock."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def total(self) -> float:
+        """Sum over every label combination."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or is read from a callback."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def remove(self, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the (unlabelled) value from ``function`` at render time."""
+        self._function = function
+
+    def value(self, **labels: Any) -> float:
+        if self._function is not None and not labels:
+            return float(self._function())
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def values(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(float(self._function()))}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, plus sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts incl. +Inf, sum)
+        self._series: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the ``with`` block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def summary(self, **labels: Any) -> Dict[str, float]:
+        """Count and sum of one series."""
+        with self._lock:
+            counts, total = self._series.get(self._key(labels)) or ([0], 0.0)
+            return {"count": sum(counts), "sum": total}
+
+    def totals(self) -> Dict[str, float]:
+        """Count and sum over every label combination."""
+        with self._lock:
+            return {
+                "count": sum(sum(counts) for counts, _ in self._series.values()),
+                "sum": sum(total for _, total in self._series.values()),
+            }
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+    def clear(self) -> None:
+        """Reset every metric's values (tests)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# LLM
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "agent_llm_request_duration_seconds",
+    "LLM request latency by phase and model",
+    ("phase", "model"),
+)
+LLM_TOKENS = REGISTRY.counter(
+    "agent_llm_tokens_total",
+    "LLM tokens by phase, model and kind (prompt, completion, cached)",
+    ("phase", "model", "kind"),
+)
+LLM_ERRORS = REGISTRY.counter(
+    "agent_llm_errors_total",
+    "Failed LLM requests by phase, model and error class",
+    ("phase", "model", "error"),
+)
+
+# Tools
+TOOL_SECONDS = REGISTRY.histogram(
+    "agent_tool_duration_seconds",
+    "Tool execution latency by tool name",
+    ("tool",),
+)
+TOOL_CPU_SECONDS = REGISTRY.counter(
+    "agent_tool_cpu_seconds_total",
+    "CPU time spent executing tools, by tool name",
+    ("tool",),
+)
+TOOL_RESULT_BYTES = REGISTRY.histogram(
+    "agent_tool_result_size_bytes",
+    "Size of tool results returned to the model, by tool name",
+    ("tool",),
+    buckets=RESULT_BUCKETS,
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "agent_tool_errors_total",
+    "Tool calls that failed, by tool name and error class",
+    ("tool", "error"),
+)
+TOOL_QUEUE_SECONDS = REGISTRY.histogram(
+    "agent_tool_queue_seconds",
+    "Time tool calls waited on conflicting calls or category limits, by tool name",
+    ("tool",),
+)
+TOOL_MEMO_HITS = REGISTRY.counter(
+    "agent_tool_memo_hits_total",
+    "Repeated read-only tool calls answered without re-running the tool, by tool name",
+    ("tool",),
+)
+
+# Context compaction
+COMPACTIONS = REGISTRY.counter(
+    "agent_context_compactions_total",
+    "Context compactions by trigger (threshold, forced, background)",
+    ("trigger",),
+)
+COMPACTION_SECONDS = REGISTRY.histogram(
+    "agent_context_compaction_duration_seconds",
+    "Context compaction (summarization) duration",
+)
+SUMMARY_INPUT_TOKENS = REGISTRY.counter(
+    "agent_context_summary_input_tokens_total",
+    "Tokens of history fed to compaction summaries, by summary tier (phase, digest)",
+    ("tier",),
+)
+
+# Persistence
+ARCHIVER_WRITE_SECONDS = REGISTRY.histogram(
+    "agent_archiver_write_duration_seconds",
+    "MongoDB archive/audit write latency by operation",
+    ("operation",),
+)
+GIT_COMMIT_SECONDS = REGISTRY.histogram(
+    "agent_git_commit_duration_seconds",
+    "Workspace git commit duration (staging included)",
+)
+GIT_COMMIT_QUEUE_DEPTH = REGISTRY.gauge(
+    "agent_git_commit_queue_depth",
+    "Commits submitted to background commit workers and not yet committed",
+)
+SNAPSHOT_SECONDS = REGISTRY.histogram(
+    "agent_phase_snapshot_duration_seconds",
+    "Phase snapshot creation duration",
+)
+CHECKPOINT_BYTES = REGISTRY.histogram(
+    "agent_checkpoint_size_bytes",
+    "Size of the checkpoint database captured by each phase snapshot",
+    buckets=SIZE_BUCKETS,
+)
+
+# Jobs
+JOBS = REGISTRY.counter(
+    "agent_jobs_total",
+    "Jobs finished by this process, by outcome (completed, failed, cancelled)",
+    ("outcome",),
+)
+JOB_SECONDS = REGISTRY.histogram(
+    "agent_job_duration_seconds",
+    "Wall time of finished jobs",
+    buckets=(10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0, 14400.0, 43200.0),
+)
+JOB_ITERATION = REGISTRY.gauge(
+    "agent_job_iteration",
+    "Current graph iteration of each running job",
+    ("job_id",),
+)
+JOB_SETUP_SECONDS = REGISTRY.histogram(
+    "agent_job_setup_duration_seconds",
+    "Time from job start until the graph runs (workspace, tools, graph)",
+)
+GRAPH_TEMPLATES = REGISTRY.counter(
+    "agent_graph_templates_total",
+    "Compiled graph template checkouts, by result (hit = reused, miss = built)",
+    ("result",),
+)
+
+
+def record_llm_usage(response: Any, phase: str, model: str) -> None:
+    """Count prompt/completion/cached tokens reported on an LLM response.
+
+    Reads LangChain's ``usage_metadata`` and falls back to the provider's
+    ``response_metadata["token_usage"]`` (OpenAI format).
+    """
+    prompt = completion = cached = 0
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage:
+        prompt = usage.get("input_tokens") or 0
+        completion = usage.get("output_tokens") or 0
+        cached = (usage.get("input_token_details") or {}).get("cache_read") or 0
+    else:
+        token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+        prompt = token_usage.get("prompt_tokens") or 0
+        completion = token_usage.get("completion_tokens") or 0
+        cached = (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+
+    for kind, count in (("prompt", prompt), ("completion", completion), ("cached", cached)):
+        if count:
+            LLM_TOKENS.inc(count, phase=phase, model=model, kind=kind)
+
+
+def render_metrics() -> str:
+    """Render the process-wide registry in Prometheus text format."""
+    return REGISTRY.render()
+
+
+__all__ = [
+    "ARCHIVER_WRITE_SECONDS",
+    "CHECKPOINT_BYTES",
+    "COMPACTIONS",
+    "COMPACTION_SECONDS",
+    "Counter",
+    "GIT_COMMIT_QUEUE_DEPTH",
+    "GIT_COMMIT_SECONDS",
+    "GRAPH_TEMPLATES",
+    "Gauge",
+    "Histogram",
+    "JOBS",
+    "JOB_ITERATION",
+    "JOB_SECONDS",
+    "JOB_SETUP_SECONDS",
+    "LLM_ERRORS",
+    "LLM_REQUEST_SECONDS",
+    "LLM_TOKENS",
+    "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
+    "REGISTRY",
+    "SNAPSHOT_SECONDS",
+    "SUMMARY_INPUT_TOKENS",
+    "TOOL_CPU_SECONDS",
+    "TOOL_ERRORS",
+    "TOOL_RESULT_BYTES",
+    "TOOL_SECONDS",
+    "record_llm_usage",
+    "render_metrics",
+]
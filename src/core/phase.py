@@ -601,6 +601,7 @@ def finalize_job(
     git_mgr = workspace.git_manager
     if git_mgr and git_mgr.is_active:
         try:
+            workspace.flush_commits()
             git_mgr.commit("Job frozen for review", allow_empty=True)
             git_mgr.tag("job-frozen", "Job frozen for human review")
             git_mgr.push()
@@ -645,7 +646,10 @@ def _complete_phase_with_git(
 ) -> None:
     """Complete a phase with git operations.
 
-    Creates a git tag for the completed phase and commits any pending changes.
+    Waits for queued background todo commits first, so the phase tag
+    covers every todo committed in the phase. Then creates a git tag for
+    the completed phase and commits any pending changes (staging the whole
+    workspace, so the phase boundary commit is exact).
 
     Args:
         workspace: WorkspaceManager with git_manager
@@ -658,6 +662,9 @@ def _complete_phase_with_git(
         return
 
     try:
+        # Barrier: todo commits are written before the tag is placed
+        workspace.flush_commits()
+
         # Create tag for completed phase
         tag_name = f"phase-{phase_number}-{phase_type}-complete"
         git_mgr.tag(tag_name, f"Phase {phase_number} {phase_type} complete")
@@ -16,11 +16,14 @@ Each snapshot includes:
 import json
 import logging
 import shutil
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime, UTC
 from pathlib import Path
 from typing import List, Optional, TYPE_CHECKING
 
+from .metrics import CHECKPOINT_BYTES, SNAPSHOT_SECONDS
+
 if TYPE_CHECKING:
     from .workspace import WorkspaceManager
 
@@ -208,6 +211,7 @@ class PhaseSnapshotManager:
             PhaseSnapshot with metadata, or None if failed
         """
         checkpoint_path = checkpoint_path or self._checkpoint_path
+        started = time.perf_counter()
 
         try:
             # Create snapshot directory
@@ -217,6 +221,7 @@ class PhaseSnapshotManager:
             # 1. Copy checkpoint database
             if checkpoint_path.exists():
                 shutil.copy2(checkpoint_path, snapshot_dir / "checkpoint.db")
+                CHECKPOINT_BYTES.observe((snapshot_dir / "checkpoint.db").stat().st_size)
                 logger.debug(f"[{self.job_id}] Snapshot: copied checkpoint.db")
             else:
                 logger.warning(
@@ -260,6 +265,7 @@ class PhaseSnapshotManager:
             with open(metadata_path, "w") as f:
                 json.dump(snapshot.to_dict(), f, indent=2)
 
+            SNAPSHOT_SECONDS.observe(time.perf_counter() - started)
             logger.info(
                 f"[{self.job_id}] Created phase {phase_number} snapshot "
                 f"(iteration={iteration}, messages={message_count})"
@@ -8,14 +8,74 @@ The state supports:
 
 File-based memory (workspace.md, plan.md) provides persistence
 across context compaction, while state fields control loop flow.
+
+Messages are stored as an append-only log: the ``messages`` channel is a
+``DeltaChannel``, so a checkpoint does not re-serialize the conversation.
+Each step only persists its own message writes (new messages, and
+``RemoveMessage`` tombstones from compaction); the history is rebuilt by
+replaying the writes since the last full snapshot, which is taken every
+``MESSAGE_SNAPSHOT_FREQUENCY`` updates. Checkpoints written before the
+switch hold the full list and are still read as-is.
+
+``DeltaChannel`` is a beta LangGraph API, and so is the checkpointer side it
+relies on (``get_delta_channel_history``). The on-disk format of the
+messages channel therefore depends on it and may change with LangGraph
+upgrades. requirements.txt pins the minimum langgraph and checkpointer
+versions it was verified with; check resume from existing checkpoints
+before raising them.
 """
 
-from typing import Any, Dict, List, Optional, Annotated
+import hashlib
+import uuid
+from typing import Any, Dict, List, Optional, Annotated, Sequence
 
 from typing_extensions import TypedDict
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, convert_to_messages
+from langgraph.channels.delta import DeltaChannel
 from langgraph.graph.message import add_messages
 
+# Updates of the messages channel between full snapshots (bounds the writes
+# replayed on resume; a snapshot costs one serialization of the history)
+MESSAGE_SNAPSHOT_FREQUENCY = 200
+
+_MESSAGE_ID_NAMESPACE = uuid.UUID("6f1d3c1e-8b0a-4c57-9d1e-2f6a0b7c4e19")
+
+
+def _assign_message_ids(current: List[BaseMessage], update: Any) -> List[BaseMessage]:
+    """Give messages without an ID a deterministic one.
+
+    ``add_messages`` assigns random IDs, which would differ when the writes
+    are replayed on resume and break later ``RemoveMessage`` tombstones. IDs
+    are derived from the preceding message ID, the history length, the
+    position in the write and the message content instead.
+    """
+    if not isinstance(update, list):
+        update = [update]
+    messages = convert_to_messages(update)
+    previous = current[-1].id if current else ""
+    for index, message in enumerate(messages):
+        if message.id is None:
+            digest = hashlib.sha1(
+                f"{message.type}:{message.content}".encode("utf-8", "replace")
+            ).hexdigest()
+            message.id = str(uuid.uuid5(
+                _MESSAGE_ID_NAMESPACE, f"{previous}:{len(current)}:{index}:{digest}"
+            ))
+        previous = message.id
+    return messages
+
+
+def append_message_log(current: List[BaseMessage], writes: Sequence[Any]) -> List[BaseMessage]:
+    """Fold message writes into the history (``DeltaChannel`` reducer).
+
+    Applies ``add_messages`` write by write, so replaying a batch of writes
+    gives the same history as applying them one step at a time.
+    """
+    messages = list(current)
+    for update in writes:
+        messages = add_messages(messages, _assign_message_ids(messages, update))
+    return messages
+
 
 class UniversalAgentState(TypedDict):
     """State for nested loop graph architecture.
@@ -66,8 +126,12 @@ class UniversalAgentState(TypedDict):
         phase_transition: Old phase transition state
     """
 
-    # Core LangGraph state - messages are automatically merged/deduped
-    messages: Annotated[List[BaseMessage], add_messages]
+    # Core LangGraph state - messages are automatically merged/deduped and
+    # checkpointed as an append-only log (see module docstring)
+    messages: Annotated[
+        List[BaseMessage],
+        DeltaChannel(append_message_log, snapshot_frequency=MESSAGE_SNAPSHOT_FREQUENCY),
+    ]
 
     # Job identification
     job_id: str
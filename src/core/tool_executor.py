@@ -0,0 +1,290 @@
+"""Parallel execution of the tool calls of one AI message.
+
+ToolNode starts every tool call of an AI message at once and returns the
+results in call order. ``ToolCallScheduler`` is installed as its
+``awrap_tool_call`` hook and decides when each call may actually run:
+
+- conflicts: tool metadata declares the resources a tool ``reads`` and
+  ``writes``, as templates over its arguments (``"file:{path}"``,
+  ``"todos"``). A call waits for every earlier call of the message that
+  writes a resource it uses, or uses a resource it writes. Calls without
+  overlapping resources run in parallel.
+- category caps: at most N calls of a tool category run at once (one git
+  command at a time, a few concurrent database queries, ...)
+
+Resources of the form ``"kind:path"`` are hierarchical: ``file:docs``
+overlaps ``file:docs/a.md``, and ``file:`` (the workspace root) overlaps
+every file. Resources without a colon only overlap themselves.
+
+Sync tools run in a dedicated thread pool (``offload_sync_tools()``)
+instead of the event loop's default executor, which is shared with all
+other blocking work of the process.
+
+Usage:
+    scheduler = ToolCallScheduler(get_available_tools(), {"git": 1}, inner=profiler)
+    tools = offload_sync_tools(tools, get_tool_thread_pool(8))
+    tool_node = ToolNode(tools, awrap_tool_call=scheduler)
+
+    scheduler.plan(last_message.tool_calls)
+    result = await tool_node.ainvoke(state)
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.tools import StructuredTool
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# (kind, path); path is None for resources without a colon
+Resource = Tuple[str, Optional[str]]
+
+ToolCallHook = Callable[[Any, Callable[[Any], Awaitable[Any]]], Awaitable[Any]]
+
+
+class _Arguments(dict):
+    """Tool arguments for template formatting; missing arguments are empty."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _parse_resource(resource: str) -> Resource:
+    kind, sep, path = resource.partition(":")
+    if not sep:
+        return kind, None
+    path = posixpath.normpath(path.strip().lstrip("/")) if path.strip() else ""
+    return kind, "" if path == "." else path
+
+
+def resolve_resources(templates: List[str], args: Dict[str, Any]) -> List[Resource]:
+    """Resources a tool call touches, from its metadata templates.
+
+    A template that can't be filled in (malformed, or an argument that is
+    not a plain value) stands for the whole resource kind.
+    """
+    resources = []
+    arguments = _Arguments(args or {})
+    for template in templates:
+        try:
+            resources.append(_parse_resource(template.format_map(arguments)))
+        except (ValueError, IndexError, AttributeError, KeyError):
+            resources.append((template.partition(":")[0], ""))
+    return resources
+
+
+def resources_overlap(a: Resource, b: Resource) -> bool:
+    """Whether two resources may refer to the same thing."""
+    kind_a, path_a = a
+    kind_b, path_b = b
+    if kind_a != kind_b:
+        return False
+    if path_a is None or path_b is None or not path_a or not path_b:
+        return True
+    return (
+        path_a == path_b
+        or path_a.startswith(path_b + "/")
+        or path_b.startswith(path_a + "/")
+    )
+
+
+@dataclass
+class ToolAccess:
+    """Resources one tool call reads and writes."""
+
+    reads: List[Resource] = field(default_factory=list)
+    writes: List[Resource] = field(default_factory=list)
+
+    def conflicts_with(self, other: "ToolAccess") -> bool:
+        """Whether the two calls must not run concurrently (or reordered)."""
+        mine = self.reads + self.writes
+        theirs = other.reads + other.writes
+        return (
+            any(resources_overlap(w, r) for w in self.writes for r in theirs)
+            or any(resources_overlap(w, r) for w in other.writes for r in mine)
+        )
+
+
+def tool_access(metadata: Optional[Dict[str, Any]], args: Dict[str, Any]) -> ToolAccess:
+    """Resources a call touches according to its tool's metadata."""
+    if not metadata:
+        return ToolAccess()
+    return ToolAccess(
+        reads=resolve_resources(metadata.get("reads", []), args),
+        writes=resolve_resources(metadata.get("writes", []), args),
+    )
+
+
+@dataclass
+class _Slot:
+    """Scheduling state of one planned call."""
+
+    after: List[asyncio.Event]
+    done: asyncio.Event
+    semaphore: Optional[asyncio.Semaphore]
+
+
+class ToolCallScheduler:
+    """``awrap_tool_call`` hook that orders conflicting calls and caps categories.
+
+    ``plan()`` must be called with the tool calls of a message before the
+    ToolNode runs them; calls that were not planned run immediately. The
+    wrapped ``inner`` hook (e.g. the profiler) only sees the time a call
+    actually runs, not the time it waited.
+    """
+
+    def __init__(
+        self,
+        declarations: Dict[str, Dict[str, Any]],
+        category_limits: Optional[Dict[str, int]] = None,
+        inner: Optional[ToolCallHook] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            declarations: Tool metadata by tool name ("category", "reads", "writes")
+            category_limits: Maximum concurrent calls per tool category (0 = unlimited)
+            inner: Hook to run each call through once it may start
+        """
+        self._declarations = declarations
+        self._category_limits = {k: v for k, v in (category_limits or {}).items() if v > 0}
+        self._inner = inner
+        self._slots: Dict[str, _Slot] = {}
+
+    def plan(self, tool_calls: List[Dict[str, Any]]) -> None:
+        """Work out the ordering constraints of a message's tool calls."""
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        planned: List[Tuple[ToolAccess, asyncio.Event]] = []
+        for call in tool_calls:
+            call_id = call.get("id") or ""
+            if not call_id or call_id in self._slots:
+                continue
+            metadata = self._declarations.get(call.get("name", ""))
+            access = tool_access(metadata, call.get("args", {}))
+            after = [done for earlier, done in planned if access.conflicts_with(earlier)]
+
+            semaphore = None
+            category = (metadata or {}).get("category")
+            if category in self._category_limits:
+                if category not in semaphores:
+                    semaphores[category] = asyncio.Semaphore(self._category_limits[category])
+                semaphore = semaphores[category]
+
+            slot = _Slot(after=after, done=asyncio.Event(), semaphore=semaphore)
+            self._slots[call_id] = slot
+            planned.append((access, slot.done))
+
+    def discard(self, call_ids: List[str]) -> None:
+        """Drop the plans of calls that were not run."""
+        for call_id in call_ids:
+            self._slots.pop(call_id, None)
+
+    async def __call__(self, request: Any, execute: Callable[[Any], Awaitable[Any]]) -> Any:
+        call = request.tool_call
+        slot = self._slots.pop(call.get("id") or "", None)
+        if slot is None:
+            return await self._run(request, execute)
+
+        try:
+            start = time.perf_counter()
+            for event in slot.after:
+                await event.wait()
+            if slot.semaphore is None:
+                self._record_wait(call, start)
+                return await self._run(request, execute)
+            async with slot.semaphore:
+                self._record_wait(call, start)
+                return await self._run(request, execute)
+        finally:
+            slot.done.set()
+
+    async def _run(self, request: Any, execute: Callable[[Any], Awaitable[Any]]) -> Any:
+        if self._inner is None:
+            return await execute(request)
+        return await self._inner(request, execute)
+
+    @staticmethod
+    def _record_wait(call: Dict[str, Any], start: float) -> None:
+        waited = time.perf_counter() - start
+        tool = call.get("name") or "unknown"
+        metrics.TOOL_QUEUE_SECONDS.observe(waited, tool=tool)
+        if waited >= 0.001:
+            logger.debug(f"Tool call {call.get('id')} ({tool}) waited {waited * 1000:.0f}ms")
+
+
+# =============================================================================
+# Sync tool thread pool
+# =============================================================================
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_thread_pool(max_workers: int = 8) -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for sync tools.
+
+    The pool is created on first use; later calls share it regardless of
+    ``max_workers``.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="tool")
+            logger.debug(f"Started tool thread pool ({max_workers} workers)")
+        return _pool
+
+
+def close_tool_thread_pool() -> None:
+    """Shut down the sync tool thread pool (on application shutdown)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_pool(func: Callable[..., Any], pool: ThreadPoolExecutor) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Copy the context so the call's profile (and other context
+        # variables) are visible in the worker thread
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(pool, call)
+
+    return wrapper
+
+
+def offload_sync_tools(tools: List[Any], pool: ThreadPoolExecutor) -> List[Any]:
+    """Copies of the tools whose sync functions run in the given pool.
+
+    Tools with a coroutine and tools of other types are returned unchanged.
+    """
+    offloaded = []
+    for tool in tools:
+        if isinstance(tool, StructuredTool) and tool.func is not None and tool.coroutine is None:
+            tool = tool.model_copy(update={"coroutine": _run_in_pool(tool.func, pool)})
+        offloaded.append(tool)
+    return offloaded
+
+
+__all__ = [
+    "ToolAccess",
+    "ToolCallScheduler",
+    "close_tool_thread_pool",
+    "get_tool_thread_pool",
+    "offload_sync_tools",
+    "resolve_resources",
+    "resources_overlap",
+    "tool_access",
+]
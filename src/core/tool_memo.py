@@ -0,0 +1,249 @@
+"""Memoization of repeated read-only tool calls within a phase.
+
+Agents often repeat the same read-only call in a phase: ``read_file`` on a
+file they read a few turns ago, ``list_files``, ``sql_schema``, ``git_log``.
+Each repeat re-runs the I/O and puts the same payload into the context a
+second time. ``ToolResultMemo`` is a tool call hook that answers such a
+repeat with a short "unchanged since call X" message instead, provided:
+
+- the tool's metadata has ``"read_only": True``
+- it has the same tool name and arguments as an earlier successful call of
+  the same phase
+- the dependency version of the call is unchanged: the resources the tool
+  ``reads`` (see core.tool_executor) have not been written by a tool call
+  since, and for workspace paths, their mtimes and sizes are unchanged
+  (which also catches files written by tools that don't declare writes)
+- the earlier result is still visible to the model (among the recent tool
+  results that compaction keeps in full, once this batch's results are in)
+
+Only call IDs and versions are stored; the earlier result itself stays in
+the conversation.
+
+Usage:
+    memo = ToolResultMemo(get_available_tools(), keep_recent_tool_results=10)
+    result = await memo(request, execute)   # as (part of) awrap_tool_call
+"""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from . import metrics
+from .tool_executor import Resource, resources_overlap, tool_access
+from .tool_profile import content_text, find_tool_message, is_error_content
+
+logger = logging.getLogger(__name__)
+
+# Directory entries scanned for a directory's version before giving up
+MAX_SCAN_ENTRIES = 2000
+
+# Jobs whose memo is kept (least recently used dropped)
+MAX_JOBS = 64
+
+UNCHANGED_TEMPLATE = (
+    "Unchanged since call {call_id}: {tool} returns the same result as that "
+    "call (shown above)."
+)
+
+
+def _path_version(root: Path, relative: str) -> Optional[Tuple[int, int, int]]:
+    """(entries, latest mtime, total size) of a workspace path.
+
+    Returns None if the path can't be versioned cheaply (outside the
+    workspace, or a directory tree larger than MAX_SCAN_ENTRIES).
+    """
+    path = root / relative if relative else root
+    if relative.startswith(".."):
+        return None
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (0, 0, 0)
+    except OSError:
+        return None
+    if not path.is_dir():
+        return (1, stat.st_mtime_ns, stat.st_size)
+
+    entries, latest, size = 1, stat.st_mtime_ns, 0
+    pending = [str(path)]
+    try:
+        while pending:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    entries += 1
+                    if entries > MAX_SCAN_ENTRIES:
+                        return None
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    latest = max(latest, entry_stat.st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        size += entry_stat.st_size
+    except OSError:
+        return None
+    return (entries, latest, size)
+
+
+@dataclass
+class _Entry:
+    """An earlier successful read-only call."""
+
+    call_id: str
+    version: Tuple[Any, ...]
+
+
+@dataclass
+class _JobMemo:
+    """Memo state of one job, reset at phase changes."""
+
+    phase: Any = None
+    entries: Dict[Tuple[str, str], _Entry] = field(default_factory=dict)
+    writes: Dict[Resource, int] = field(default_factory=dict)
+    sequence: int = 0
+
+    def write_sequence(self, resource: Resource) -> int:
+        """Latest write (by any tool call) overlapping a resource."""
+        return max(
+            (seq for written, seq in self.writes.items() if resources_overlap(written, resource)),
+            default=0,
+        )
+
+    def record_writes(self, resources: List[Resource]) -> None:
+        for resource in resources:
+            self.sequence += 1
+            self.writes[resource] = self.sequence
+
+
+class ToolResultMemo:
+    """Tool call hook that short-circuits repeated read-only calls.
+
+    State is kept per job (from the ``job_id`` of the tool node's state) and
+    cleared whenever the job's ``phase_number`` changes.
+    """
+
+    def __init__(
+        self,
+        declarations: Dict[str, Dict[str, Any]],
+        keep_recent_tool_results: int = 10,
+        workspace_root: Optional[Callable[[str], Optional[Path]]] = None,
+        on_hit: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        """Initialize the memo.
+
+        Args:
+            declarations: Tool metadata by tool name ("read_only", "reads", "writes")
+            keep_recent_tool_results: Tool results the model sees in full
+            workspace_root: Workspace directory of a job (None: files are
+                versioned by write counters only)
+            on_hit: Called with (tool name, args) when a call is answered
+                from the memo
+        """
+        self._declarations = declarations
+        self._keep_recent = keep_recent_tool_results
+        self._workspace_root = workspace_root
+        self._on_hit = on_hit
+        self._jobs: "OrderedDict[str, _JobMemo]" = OrderedDict()
+
+    def _job(self, job_id: str, phase: Any) -> _JobMemo:
+        job = self._jobs.get(job_id)
+        if job is None or job.phase != phase:
+            job = _JobMemo(phase=phase)
+            self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        while len(self._jobs) > MAX_JOBS:
+            self._jobs.popitem(last=False)
+        return job
+
+    def clear(self, job_id: str) -> None:
+        """Forget a job's memo."""
+        self._jobs.pop(job_id, None)
+
+    def _version(self, job_id: str, job: _JobMemo, reads: List[Resource]) -> Optional[Tuple[Any, ...]]:
+        root = self._workspace_root(job_id) if self._workspace_root else None
+        parts: List[Any] = []
+        for resource in reads:
+            parts.append(job.write_sequence(resource))
+            kind, path = resource
+            if kind == "file" and root is not None:
+                path_version = _path_version(root, path or "")
+                if path_version is None:
+                    return None
+                parts.append(path_version)
+        return tuple(parts)
+
+    def _visible(self, messages: List[Any], call_id: str) -> bool:
+        """Whether the result of a call is among the results kept in full.
+
+        The results of the batch being executed (this call included) are
+        counted as well: they are added before the next turn, and push the
+        oldest kept results out.
+        """
+        batch = 0
+        for message in reversed(messages):
+            if isinstance(message, AIMessage):
+                batch = len(message.tool_calls)
+                break
+        seen = batch
+        for message in reversed(messages):
+            if self._keep_recent and seen >= self._keep_recent:
+                return False
+            if not isinstance(message, ToolMessage):
+                continue
+            if message.tool_call_id == call_id:
+                return True
+            seen += 1
+        return False
+
+    async def __call__(self, request: Any, execute: Callable[[Any], Awaitable[Any]]) -> Any:
+        call = request.tool_call
+        name = call.get("name") or ""
+        args = call.get("args") or {}
+        metadata = self._declarations.get(name)
+        state = request.state if isinstance(request.state, dict) else {}
+        job = self._job(state.get("job_id", "unknown"), state.get("phase_number"))
+        access = tool_access(metadata, args)
+
+        if not (metadata and metadata.get("read_only")):
+            try:
+                return await execute(request)
+            finally:
+                job.record_writes(access.writes)
+
+        key = (name, json.dumps(args, sort_keys=True, default=str))
+        version = self._version(state.get("job_id", "unknown"), job, access.reads)
+        entry = job.entries.get(key)
+        if (
+            entry is not None
+            and version is not None
+            and entry.version == version
+            and self._visible(state.get("messages", []), entry.call_id)
+        ):
+            metrics.TOOL_MEMO_HITS.inc(tool=name)
+            logger.debug(f"Tool call {call.get('id')} ({name}) answered from call {entry.call_id}")
+            if self._on_hit is not None:
+                self._on_hit(name, args)
+            return ToolMessage(
+                content=UNCHANGED_TEMPLATE.format(call_id=entry.call_id, tool=name),
+                name=name,
+                tool_call_id=call.get("id") or "",
+            )
+
+        result = await execute(request)
+        message = find_tool_message(result, call.get("id") or "")
+        if version is not None and message is not None and message.status != "error":
+            if not is_error_content(content_text(message)):
+                job.entries[key] = _Entry(call_id=message.tool_call_id, version=version)
+        return result
+
+
+__all__ = [
+    "MAX_SCAN_ENTRIES",
+    "ToolResultMemo",
+    "UNCHANGED_TEMPLATE",
+]
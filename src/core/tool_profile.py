@@ -0,0 +1,208 @@
+"""Per-call tool execution profiling.
+
+ToolNode runs the tool calls of one AI message concurrently, so timing the
+whole batch says nothing about which call was slow. ``ToolCallProfiler`` is
+installed as the ToolNode's ``awrap_tool_call`` hook and measures every call
+on its own:
+
+- wall time: from dispatch to result
+- CPU time: thread CPU time spent in the tool (async steps of the tool
+  coroutine, plus the worker-thread time of sync tools)
+- result size: UTF-8 bytes of the ToolMessage content
+- error class: exception class, or ``ToolError`` for tools that report
+  failure in their result text
+
+Sync tools run in an executor thread, outside the coroutine being timed;
+``instrument_tools()`` wraps their functions so that thread's CPU time is
+added to the profile of the call (found through a context variable, which
+LangChain copies into the executor thread).
+
+Usage:
+    profiler = ToolCallProfiler()
+    tool_node = ToolNode(instrument_tools(tools), awrap_tool_call=profiler)
+    result = await tool_node.ainvoke(state)
+    profile = profiler.pop(call_id)
+"""
+
+import functools
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import StructuredTool
+
+# Error class recorded for tools that return an error message instead of raising
+TOOL_ERROR = "ToolError"
+
+_ERROR_INDICATORS = ("error:", "failed:", "exception:", "traceback")
+
+
+@dataclass
+class ToolCallProfile:
+    """Measurements of a single tool call."""
+
+    tool: str
+    call_id: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    result_bytes: int = 0
+    error_class: Optional[str] = None
+
+    @property
+    def wall_ms(self) -> int:
+        return int(self.wall_seconds * 1000)
+
+    @property
+    def cpu_ms(self) -> int:
+        return int(self.cpu_seconds * 1000)
+
+    @property
+    def success(self) -> bool:
+        return self.error_class is None
+
+
+_current_profile: ContextVar[Optional[ToolCallProfile]] = ContextVar(
+    "tool_call_profile", default=None
+)
+
+
+def is_error_content(content: str) -> bool:
+    """Whether tool result text reports a failure."""
+    if not content:
+        return False
+    content_lower = content.lower()
+    return any(indicator in content_lower for indicator in _ERROR_INDICATORS)
+
+
+def content_text(message: ToolMessage) -> str:
+    """ToolMessage content as text (multimodal content is JSON-encoded)."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, default=str)
+
+
+class _CpuTimed:
+    """Awaitable that drives a coroutine and sums the CPU time of its steps.
+
+    Time spent suspended (waiting on I/O or other tasks) is not counted, so
+    concurrent calls on the same event loop don't bill each other.
+    """
+
+    def __init__(self, coro: Awaitable[Any], profile: ToolCallProfile) -> None:
+        self._coro = coro.__await__()
+        self._profile = profile
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        send_value: Any = None
+        throw_exc: Optional[BaseException] = None
+        while True:
+            start = time.thread_time()
+            try:
+                if throw_exc is not None:
+                    yielded = self._coro.throw(throw_exc)
+                else:
+                    yielded = self._coro.send(send_value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._profile.cpu_seconds += time.thread_time() - start
+            try:
+                send_value, throw_exc = (yield yielded), None
+            except BaseException as e:
+                send_value, throw_exc = None, e
+
+
+def _cpu_timed_func(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = _current_profile.get()
+        start = time.thread_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profile is not None:
+                profile.cpu_seconds += time.thread_time() - start
+
+    return wrapper
+
+
+def instrument_tools(tools: List[Any]) -> List[Any]:
+    """Copies of the tools with CPU accounting for sync-only tools.
+
+    Tools with a coroutine are timed by the profiler directly and are
+    returned unchanged, as are tools of other types.
+    """
+    instrumented = []
+    for tool in tools:
+        if isinstance(tool, StructuredTool) and tool.func is not None and tool.coroutine is None:
+            tool = tool.model_copy(update={"func": _cpu_timed_func(tool.func)})
+        instrumented.append(tool)
+    return instrumented
+
+
+class ToolCallProfiler:
+    """``awrap_tool_call`` hook that profiles each tool call.
+
+    Profiles are kept by tool call ID until collected with ``pop()``.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: Dict[str, ToolCallProfile] = {}
+
+    async def __call__(self, request: Any, execute: Callable[[Any], Awaitable[Any]]) -> Any:
+        call = request.tool_call
+        profile = ToolCallProfile(tool=call.get("name") or "unknown", call_id=call.get("id") or "")
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            result = await _CpuTimed(execute(request), profile)
+        except Exception as e:
+            profile.error_class = type(e).__name__
+            raise
+        finally:
+            profile.wall_seconds = time.perf_counter() - start
+            _current_profile.reset(token)
+            self._profiles[profile.call_id] = profile
+
+        message = find_tool_message(result, profile.call_id)
+        if message is not None:
+            text = content_text(message)
+            profile.result_bytes = len(text.encode("utf-8"))
+            if getattr(message, "status", None) == "error" or is_error_content(text):
+                profile.error_class = TOOL_ERROR
+        return result
+
+    def pop(self, call_id: str) -> Optional[ToolCallProfile]:
+        """Take the profile of a finished call."""
+        return self._profiles.pop(call_id, None)
+
+
+def find_tool_message(result: Any, call_id: str) -> Optional[ToolMessage]:
+    """The ToolMessage answering a call in a ToolNode result (message, Command or list)."""
+    candidates = result if isinstance(result, list) else [result]
+    for item in candidates:
+        if isinstance(item, ToolMessage):
+            if item.tool_call_id == call_id:
+                return item
+            continue
+        update = getattr(item, "update", None)
+        messages = update.get("messages", []) if isinstance(update, dict) else []
+        for message in messages:
+            if isinstance(message, ToolMessage) and message.tool_call_id == call_id:
+                return message
+    return None
+
+
+__all__ = [
+    "TOOL_ERROR",
+    "ToolCallProfile",
+    "ToolCallProfiler",
+    "content_text",
+    "find_tool_message",
+    "instrument_tools",
+    "is_error_content",
+]
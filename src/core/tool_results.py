@@ -0,0 +1,141 @@
+"""Spill store for large tool results.
+
+Context compaction replaces old tool results with a placeholder or a
+truncated prefix. Most of that output (search results, SQL rows, extracted
+text) is not in the workspace, so the agent used to re-run the tool to see
+it again. Instead, large results are written to a per-job, content-addressed
+store as they are produced:
+
+    workspace/tool_results/job_<id>/<handle>.txt
+
+The ToolMessage records the handle (``additional_kwargs["tool_result_handle"]``),
+so compaction can leave a compact reference plus a preview, and the
+``recall_tool_result`` tool returns exact slices of the stored text.
+
+Usage:
+    store = ToolResultStore(job_id)
+    handle = store.put(content)
+    text = store.read(handle, start=5000, length=5000)
+"""
+
+import hashlib
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.messages import ToolMessage
+
+from .workspace import get_tool_results_path
+
+logger = logging.getLogger(__name__)
+
+# ToolMessage.additional_kwargs key holding the spill handle
+HANDLE_KEY = "tool_result_handle"
+
+_HANDLE_PATTERN = re.compile(r"^tr_[0-9a-f]{16}$")
+
+
+def result_handle(content: str) -> str:
+    """Content-addressed handle of a tool result."""
+    return "tr_" + hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def get_result_handle(message: ToolMessage) -> Optional[str]:
+    """Spill handle recorded on a ToolMessage, if any."""
+    return message.additional_kwargs.get(HANDLE_KEY)
+
+
+class ToolResultStore:
+    """Per-job store of tool result texts, keyed by content hash.
+
+    Identical results share one file; files are written once and never
+    modified.
+    """
+
+    def __init__(self, job_id: str, root: Optional[Path] = None) -> None:
+        self.job_id = job_id
+        self.root = (root or get_tool_results_path()) / f"job_{job_id}"
+
+    def _path(self, handle: str) -> Path:
+        if not _HANDLE_PATTERN.match(handle):
+            raise ValueError(f"Invalid tool result handle: {handle!r}")
+        return self.root / f"{handle}.txt"
+
+    def put(self, content: str) -> str:
+        """Store a result.
+
+        Returns:
+            Handle for reading the result back
+        """
+        handle = result_handle(content)
+        path = self._path(handle)
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
+            logger.debug(f"[{self.job_id}] Spilled tool result {handle} ({len(content)} chars)")
+        return handle
+
+    def get(self, handle: str) -> Optional[str]:
+        """Full text of a stored result (None if unknown)."""
+        path = self._path(handle)
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def read(self, handle: str, start: int = 0, length: Optional[int] = None) -> Optional[str]:
+        """Slice of a stored result (None if unknown).
+
+        Args:
+            handle: Result handle
+            start: First character
+            length: Number of characters (default: to the end)
+        """
+        content = self.get(handle)
+        if content is None:
+            return None
+        end = None if length is None else start + length
+        return content[start:end]
+
+
+def spill_tool_message(
+    message: ToolMessage,
+    store: ToolResultStore,
+    min_chars: int,
+) -> Optional[str]:
+    """Spill a ToolMessage's text content if it is at least ``min_chars`` long.
+
+    Records the handle on the message. Multimodal (non-text) content is
+    not spilled.
+
+    Returns:
+        Handle, or None if the message was not spilled
+    """
+    content = message.content
+    if not isinstance(content, str) or len(content) < min_chars:
+        return None
+    handle = get_result_handle(message)
+    if handle is None:
+        handle = store.put(content)
+        message.additional_kwargs[HANDLE_KEY] = handle
+    return handle
+
+
+def recall_hint(handle: str, start: int = 0) -> str:
+    """Instruction for reading a spilled result back."""
+    if start:
+        return f"recall_tool_result(handle=\"{handle}\", start={start})"
+    return f"recall_tool_result(handle=\"{handle}\")"
+
+
+__all__ = [
+    "HANDLE_KEY",
+    "ToolResultStore",
+    "get_result_handle",
+    "recall_hint",
+    "result_handle",
+    "spill_tool_message",
+]
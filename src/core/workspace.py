@@ -10,7 +10,8 @@ Environment-aware path resolution:
 
 Git versioning:
 - Optional git repository per workspace for automatic change tracking
-- Commits on todo completion for audit trail
+- Commits on todo completion for audit trail (batched on a background
+  thread, staging only paths reported as changed)
 - Phase tags for milestone tracking
 """
 
@@ -18,11 +19,11 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional, List, Set
 from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
-    from ..managers.git_manager import GitManager
+    from ..managers.git_manager import GitCommitWorker, GitManager
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,9 @@ class WorkspaceManagerConfig:
     # Git remote URL for workspace delivery (set by orchestrator via Gitea)
     git_remote_url: Optional[str] = None
 
+    # Coalescing window for background todo commits (0 = commit synchronously)
+    git_commit_batch_seconds: float = 2.0
+
     @classmethod
     def from_dict(cls, data: dict) -> "WorkspaceManagerConfig":
         """Create config from dictionary."""
@@ -74,6 +78,7 @@ class WorkspaceManagerConfig:
                 cls.__dataclass_fields__["git_ignore_patterns"].default_factory()
             ),
             git_remote_url=data.get("git_remote_url"),
+            git_commit_batch_seconds=data.get("git_commit_batch_seconds", 2.0),
         )
 
 
@@ -118,6 +123,22 @@ def get_checkpoints_path() -> Path:
     return checkpoints_dir
 
 
+def get_tool_results_path() -> Path:
+    """Get path for spilled tool result storage.
+
+    Large tool results are stored in a shared directory outside individual
+    job workspaces (so they are not versioned or listed as workspace files):
+        workspace/tool_results/job_<id>/
+
+    Returns:
+        Path to tool results directory (created if it doesn't exist)
+    """
+    base = get_workspace_base_path()
+    results_dir = base / "tool_results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    return results_dir
+
+
 def get_logs_path() -> Path:
     """Get path for job log file storage.
 
@@ -192,6 +213,10 @@ class WorkspaceManager:
 
         # Git manager (created during initialize if git_versioning enabled)
         self._git_manager: Optional["GitManager"] = None
+        self._commit_worker: Optional["GitCommitWorker"] = None
+
+        # Paths changed since the last commit (None = unknown, stage everything)
+        self._changed_paths: Optional[Set[str]] = set()
 
     @property
     def path(self) -> Path:
@@ -211,6 +236,80 @@ class WorkspaceManager:
         """
         return self._git_manager
 
+    @property
+    def commit_worker(self) -> Optional["GitCommitWorker"]:
+        """Get the background commit worker for the active GitManager.
+
+        Created lazily and recreated if the GitManager is replaced (e.g.
+        after a pod-handoff clone). Returns None if git is not active.
+        """
+        git_mgr = self._git_manager
+        if git_mgr is None or not git_mgr.is_active:
+            return None
+
+        if self._commit_worker is None or self._commit_worker.git_manager is not git_mgr:
+            try:
+                from ..managers.git_manager import GitCommitWorker
+            except ImportError:
+                from src.managers.git_manager import GitCommitWorker
+
+            if self._commit_worker is not None:
+                self._commit_worker.close()
+            self._commit_worker = GitCommitWorker(
+                git_mgr, batch_seconds=self.config.git_commit_batch_seconds
+            )
+        return self._commit_worker
+
+    def flush_commits(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued background commits are written.
+
+        Use before tagging or pushing so the tag covers every prior commit.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if nothing is pending anymore
+        """
+        if self._commit_worker is None:
+            return True
+        return self._commit_worker.flush(timeout)
+
+    def record_change(self, relative_path: Optional[str] = None) -> None:
+        """Report a changed path so the next todo commit stages it.
+
+        Workspace write methods call this automatically. Tools that modify
+        files directly should call it too; pass None when the changed paths
+        are unknown (e.g. after running a shell command) so the next commit
+        stages everything.
+
+        Args:
+            relative_path: Path relative to workspace root, or None
+        """
+        if relative_path is None:
+            self._changed_paths = None
+            return
+        if self._changed_paths is None:
+            return
+        try:
+            path = self.get_path(relative_path)
+            rel = path.relative_to(self._workspace_path.resolve())
+        except ValueError:
+            return
+        if str(rel) != ".":
+            self._changed_paths.add(rel.as_posix())
+
+    def consume_changed_paths(self) -> Optional[List[str]]:
+        """Return and reset the paths changed since the last call.
+
+        Returns:
+            Sorted workspace-relative paths, or None if unknown changes were
+            reported and everything should be staged
+        """
+        changed = self._changed_paths
+        self._changed_paths = set()
+        return sorted(changed) if changed is not None else None
+
     def initialize(self) -> None:
         """Initialize the workspace directory structure.
 
@@ -367,6 +466,7 @@ class WorkspaceManager:
 
         # Write content
         file_path.write_text(content, encoding="utf-8")
+        self.record_change(relative_path)
         logger.debug(f"Wrote file: {relative_path}")
 
         return file_path
@@ -388,6 +488,7 @@ class WorkspaceManager:
 
         with open(file_path, "a", encoding="utf-8") as f:
             f.write(content)
+        self.record_change(relative_path)
 
         return file_path
 
@@ -432,6 +533,7 @@ class WorkspaceManager:
             raise ValueError(f"Not a directory: {relative_path}")
 
         shutil.rmtree(dir_path)
+        self.record_change(relative_path)
         logger.debug(f"Deleted directory: {relative_path}")
         return True
 
@@ -454,6 +556,7 @@ class WorkspaceManager:
 
         if file_path.is_file():
             file_path.unlink()
+            self.record_change(relative_path)
             logger.debug(f"Deleted file: {relative_path}")
             return True
 
@@ -494,6 +597,8 @@ class WorkspaceManager:
 
         # Use shutil.move for the actual operation
         shutil.move(str(source_path), str(dest_path))
+        self.record_change(source)
+        self.record_change(dest)
         logger.debug(f"Moved: {source} -> {dest}")
 
         return dest_path
@@ -528,6 +633,7 @@ class WorkspaceManager:
 
         # Use shutil.copy2 to preserve metadata
         shutil.copy2(str(source_path), str(dest_path))
+        self.record_change(dest)
         logger.debug(f"Copied: {source} -> {dest}")
 
         return dest_path
@@ -643,6 +749,10 @@ class WorkspaceManager:
         if not self._workspace_path.exists():
             return False
 
+        if self._commit_worker is not None:
+            self._commit_worker.close()
+            self._commit_worker = None
+
         shutil.rmtree(self._workspace_path)
         logger.info(f"Cleaned up workspace: {self._workspace_path}")
         self._initialized = False
@@ -24,19 +24,40 @@ Example:
     mongo_db = MongoDB()
     mongo_db.archive_llm_request(job_id="abc", agent_type="worker", ...)
     ```
+
+The database classes are imported on first access, so that importing
+``src.database.postgres_db`` does not load the neo4j and pymongo drivers.
 """
 
+import importlib
 from pathlib import Path
+from typing import Any
 
 # Schema files
 SCHEMA_DIR = Path(__file__).parent
 SCHEMA_FILE = SCHEMA_DIR / "queries" / "postgres" / "schema.sql"
 SCHEMA_VECTOR_FILE = SCHEMA_DIR / "schema_vector.sql"  # TODO: Move to queries/ if exists
 
-# Database classes
-from .postgres_db import PostgresDB  # noqa: E402
-from .neo4j_db import Neo4jDB  # noqa: E402
-from .mongo_db import MongoDB  # noqa: E402
+# Database class -> submodule defining it
+_EXPORTS = {
+    'PostgresDB': 'postgres_db',
+    'Neo4jDB': 'neo4j_db',
+    'MongoDB': 'mongo_db',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Database classes
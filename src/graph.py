@@ -43,6 +43,8 @@ Phase Alternation:
 - workspace.md persists across phases for long-term memory
 """
 
+import asyncio
+import functools
 import logging
 import re
 import time
@@ -57,6 +59,7 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.checkpoint.base import BaseCheckpointSaver
@@ -69,8 +72,14 @@ from .core.loader import (
 )
 from .core.workspace import WorkspaceManager
 from .core.archiver import get_archiver
-from .core.context import ContextManager, ContextConfig, ToolRetryManager, sanitize_message_history
+from .core import metrics
+from .core.tool_profile import ToolCallProfiler, content_text, instrument_tools
+from .core.tool_executor import ToolCallScheduler, get_tool_thread_pool, offload_sync_tools
+from .core.tool_memo import ToolResultMemo
+from .core.tool_results import ToolResultStore, spill_tool_message
+from .core.context import ContextManager, ContextConfig, ToolRetryManager
 from .core.phase_snapshot import PhaseSnapshotManager
+from .core.graph_templates import GraphTemplate, JobBound, current_job_bindings
 from .core.phase import (
     handle_phase_transition,
     get_initial_strategic_todos,
@@ -79,7 +88,9 @@ from .core.phase import (
 )
 from .managers import TodoManager, TodoStatus, PlanManager, MemoryManager
 from .llm.exceptions import ContextOverflowError
+from .llm.tool_schemas import ToolSchemaSet, get_tool_schema_registry
 from .tools.context import ToolContext
+from .tools.registry import get_available_tools
 
 logger = logging.getLogger(__name__)
 
@@ -212,22 +223,6 @@ def _build_tool_use_failed_feedback(failed_generation: str) -> str:
     )
 
 
-def _is_tool_error(content: str) -> bool:
-    """Check if tool message content indicates an error.
-
-    Args:
-        content: Tool result content to check
-
-    Returns:
-        True if content appears to indicate an error
-    """
-    if not content:
-        return False
-    content_lower = content.lower()
-    error_indicators = ["error:", "failed:", "exception:", "traceback"]
-    return any(indicator in content_lower for indicator in error_indicators)
-
-
 def _extract_markdown_content(content: str) -> str:
     """Extract clean markdown content from LLM response.
 
@@ -430,15 +425,20 @@ def create_execute_node(
         summarization_prompt: Prompt template for summarization
     """
 
-    # Extract tool schemas from bound LLMs once at creation time for archiving
-    def _extract_tool_schemas(bound_llm: BaseChatModel) -> Optional[List[Dict[str, Any]]]:
-        """Extract OpenAI-format tool schemas from a bound LLM."""
-        if hasattr(bound_llm, 'kwargs'):
-            return bound_llm.kwargs.get('tools')
-        return None
-
-    strategic_tool_schemas = _extract_tool_schemas(strategic_llm_with_tools)
-    tactical_tool_schemas = _extract_tool_schemas(tactical_llm_with_tools)
+    # Register the tool schemas of each phase once at creation time. Archived
+    # requests and audit docs reference them by hash, and HTTP-layer token
+    # counting reuses their cached token count.
+    def _register_tool_schemas(bound_llm: BaseChatModel, phase: str) -> Optional[ToolSchemaSet]:
+        """Register the OpenAI-format tool schemas of a bound LLM."""
+        schemas = bound_llm.kwargs.get('tools') if hasattr(bound_llm, 'kwargs') else None
+        if not schemas or not isinstance(schemas, list):
+            return None
+        return get_tool_schema_registry().register(schemas, phase=phase)
+
+    phase_tool_schemas = {
+        "strategic": _register_tool_schemas(strategic_llm_with_tools, "strategic"),
+        "tactical": _register_tool_schemas(tactical_llm_with_tools, "tactical"),
+    }
 
     # Extract model kwargs (temperature, etc.) for archiving
     def _extract_model_kwargs(bound_llm: BaseChatModel) -> Dict[str, Any]:
@@ -460,8 +460,9 @@ def create_execute_node(
 
     model_kwargs = _extract_model_kwargs(strategic_llm_with_tools)
 
-    # Track consecutive tool_use_failed errors (mutable container for closure access)
-    _tool_use_failed_streak = [0]
+    # Track consecutive tool_use_failed errors per job (the node may be
+    # reused by later jobs through a graph template)
+    _tool_use_failed_streak: Dict[str, int] = {}
 
     async def execute(state: UniversalAgentState) -> Dict[str, Any]:
         """Execute current todo using ReAct pattern."""
@@ -478,13 +479,7 @@ def create_execute_node(
             tool_context.set_current_phase("strategic" if is_strategic else "tactical")
 
         logger.debug(f"[{job_id}] Execute iteration {iteration}")
-
-        # Debug: log message types in state
-        msg_types = {}
-        for msg in messages:
-            msg_type = type(msg).__name__
-            msg_types[msg_type] = msg_types.get(msg_type, 0) + 1
-        logger.debug(f"[{job_id}] State messages: {len(messages)} total, types: {msg_types}")
+        metrics.JOB_ITERATION.set(iteration, job_id=job_id)
 
         # Build messages for LLM
         prepared_messages = []
@@ -506,6 +501,19 @@ def create_execute_node(
         )
         prepared_messages.append(SystemMessage(content=full_system))
 
+        # Swap in a background summary of the older history if one finished.
+        # At the hard limit, wait for a running one rather than summarizing inline.
+        compaction_update = await context_mgr.take_background_summary(
+            job_id, messages, wait=context_mgr.should_summarize(messages),
+        )
+        if compaction_update:
+            original_message_count = len(messages)
+            messages = add_messages(messages, compaction_update)
+            logger.info(
+                f"[{job_id}] Background summary applied: {original_message_count} -> "
+                f"{len(messages)} messages"
+            )
+
         # Ensure context is within limits before LLM call
         original_message_count = len(messages)
         oss_reasoning_level = config.context_management.reasoning_level or config.llm.reasoning_level or "high"
@@ -515,24 +523,38 @@ def create_execute_node(
             summarization_prompt,
             oss_reasoning_level=oss_reasoning_level,
             max_summary_length=config.context_management.max_summary_length,
+            phase_number=phase_number,
         )
-        # Separate RemoveMessage markers from actual messages
-        # RemoveMessage markers must NOT be sent to LLM - they're only for state update
-        remove_markers = [m for m in messages if isinstance(m, RemoveMessage)]
-        messages = [m for m in messages if not isinstance(m, RemoveMessage)]
+        # Prepare the history in a single pass:
+        # - RemoveMessage markers are split off (state update only, never sent to the LLM)
+        # - Old tool results are cleared (keeping the most recent ones)
+        # - Orphaned ToolMessages are dropped (can occur from improper context
+        #   compaction or checkpoint corruption)
+        # - Summary SystemMessages and the conversation are picked out
+        history = context_mgr.prepare_history(messages)
+        logger.debug(
+            f"[{job_id}] History messages: {len(messages)} total, types: {history.type_counts}"
+        )
+        remove_markers = history.remove_markers
         context_was_compacted = len(remove_markers) > 0
         if context_was_compacted:
+            context_mgr.cancel_background_summary(job_id)
             logger.info(
-                f"[{job_id}] Context compacted in execute: {original_message_count} -> {len(messages)} messages "
-                f"(removing {len(remove_markers)} old messages)"
+                f"[{job_id}] Context compacted in execute: {original_message_count} -> "
+                f"{len(history.history)} messages (removing {len(remove_markers)} old messages)"
             )
-
-        # Always clear old tool results, keep last 10
-        messages = context_mgr.clear_old_tool_results(messages)
-
-        # Sanitize message history to remove orphaned ToolMessages
-        # (can occur from improper context compaction or checkpoint corruption)
-        messages = sanitize_message_history(messages)
+        else:
+            # Summarize the older history in the background ahead of the hard limit
+            context_mgr.start_background_summary(
+                job_id,
+                history.history,
+                summarization_llm,
+                summarization_prompt,
+                oss_reasoning_level=oss_reasoning_level,
+                max_summary_length=config.context_management.max_summary_length,
+                phase_number=phase_number,
+            )
+        messages = history.messages
 
         # Add full conversation history in specific order:
         # 1. Summary SystemMessages first (context from before compaction)
@@ -540,10 +562,7 @@ def create_execute_node(
         # 3. Rest of conversation (excluding regular SystemMessages)
 
         # Step 1: Add summaries first
-        for msg in messages:
-            if isinstance(msg, SystemMessage):
-                if "[Summary of prior work]" in msg.content:
-                    prepared_messages.append(msg)
+        prepared_messages.extend(history.summaries)
 
         # Step 2: Inject workspace.md as fake tool call result
         # This makes it appear as if the agent already read workspace.md
@@ -558,9 +577,7 @@ def create_execute_node(
             prepared_messages.append(ws_tool_msg)
 
         # Step 3: Add rest of conversation (excluding all SystemMessages)
-        for msg in messages:
-            if not isinstance(msg, SystemMessage):
-                prepared_messages.append(msg)
+        prepared_messages.extend(history.conversation)
 
         # Todo reminders are injected post-LLM-response (see below) so they
         # persist in conversation history and survive context compaction.
@@ -583,12 +600,14 @@ def create_execute_node(
                 summarization_prompt,
                 oss_reasoning_level=oss_reasoning_level,
                 max_summary_length=config.context_management.max_summary_length,
+                phase_number=phase_number,
                 force=True,
             )
 
             # Separate RemoveMessage markers from actual messages
-            safety_remove_markers = [m for m in messages if isinstance(m, RemoveMessage)]
-            messages = [m for m in messages if not isinstance(m, RemoveMessage)]
+            forced = context_mgr.prepare_history(messages)
+            safety_remove_markers = forced.remove_markers
+            messages = forced.messages
 
             # Rebuild prepared_messages with compacted history
             # Keep system prompt, replace conversation history
@@ -598,17 +617,14 @@ def create_execute_node(
                 prepared_messages.append(system_msg)
 
             # Add compacted conversation (including summary SystemMessages)
-            for msg in messages:
-                if isinstance(msg, SystemMessage):
-                    if "[Summary of prior work]" in msg.content:
-                        prepared_messages.append(msg)
-                else:
-                    prepared_messages.append(msg)
+            prepared_messages.extend(forced.summaries)
+            prepared_messages.extend(forced.conversation)
 
             # Merge remove markers if compaction occurred
             if safety_remove_markers:
                 remove_markers = safety_remove_markers + remove_markers
                 context_was_compacted = True
+                context_mgr.cancel_background_summary(job_id)
 
             # Re-check - if still over limit, something is very wrong
             total_tokens = context_mgr.get_token_count(prepared_messages)
@@ -627,6 +643,7 @@ def create_execute_node(
         auditor = get_archiver()
         llm_audit_id = None
         phase_str = "strategic" if is_strategic else "tactical"
+        tool_schemas = phase_tool_schemas[phase_str]
         if auditor:
             llm_audit_id = auditor.audit_llm_call(
                 job_id=job_id,
@@ -638,6 +655,7 @@ def create_execute_node(
                 metadata=state.get("metadata"),
                 phase=phase_str,
                 phase_number=phase_number,
+                tool_schema_hash=tool_schemas.schema_hash if tool_schemas else None,
             )
 
         # Retry loop for LLM call with exponential backoff
@@ -648,9 +666,13 @@ def create_execute_node(
                 start_time = time.time()
                 response = llm_with_tools.invoke(prepared_messages)
                 latency_ms = int((time.time() - start_time) * 1000)
+                metrics.LLM_REQUEST_SECONDS.observe(
+                    latency_ms / 1000, phase=phase_str, model=config.llm.model
+                )
+                metrics.record_llm_usage(response, phase=phase_str, model=config.llm.model)
 
                 # Reset tool_use_failed streak on successful response
-                _tool_use_failed_streak[0] = 0
+                _tool_use_failed_streak.pop(job_id, None)
 
                 tool_calls_count = len(response.tool_calls) if hasattr(response, 'tool_calls') and response.tool_calls else 0
                 logger.info(f"[{job_id}] LLM response: {len(response.content)} chars, {tool_calls_count} tool calls")
@@ -658,7 +680,6 @@ def create_execute_node(
                 # Archive full LLM request/response to llm_requests collection
                 request_id = None
                 if auditor:
-                    current_tool_schemas = strategic_tool_schemas if is_strategic else tactical_tool_schemas
                     request_id = auditor.archive(
                         job_id=job_id,
                         agent_type=config.agent_id,
@@ -670,8 +691,9 @@ def create_execute_node(
                         metadata=state.get("metadata"),
                         phase=phase_str,
                         phase_number=phase_number,
-                        tool_schemas=current_tool_schemas,
+                        tool_schemas=tool_schemas.schemas if tool_schemas else None,
                         model_kwargs=model_kwargs,
+                        tool_schema_hash=tool_schemas.schema_hash if tool_schemas else None,
                     )
 
                     # Build tool calls preview
@@ -728,18 +750,13 @@ def create_execute_node(
                         ))
 
                 # Return compacted messages + response if compaction occurred,
-                # otherwise just append the response (add_messages reducer handles this)
+                # otherwise just append the response (add_messages reducer handles this).
+                # A swapped-in background summary only touches the summarized range.
+                result_messages = list(compaction_update)
                 if context_was_compacted:
                     # Include RemoveMessage markers so state reducer removes old messages
-                    result_messages = remove_markers + messages + [response]
-                    if injected_reminder:
-                        result_messages.append(injected_reminder)
-                    return {
-                        "messages": result_messages,
-                        "iteration": iteration + 1,
-                        "error": None,
-                    }
-                result_messages = [response]
+                    result_messages += remove_markers + messages
+                result_messages.append(response)
                 if injected_reminder:
                     result_messages.append(injected_reminder)
                 return {
@@ -749,6 +766,9 @@ def create_execute_node(
                 }
 
             except ContextOverflowError as e:
+                metrics.LLM_ERRORS.inc(
+                    phase=phase_str, model=config.llm.model, error="ContextOverflowError"
+                )
                 # Layer 0 (HTTP layer) caught context overflow
                 logger.warning(
                     f"[{job_id}] HTTP layer context overflow: "
@@ -766,12 +786,14 @@ def create_execute_node(
                         summarization_prompt,
                         oss_reasoning_level=oss_reasoning_level,
                         max_summary_length=config.context_management.max_summary_length,
+                        phase_number=phase_number,
                         force=True,
                     )
 
                     # Separate RemoveMessage markers
-                    emergency_remove_markers = [m for m in messages if isinstance(m, RemoveMessage)]
-                    messages = [m for m in messages if not isinstance(m, RemoveMessage)]
+                    forced = context_mgr.prepare_history(messages)
+                    emergency_remove_markers = forced.remove_markers
+                    messages = forced.messages
 
                     # Rebuild prepared_messages with compacted history
                     system_msg = prepared_messages[0] if prepared_messages and isinstance(prepared_messages[0], SystemMessage) else None
@@ -779,17 +801,14 @@ def create_execute_node(
                     if system_msg:
                         prepared_messages.append(system_msg)
 
-                    for msg in messages:
-                        if isinstance(msg, SystemMessage):
-                            if "[Summary of prior work]" in msg.content:
-                                prepared_messages.append(msg)
-                        else:
-                            prepared_messages.append(msg)
+                    prepared_messages.extend(forced.summaries)
+                    prepared_messages.extend(forced.conversation)
 
                     # Merge remove markers
                     if emergency_remove_markers:
                         remove_markers = emergency_remove_markers + remove_markers
                         context_was_compacted = True
+                        context_mgr.cancel_background_summary(job_id)
 
                     logger.info(
                         f"[{job_id}] Emergency compaction complete, "
@@ -826,7 +845,7 @@ def create_execute_node(
                         phase_number=phase_number,
                     )
 
-                return {
+                result = {
                     "error": {
                         "message": str(e),
                         "type": "context_overflow",
@@ -836,13 +855,20 @@ def create_execute_node(
                     },
                     "iteration": iteration + 1,
                 }
+                if compaction_update:
+                    # The background summary was already taken from the manager
+                    result["messages"] = list(compaction_update)
+                return result
 
             except Exception as e:
+                metrics.LLM_ERRORS.inc(
+                    phase=phase_str, model=config.llm.model, error=type(e).__name__
+                )
                 # Check for Groq tool_use_failed before standard retry logic
                 failed_generation = _extract_tool_use_failed(e)
                 if failed_generation is not None:
-                    _tool_use_failed_streak[0] += 1
-                    streak = _tool_use_failed_streak[0]
+                    streak = _tool_use_failed_streak.get(job_id, 0) + 1
+                    _tool_use_failed_streak[job_id] = streak
 
                     if streak <= 3:
                         logger.warning(
@@ -886,10 +912,10 @@ def create_execute_node(
 
                         # Return feedback messages — graph continues normally
                         # Route: execute → check_todos (no tool_calls) → pending todos → execute
+                        result_messages = list(compaction_update)
                         if context_was_compacted:
-                            result_messages = remove_markers + messages + [ai_summary, human_feedback]
-                        else:
-                            result_messages = [ai_summary, human_feedback]
+                            result_messages += remove_markers + messages
+                        result_messages += [ai_summary, human_feedback]
 
                         return {
                             "messages": result_messages,
@@ -951,7 +977,7 @@ def create_execute_node(
                         phase_number=phase_number,
                     )
 
-                return {
+                result = {
                     "error": {
                         "message": str(e),
                         "type": "llm_error",
@@ -959,6 +985,10 @@ def create_execute_node(
                     },
                     "iteration": iteration + 1,
                 }
+                if compaction_update:
+                    # The background summary was already taken from the manager
+                    result["messages"] = list(compaction_update)
+                return result
 
     return execute
 
@@ -1131,6 +1161,7 @@ def create_archive_phase_node(
                 summarization_prompt,
                 oss_reasoning_level=oss_reasoning_level,
                 max_summary_length=config.context_management.max_summary_length,
+                phase_number=phase_number,
                 force=force_summarize,
             )
 
@@ -1139,6 +1170,7 @@ def create_archive_phase_node(
             remove_markers = [m for m in compacted_messages if isinstance(m, RemoveMessage)]
             if remove_markers:
                 # Compaction occurred - separate markers from actual messages
+                context_mgr.cancel_background_summary(job_id)
                 actual_messages = [m for m in compacted_messages if not isinstance(m, RemoveMessage)]
                 reason = "strategic→tactical transition" if force_summarize else "threshold exceeded"
                 logger.info(
@@ -1576,6 +1608,7 @@ def create_restore_from_feedback_node(
         job_id = state.get("job_id", "unknown")
         feedback = state.get("resume_feedback", "")
         messages = state.get("messages", [])
+        phase_number = state.get("phase_number", 0)
 
         logger.info(f"[{job_id}] Restoring from feedback resume ({len(feedback)} chars)")
 
@@ -1588,6 +1621,7 @@ def create_restore_from_feedback_node(
             summarization_prompt,
             oss_reasoning_level=oss_reasoning_level,
             max_summary_length=config.context_management.max_summary_length,
+            phase_number=phase_number,
             force=True,
         )
 
@@ -1596,6 +1630,7 @@ def create_restore_from_feedback_node(
         actual_messages = [m for m in compacted_messages if not isinstance(m, RemoveMessage)]
 
         if remove_markers:
+            context_mgr.cancel_background_summary(job_id)
             logger.info(
                 f"[{job_id}] Compacted context for feedback resume: "
                 f"{len(messages)} -> {len(actual_messages)} messages "
@@ -1726,23 +1761,86 @@ def create_route_after_transition(
 # =============================================================================
 
 
+def prepare_tools(tools: List[Any], config: AgentConfig) -> List[Any]:
+    """Copies of the tools as the tool node runs them.
+
+    Sync tools get CPU accounting and run in the tool thread pool.
+    """
+    pool = get_tool_thread_pool(config.tool_execution.max_workers)
+    return offload_sync_tools(instrument_tools(tools), pool)
+
+
 def create_audited_tool_node(
     tools: List[Any],
     config: AgentConfig,
+    workspace: Optional[WorkspaceManager] = None,
+    tool_context: Optional[ToolContext] = None,
 ) -> Callable[[UniversalAgentState], Dict[str, Any]]:
     """Create a tool node with audit logging.
 
     This wraps LangGraph's ToolNode to add MongoDB audit logging for
-    tool calls and results.
+    tool calls and results. Each call is profiled individually (wall time,
+    CPU time, result size, error class) and the measurements are written to
+    its audit document and the tool metrics.
+
+    Large results are spilled to the job's tool result store as they are
+    produced, so context compaction can replace them with a handle that
+    ``recall_tool_result`` reads back.
+
+    The calls of one AI message run in parallel: sync tools in the tool
+    thread pool, conflicting calls (same file, todo list, ...) in call
+    order, and at most ``category_concurrency`` calls per tool category at
+    once. Audit documents are written off the event loop while the tools
+    run.
+
+    Repeated read-only calls whose inputs are unchanged within a phase are
+    answered with a short reference to the earlier call (see
+    ``core.tool_memo``), unless ``tool_execution.memoize_results`` is off.
 
     Args:
         tools: List of tool objects
         config: Agent configuration for agent_id
+        workspace: WorkspaceManager whose files version memoized reads
+        tool_context: ToolContext whose read tracking memoized reads update
 
     Returns:
         A callable node function with audit logging
     """
-    tool_node = ToolNode(tools)
+    execution = config.tool_execution
+    declarations = get_available_tools()
+    profiler = ToolCallProfiler()
+
+    memo: Optional[ToolResultMemo] = None
+    if execution.memoize_results:
+        def record_memo_hit(tool_name: str, args: Dict[str, Any]) -> None:
+            # A memoized read_file still counts as a read for write_file/edit_file
+            if tool_name == "read_file" and tool_context is not None:
+                tool_context.record_file_read(args.get("path", ""))
+
+        memo = ToolResultMemo(
+            declarations,
+            keep_recent_tool_results=config.context_management.keep_recent_tool_results,
+            workspace_root=(lambda job_id: workspace.path) if workspace is not None else None,
+            on_hit=record_memo_hit,
+        )
+
+    async def run_call(request: Any, execute: Callable[[Any], Any]) -> Any:
+        """Profile a call that may be answered from the memo."""
+        # In a graph template, run the tool instance of the job being executed
+        bindings = current_job_bindings()
+        if bindings is not None and request.tool is not None:
+            job_tool = bindings.tools.get(request.tool_call.get("name"))
+            if job_tool is not None:
+                request = request.override(tool=job_tool)
+        if memo is not None:
+            execute = functools.partial(memo, execute=execute)
+        return await profiler(request, execute)
+
+    scheduler = ToolCallScheduler(
+        declarations, execution.category_concurrency, inner=run_call
+    )
+    tool_node = ToolNode(prepare_tools(tools, config), awrap_tool_call=scheduler)
+    spill_chars = config.context_management.tool_result_spill_chars
 
     async def audited_tools(state: UniversalAgentState) -> Dict[str, Any]:
         """Execute tools with audit logging."""
@@ -1754,21 +1852,25 @@ def create_audited_tool_node(
         phase_str = "strategic" if is_strategic else "tactical"
 
         # Extract tool calls from last message
+        tool_calls: List[Dict[str, Any]] = []
         tool_calls_info = []
         if messages and isinstance(messages[-1], AIMessage):
             last_msg = messages[-1]
             if hasattr(last_msg, "tool_calls") and last_msg.tool_calls:
-                for tc in last_msg.tool_calls:
+                tool_calls = last_msg.tool_calls
+                for tc in tool_calls:
                     tool_calls_info.append({
                         "name": tc.get("name", "unknown"),
                         "call_id": tc.get("id", ""),
                         "args": tc.get("args", {}),
                     })
 
-        # Audit tool calls before execution (will be updated with results via update_tool_result)
+        # Audit tool calls before execution (will be updated with results via
+        # update_tool_result); written in a thread while the tools run
         auditor = get_archiver()
-        audit_ids: Dict[str, str] = {}  # call_id -> audit_doc_id
-        if auditor:
+
+        def audit_calls() -> Dict[str, str]:
+            audit_ids: Dict[str, str] = {}  # call_id -> audit_doc_id
             for tc_info in tool_calls_info:
                 doc_id = auditor.audit_tool_call(
                     job_id=job_id,
@@ -1783,30 +1885,67 @@ def create_audited_tool_node(
                 )
                 if doc_id:
                     audit_ids[tc_info["call_id"]] = doc_id
+            return audit_ids
 
-        # Execute tools with timing (use ainvoke for async tool support)
-        start_time = time.time()
-        result = await tool_node.ainvoke(state)
-        execution_time_ms = int((time.time() - start_time) * 1000)
+        audit_task = (
+            asyncio.ensure_future(asyncio.to_thread(audit_calls))
+            if auditor and tool_calls_info else None
+        )
 
-        # Update tool audit documents with results
-        if auditor and "messages" in result:
+        # Execute tools (use ainvoke for async tool support); the scheduler
+        # orders conflicting calls and the profiler times each call individually
+        call_ids = [tc_info["call_id"] for tc_info in tool_calls_info]
+        scheduler.plan(tool_calls)
+        try:
+            result = await tool_node.ainvoke(state)
+        finally:
+            scheduler.discard(call_ids)
+            profiles = {call_id: profiler.pop(call_id) for call_id in call_ids}
+            audit_ids = await audit_task if audit_task else {}
+
+        for profile in profiles.values():
+            if profile is None:
+                continue
+            metrics.TOOL_SECONDS.observe(profile.wall_seconds, tool=profile.tool)
+            metrics.TOOL_CPU_SECONDS.inc(profile.cpu_seconds, tool=profile.tool)
+            metrics.TOOL_RESULT_BYTES.observe(profile.result_bytes, tool=profile.tool)
+            if profile.error_class:
+                metrics.TOOL_ERRORS.inc(tool=profile.tool, error=profile.error_class)
+
+        # Spill large results (recalled slices are already stored)
+        if spill_chars > 0 and "messages" in result:
+            store = ToolResultStore(job_id)
             for msg in result["messages"]:
-                if isinstance(msg, ToolMessage):
+                if isinstance(msg, ToolMessage) and msg.name != "recall_tool_result":
+                    try:
+                        spill_tool_message(msg, store, spill_chars)
+                    except OSError as e:
+                        logger.warning(f"[{job_id}] Failed to spill tool result: {e}")
+
+        # Update tool audit documents with results
+        if audit_ids and "messages" in result:
+            def update_results() -> None:
+                for msg in result["messages"]:
+                    if not isinstance(msg, ToolMessage):
+                        continue
                     call_id = getattr(msg, "tool_call_id", "")
                     audit_doc_id = audit_ids.get(call_id)
-                    if audit_doc_id:
-                        content = msg.content if msg.content else ""
-                        is_error = _is_tool_error(content)
-
+                    profile = profiles.get(call_id)
+                    if audit_doc_id and profile is not None:
+                        content = content_text(msg)
                         auditor.update_tool_result(
                             audit_doc_id=audit_doc_id,
                             result=content,
-                            success=not is_error,
-                            latency_ms=execution_time_ms // max(len(tool_calls_info), 1),
-                            error=content[:500] if is_error else None,
+                            success=profile.success,
+                            latency_ms=profile.wall_ms,
+                            error=content[:500] if not profile.success else None,
+                            cpu_ms=profile.cpu_ms,
+                            result_size_bytes=profile.result_bytes,
+                            error_class=profile.error_class,
                         )
 
+            await asyncio.to_thread(update_results)
+
         return result
 
     return audited_tools
@@ -1817,6 +1956,30 @@ def create_audited_tool_node(
 # =============================================================================
 
 
+def create_context_manager(config: AgentConfig) -> ContextManager:
+    """Create the context manager for context window management."""
+    context_config = ContextConfig(
+        compaction_threshold_tokens=config.limits.context_threshold_tokens,
+        summarization_threshold_tokens=config.limits.context_threshold_tokens,
+        message_count_threshold=config.limits.message_count_threshold,
+        message_count_min_tokens=config.limits.message_count_min_tokens,
+        keep_recent_messages=config.context_management.keep_recent_messages,
+        keep_recent_tool_results=config.context_management.keep_recent_tool_results,
+        # Safety layer constants
+        model_max_context_tokens=config.limits.model_max_context_tokens,
+        summarization_safe_limit=config.limits.summarization_safe_limit,
+        summarization_chunk_size=config.limits.summarization_chunk_size,
+        background_summarization_ratio=config.context_management.background_summarization_ratio,
+        summary_digest_tokens=config.context_management.summary_digest_tokens,
+    )
+    return ContextManager(config=context_config, model=config.llm.model)
+
+
+def create_retry_manager(config: AgentConfig) -> ToolRetryManager:
+    """Create the retry manager for LLM call retries."""
+    return ToolRetryManager(max_retries=config.limits.tool_retry_count)
+
+
 def build_phase_alternation_graph(
     strategic_llm_with_tools: BaseChatModel,
     tactical_llm_with_tools: BaseChatModel,
@@ -1830,6 +1993,8 @@ def build_phase_alternation_graph(
     snapshot_manager: Optional[PhaseSnapshotManager] = None,
     tool_context: Optional[ToolContext] = None,
     postgres_db: Optional[Any] = None,
+    context_mgr: Optional[ContextManager] = None,
+    retry_manager: Optional[ToolRetryManager] = None,
     # Backwards compatibility
     llm_with_tools: Optional[BaseChatModel] = None,
 ) -> CompiledStateGraph:
@@ -1858,6 +2023,8 @@ def build_phase_alternation_graph(
             If not provided, uses strategic_llm_with_tools for summarization.
         snapshot_manager: Optional PhaseSnapshotManager for creating phase snapshots.
             When provided, enables recovery to previous phases after corruption.
+        context_mgr: ContextManager to use (default: created from config)
+        retry_manager: ToolRetryManager to use (default: created from config)
         llm_with_tools: Deprecated - use strategic_llm_with_tools instead.
 
     Returns:
@@ -1878,23 +2045,10 @@ def build_phase_alternation_graph(
     plan_manager = PlanManager(workspace)
     memory_manager = MemoryManager(workspace)
 
-    # Create context manager for context window management
-    context_config = ContextConfig(
-        compaction_threshold_tokens=config.limits.context_threshold_tokens,
-        summarization_threshold_tokens=config.limits.context_threshold_tokens,
-        message_count_threshold=config.limits.message_count_threshold,
-        message_count_min_tokens=config.limits.message_count_min_tokens,
-        keep_recent_messages=config.context_management.keep_recent_messages,
-        keep_recent_tool_results=config.context_management.keep_recent_tool_results,
-        # Safety layer constants
-        model_max_context_tokens=config.limits.model_max_context_tokens,
-        summarization_safe_limit=config.limits.summarization_safe_limit,
-        summarization_chunk_size=config.limits.summarization_chunk_size,
-    )
-    context_mgr = ContextManager(config=context_config, model=config.llm.model)
-
-    # Create retry manager for LLM call retries
-    retry_manager = ToolRetryManager(max_retries=config.limits.tool_retry_count)
+    if context_mgr is None:
+        context_mgr = create_context_manager(config)
+    if retry_manager is None:
+        retry_manager = create_retry_manager(config)
 
     # Load summarization prompt
     summarization_prompt = load_summarization_prompt(config)
@@ -1945,7 +2099,7 @@ def build_phase_alternation_graph(
     )
 
     check_goal = create_check_goal_node(plan_manager, workspace, config, todo_manager)
-    tool_node = create_audited_tool_node(tools, config)
+    tool_node = create_audited_tool_node(tools, config, workspace, tool_context)
 
     # Add nodes to graph
     workflow.add_node("init_workspace", init_workspace)
@@ -2027,6 +2181,64 @@ def build_phase_alternation_graph(
     return workflow.compile(checkpointer=checkpointer)
 
 
+def build_graph_template(
+    key: str,
+    strategic_llm: BaseChatModel,
+    tactical_llm: BaseChatModel,
+    tools: List[Any],
+    config: AgentConfig,
+    workspace_template: str,
+    summarization_llm: Optional[BaseChatModel] = None,
+    postgres_db: Optional[Any] = None,
+) -> GraphTemplate:
+    """Build a phase alternation graph that can be reused across jobs.
+
+    The graph is compiled without a checkpointer and its job-specific
+    objects are ``JobBound`` proxies: each run must pass the job's
+    ``JobBindings`` in ``configurable["job"]`` (see core.graph_templates).
+    ``tools`` only provide the schemas; calls run the bound job's tools.
+
+    Args:
+        key: Template key (see ``core.graph_templates.template_key``)
+        strategic_llm: LLM for strategic phases (tools are bound here)
+        tactical_llm: LLM for tactical phases (tools are bound here)
+        tools: Tools of the job the template is built for
+        config: Resolved agent configuration
+        workspace_template: Template content for workspace.md
+        summarization_llm: Optional LLM for context summarization
+        postgres_db: PostgreSQL connection of the agent
+
+    Returns:
+        GraphTemplate with the compiled graph and the tool-bound LLMs
+    """
+    strategic_llm_with_tools = strategic_llm.bind_tools(tools)
+    tactical_llm_with_tools = (
+        strategic_llm_with_tools if tactical_llm is strategic_llm
+        else tactical_llm.bind_tools(tools)
+    )
+    graph = build_phase_alternation_graph(
+        strategic_llm_with_tools=strategic_llm_with_tools,
+        tactical_llm_with_tools=tactical_llm_with_tools,
+        tools=tools,
+        config=config,
+        workspace=JobBound("workspace"),
+        todo_manager=JobBound("todo_manager"),
+        workspace_template=workspace_template,
+        summarization_llm=summarization_llm,
+        snapshot_manager=JobBound("snapshot_manager"),
+        tool_context=JobBound("tool_context"),
+        postgres_db=postgres_db,
+        context_mgr=JobBound("context_mgr"),
+        retry_manager=JobBound("retry_manager"),
+    )
+    return GraphTemplate(
+        key=key,
+        graph=graph,
+        strategic_llm_with_tools=strategic_llm_with_tools,
+        tactical_llm_with_tools=tactical_llm_with_tools,
+    )
+
+
 # Backward compatibility alias
 def build_nested_loop_graph(
     llm: BaseChatModel,
@@ -1,6 +1,21 @@
-"""LLM utilities and wrappers."""
+"""LLM utilities and wrappers.
+
+``ReasoningChatOpenAI`` is imported on first access: langchain_openai (and
+the openai SDK) take most of a second to import, and modules that only need
+the exceptions or tool schemas shouldn't pay for it.
+"""
+
+from typing import Any
 
-from src.llm.reasoning_chat import ReasoningChatOpenAI
 from src.llm.exceptions import ContextOverflowError
 
+
+def __getattr__(name: str) -> Any:
+    if name == "ReasoningChatOpenAI":
+        from src.llm.reasoning_chat import ReasoningChatOpenAI
+
+        return ReasoningChatOpenAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["ReasoningChatOpenAI", "ContextOverflowError"]
@@ -10,17 +10,19 @@ actual HTTP request body before sending.
 Set DEBUG_LLM_STREAM=1 to print a tail of LLM responses to stderr after each call.
 """
 
+import functools
 import json
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 from langchain_openai import ChatOpenAI
 from pydantic import PrivateAttr
 
 from .exceptions import ContextOverflowError
+from .tool_schemas import get_tool_schema_registry
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +49,22 @@ def _get_debug_tail_chars() -> int:
     return int(os.environ.get("DEBUG_LLM_TAIL", "500"))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Any:
+    """tiktoken encoding for a model, resolved once per model."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_request_tokens(body: dict, model: str = "gpt-4") -> int:
     """Count tokens in OpenAI API request body.
 
     Counts tokens in messages, tool definitions, and request overhead.
     This gives an accurate count of what's actually being sent to the API.
+    Tool definitions are counted once per distinct tool set (see
+    src/llm/tool_schemas.py); they only change at phase boundaries.
 
     Args:
         body: Parsed JSON body of the API request
@@ -64,10 +77,7 @@ def count_request_tokens(body: dict, model: str = "gpt-4") -> int:
         # Fallback: approximate as ~4 chars per token
         return len(json.dumps(body)) // 4
 
-    try:
-        enc = tiktoken.encoding_for_model(model)
-    except KeyError:
-        enc = tiktoken.get_encoding("cl100k_base")
+    enc = _get_encoding(model)
 
     total = 0
 
@@ -98,8 +108,9 @@ def count_request_tokens(body: dict, model: str = "gpt-4") -> int:
         total += 4
 
     # Count tool definitions
-    for tool in body.get("tools", []):
-        total += len(enc.encode(json.dumps(tool)))
+    tools = body.get("tools")
+    if tools:
+        total += get_tool_schema_registry().lookup(tools).token_count(enc)
 
     # Request structure overhead
     total += 10
@@ -0,0 +1,164 @@
+"""Registry of the tool schemas sent to the LLM.
+
+Tool sets only change at phase boundaries (strategic vs tactical tools), yet
+every chat completion request carries the full list of tool schemas. The
+registry serializes each distinct tool set once and keeps:
+- its canonical JSON (sorted keys, compact separators)
+- a content hash ("ts_<16 hex>") that archived requests and audit documents
+  reference instead of embedding the schemas
+- its token count per tokenizer, reused by count_request_tokens() on every
+  HTTP call instead of re-encoding each tool
+
+Requests find their registered set through lookup(), keyed by the tool
+names, so the per-call path neither re-serializes nor re-hashes the list.
+
+Usage:
+    tool_set = get_tool_schema_registry().register(schemas, phase="tactical")
+    tool_set.schema_hash        # "ts_0123456789abcdef"
+    tool_set.token_count(enc)   # encoded once per tokenizer
+    get_tool_schema_registry().lookup(request_tools)  # same set, by tool names
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Distinct tool sets kept (least recently used evicted)
+MAX_TOOL_SCHEMA_SETS = 64
+
+
+def serialize_tool_schemas(schemas: List[Dict[str, Any]]) -> str:
+    """Canonical JSON of a tool set (independent of dict key order)."""
+    return json.dumps(schemas, sort_keys=True, separators=(",", ":"))
+
+
+def tool_schema_hash(serialized: str) -> str:
+    """Content hash of a serialized tool set."""
+    return "ts_" + hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:16]
+
+
+def tool_names_key(schemas: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    """Tool names of a tool set, in order (cheap lookup key)."""
+    return tuple(str((tool.get("function") or tool).get("name", "")) for tool in schemas)
+
+
+@dataclass
+class ToolSchemaSet:
+    """A tool set in OpenAI format, serialized and hashed once."""
+
+    schemas: List[Dict[str, Any]]
+    json: str
+    schema_hash: str
+    _token_counts: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def tool_count(self) -> int:
+        return len(self.schemas)
+
+    def token_count(self, encoding: Any) -> int:
+        """Tokens of the tool definitions, counted once per tiktoken encoding.
+
+        Counted per tool as in count_request_tokens().
+        """
+        count = self._token_counts.get(encoding.name)
+        if count is None:
+            count = sum(len(encoding.encode(json.dumps(tool))) for tool in self.schemas)
+            self._token_counts[encoding.name] = count
+        return count
+
+
+class ToolSchemaRegistry:
+    """Process-wide cache of tool sets, keyed by content hash."""
+
+    def __init__(self, max_sets: int = MAX_TOOL_SCHEMA_SETS) -> None:
+        self._max_sets = max_sets
+        self._sets: "OrderedDict[str, ToolSchemaSet]" = OrderedDict()
+        # Tool names -> hash of the set last registered with those names
+        self._by_names: Dict[Tuple[str, ...], str] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        schemas: List[Dict[str, Any]],
+        phase: Optional[str] = None,
+    ) -> ToolSchemaSet:
+        """Look up a tool set, serializing and hashing it on first sight.
+
+        Args:
+            schemas: Tool definitions in OpenAI format
+            phase: Phase the tool set belongs to (for logging)
+
+        Returns:
+            The registered tool set
+        """
+        serialized = serialize_tool_schemas(schemas)
+        schema_hash = tool_schema_hash(serialized)
+        names = tool_names_key(schemas)
+        with self._lock:
+            self._by_names[names] = schema_hash
+            tool_set = self._sets.get(schema_hash)
+            if tool_set is not None:
+                self._sets.move_to_end(schema_hash)
+                return tool_set
+            tool_set = ToolSchemaSet(schemas=schemas, json=serialized, schema_hash=schema_hash)
+            self._sets[schema_hash] = tool_set
+            if len(self._sets) > self._max_sets:
+                evicted, _ = self._sets.popitem(last=False)
+                self._by_names = {k: h for k, h in self._by_names.items() if h != evicted}
+        if phase:
+            logger.debug(
+                f"Registered {phase} tool schemas {schema_hash}: "
+                f"{tool_set.tool_count} tools, {len(serialized)} chars"
+            )
+        return tool_set
+
+    def lookup(self, schemas: List[Dict[str, Any]]) -> ToolSchemaSet:
+        """Registered tool set with the same tool names, registering on a miss.
+
+        Used per request: the tool list sent with a request is the one
+        registered for its phase, so matching by names avoids serializing
+        and hashing the whole list again.
+        """
+        names = tool_names_key(schemas)
+        with self._lock:
+            schema_hash = self._by_names.get(names)
+            tool_set = self._sets.get(schema_hash) if schema_hash else None
+            if tool_set is not None:
+                self._sets.move_to_end(schema_hash)
+                return tool_set
+        return self.register(schemas)
+
+    def get(self, schema_hash: str) -> Optional[ToolSchemaSet]:
+        """Registered tool set by hash (None if unknown or evicted)."""
+        with self._lock:
+            return self._sets.get(schema_hash)
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+
+_registry: Optional[ToolSchemaRegistry] = None
+
+
+def get_tool_schema_registry() -> ToolSchemaRegistry:
+    """Get the process-wide tool schema registry."""
+    global _registry
+    if _registry is None:
+        _registry = ToolSchemaRegistry()
+    return _registry
+
+
+__all__ = [
+    "ToolSchemaRegistry",
+    "ToolSchemaSet",
+    "get_tool_schema_registry",
+    "serialize_tool_schemas",
+    "tool_names_key",
+    "tool_schema_hash",
+]
@@ -38,13 +38,14 @@ Example:
     ```
 """
 
-from .git_manager import GitManager
+from .git_manager import GitCommitWorker, GitManager
 from .memory import MemoryManager
 from .plan import PlanManager
 from .todo import TodoItem, TodoManager, TodoStatus
 
 __all__ = [
     "GitManager",
+    "GitCommitWorker",
     "TodoManager",
     "TodoItem",
     "TodoStatus",
@@ -4,6 +4,10 @@ Provides a GitManager class that encapsulates all git operations for
 agent workspaces. This enables automatic versioning of workspace changes,
 queryable history, and phase tracking via git tags.
 
+Also provides GitCommitWorker, which moves commits off the caller's thread
+and coalesces rapid submissions into batched commits, with a flush()
+barrier for callers that need an exact commit (e.g. phase tags).
+
 Usage:
     from src.managers import GitManager
 
@@ -16,8 +20,12 @@ Usage:
 import logging
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.metrics import GIT_COMMIT_QUEUE_DEPTH, GIT_COMMIT_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +62,8 @@ class GitManager:
         """
         self._workspace_path = Path(workspace_path)
         self._git_available = self._check_git_available()
+        # Serializes index-mutating operations (commit worker vs. callers)
+        self._lock = threading.RLock()
 
         if not self._git_available:
             logger.warning("Git not available, workspace versioning disabled")
@@ -134,17 +144,25 @@ class GitManager:
             logger.error(f"Failed to initialize git repository: {e}")
             return False
 
-    def commit(self, message: str, allow_empty: bool = True) -> bool:
-        """Stage all changes and commit.
+    def commit(
+        self,
+        message: str,
+        allow_empty: bool = True,
+        paths: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Stage changes and commit.
 
-        Stages all modified, added, and deleted files, then creates a commit
-        with the provided message.
+        By default stages all modified, added, and deleted files. When
+        ``paths`` is given, only those workspace-relative paths are staged,
+        which avoids rescanning the whole workspace.
 
         Args:
             message: Commit message
             allow_empty: If True, allow commits with no changes (default: True)
                         Empty commits maintain the audit trail even for
                         read-only analysis tasks.
+            paths: Optional workspace-relative paths to stage instead of
+                   everything (an empty iterable stages nothing)
 
         Returns:
             True if commit succeeded, False otherwise
@@ -153,19 +171,24 @@ class GitManager:
             logger.debug("Git not active, skipping commit")
             return False
 
+        started = time.perf_counter()
         try:
-            # Stage all changes
-            result = self._run_git(["add", "-A"])
-            if result.returncode != 0:
-                logger.warning(f"git add failed: {result.stderr}")
-                return False
-
-            # Create commit
-            args = ["commit", "-m", message]
-            if allow_empty:
-                args.append("--allow-empty")
-
-            result = self._run_git(args)
+            with self._lock:
+                # Stage changes
+                if paths is None:
+                    result = self._run_git(["add", "-A"])
+                else:
+                    result = self._stage_paths(list(paths))
+                if result.returncode != 0:
+                    logger.warning(f"git add failed: {result.stderr}")
+                    return False
+
+                # Create commit
+                args = ["commit", "-m", message]
+                if allow_empty:
+                    args.append("--allow-empty")
+
+                result = self._run_git(args)
 
             # Check for "nothing to commit" which is OK if allow_empty=False
             if result.returncode != 0:
@@ -185,6 +208,31 @@ class GitManager:
         except Exception as e:
             logger.error(f"Failed to commit: {e}")
             return False
+        finally:
+            GIT_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+    def _stage_paths(self, paths: List[str]) -> subprocess.CompletedProcess:
+        """Stage only the given paths, falling back to a full ``add -A``.
+
+        Paths that neither exist nor are tracked (created and removed between
+        commits) are dropped, since git rejects unmatched pathspecs. If git
+        still refuses (e.g. an explicitly named ignored file), everything is
+        staged instead so no change is lost.
+        """
+        existing = [p for p in paths if (self._workspace_path / p).exists()]
+        missing = [p for p in paths if p not in existing]
+        if missing:
+            tracked = self._run_git(["ls-files", "--", *missing])
+            existing += [p for p in tracked.stdout.splitlines() if p]
+
+        if not existing:
+            return subprocess.CompletedProcess(["git", "add"], returncode=0, stdout="", stderr="")
+
+        result = self._run_git(["add", "-A", "--", *existing])
+        if result.returncode != 0:
+            logger.debug(f"Selective git add failed, staging everything: {result.stderr}")
+            result = self._run_git(["add", "-A"])
+        return result
 
     def log(self, max_count: int = 10, oneline: bool = True) -> str:
         """Get commit history.
@@ -410,7 +458,8 @@ class GitManager:
             else:
                 args.append(tag_name)
 
-            result = self._run_git(args)
+            with self._lock:
+                result = self._run_git(args)
             if result.returncode != 0:
                 logger.warning(f"git tag failed: {result.stderr}")
                 return False
@@ -726,3 +775,202 @@ class GitManager:
             True if git is available, False otherwise
         """
         return shutil.which("git") is not None
+
+
+class GitCommitWorker:
+    """Commits workspace changes on a background thread.
+
+    Submissions arriving within ``batch_seconds`` of each other are
+    coalesced into a single commit whose subject is the first submission's
+    subject and whose body lists every submitted message. Paths reported by
+    submitters are unioned; a submission without paths stages everything.
+
+    Commits are applied in submission order. ``flush()`` is a barrier: it
+    returns once every submission made before the call is committed, so a
+    following ``tag()`` points at a commit that contains them.
+
+    With ``batch_seconds <= 0`` commits run synchronously in ``submit()``.
+    The worker thread exits after ``idle_seconds`` without work and is
+    restarted on the next submission.
+
+    Example:
+        ```python
+        worker = GitCommitWorker(git_mgr, batch_seconds=2.0)
+        worker.submit("[Phase 2 Tactical] todo_1: ...", paths=["notes.md"])
+        worker.submit("[Phase 2 Tactical] todo_2: ...", paths=["output/a.json"])
+
+        worker.flush()  # both committed (as one commit)
+        git_mgr.tag("phase-2-tactical-complete")
+        ```
+    """
+
+    def __init__(
+        self,
+        git_manager: GitManager,
+        batch_seconds: float = 2.0,
+        idle_seconds: float = 30.0,
+    ):
+        """Initialize the worker.
+
+        Args:
+            git_manager: GitManager to commit through
+            batch_seconds: Coalescing window for rapid submissions
+            idle_seconds: Idle time after which the thread exits
+        """
+        self._git_manager = git_manager
+        self._batch_seconds = batch_seconds
+        self._idle_seconds = idle_seconds
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[int, str, Optional[List[str]]]] = []
+        self._submitted = 0
+        self._completed = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"submitted": 0, "commits": 0, "failed": 0}
+
+    @property
+    def git_manager(self) -> GitManager:
+        """The GitManager this worker commits through."""
+        return self._git_manager
+
+    @property
+    def pending_count(self) -> int:
+        """Number of submissions not yet committed."""
+        with self._cond:
+            return self._submitted - self._completed
+
+    def submit(self, message: str, paths: Optional[Iterable[str]] = None) -> None:
+        """Queue a commit.
+
+        Args:
+            message: Commit message
+            paths: Workspace-relative paths to stage, or None to stage all
+        """
+        paths_list = sorted(set(paths)) if paths is not None else None
+
+        if self._batch_seconds <= 0:
+            with self._cond:
+                self._stats["submitted"] += 1
+            self._commit_batch([(0, message, paths_list)])
+            return
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GitCommitWorker is closed")
+            self._submitted += 1
+            self._stats["submitted"] += 1
+            self._pending.append((self._submitted, message, paths_list))
+            GIT_COMMIT_QUEUE_DEPTH.inc()
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every commit submitted before this call is done.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all prior submissions were committed (or attempted)
+        """
+        with self._cond:
+            target = self._submitted
+            if self._completed >= target:
+                return True
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: self._completed >= target, timeout=timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Commit anything pending and stop the worker thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Submission and commit counters."""
+        with self._cond:
+            return {**self._stats, "pending": self._submitted - self._completed}
+
+    def _ensure_thread(self) -> None:
+        """Start the worker thread if it is not running (lock held)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"git-commit-{self._git_manager.workspace_path.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: wait for work, coalesce, commit."""
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(
+                    lambda: self._pending or self._closed, timeout=self._idle_seconds
+                ):
+                    self._thread = None
+                    return
+                if not self._pending:
+                    self._thread = None
+                    return
+
+                # Coalescing window: keep collecting unless someone is waiting
+                deadline = time.monotonic() + self._batch_seconds
+                while not (self._flush_waiters or self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch, self._pending = self._pending, []
+
+            self._commit_batch(batch)
+            GIT_COMMIT_QUEUE_DEPTH.dec(len(batch))
+
+            with self._cond:
+                self._completed = batch[-1][0]
+                self._cond.notify_all()
+
+    def _commit_batch(self, batch: List[Tuple[int, str, Optional[List[str]]]]) -> None:
+        """Create one commit for a batch of submissions."""
+        messages = [message for _, message, _ in batch]
+        if len(messages) == 1:
+            message = messages[0]
+        else:
+            subject = messages[0].splitlines()[0] if messages[0] else "Batched commit"
+            message = f"{subject} (+{len(messages) - 1} more)\n\n" + "\n\n".join(messages)
+
+        paths: Optional[set] = set()
+        for _, _, entry_paths in batch:
+            if entry_paths is None:
+                paths = None
+                break
+            paths.update(entry_paths)
+
+        try:
+            success = self._git_manager.commit(
+                message,
+                allow_empty=True,
+                paths=sorted(paths) if paths is not None else None,
+            )
+        except Exception as e:
+            logger.error(f"Background git commit failed: {e}")
+            success = False
+
+        with self._cond:
+            if success:
+                self._stats["commits"] += 1
+            else:
+                self._stats["failed"] += 1
+        if not success:
+            logger.warning(f"Git commit failed for batch of {len(batch)} submission(s)")
@@ -426,21 +426,26 @@ class TodoManager:
         return header + "\n\n" + "\n".join(body_lines)
 
     def _commit_todo_completion(self, todo: TodoItem) -> bool:
-        """Commit workspace changes for completed todo.
+        """Queue a commit of workspace changes for a completed todo.
 
         Auto-commits when git versioning is active. Uses the commit message
-        format defined by _build_commit_message().
+        format defined by _build_commit_message(). The commit is handed to
+        the workspace's background GitCommitWorker so the tool call does not
+        block on git; rapid completions are coalesced into one commit, and
+        only the paths reported as changed since the last todo are staged.
 
         Args:
             todo: The completed TodoItem
 
         Returns:
-            True if commit succeeded or git not active, False if commit failed
+            True if the commit was queued or git not active, False on error
 
         Note:
             Empty commits are allowed (allow_empty=True) because a todo might
             involve read-only analysis. This maintains the audit trail.
             Commit failures are logged but don't fail the todo completion.
+            Phase transitions call WorkspaceManager.flush_commits() before
+            tagging, so phase tags still cover every todo commit.
         """
         git_mgr = self._workspace.git_manager
         if git_mgr is None or not git_mgr.is_active:
@@ -448,13 +453,17 @@ class TodoManager:
             return True
 
         message = self._build_commit_message(todo)
-        success = git_mgr.commit(message, allow_empty=True)
+        worker = self._workspace.commit_worker
+        if worker is None:
+            return git_mgr.commit(message, allow_empty=True)
 
-        if not success:
-            logger.warning(f"Git commit failed for {todo.id}")
+        try:
+            worker.submit(message, paths=self._workspace.consume_changed_paths())
+        except Exception as e:
+            logger.warning(f"Git commit failed for {todo.id}: {e}")
             return False
 
-        logger.debug(f"Committed changes for {todo.id}")
+        logger.debug(f"Queued commit for {todo.id}")
         return True
 
     def archive(self, phase_name: str = "") -> str:
@@ -3,6 +3,7 @@
 from src.services.vision_helper import VisionHelper, get_vision_helper
 from src.services.document_renderer import DocumentRenderer, get_document_renderer
 from src.services.description_cache import DescriptionCache, get_description_cache
+from src.services.research_cache import ResearchCache, ResearchCacheMiss, get_research_cache
 
 __all__ = [
     "VisionHelper",
@@ -11,4 +12,7 @@ __all__ = [
     "get_document_renderer",
     "DescriptionCache",
     "get_description_cache",
+    "ResearchCache",
+    "ResearchCacheMiss",
+    "get_research_cache",
 ]
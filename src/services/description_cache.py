@@ -16,7 +16,7 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +88,7 @@ class DescriptionCache:
         file_path: Path,
         page: Optional[int] = None,
         query: Optional[str] = None,
+        content_hash: Optional[str] = None,
     ) -> str:
         """Create content-addressable cache key.
 
@@ -100,11 +101,13 @@ class DescriptionCache:
             file_path: Path to the file
             page: Page/slide number (1-indexed), or None for standalone images
             query: Optional query string used for the description
+            content_hash: Precomputed file content hash (skips re-hashing)
 
         Returns:
             SHA256 hash suitable for use as cache filename
         """
-        content_hash = self._hash_file_content(file_path)
+        if content_hash is None:
+            content_hash = self._hash_file_content(file_path)
 
         key_data = {
             "content_hash": content_hash,
@@ -184,6 +187,74 @@ class DescriptionCache:
             logger.warning(f"Cache write error for {file_path}: {e}")
             return False
 
+    def get_many(
+        self,
+        file_path: Path,
+        pages: Iterable[int],
+        query: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """Retrieve cached descriptions for several pages of one file.
+
+        The file content is hashed once for the whole batch.
+
+        Args:
+            file_path: Path to the original document
+            pages: Page/slide numbers (1-indexed)
+            query: Optional query string used for the descriptions
+
+        Returns:
+            Mapping of page number to description for cache hits only
+        """
+        hits: Dict[int, str] = {}
+        try:
+            content_hash = self._hash_file_content(file_path)
+        except Exception as e:
+            logger.warning(f"Cache read error for {file_path}: {e}")
+            return hits
+
+        for page in pages:
+            cache_file = self.cache_dir / f"{self._make_key(file_path, page, query, content_hash)}.txt"
+            try:
+                if cache_file.exists():
+                    hits[page] = cache_file.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning(f"Cache read error for {file_path} page {page}: {e}")
+
+        logger.debug(f"Cache lookup: {file_path.name}, {len(hits)} hit(s)")
+        return hits
+
+    def set_many(
+        self,
+        file_path: Path,
+        descriptions: Dict[int, str],
+        query: Optional[str] = None,
+    ) -> int:
+        """Store descriptions for several pages of one file.
+
+        Args:
+            file_path: Path to the original document
+            descriptions: Mapping of page number to description
+            query: Optional query string used for the descriptions
+
+        Returns:
+            Number of pages cached
+        """
+        try:
+            content_hash = self._hash_file_content(file_path)
+        except Exception as e:
+            logger.warning(f"Cache write error for {file_path}: {e}")
+            return 0
+
+        stored = 0
+        for page, description in descriptions.items():
+            cache_file = self.cache_dir / f"{self._make_key(file_path, page, query, content_hash)}.txt"
+            try:
+                cache_file.write_text(description, encoding="utf-8")
+                stored += 1
+            except Exception as e:
+                logger.warning(f"Cache write error for {file_path} page {page}: {e}")
+        return stored
+
     def clear(self) -> int:
         """Clear all cached descriptions.
 
@@ -9,15 +9,21 @@ Ported from Advanced-LLM-Chat/backend/services/document_handler.py with extensio
 - Added PPTX slide rendering via LibreOffice
 - Added DOCX page rendering via LibreOffice
 - Returns bytes directly instead of saving to files
+- Batch rendering of several pages in a process pool (office documents are
+  converted to PDF once per batch)
 """
 
 import io
 import logging
+import multiprocessing
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,33 @@ MAX_RENDER_PAGES = 20
 # Default DPI for rendering
 DEFAULT_DPI = 150
 
+# Default worker processes for batch rendering
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _rasterize_pdf_page(file_path: Path, page_num: int, dpi: int) -> bytes:
+    """Render one PDF page to PNG bytes.
+
+    Module-level so it can run in a worker process.
+    """
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(
+        file_path,
+        first_page=page_num,
+        last_page=page_num,
+        dpi=dpi,
+        fmt="png",
+    )
+
+    if not images:
+        raise ValueError(f"Could not render page {page_num} from {file_path}")
+
+    # Convert PIL image to bytes
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="PNG")
+    return buffer.getvalue()
+
 
 class DocumentRenderer:
     """
@@ -49,6 +82,9 @@ class DocumentRenderer:
 
         # Render any document type
         png_bytes = renderer.render_page(Path("slides.pptx"), page_num=3)
+
+        # Render several pages in parallel
+        pages = renderer.render_pages(Path("report.pdf"), [1, 2, 3])
         ```
     """
 
@@ -57,6 +93,7 @@ class DocumentRenderer:
         dpi: int = DEFAULT_DPI,
         max_pages: int = MAX_RENDER_PAGES,
         libreoffice_path: Optional[str] = None,
+        render_workers: Optional[int] = None,
     ):
         """Initialize the document renderer.
 
@@ -65,10 +102,20 @@ class DocumentRenderer:
             max_pages: Maximum pages to render (default: 20)
             libreoffice_path: Path to LibreOffice executable.
                              Auto-detected if not provided.
+            render_workers: Worker processes for render_pages. Defaults to
+                           DOCUMENT_RENDER_WORKERS or min(4, cpu_count).
+                           1 renders inline without a pool.
         """
         self.dpi = dpi
         self.max_pages = max_pages
         self.libreoffice_path = libreoffice_path or self._find_libreoffice()
+        if render_workers is None:
+            render_workers = int(
+                os.getenv("DOCUMENT_RENDER_WORKERS", str(DEFAULT_RENDER_WORKERS))
+            )
+        self.render_workers = max(1, render_workers)
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
 
         # Check dependencies
         self._check_pdf2image()
@@ -136,7 +183,7 @@ class DocumentRenderer:
             RuntimeError: If rendering fails
         """
         try:
-            from pdf2image import convert_from_path
+            import pdf2image  # noqa: F401
         except ImportError:
             raise ImportError(
                 "pdf2image not installed. Install with: pip install pdf2image"
@@ -153,21 +200,7 @@ class DocumentRenderer:
             )
 
         try:
-            images = convert_from_path(
-                file_path,
-                first_page=page_num,
-                last_page=page_num,
-                dpi=dpi,
-                fmt="png",
-            )
-
-            if not images:
-                raise ValueError(f"Could not render page {page_num} from {file_path}")
-
-            # Convert PIL image to bytes
-            buffer = io.BytesIO()
-            images[0].save(buffer, format="PNG")
-            return buffer.getvalue()
+            return _rasterize_pdf_page(file_path, page_num, dpi)
 
         except Exception as e:
             logger.error(f"Error rendering PDF page {page_num} from {file_path}: {e}")
@@ -314,6 +347,126 @@ class DocumentRenderer:
                 f"Supported: .pdf, .pptx, .docx"
             )
 
+    def render_pages(
+        self,
+        file_path: Path,
+        page_nums: Iterable[int],
+        dpi: Optional[int] = None,
+    ) -> Dict[int, bytes]:
+        """Render several pages of a document as PNG, in parallel.
+
+        PPTX/DOCX files are converted to PDF once for the whole batch, then
+        pages are rasterized in the worker pool. Pages that fail to render
+        (out of range, over max_pages, renderer errors) are logged and left
+        out of the result, so callers can fall back to text only.
+
+        Args:
+            file_path: Path to the document
+            page_nums: Page/slide numbers to render (1-indexed)
+            dpi: Resolution (default: instance dpi)
+
+        Returns:
+            Mapping of page number to PNG bytes for the pages that rendered
+
+        Raises:
+            ValueError: If file type is not supported
+            RuntimeError: If an office document cannot be converted to PDF
+        """
+        suffix = file_path.suffix.lower()
+        if suffix not in (".pdf", ".pptx", ".docx"):
+            raise ValueError(
+                f"Unsupported document type: {suffix}. "
+                f"Supported: .pdf, .pptx, .docx"
+            )
+
+        dpi = dpi or self.dpi
+        pages = []
+        for page_num in sorted(set(page_nums)):
+            if 1 <= page_num <= self.max_pages:
+                pages.append(page_num)
+            else:
+                logger.warning(
+                    f"Skipping page {page_num} of {file_path.name}: "
+                    f"outside 1..{self.max_pages}"
+                )
+        if not pages:
+            return {}
+
+        pdf_path = file_path if suffix == ".pdf" else self._convert_to_pdf(file_path)
+        try:
+            return self._rasterize_pages(pdf_path, pages, dpi, file_path.name)
+        finally:
+            if pdf_path != file_path:
+                shutil.rmtree(pdf_path.parent, ignore_errors=True)
+
+    def _rasterize_pages(
+        self,
+        pdf_path: Path,
+        pages: list,
+        dpi: int,
+        display_name: str,
+    ) -> Dict[int, bytes]:
+        """Rasterize PDF pages, using the worker pool for more than one page."""
+        results: Dict[int, bytes] = {}
+        pool = self._get_pool() if len(pages) > 1 else None
+
+        if pool is not None:
+            try:
+                futures = {
+                    page_num: pool.submit(_rasterize_pdf_page, pdf_path, page_num, dpi)
+                    for page_num in pages
+                }
+            except Exception as e:
+                logger.warning(f"Render pool unavailable, rendering inline: {e}")
+                self._discard_pool()
+                futures = {}
+
+            for page_num, future in futures.items():
+                try:
+                    results[page_num] = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not render page {page_num} of {display_name}: {e}")
+            if futures:
+                return results
+
+        for page_num in pages:
+            try:
+                results[page_num] = _rasterize_pdf_page(pdf_path, page_num, dpi)
+            except Exception as e:
+                logger.warning(f"Could not render page {page_num} of {display_name}: {e}")
+        return results
+
+    def _get_pool(self) -> Optional[Executor]:
+        """Get or create the render process pool (None when rendering inline)."""
+        if self.render_workers <= 1:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    # spawn: the agent runs background threads, which fork does not copy safely
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.render_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not start render pool: {e}")
+                    return None
+            return self._pool
+
+    def _discard_pool(self) -> None:
+        """Drop a broken pool so the next batch starts a fresh one."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the render worker pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def get_page_count(self, file_path: Path) -> int:
         """Get the total page/slide count for a document.
 
@@ -0,0 +1,488 @@
+# src/services/research_cache.py
+"""
+Research Cache for external research API responses.
+
+Provides a SQLite-backed cache shared by all jobs for Tavily (search,
+extract, crawl, map), arXiv, Semantic Scholar and Unpaywall responses.
+Jobs on overlapping topics issue the same requests again and again; the
+cache saves the network round trip, the rate-limit waits and the API cost.
+
+- Keys are derived from the provider name plus the normalized request
+  parameters (whitespace-collapsed strings, sorted keys, None dropped).
+- Every provider has its own TTL. Entries past their TTL but still inside
+  the stale window are served immediately while a background refresh
+  fetches a new copy (stale-while-revalidate).
+- The database is bounded in size; least recently used entries are evicted.
+- In offline mode the network is never touched: hits are replayed
+  regardless of age and misses raise ResearchCacheMiss. This makes research
+  jobs and tests deterministic.
+
+Configuration:
+    RESEARCH_CACHE_MODE: "on" (default), "off" (bypass) or "offline" (replay only)
+    RESEARCH_CACHE_PATH: SQLite file (default workspace/.research_cache/responses.db)
+    RESEARCH_CACHE_MAX_MB: Size bound before LRU eviction (default 256)
+    RESEARCH_CACHE_STALE_SECONDS: How long expired entries may still be served
+        while they are refreshed (default 86400)
+    RESEARCH_CACHE_TTL_<PROVIDER>: TTL override in seconds, e.g.
+        RESEARCH_CACHE_TTL_TAVILY_SEARCH=3600
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default database location (global, shared across all jobs)
+DEFAULT_CACHE_PATH = Path("workspace/.research_cache/responses.db")
+
+# Default TTLs in seconds. Search results drift quickly, page content and
+# paper metadata much more slowly.
+DEFAULT_TTLS: Dict[str, float] = {
+    "tavily_search": 24 * 3600,
+    "tavily_extract": 7 * 24 * 3600,
+    "tavily_crawl": 7 * 24 * 3600,
+    "tavily_map": 7 * 24 * 3600,
+    "arxiv": 7 * 24 * 3600,
+    "semantic_scholar": 24 * 3600,
+    "unpaywall": 7 * 24 * 3600,
+}
+FALLBACK_TTL = 24 * 3600
+
+CACHE_MODES = ("on", "off", "offline")
+
+
+class ResearchCacheMiss(ConnectionError):
+    """Raised in offline mode when a request has no cached response.
+
+    Subclasses ConnectionError so callers report it like any other network
+    failure.
+    """
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize request parameters so equivalent requests share a key."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+class ResearchCache:
+    """
+    SQLite-backed response cache for research APIs.
+
+    Values must be JSON-serializable. Loaders returning None are not cached,
+    and exceptions raised by loaders propagate, so callers decide what is
+    worth keeping (e.g. not caching rate-limit responses).
+
+    Example:
+        ```python
+        cache = get_research_cache()
+
+        response = cache.fetch(
+            "tavily_search",
+            {"query": query, "max_results": 5},
+            lambda: search.invoke({"query": query}),
+        )
+
+        papers = await cache.fetch_async(
+            "arxiv", {"op": "search", "query": query}, load_papers
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mode: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        stale_seconds: Optional[float] = None,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """Initialize the research cache.
+
+        Args:
+            path: SQLite database file. Defaults to RESEARCH_CACHE_PATH or
+                `workspace/.research_cache/responses.db`.
+            mode: "on", "off" or "offline". Defaults to RESEARCH_CACHE_MODE.
+            max_bytes: Size bound for stored values. Defaults to
+                RESEARCH_CACHE_MAX_MB.
+            stale_seconds: Stale window after TTL expiry. Defaults to
+                RESEARCH_CACHE_STALE_SECONDS.
+            ttls: Per-provider TTL overrides in seconds
+        """
+        mode = (mode or os.getenv("RESEARCH_CACHE_MODE", "on")).lower()
+        if mode not in CACHE_MODES:
+            logger.warning(f"Unknown RESEARCH_CACHE_MODE: {mode}. Using 'on'.")
+            mode = "on"
+        self.mode = mode
+        self.path = Path(path or os.getenv("RESEARCH_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        self.max_bytes = (
+            max_bytes if max_bytes is not None
+            else int(float(os.getenv("RESEARCH_CACHE_MAX_MB", "256")) * 1024 * 1024)
+        )
+        self.stale_seconds = (
+            stale_seconds if stale_seconds is not None
+            else float(os.getenv("RESEARCH_CACHE_STALE_SECONDS", "86400"))
+        )
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._refreshing: Set[str] = set()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0}
+
+        if self.enabled:
+            logger.debug(f"ResearchCache initialized: {self.path} (mode={self.mode})")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are read from and written to the cache."""
+        return self.mode != "off"
+
+    @property
+    def offline(self) -> bool:
+        """Whether the network must not be used (replay only)."""
+        return self.mode == "offline"
+
+    def ttl_for(self, provider: str) -> float:
+        """TTL in seconds for a provider (env override first)."""
+        override = os.getenv(f"RESEARCH_CACHE_TTL_{provider.upper()}")
+        if override:
+            try:
+                return float(override)
+            except ValueError:
+                logger.warning(f"Invalid TTL override for {provider}: {override}")
+        return self._ttls.get(provider, FALLBACK_TTL)
+
+    def make_key(self, provider: str, params: Dict[str, Any]) -> str:
+        """Create the cache key for a provider request."""
+        key_data = {"provider": provider, "params": _normalize(params)}
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    # --- Storage ---
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " provider TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, provider: str, params: Dict[str, Any]) -> Tuple[Optional[Any], Optional[float]]:
+        """Look up a cached response.
+
+        Args:
+            provider: Provider name (e.g. "tavily_search")
+            params: Request parameters
+
+        Returns:
+            Tuple of (value, age in seconds), or (None, None) on a miss
+        """
+        if not self.enabled:
+            return None, None
+        key = self.make_key(provider, params)
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None, None
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+                conn.commit()
+            return json.loads(row[0]), max(0.0, time.time() - row[1])
+        except Exception as e:
+            logger.warning(f"Research cache read error ({provider}): {e}")
+            return None, None
+
+    def set(self, provider: str, params: Dict[str, Any], value: Any) -> bool:
+        """Store a response and evict old entries if over the size bound.
+
+        Returns:
+            True if cached successfully, False on error
+        """
+        if not self.enabled or value is None:
+            return False
+        key = self.make_key(provider, params)
+        try:
+            payload = json.dumps(value, default=str)
+            now = time.time()
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses"
+                    " (key, provider, value, size, created_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, provider, payload, len(payload), now, now),
+                )
+                self._evict(conn)
+                conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Research cache write error ({provider}): {e}")
+            return False
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until under the size bound."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% so every write near the bound does not evict again
+        excess = total - int(self.max_bytes * 0.9)
+        evicted = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if excess <= 0:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            excess -= size
+            evicted += 1
+        self._stats["evictions"] += evicted
+        logger.debug(f"Research cache evicted {evicted} entries")
+
+    # --- Read-through API ---
+
+    def _lookup(self, provider: str, params: Dict[str, Any]) -> Tuple[Optional[Any], bool]:
+        """Return (cached value, needs refresh) or raise ResearchCacheMiss offline.
+
+        A value of None means the caller must load it.
+        """
+        value, age = self.get(provider, params)
+        if value is None:
+            self._stats["misses"] += 1
+            if self.offline:
+                raise ResearchCacheMiss(
+                    f"No cached {provider} response for {_normalize(params)} (offline mode)"
+                )
+            return None, False
+
+        ttl = self.ttl_for(provider)
+        if self.offline or age <= ttl:
+            self._stats["hits"] += 1
+            return value, False
+        if age <= ttl + self.stale_seconds:
+            self._stats["stale_hits"] += 1
+            return value, True
+        self._stats["misses"] += 1
+        return None, False
+
+    def _claim_refresh(self, key: str) -> bool:
+        """Mark a key as being refreshed; False if a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _finish_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def fetch(
+        self,
+        provider: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Return a cached response or call the (synchronous) loader.
+
+        Stale entries are returned immediately and refreshed on a
+        background thread.
+
+        Args:
+            provider: Provider name, selects the TTL
+            params: Request parameters forming the cache key
+            loader: Performs the real request
+
+        Raises:
+            ResearchCacheMiss: In offline mode when nothing is cached
+        """
+        if not self.enabled:
+            return loader()
+
+        value, refresh = self._lookup(provider, params)
+        if value is None:
+            value = loader()
+            self.set(provider, params, value)
+            return value
+
+        if refresh:
+            key = self.make_key(provider, params)
+            if self._claim_refresh(key):
+                if self._refresh_pool is None:
+                    self._refresh_pool = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="research-cache"
+                    )
+                self._refresh_pool.submit(self._refresh_sync, key, provider, params, loader)
+        return value
+
+    def _refresh_sync(self, key: str, provider: str, params: Dict[str, Any], loader: Callable[[], Any]) -> None:
+        try:
+            self.set(provider, params, loader())
+        except Exception as e:
+            logger.debug(f"Background refresh failed ({provider}): {e}")
+        finally:
+            self._finish_refresh(key)
+
+    async def fetch_async(
+        self,
+        provider: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Async variant of fetch; stale entries are refreshed in a task.
+
+        Args:
+            provider: Provider name, selects the TTL
+            params: Request parameters forming the cache key
+            loader: Coroutine function performing the real request
+
+        Raises:
+            ResearchCacheMiss: In offline mode when nothing is cached
+        """
+        if not self.enabled:
+            return await loader()
+
+        value, refresh = self._lookup(provider, params)
+        if value is None:
+            value = await loader()
+            self.set(provider, params, value)
+            return value
+
+        if refresh:
+            key = self.make_key(provider, params)
+            if self._claim_refresh(key):
+                task = asyncio.create_task(self._refresh_async(key, provider, params, loader))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+        return value
+
+    async def _refresh_async(
+        self, key: str, provider: str, params: Dict[str, Any], loader: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            self.set(provider, params, await loader())
+        except Exception as e:
+            logger.debug(f"Background refresh failed ({provider}): {e}")
+        finally:
+            self._finish_refresh(key)
+
+    # --- Maintenance ---
+
+    def clear(self, provider: Optional[str] = None) -> int:
+        """Delete cached responses.
+
+        Args:
+            provider: Only clear this provider's entries
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                if provider:
+                    cursor = conn.execute("DELETE FROM responses WHERE provider = ?", (provider,))
+                else:
+                    cursor = conn.execute("DELETE FROM responses")
+                conn.commit()
+            logger.info(f"Cleared {cursor.rowcount} research cache entries")
+            return cursor.rowcount
+        except Exception as e:
+            logger.warning(f"Error clearing research cache: {e}")
+            return 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry counts per provider, total size and the
+            hit/miss counters of this process
+        """
+        providers: Dict[str, int] = {}
+        total_size = 0
+        if self.enabled:
+            try:
+                with self._lock:
+                    rows = self._connect().execute(
+                        "SELECT provider, COUNT(*), SUM(size) FROM responses GROUP BY provider"
+                    ).fetchall()
+                for provider, count, size in rows:
+                    providers[provider] = count
+                    total_size += size or 0
+            except Exception as e:
+                logger.warning(f"Research cache stats error: {e}")
+
+        return {
+            **self._stats,
+            "mode": self.mode,
+            "entry_count": sum(providers.values()),
+            "entries_by_provider": providers,
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "cache_path": str(self.path),
+        }
+
+    def close(self) -> None:
+        """Stop background refreshes and close the database."""
+        if self._refresh_pool is not None:
+            self._refresh_pool.shutdown(wait=True)
+            self._refresh_pool = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton (lazy-loaded)
+_research_cache: Optional[ResearchCache] = None
+
+
+def get_research_cache() -> ResearchCache:
+    """Get or create the ResearchCache singleton instance.
+
+    Returns:
+        Shared ResearchCache instance
+    """
+    global _research_cache
+    if _research_cache is None:
+        _research_cache = ResearchCache()
+    return _research_cache
@@ -7,6 +7,9 @@ generate text descriptions of visual content (images, document pages).
 
 Ported from Advanced-LLM-Chat/backend/services/vision_helper.py with adaptations:
 - Added sync wrappers for use with sync tool signatures
+- Sync wrappers share one background event loop, so the async client and its
+  connection pool persist between calls
+- Batch page descriptions with a bounded concurrency limit
 - Configurable via environment variables
 """
 
@@ -14,35 +17,14 @@ import asyncio
 import base64
 import logging
 import os
-from typing import Optional, Union
+import threading
+from typing import Dict, Optional, Union
 
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
 
-def run_async(coro):
-    """Run an async coroutine synchronously.
-
-    Used to bridge async VisionHelper methods with sync tool signatures.
-    Creates a new event loop if none exists (safe for tool context).
-    """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        # We're already in an async context - use nest_asyncio pattern
-        # or run in a thread. For simplicity, create new loop in thread.
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(asyncio.run, coro)
-            return future.result()
-    else:
-        return asyncio.run(coro)
-
-
 class VisionHelper:
     """
     Helper service for vision tasks using a dedicated multimodal model.
@@ -55,6 +37,12 @@ class VisionHelper:
     - VISION_BASE_URL: Base URL for vision API (defaults to OpenAI: https://api.openai.com/v1)
     - VISION_MODEL: Model to use (default: gpt-4o-mini)
     - VISION_TIMEOUT: Request timeout in seconds (default: 120)
+    - VISION_MAX_CONCURRENCY: Parallel requests for batch descriptions (default: 4)
+
+    Sync wrappers run on a dedicated event loop thread owned by the helper.
+    The AsyncOpenAI client is bound to that loop, so async methods should be
+    awaited from the sync wrappers (or ``run_sync``) rather than from other
+    event loops.
 
     Example:
         ```python
@@ -65,6 +53,9 @@ class VisionHelper:
 
         # Sync usage (for tools)
         description = helper.describe_image_sync(image_bytes)
+
+        # Several pages at once, described concurrently
+        descriptions = helper.describe_document_pages_sync({1: png1, 2: png2})
         ```
     """
 
@@ -86,6 +77,7 @@ class VisionHelper:
         self.api_base = os.getenv("VISION_BASE_URL", self.OPENAI_API_URL)
         self.model = os.getenv("VISION_MODEL", "gpt-4o-mini")
         self.timeout = float(os.getenv("VISION_TIMEOUT", "120"))
+        self.max_concurrency = max(1, int(os.getenv("VISION_MAX_CONCURRENCY", "4")))
 
         if not self.api_key:
             logger.warning(
@@ -104,9 +96,53 @@ class VisionHelper:
         logger.info(
             f"VisionHelper initialized: model={self.model}, "
             f"base_url={self.api_base} (from {base_source}), "
-            f"api_key from {key_source}, timeout={self.timeout}s"
+            f"api_key from {key_source}, timeout={self.timeout}s, "
+            f"max_concurrency={self.max_concurrency}"
         )
 
+        # Background event loop for sync wrappers (started lazily)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get or start the persistent event loop used by sync wrappers."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="vision-helper-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def run_sync(self, coro):
+        """Run a coroutine on the helper's persistent event loop and wait.
+
+        Safe to call from sync code whether or not the calling thread has
+        its own running loop.
+        """
+        loop = self._get_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Close the async client and stop the background loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+        if loop is None or loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing vision client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
     async def describe_image(
         self,
         image_data: Union[bytes, str],
@@ -171,7 +207,7 @@ class VisionHelper:
 
         Use this in sync tool implementations.
         """
-        return run_async(self.describe_image(image_data, mime_type, query))
+        return self.run_sync(self.describe_image(image_data, mime_type, query))
 
     async def describe_document_page(
         self,
@@ -247,10 +283,54 @@ class VisionHelper:
 
         Use this in sync tool implementations.
         """
-        return run_async(
+        return self.run_sync(
             self.describe_document_page(page_image, page_num, mime_type, query)
         )
 
+    async def describe_document_pages(
+        self,
+        page_images: Dict[int, Union[bytes, str]],
+        mime_type: str = "image/png",
+        query: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """
+        Describe several rendered pages concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. Failures
+        are reported per page in the same way as describe_document_page.
+
+        Args:
+            page_images: Mapping of page number to rendered page image
+            mime_type: MIME type of the images (default: "image/png")
+            query: Optional specific question asked for every page
+
+        Returns:
+            Mapping of page number to description, in ascending page order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def describe(page_num: int, image: Union[bytes, str]) -> str:
+            async with semaphore:
+                return await self.describe_document_page(image, page_num, mime_type, query)
+
+        page_nums = sorted(page_images)
+        descriptions = await asyncio.gather(
+            *(describe(page_num, page_images[page_num]) for page_num in page_nums)
+        )
+        return dict(zip(page_nums, descriptions))
+
+    def describe_document_pages_sync(
+        self,
+        page_images: Dict[int, Union[bytes, str]],
+        mime_type: str = "image/png",
+        query: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """Synchronous wrapper for describe_document_pages.
+
+        Use this in sync tool implementations.
+        """
+        return self.run_sync(self.describe_document_pages(page_images, mime_type, query))
+
 
 # Module-level singleton instance (lazy-loaded)
 _vision_helper: Optional[VisionHelper] = None
@@ -27,6 +27,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "cite_document",
         "description": "Create a verified citation for document content",
         "category": "citation",
+        "writes": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Create verified citation for document content.",
         "phases": ["strategic", "tactical"],
@@ -36,6 +37,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "cite_web",
         "description": "Create a verified citation for web content",
         "category": "citation",
+        "writes": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Create verified citation for web content.",
         "phases": ["strategic", "tactical"],
@@ -45,6 +47,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "list_sources",
         "description": "List all registered citation sources",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "List all registered citation sources.",
         "phases": ["strategic", "tactical"],
@@ -54,6 +57,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "get_citation",
         "description": "Get details about a specific citation",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Get details about a specific citation by ID.",
         "phases": ["strategic", "tactical"],
@@ -63,6 +67,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "list_citations",
         "description": "List all citations created in this session",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "List all citations with status and source info.",
         "phases": ["strategic", "tactical"],
@@ -72,6 +77,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "edit_citation",
         "description": "Edit fields of an existing citation",
         "category": "citation",
+        "writes": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Edit citation fields (claim, quote, confidence, etc.).",
         "phases": ["strategic", "tactical"],
@@ -81,6 +87,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "annotate_source",
         "description": "Add a note, highlight, summary, question, or critique to a source",
         "category": "citation",
+        "writes": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Add annotation to a citation source.",
         "phases": ["strategic", "tactical"],
@@ -90,6 +97,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "get_annotations",
         "description": "Get annotations for a source",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Get annotations for a citation source.",
         "phases": ["strategic", "tactical"],
@@ -99,6 +107,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "tag_source",
         "description": "Add or remove tags on a citation source",
         "category": "citation",
+        "writes": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Add or remove tags on a citation source.",
         "phases": ["strategic", "tactical"],
@@ -108,6 +117,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "search_library",
         "description": "Search the source library using keyword, semantic, or hybrid search",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Search source library with hybrid retrieval and evidence labels.",
         "phases": ["strategic", "tactical"],
@@ -117,6 +127,7 @@ CITATION_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "generate_bibliography",
         "description": "Generate a formatted bibliography/references file from citations",
         "category": "citation",
+        "reads": ["citations"],
         "defer_to_workspace": True,
         "short_description": "Generate formatted bibliography file from citations.",
         "phases": ["strategic", "tactical"],
@@ -964,6 +975,7 @@ Similarity Score: {similarity}
                         append_text = "\n\n" + "\n\n".join(new_entries)
                         with open(resolved, "a", encoding="utf-8") as f:
                             f.write(append_text)
+                        workspace.record_change(output_path)
                 else:
                     # For non-bibtex styles, use exact string matching
                     existing_entries = set(existing_content.strip().split("\n\n"))
@@ -979,6 +991,7 @@ Similarity Score: {similarity}
                         append_text = "\n\n" + "\n\n".join(new_entries)
                         with open(resolved, "a", encoding="utf-8") as f:
                             f.write(append_text)
+                        workspace.record_change(output_path)
 
                 return (
                     f"Updated {output_path}: {new_count} new entries appended, "
@@ -987,6 +1000,7 @@ Similarity Score: {similarity}
             else:
                 with open(resolved, "w", encoding="utf-8") as f:
                     f.write(bibliography + "\n")
+                workspace.record_change(output_path)
                 return f"Written {output_path}: {len(entries)} entries ({effective_style} style)"
 
         except Exception as e:
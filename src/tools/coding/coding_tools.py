@@ -42,6 +42,7 @@ CODING_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "run_command",
         "description": "Execute a shell command in the workspace and return stdout/stderr",
         "category": "coding",
+        "writes": ["file:"],
         "short_description": "Run a shell command with timeout and output capture.",
         "phases": ["strategic", "tactical"],
     },
@@ -164,6 +165,8 @@ def create_coding_tools(context: ToolContext) -> List[Any]:
                 text=True,
                 timeout=timeout_capped,
             )
+            # Arbitrary commands may touch any file: stage everything next commit
+            ws.record_change(None)
 
             # Build structured output
             output_parts = [f"Exit code: {result.returncode}"]
@@ -5,18 +5,24 @@ such as workspace managers, database connections, and configuration.
 """
 
 import hashlib
+import inspect
 import logging
 import re
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..core.workspace import WorkspaceManager
 
 logger = logging.getLogger(__name__)
 
+# Default number of web sources registered in parallel
+DEFAULT_WEB_SOURCE_WORKERS = 4
+
 # Avoid circular imports with TYPE_CHECKING
 if TYPE_CHECKING:
     from ..database.postgres_db import PostgresDB
@@ -64,6 +70,7 @@ class ToolContext:
     citation_engine: Optional[Any] = None  # CitationEngine, imported lazily
     _source_registry: Dict[str, int] = field(default_factory=dict)  # path/url -> source_id
     _inaccessible_sources: Dict[str, str] = field(default_factory=dict)  # url -> error message
+    _web_content_supported: Optional[bool] = None  # add_web_source accepts content (probed once)
     _recent_reads: Deque[str] = field(default_factory=lambda: deque(maxlen=10))  # Recently read file paths
     _current_phase: Optional[str] = None
     _llm_config: Optional[Any] = None  # LLMConfig for phase-aware multimodal
@@ -173,19 +180,24 @@ class ToolContext:
             ImportError: If citation_engine package is not installed
         """
         if self.citation_engine is None:
-            from citation_engine import CitationEngine, CitationContext
+            self.citation_engine = self._create_citation_engine()
 
-            # Create context for audit trails using job_id as session
-            ctx = CitationContext(
-                session_id=self.job_id or "unknown",
-                agent_id=self.config.get("agent_id", "unknown"),
-            )
+        return self.citation_engine
 
-            # Use multi-agent mode (PostgreSQL) - reads CITATION_DB_URL from env
-            self.citation_engine = CitationEngine(mode="multi-agent", context=ctx)
-            self.citation_engine._connect()
+    def _create_citation_engine(self) -> Any:
+        """Create and connect a CitationEngine with its own database connection."""
+        from citation_engine import CitationEngine, CitationContext
 
-        return self.citation_engine
+        # Create context for audit trails using job_id as session
+        ctx = CitationContext(
+            session_id=self.job_id or "unknown",
+            agent_id=self.config.get("agent_id", "unknown"),
+        )
+
+        # Use multi-agent mode (PostgreSQL) - reads CITATION_DB_URL from env
+        engine = CitationEngine(mode="multi-agent", context=ctx)
+        engine._connect()
+        return engine
 
     def get_or_register_doc_source(self, file_path: str, name: Optional[str] = None) -> int:
         """Get cached source_id or register new document source.
@@ -211,7 +223,10 @@ class ToolContext:
         return source.id
 
     def get_or_register_web_source(
-        self, url: str, name: Optional[str] = None
+        self,
+        url: str,
+        name: Optional[str] = None,
+        content: Optional[str] = None,
     ) -> tuple[int, Optional[str]]:
         """Get cached source_id or register new web source.
 
@@ -222,6 +237,9 @@ class ToolContext:
         Args:
             url: URL of the web source
             name: Optional human-readable name for the source
+            content: Page content the caller already fetched (e.g. Tavily
+                raw_content). Handed to the CitationEngine so it does not
+                fetch the page a second time.
 
         Returns:
             Tuple of (source_id, fetch_error). fetch_error is None if content
@@ -233,7 +251,119 @@ class ToolContext:
             return source_id, fetch_error
 
         engine = self.get_citation_engine()
-        source = engine.add_web_source(url, name=name)
+        source = self._add_web_source(engine, url, name, content)
+        return self._record_web_source(url, source)
+
+    def register_web_sources(
+        self, pages: List[Dict[str, Any]]
+    ) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Register several web pages as citation sources at once.
+
+        Already-registered URLs are answered from the source registry. The
+        rest are registered in parallel (``web_source_workers`` config,
+        default 4), passing each page's already-fetched content so the
+        CitationEngine does not download it again. A CitationEngine holds a
+        single database connection, so each worker thread registers through
+        an engine of its own, closed once the batch is done.
+
+        Args:
+            pages: Dicts with ``url`` and optional ``title`` and ``content``
+
+        Returns:
+            Mapping of URL to (source_id, fetch_error) for every page that
+            was registered; failures are logged and left out
+        """
+        results: Dict[str, Tuple[int, Optional[str]]] = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            url = page.get("url")
+            if not url:
+                continue
+            if url in self._source_registry:
+                results[url] = (self._source_registry[url], self._inaccessible_sources.get(url))
+            elif url not in pending:
+                pending[url] = page
+
+        if not pending:
+            return results
+
+        engine = self.get_citation_engine()
+        workers = min(len(pending), self.get_config("web_source_workers", DEFAULT_WEB_SOURCE_WORKERS))
+
+        if workers <= 1:
+            outcomes = []
+            for page in pending.values():
+                try:
+                    outcomes.append(
+                        self._add_web_source(engine, page["url"], page.get("title"), page.get("content"))
+                    )
+                except Exception as e:
+                    outcomes.append(e)
+        else:
+            # Probe once here rather than racing on it from the workers
+            self._engine_accepts_web_content(engine)
+            local = threading.local()
+            worker_engines: List[Any] = []
+            engines_lock = threading.Lock()
+
+            def register(page: Dict[str, Any]) -> Any:
+                worker_engine = getattr(local, "engine", None)
+                if worker_engine is None:
+                    worker_engine = self._create_citation_engine()
+                    local.engine = worker_engine
+                    with engines_lock:
+                        worker_engines.append(worker_engine)
+                return self._add_web_source(
+                    worker_engine, page["url"], page.get("title"), page.get("content")
+                )
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="web-source") as pool:
+                    futures = [pool.submit(register, page) for page in pending.values()]
+                    outcomes = [f.exception() or f.result() for f in futures]
+            finally:
+                for worker_engine in worker_engines:
+                    try:
+                        worker_engine.close()
+                    except Exception as e:
+                        logger.warning(f"Could not close web source engine: {e}")
+
+        # Registry updates stay on the calling thread
+        for url, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Could not register web source {url}: {outcome}")
+                continue
+            results[url] = self._record_web_source(url, outcome)
+        return results
+
+    def _add_web_source(
+        self, engine: Any, url: str, name: Optional[str], content: Optional[str]
+    ) -> Any:
+        """Call engine.add_web_source, handing over prefetched content if supported."""
+        if content and self._engine_accepts_web_content(engine):
+            return engine.add_web_source(url, name=name, content=content)
+        return engine.add_web_source(url, name=name)
+
+    def _engine_accepts_web_content(self, engine: Any) -> bool:
+        """Check once whether add_web_source takes a ``content`` argument.
+
+        Older CitationEngine releases always fetch the URL themselves; with
+        those, registration falls back to the engine's own fetch.
+        """
+        if self._web_content_supported is None:
+            try:
+                params = inspect.signature(engine.add_web_source).parameters
+                self._web_content_supported = "content" in params or any(
+                    p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+                )
+            except (TypeError, ValueError):
+                self._web_content_supported = False
+            if not self._web_content_supported:
+                logger.info("CitationEngine.add_web_source does not accept content; pages will be re-fetched")
+        return self._web_content_supported
+
+    def _record_web_source(self, url: str, source: Any) -> Tuple[int, Optional[str]]:
+        """Cache a newly registered web source and extract its fetch error."""
         self._source_registry[url] = source.id
 
         # Check if content was actually fetched
@@ -266,53 +396,89 @@ class ToolContext:
             Workspace-relative path (e.g. "documents/external/example_com_a1b2c3d4.md"),
             or None if no workspace is available.
         """
-        if not self.has_workspace():
-            return None
+        saved = self.save_web_contents_to_disk(
+            [{"url": url, "content": content, "title": title, "source_id": source_id}]
+        )
+        return saved.get(url)
+
+    def save_web_contents_to_disk(self, pages: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Save several web pages as markdown files in one pass.
+
+        Same file format and first-save-wins rule as save_web_content_to_disk;
+        the target directory is prepared once and all pages share one
+        fetched_at timestamp.
+
+        Args:
+            pages: Dicts with ``url`` and ``content`` and optional ``title``
+                and ``source_id``
 
-        # Generate deterministic filename from URL
+        Returns:
+            Mapping of URL to workspace-relative path for pages that are on
+            disk (newly written or already present)
+        """
+        if not self.has_workspace():
+            return {}
+
+        fetched_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        saved: Dict[str, str] = {}
+        directory_ready = False
+
+        for page in pages:
+            url = page.get("url")
+            content = page.get("content")
+            if not url or not content or url in saved:
+                continue
+
+            relative_path = self._web_content_path(url)
+
+            # Skip if file already exists (first save wins)
+            full_path = self.workspace_manager.get_path(relative_path)
+            if full_path.exists():
+                saved[url] = relative_path
+                continue
+
+            # Ensure directory exists
+            if not directory_ready:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                directory_ready = True
+
+            # Build YAML front-matter
+            front_matter_lines = [
+                "---",
+                f"url: {url}",
+            ]
+            title = page.get("title")
+            if title:
+                # Escape quotes in title for YAML
+                safe_title = title.replace('"', '\\"')
+                front_matter_lines.append(f'title: "{safe_title}"')
+            front_matter_lines.append(f"fetched_at: {fetched_at}")
+            if page.get("source_id") is not None:
+                front_matter_lines.append(f"source_id: {page['source_id']}")
+            front_matter_lines.append("---")
+            front_matter_lines.append("")
+
+            file_content = "\n".join(front_matter_lines) + content
+
+            try:
+                self.workspace_manager.write_file(relative_path, file_content)
+                saved[url] = relative_path
+            except Exception as e:
+                logger.warning(f"Failed to save web content to disk: {e}")
+
+        if saved:
+            logger.debug(f"Saved web content for {len(saved)} page(s) to documents/external/")
+        return saved
+
+    @staticmethod
+    def _web_content_path(url: str) -> str:
+        """Deterministic workspace path for a URL's saved content."""
         url_hash = hashlib.sha256(url.encode()).hexdigest()[:8]
         parsed = urlparse(url)
         domain = parsed.netloc or "unknown"
         # Sanitize domain for filesystem
         safe_domain = re.sub(r"[^a-zA-Z0-9_.-]", "_", domain)
-        filename = f"{safe_domain}_{url_hash}.md"
-        relative_path = f"documents/external/{filename}"
-
-        # Skip if file already exists (first save wins)
-        full_path = self.workspace_manager.get_path(relative_path)
-        if full_path.exists():
-            return relative_path
-
-        # Ensure directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Build YAML front-matter
-        front_matter_lines = [
-            "---",
-            f"url: {url}",
-        ]
-        if title:
-            # Escape quotes in title for YAML
-            safe_title = title.replace('"', '\\"')
-            front_matter_lines.append(f'title: "{safe_title}"')
-        front_matter_lines.append(
-            f"fetched_at: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}"
-        )
-        if source_id is not None:
-            front_matter_lines.append(f"source_id: {source_id}")
-        front_matter_lines.append("---")
-        front_matter_lines.append("")
-
-        file_content = "\n".join(front_matter_lines) + content
-
-        try:
-            self.workspace_manager.write_file(relative_path, file_content)
-            logger.debug(f"Saved web content to {relative_path}")
-        except Exception as e:
-            logger.warning(f"Failed to save web content to disk: {e}")
-            return None
-
-        return relative_path
+        return f"documents/external/{safe_domain}_{url_hash}.md"
 
     def close_citation_engine(self) -> None:
         """Close CitationEngine connection if open.
@@ -4,6 +4,7 @@ This toolkit is always loaded as it provides essential agent functionality.
 It includes:
 - Todo tools: Task tracking (next_phase_todos, todo_complete, todo_list, todo_rewind)
 - Job tools: Completion signaling (mark_complete, job_complete)
+- Result tools: Read back spilled tool results (recall_tool_result)
 """
 
 from typing import Any, Dict, List
@@ -22,6 +23,7 @@ def create_core_tools(context: ToolContext) -> List[Any]:
     """
     from .todo import create_todo_tools
     from .job import create_job_tools
+    from .results import create_result_tools
 
     tools = []
 
@@ -31,6 +33,9 @@ def create_core_tools(context: ToolContext) -> List[Any]:
     if context.has_workspace():
         tools.extend(create_job_tools(context))
 
+    if context.job_id:
+        tools.extend(create_result_tools(context))
+
     return tools
 
 
@@ -38,8 +43,9 @@ def get_core_metadata() -> Dict[str, Dict[str, Any]]:
     """Get metadata for all core tools."""
     from .todo import TODO_TOOLS_METADATA
     from .job import JOB_TOOLS_METADATA
+    from .results import RESULT_TOOLS_METADATA
 
-    return {**TODO_TOOLS_METADATA, **JOB_TOOLS_METADATA}
+    return {**TODO_TOOLS_METADATA, **JOB_TOOLS_METADATA, **RESULT_TOOLS_METADATA}
 
 
 __all__ = [
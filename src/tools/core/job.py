@@ -39,6 +39,7 @@ JOB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mark_complete",
         "description": "Signal task/phase completion with structured report",
         "category": "core",
+        "writes": ["todos"],
         "phases": ["strategic", "tactical"],  # Both modes
     },
     "job_complete": {
@@ -46,6 +47,7 @@ JOB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "job_complete",
         "description": "Signal FINAL job completion - call when all phases are done",
         "category": "core",
+        "writes": ["todos"],
         "phases": ["strategic"],  # Strategic-only: prevents premature termination
     },
 }
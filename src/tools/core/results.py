@@ -0,0 +1,107 @@
+"""Tool result recall for the Universal Agent.
+
+Large tool results are spilled to the job's tool result store when they are
+produced (see src/core/tool_results.py). Once context compaction has cleared
+or truncated such a result, the agent reads it back with:
+- recall_tool_result: Return a slice of a stored result by handle
+
+This avoids re-running searches, queries or extractions only to see their
+output again.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from langchain_core.tools import tool
+
+from ..context import ToolContext
+from ...core.tool_results import ToolResultStore, recall_hint
+
+logger = logging.getLogger(__name__)
+
+# Default and maximum number of characters returned per call
+DEFAULT_RECALL_LENGTH = 5000
+MAX_RECALL_LENGTH = 20000
+
+
+# Tool metadata for registry
+RESULT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
+    "recall_tool_result": {
+        "module": "core.results",
+        "function": "recall_tool_result",
+        "description": "Read back a stored tool result by handle, without re-running the tool",
+        "category": "core",
+        "phases": ["strategic", "tactical"],  # Both modes
+    },
+}
+
+
+def create_result_tools(context: ToolContext) -> List[Any]:
+    """Create tool result recall tools.
+
+    Args:
+        context: Tool context with the job ID
+
+    Returns:
+        List of result tools
+
+    Raises:
+        ValueError: If the context has no job ID
+    """
+    if not context.job_id:
+        raise ValueError("ToolContext must have a job_id for result tools")
+
+    store = ToolResultStore(context.job_id)
+
+    @tool
+    def recall_tool_result(
+        handle: str,
+        start: int = 0,
+        length: int = DEFAULT_RECALL_LENGTH,
+    ) -> str:
+        """Read back an earlier tool result that was cleared or truncated.
+
+        Old tool results are removed from the conversation to save context,
+        leaving a note like "stored as tr_0123456789abcdef". Use this tool
+        to read that result again instead of re-running the original tool.
+
+        Args:
+            handle: Result handle from the note (e.g., "tr_0123456789abcdef")
+            start: Character offset to start reading from (default 0)
+            length: Number of characters to return (default 5000, max 20000)
+
+        Returns:
+            The requested part of the stored result
+        """
+        try:
+            start = max(0, start)
+            length = max(1, min(length, MAX_RECALL_LENGTH))
+            content = store.get(handle.strip())
+        except ValueError as e:
+            return f"Error: {e}"
+        except OSError as e:
+            logger.error(f"Failed to read tool result {handle}: {e}")
+            return f"Error reading tool result {handle}: {e}"
+
+        if content is None:
+            return f"Error: No stored tool result with handle {handle}"
+
+        total = len(content)
+        if start >= total:
+            return f"Error: start={start} is past the end of {handle} ({total} chars)"
+
+        end = min(start + length, total)
+        header = f"[{handle}: chars {start}-{end} of {total}]"
+        if end < total:
+            footer = f"\n\n[{total - end} chars remaining, use {recall_hint(handle, start=end)} to continue]"
+        else:
+            footer = ""
+        return f"{header}\n{content[start:end]}{footer}"
+
+    return [recall_tool_result]
+
+
+__all__ = [
+    "RESULT_TOOLS_METADATA",
+    "create_result_tools",
+]
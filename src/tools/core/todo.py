@@ -30,6 +30,7 @@ TODO_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "next_phase_todos",
         "description": "Stage todos for the next tactical phase",
         "category": "core",
+        "writes": ["todos"],
         "phases": ["strategic"],  # Strategic-only: creates work for tactical phase
     },
     "todo_complete": {
@@ -37,6 +38,7 @@ TODO_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "todo_complete",
         "description": "Mark one or more tasks as complete (by ID or comma-separated IDs)",
         "category": "core",
+        "writes": ["todos"],
         "phases": ["strategic", "tactical"],  # Both: used in all phases
     },
     "todo_list": {
@@ -44,6 +46,7 @@ TODO_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "todo_list",
         "description": "List all todos with IDs and status",
         "category": "core",
+        "reads": ["todos"],
         "phases": ["strategic", "tactical"],  # Both: helps see current state
     },
     "todo_rewind": {
@@ -51,6 +54,7 @@ TODO_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "todo_rewind",
         "description": "Panic button - abandon current approach and re-plan",
         "category": "core",
+        "writes": ["todos"],
         "phases": ["tactical"],  # Tactical-only: escape hatch when stuck
     },
 }
@@ -28,6 +28,8 @@ GIT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "git_log",
         "description": "View commit history with filtering",
         "category": "git",
+        "reads": ["file:.git/HEAD", "file:.git/refs", "file:.git/packed-refs"],
+        "read_only": True,
         "short_description": "View commit history (default: last 10 commits).",
         "phases": ["strategic", "tactical"],
     },
@@ -36,6 +38,8 @@ GIT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "git_show",
         "description": "Inspect a specific commit's changes",
         "category": "git",
+        "reads": ["file:.git/HEAD", "file:.git/refs", "file:.git/packed-refs"],
+        "read_only": True,
         "short_description": "Show commit details and diff (use stat_only=true for summary).",
         "phases": ["strategic", "tactical"],
     },
@@ -44,6 +48,8 @@ GIT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "git_diff",
         "description": "Compare current state to previous commits",
         "category": "git",
+        "reads": ["file:"],
+        "read_only": True,
         "short_description": "Show differences (uncommitted changes or between refs).",
         "phases": ["strategic", "tactical"],
     },
@@ -52,6 +58,8 @@ GIT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "git_status",
         "description": "See uncommitted changes and workspace state",
         "category": "git",
+        "reads": ["file:"],
+        "read_only": True,
         "short_description": "Show current branch and uncommitted changes.",
         "phases": ["strategic", "tactical"],
     },
@@ -60,6 +68,8 @@ GIT_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "git_tags",
         "description": "List phase milestone tags",
         "category": "git",
+        "reads": ["file:.git/HEAD", "file:.git/refs", "file:.git/packed-refs"],
+        "read_only": True,
         "short_description": "List git tags (default: phase-* pattern).",
         "phases": ["strategic", "tactical"],
     },
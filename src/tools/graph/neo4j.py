@@ -26,6 +26,7 @@ GRAPH_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "execute_cypher_query",
         "description": "Execute a Cypher query against Neo4j",
         "category": "graph",
+        "writes": ["graph"],
         "defer_to_workspace": True,
         "short_description": "Execute Cypher query against Neo4j database.",
         "phases": ["tactical"],
@@ -35,6 +36,8 @@ GRAPH_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "get_database_schema",
         "description": "Get Neo4j database schema (labels, relationships, properties)",
         "category": "graph",
+        "reads": ["graph"],
+        "read_only": True,
         "defer_to_workspace": True,
         "short_description": "Get Neo4j schema (labels, relationships, properties).",
         "phases": ["tactical"],
@@ -50,6 +50,7 @@ MONGODB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mongo_query",
         "description": "Query documents from a MongoDB collection with optional filters",
         "category": "mongodb",
+        "reads": ["mongodb"],
         "defer_to_workspace": True,
         "short_description": "Query documents from a MongoDB collection.",
         "phases": ["tactical"],
@@ -59,6 +60,7 @@ MONGODB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mongo_aggregate",
         "description": "Run an aggregation pipeline on a MongoDB collection",
         "category": "mongodb",
+        "reads": ["mongodb"],
         "defer_to_workspace": True,
         "short_description": "Run aggregation pipeline on a MongoDB collection.",
         "phases": ["tactical"],
@@ -68,6 +70,8 @@ MONGODB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mongo_schema",
         "description": "Inspect MongoDB database schema (collections, sample fields, indexes)",
         "category": "mongodb",
+        "reads": ["mongodb"],
+        "read_only": True,
         "defer_to_workspace": True,
         "short_description": "Inspect MongoDB schema (collections, fields, indexes).",
         "phases": ["tactical"],
@@ -77,6 +81,7 @@ MONGODB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mongo_insert",
         "description": "Insert one or more documents into a MongoDB collection",
         "category": "mongodb",
+        "writes": ["mongodb"],
         "defer_to_workspace": True,
         "short_description": "Insert documents into a MongoDB collection.",
         "phases": ["tactical"],
@@ -86,6 +91,7 @@ MONGODB_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "mongo_update",
         "description": "Update documents in a MongoDB collection",
         "category": "mongodb",
+        "writes": ["mongodb"],
         "defer_to_workspace": True,
         "short_description": "Update documents in a MongoDB collection.",
         "phases": ["tactical"],
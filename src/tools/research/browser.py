@@ -4,14 +4,20 @@ Provides tools for navigating websites and downloading files using
 AI-driven browser automation. Supports both DOM-based (text-only LLM)
 and vision-based (multimodal LLM) modes.
 
+Browsers come from a warm pool (utils/browser_pool.py): each call leases an
+isolated context on an already running Chromium and browser-use attaches to
+it over CDP, so only the first call pays for the browser launch.
+
 Requires: pip install browser-use playwright
           playwright install chromium
 """
 
 import logging
 import os
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain_core.tools import tool
 
@@ -122,6 +128,72 @@ def _get_browser_config(context: ToolContext, downloads_path: Optional[Path] = N
     return kwargs
 
 
+@asynccontextmanager
+async def _leased_browser(
+    context: ToolContext, downloads_path: Optional[Path] = None
+) -> AsyncIterator[Tuple[Any, Optional[Any]]]:
+    """Yield a browser-use Browser attached to a pooled browser.
+
+    If the pool cannot launch Chromium, browser-use starts its own browser
+    (the pre-pool behaviour) and the yielded lease is None.
+
+    Args:
+        context: ToolContext with config
+        downloads_path: Override download directory
+
+    Yields:
+        (browser-use Browser, BrowserLease or None)
+    """
+    from browser_use import Browser
+
+    from .utils.browser_pool import get_browser_pool
+    from .utils.network import get_proxy_from_context
+
+    browser_kwargs = _get_browser_config(context, downloads_path=downloads_path)
+    pool = get_browser_pool(context.config.get("browser", {}))
+
+    async with AsyncExitStack() as stack:
+        lease = None
+        try:
+            lease = await stack.enter_async_context(pool.lease(
+                headless=browser_kwargs["headless"],
+                proxy=get_proxy_from_context(context),
+                downloads_path=Path(browser_kwargs["downloads_path"]),
+            ))
+        except Exception as e:
+            logger.warning(f"Browser pool unavailable, launching a dedicated browser: {e}")
+
+        if lease is not None:
+            # Headless/proxy were applied when the pooled browser launched
+            shared = {k: v for k, v in browser_kwargs.items() if k not in ("headless", "proxy")}
+            browser = Browser(cdp_url=lease.cdp_url, keep_alive=True, **shared)
+        else:
+            browser = Browser(**browser_kwargs)
+
+        try:
+            yield browser, lease
+        finally:
+            try:
+                await browser.stop()
+            except Exception:
+                pass
+
+
+async def _collect_downloads(lease: Optional[Any], dest_dir: Path, started: float) -> List[Path]:
+    """Files downloaded during a leased browser session, newest first.
+
+    Downloads are taken from the lease's Playwright download events first.
+    Files browser-use wrote itself (its PDF auto-download, or downloads from
+    tabs it opened outside the leased context) are not events, so files
+    created in the directory since ``started`` are added after them.
+    """
+    files = list(reversed(await lease.downloads.wait())) if lease is not None else []
+    for path in _find_new_files(dest_dir, max_age_seconds=time.time() - started + 1):
+        if path not in files:
+            files.append(path)
+    return files
+
+
 def _get_documents_dir(context: ToolContext) -> Path:
     """Get the documents directory from workspace, or a fallback."""
     if context.has_workspace():
@@ -160,35 +232,31 @@ def create_browser_tools(context: ToolContext) -> List[Any]:
             Extracted information or task completion status
         """
         try:
-            from browser_use import Agent, Browser
+            from browser_use import Agent
         except ImportError:
             return (
                 "Error: browser-use package not installed.\n"
                 "Install with: pip install browser-use && playwright install chromium"
             )
 
-        browser = None
         try:
             # Create LLM for browser agent
             llm = _get_browser_llm()
 
-            # Configure browser
-            browser_kwargs = _get_browser_config(context)
-            browser = Browser(**browser_kwargs)
-
             # Build full task with starting URL
             full_task = f"Go to {url} and {task}"
 
-            # Create and run browser agent
-            agent = Agent(
-                task=full_task,
-                llm=llm,
-                browser=browser,
-                use_vision=use_vision,
-                max_actions_per_step=4,
-            )
+            async with _leased_browser(context) as (browser, _):
+                # Create and run browser agent
+                agent = Agent(
+                    task=full_task,
+                    llm=llm,
+                    browser=browser,
+                    use_vision=use_vision,
+                    max_actions_per_step=4,
+                )
 
-            history = await agent.run()
+                history = await agent.run()
 
             # Extract final result from history
             result = _extract_result(history)
@@ -197,12 +265,6 @@ def create_browser_tools(context: ToolContext) -> List[Any]:
         except Exception as e:
             logger.error(f"Browser automation error: {e}", exc_info=True)
             return f"Browser automation failed: {e}"
-        finally:
-            if browser is not None:
-                try:
-                    await browser.stop()
-                except Exception:
-                    pass
 
     @tool
     async def download_from_website(
@@ -226,7 +288,7 @@ def create_browser_tools(context: ToolContext) -> List[Any]:
             Path to downloaded file or error message
         """
         try:
-            from browser_use import Agent, Browser
+            from browser_use import Agent
         except ImportError:
             return (
                 "Error: browser-use package not installed.\n"
@@ -236,34 +298,32 @@ def create_browser_tools(context: ToolContext) -> List[Any]:
         dest_dir = _get_documents_dir(context)
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        browser = None
         try:
             # Create LLM for browser agent
             llm = _get_browser_llm()
 
-            # Configure browser with downloads path
-            browser_kwargs = _get_browser_config(context, downloads_path=dest_dir)
-            browser = Browser(**browser_kwargs)
-
             # Build download task
             full_task = (
                 f"Go to {url} and {download_task}. "
                 f"Wait for the download to complete."
             )
 
-            # Create and run browser agent
-            agent = Agent(
-                task=full_task,
-                llm=llm,
-                browser=browser,
-                use_vision=False,  # DOM-based is more reliable for downloads
-                max_actions_per_step=4,
-            )
+            started = time.time()
+            async with _leased_browser(context, downloads_path=dest_dir) as (browser, lease):
+                # Create and run browser agent
+                agent = Agent(
+                    task=full_task,
+                    llm=llm,
+                    browser=browser,
+                    use_vision=False,  # DOM-based is more reliable for downloads
+                    max_actions_per_step=4,
+                )
+
+                history = await agent.run()
 
-            history = await agent.run()
+                # Downloads finished during (or right after) the agent run
+                downloaded_files = await _collect_downloads(lease, dest_dir, started)
 
-            # Check for downloaded files
-            downloaded_files = _find_new_files(dest_dir)
             if downloaded_files:
                 # Register the first downloaded file as a citation source
                 downloaded_path = downloaded_files[0]
@@ -281,12 +341,6 @@ def create_browser_tools(context: ToolContext) -> List[Any]:
         except Exception as e:
             logger.error(f"Browser download error: {e}", exc_info=True)
             return f"Browser download failed: {e}"
-        finally:
-            if browser is not None:
-                try:
-                    await browser.stop()
-                except Exception:
-                    pass
 
     return [browse_website, download_from_website]
 
@@ -335,7 +389,7 @@ def _extract_result(history) -> str:
         return "Browser agent completed. Check workspace documents for any downloaded files."
 
 
-def _find_new_files(directory: Path, max_age_seconds: int = 60) -> List[Path]:
+def _find_new_files(directory: Path, max_age_seconds: float = 60) -> List[Path]:
     """Find recently created files in directory.
 
     Args:
@@ -345,8 +399,6 @@ def _find_new_files(directory: Path, max_age_seconds: int = 60) -> List[Path]:
     Returns:
         List of recently created file paths, sorted by modification time (newest first)
     """
-    import time
-
     now = time.time()
     new_files = []
 
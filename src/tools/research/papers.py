@@ -1,18 +1,24 @@
 """Academic paper search and download tools.
 
 Provides tools for searching academic databases (arXiv, Semantic Scholar)
-and downloading open access papers via arXiv and Unpaywall fallback chain.
+and downloading open access papers. Independent sources are queried
+concurrently (see utils/fanout.py): arXiv and Unpaywall race for a
+download while the DOI is resolved for the browser fallback, and batch
+downloads run with bounded parallelism.
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
 import re
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .utils.paper_types import DownloadResult
+    from .utils.paper_types import DownloadResult, Paper
 
 from langchain_core.tools import tool
 
@@ -37,6 +43,14 @@ PAPER_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "short_description": "Download paper PDF using arXiv/Unpaywall/browser fallback chain.",
         "phases": ["tactical"],
     },
+    "download_papers": {
+        "module": "research.papers",
+        "function": "download_papers",
+        "description": "Download several paper PDFs to workspace concurrently",
+        "category": "research",
+        "short_description": "Batch-download paper PDFs by DOI/arXiv ID with bounded parallelism.",
+        "phases": ["tactical"],
+    },
     "get_paper_info": {
         "module": "research.papers",
         "function": "get_paper_info",
@@ -54,6 +68,12 @@ DOI_PATTERN = re.compile(r"10\.\d{4,9}/[-._;()/:A-Z0-9]+", re.IGNORECASE)
 # arXiv ID pattern: YYMM.NNNNN
 ARXIV_PATTERN = re.compile(r"\d{4}\.\d{4,5}(?:v\d+)?")
 
+# Default number of papers downloaded at once by download_papers
+DEFAULT_MAX_PARALLEL_DOWNLOADS = 4
+
+# Upper bound on identifiers per download_papers call
+MAX_BATCH_DOWNLOADS = 20
+
 
 def _detect_identifier_type(identifier: str) -> str:
     """Detect whether identifier is a DOI, arXiv ID, or URL."""
@@ -89,7 +109,7 @@ def create_paper_tools(context: ToolContext) -> List[Any]:
 
         Args:
             query: Search query (keywords, title, author)
-            source: Database to search ("arxiv" or "semantic_scholar")
+            source: Database to search ("arxiv", "semantic_scholar", or "all" to query both concurrently and merge duplicates)
             max_results: Maximum results (default 10, max 50)
 
         Returns:
@@ -101,8 +121,10 @@ def create_paper_tools(context: ToolContext) -> List[Any]:
             return await _search_arxiv(query, max_results)
         elif source == "semantic_scholar":
             return await _search_semantic_scholar(query, max_results, proxy=proxy)
+        elif source == "all":
+            return await _search_all(query, max_results, proxy=proxy)
         else:
-            return f"Unknown source: {source}. Use 'arxiv' or 'semantic_scholar'."
+            return f"Unknown source: {source}. Use 'arxiv', 'semantic_scholar' or 'all'."
 
     @tool
     async def download_paper(
@@ -112,7 +134,7 @@ def create_paper_tools(context: ToolContext) -> List[Any]:
     ) -> str:
         """Download paper PDF to workspace documents folder.
 
-        Uses fallback chain: arXiv -> Unpaywall -> Browser automation.
+        Tries arXiv and Unpaywall concurrently, then browser automation.
         Downloaded papers are registered as citation sources when possible.
 
         Args:
@@ -123,70 +145,73 @@ def create_paper_tools(context: ToolContext) -> List[Any]:
         Returns:
             Path to downloaded PDF or error message with suggestions
         """
-        if identifier_type == "auto":
-            identifier_type = _detect_identifier_type(identifier)
+        _, message = await _download_identifier(
+            identifier,
+            identifier_type,
+            _get_documents_dir(context),
+            context,
+            proxy=proxy,
+            use_browser_fallback=use_browser_fallback,
+        )
+        return message
 
-        dest_dir = _get_documents_dir(context)
+    @tool
+    async def download_papers(
+        identifiers: str,
+        use_browser_fallback: bool = False,
+    ) -> str:
+        """Download several papers to the workspace documents folder at once.
 
-        # Track whether we found a paywalled paper (for messaging)
-        paywalled_title = None
-
-        # Try arXiv first (for arXiv IDs, or DOIs that might be arXiv)
-        if identifier_type == "arxiv" or "arxiv" in identifier.lower():
-            result = await _try_arxiv_download(identifier, dest_dir)
-            if result.success:
-                _register_downloaded_paper(context, result)
-                return (
-                    f"Downloaded: {result.paper.title}\n"
-                    f"Path: {result.path}\n"
-                    f"Source: arXiv ({result.paper.arxiv_id})"
-                )
-
-        # Try Unpaywall for DOIs
-        if identifier_type == "doi":
-            doi = DOI_PATTERN.search(identifier)
-            if doi:
-                result = await _try_unpaywall_download(doi.group(), dest_dir, proxy=proxy)
-                if result.success:
-                    _register_downloaded_paper(context, result)
-                    return (
-                        f"Downloaded: {result.paper.title}\n"
-                        f"Path: {result.path}\n"
-                        f"Source: Unpaywall (OA copy)"
-                    )
-                elif result.paper and result.paper.access_status.value == "paywalled":
-                    paywalled_title = result.paper.title
-                elif result.error:
-                    logger.debug(f"Unpaywall download failed: {result.error}")
+        Each paper goes through the same sources as download_paper. Papers are
+        downloaded in parallel and duplicate identifiers only once.
 
-        # Try browser automation as final fallback
-        if use_browser_fallback:
-            browser_result = await _try_browser_download(
-                identifier, identifier_type, dest_dir, context, proxy=proxy
-            )
-            if browser_result:
-                return browser_result
+        Args:
+            identifiers: Comma- or newline-separated DOIs, arXiv IDs, or URLs (max 20)
+            use_browser_fallback: Try browser automation for papers the APIs cannot provide (default False, slow)
 
-        # All methods failed
-        if paywalled_title:
-            return (
-                f"Paper is paywalled: {paywalled_title}\n"
-                f"No open access version found and browser download failed.\n"
-                f"Suggestions:\n"
-                f"  - Check if a preprint exists on arXiv\n"
-                f"  - Connect to institutional VPN and configure proxy\n"
-                f"  - Contact the author directly"
-            )
+        Returns:
+            Per-paper download summary
+        """
+        unique = _unique_identifiers(identifiers)
+        if not unique:
+            return "Error: No identifiers provided"
+        if len(unique) > MAX_BATCH_DOWNLOADS:
+            return f"Error: Maximum {MAX_BATCH_DOWNLOADS} identifiers allowed per request"
 
-        return (
-            f"Could not download paper for identifier: {identifier}\n"
-            f"Detected type: {identifier_type}\n"
-            f"Suggestions:\n"
-            f"  - For arXiv papers, use the arXiv ID (e.g., '2408.08921')\n"
-            f"  - For other papers, use the DOI (e.g., '10.1038/nature12373')\n"
-            f"  - Use search_papers to find the paper first"
+        dest_dir = _get_documents_dir(context)
+        limit = context.config.get("research", {}).get(
+            "max_parallel_downloads", DEFAULT_MAX_PARALLEL_DOWNLOADS
         )
 
+        async def download(identifier: str) -> Tuple[bool, str]:
+            return await _download_identifier(
+                identifier,
+                "auto",
+                dest_dir,
+                context,
+                proxy=proxy,
+                use_browser_fallback=use_browser_fallback,
+            )
+
+        from .utils.fanout import bounded_gather
+
+        outcomes = await bounded_gather(unique, download, limit)
+
+        downloaded = 0
+        lines = []
+        for i, (identifier, outcome) in enumerate(zip(unique, outcomes), 1):
+            if isinstance(outcome, Exception):
+                outcome = (False, f"Error: {outcome}")
+            success, message = outcome
+            downloaded += success
+            status = "OK" if success else "FAILED"
+            lines.append(f"{i}. [{status}] {identifier}")
+            lines.extend(f"   {line}" for line in message.splitlines())
+            lines.append("")
+
+        header = f"Batch Download: {downloaded}/{len(unique)} papers downloaded\n"
+        return header + "\n" + "\n".join(lines).rstrip()
+
     @tool
     async def get_paper_info(identifier: str) -> str:
         """Get detailed paper information including abstract, authors, and citations.
@@ -212,12 +237,19 @@ def create_paper_tools(context: ToolContext) -> List[Any]:
 
         return f"Could not find paper info for: {identifier}"
 
-    return [search_papers, download_paper, get_paper_info]
+    return [search_papers, download_paper, download_papers, get_paper_info]
 
 
 # --- Implementation helpers ---
 
 
+class _RateLimited(Exception):
+    """Semantic Scholar answered 429; surfaced to the agent, never cached."""
+
+    def __init__(self) -> None:
+        super().__init__("Semantic Scholar rate limit hit")
+
+
 async def _search_arxiv(query: str, max_results: int) -> str:
     """Search arXiv and format results."""
     try:
@@ -240,15 +272,21 @@ async def _search_arxiv(query: str, max_results: int) -> str:
     return "\n".join(lines)
 
 
-async def _search_semantic_scholar(
+async def _search_semantic_scholar_papers(
     query: str, max_results: int, *, proxy=None
-) -> str:
-    """Search Semantic Scholar and format results."""
+) -> Tuple[List["Paper"], Any]:
+    """Search Semantic Scholar and return (papers, total match count).
+
+    Raises:
+        _RateLimited: On HTTP 429
+        ConnectionError, aiohttp.ClientError: On request failures
+    """
     import os
 
-    import aiohttp
+    from src.services.research_cache import get_research_cache
 
     from .utils.network import research_request
+    from .utils.paper_types import AccessStatus, Paper, PaperSource
 
     api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
     headers = {}
@@ -262,34 +300,24 @@ async def _search_semantic_scholar(
         "fields": "title,authors,year,abstract,citationCount,openAccessPdf,externalIds,venue",
     }
 
-    try:
+    async def load() -> dict:
         async with research_request(
             "GET", url, proxy=proxy, timeout=30, params=params, headers=headers
         ) as resp:
             if resp.status == 429:
-                return "Semantic Scholar rate limit hit. Try again in a few minutes or set SEMANTIC_SCHOLAR_API_KEY."
+                raise _RateLimited()
             resp.raise_for_status()
-            data = await resp.json()
-    except ConnectionError as e:
-        return f"Semantic Scholar search error (connection): {e}"
-    except aiohttp.ClientError as e:
-        return f"Semantic Scholar search error: {e}"
+            return await resp.json()
 
-    results = data.get("data", [])
-    if not results:
-        return f"No Semantic Scholar results for: {query}"
-
-    from .utils.paper_types import AccessStatus, Paper, PaperSource
+    data = await get_research_cache().fetch_async(
+        "semantic_scholar", {"op": "search", **params}, load
+    )
 
-    lines = [
-        f"Semantic Scholar Results for: {query}",
-        f"Results: {len(results)} (of {data.get('total', '?')} total)",
-        "",
-    ]
-    for i, r in enumerate(results, 1):
+    papers = []
+    for r in data.get("data", []):
         ext_ids = r.get("externalIds") or {}
         oa_pdf = r.get("openAccessPdf") or {}
-        paper = Paper(
+        papers.append(Paper(
             title=r.get("title", "Unknown"),
             authors=[a.get("name", "") for a in r.get("authors", [])],
             abstract=r.get("abstract"),
@@ -302,24 +330,262 @@ async def _search_semantic_scholar(
             citation_count=r.get("citationCount"),
             year=r.get("year"),
             venue=r.get("venue"),
-        )
+        ))
+    return papers, data.get("total", "?")
+
+
+async def _search_semantic_scholar(
+    query: str, max_results: int, *, proxy=None
+) -> str:
+    """Search Semantic Scholar and format results."""
+    import aiohttp
+
+    try:
+        papers, total = await _search_semantic_scholar_papers(query, max_results, proxy=proxy)
+    except _RateLimited:
+        return "Semantic Scholar rate limit hit. Try again in a few minutes or set SEMANTIC_SCHOLAR_API_KEY."
+    except ConnectionError as e:
+        return f"Semantic Scholar search error (connection): {e}"
+    except aiohttp.ClientError as e:
+        return f"Semantic Scholar search error: {e}"
+
+    if not papers:
+        return f"No Semantic Scholar results for: {query}"
+
+    lines = [
+        f"Semantic Scholar Results for: {query}",
+        f"Results: {len(papers)} (of {total} total)",
+        "",
+    ]
+    for i, paper in enumerate(papers, 1):
         lines.append(paper.format(index=i))
         lines.append("")
 
     return "\n".join(lines)
 
 
-async def _try_arxiv_download(identifier: str, dest_dir: Path) -> "DownloadResult":
-    """Try downloading from arXiv."""
+async def _search_all(query: str, max_results: int, *, proxy=None) -> str:
+    """Search arXiv and Semantic Scholar concurrently and merge the results.
+
+    Semantic Scholar entries win on duplicates (they carry citation counts).
+    """
+    from .utils.arxiv_client import ArxivClient
+    from .utils.fanout import dedupe_papers
+
+    arxiv_papers, s2_result = await asyncio.gather(
+        ArxivClient().search(query, max_results),
+        _search_semantic_scholar_papers(query, max_results, proxy=proxy),
+        return_exceptions=True,
+    )
+
+    notes = []
+    if isinstance(arxiv_papers, BaseException):
+        notes.append(f"arXiv unavailable: {arxiv_papers}")
+        arxiv_papers = []
+    if isinstance(s2_result, BaseException):
+        notes.append(f"Semantic Scholar unavailable: {s2_result}")
+        s2_papers = []
+    else:
+        s2_papers = s2_result[0]
+
+    merged = dedupe_papers(s2_papers, arxiv_papers)
+    duplicates = len(s2_papers) + len(arxiv_papers) - len(merged)
+    papers = merged[:max_results]
+    if not papers:
+        return "\n".join([f"No results for: {query}", *notes])
+
+    lines = [
+        f"Combined Search Results for: {query}",
+        f"Results: {len(papers)} (Semantic Scholar: {len(s2_papers)}, arXiv: {len(arxiv_papers)}, "
+        f"duplicates merged: {duplicates})",
+        *notes,
+        "",
+    ]
+    for i, paper in enumerate(papers, 1):
+        lines.append(paper.format(index=i))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _unique_identifiers(identifiers: str) -> List[str]:
+    """Split a comma/newline-separated identifier list, dropping duplicates.
+
+    DOIs compare case-insensitively and arXiv IDs ignore the version suffix.
+    """
+    unique: List[str] = []
+    seen = set()
+    for raw in re.split(r"[,\n]", identifiers):
+        identifier = raw.strip()
+        if not identifier:
+            continue
+        doi = DOI_PATTERN.search(identifier)
+        arxiv = ARXIV_PATTERN.search(identifier)
+        if doi:
+            key = f"doi:{doi.group().lower()}"
+        elif arxiv:
+            key = "arxiv:" + re.sub(r"v\d+$", "", arxiv.group())
+        else:
+            key = identifier
+        if key not in seen:
+            seen.add(key)
+            unique.append(identifier)
+    return unique
+
+
+def _browser_available() -> bool:
+    """Whether browser-use is installed (the browser fallback can run)."""
+    return importlib.util.find_spec("browser_use") is not None
+
+
+async def _download_identifier(
+    identifier: str,
+    identifier_type: str,
+    dest_dir: Path,
+    context: ToolContext,
+    *,
+    proxy=None,
+    use_browser_fallback: bool = True,
+) -> Tuple[bool, str]:
+    """Download one paper, querying the independent sources concurrently.
+
+    arXiv and Unpaywall are looked up at the same time, but the PDF is
+    downloaded only once (see :class:`_DownloadSlot`): the first source to
+    find it downloads it, and the other one is cancelled or only tries if
+    that download failed. For DOIs the publisher URL is resolved in
+    parallel so the browser fallback can start immediately.
+
+    Returns:
+        Tuple of (success, message for the agent)
+    """
+    from .utils.fanout import first_success
+
+    if identifier_type == "auto":
+        identifier_type = _detect_identifier_type(identifier)
+
+    attempts = {}
+    slot = _DownloadSlot()
+    if identifier_type == "arxiv" or "arxiv" in identifier.lower():
+        attempts["arxiv"] = _try_arxiv_download(identifier, dest_dir, slot=slot)
+    doi_match = DOI_PATTERN.search(identifier) if identifier_type == "doi" else None
+    if doi_match:
+        attempts["unpaywall"] = _try_unpaywall_download(
+            doi_match.group(), dest_dir, proxy=proxy, slot=slot
+        )
+
+    # Resolve the publisher URL for the browser fallback while the APIs run
+    resolve_task = None
+    if use_browser_fallback and doi_match and _browser_available():
+        resolve_task = asyncio.ensure_future(_resolve_doi_url(doi_match.group(), proxy=proxy))
+
+    # Track whether we found a paywalled paper (for messaging)
+    paywalled_title = None
+    try:
+        outcome = await first_success(attempts, lambda r: r.success)
+        if outcome.winner is not None:
+            result = outcome.result
+            _register_downloaded_paper(context, result)
+            source = (
+                f"arXiv ({result.paper.arxiv_id})" if outcome.winner == "arxiv"
+                else "Unpaywall (OA copy)"
+            )
+            return True, (
+                f"Downloaded: {result.paper.title}\n"
+                f"Path: {result.path}\n"
+                f"Source: {source}"
+            )
+
+        unpaywall_result = outcome.failures.get("unpaywall")
+        if unpaywall_result is not None and not isinstance(unpaywall_result, BaseException):
+            if unpaywall_result.paper and unpaywall_result.paper.access_status.value == "paywalled":
+                paywalled_title = unpaywall_result.paper.title
+            elif unpaywall_result.error:
+                logger.debug(f"Unpaywall download failed: {unpaywall_result.error}")
+
+        # Try browser automation as final fallback
+        if use_browser_fallback:
+            resolved_url = await resolve_task if resolve_task is not None else None
+            browser_result = await _try_browser_download(
+                identifier, identifier_type, dest_dir, context,
+                proxy=proxy, resolved_url=resolved_url,
+            )
+            if browser_result:
+                return True, browser_result
+    finally:
+        if resolve_task is not None and not resolve_task.done():
+            resolve_task.cancel()
+
+    # All methods failed
+    if paywalled_title:
+        return False, (
+            f"Paper is paywalled: {paywalled_title}\n"
+            f"No open access version found and browser download failed.\n"
+            f"Suggestions:\n"
+            f"  - Check if a preprint exists on arXiv\n"
+            f"  - Connect to institutional VPN and configure proxy\n"
+            f"  - Contact the author directly"
+        )
+
+    return False, (
+        f"Could not download paper for identifier: {identifier}\n"
+        f"Detected type: {identifier_type}\n"
+        f"Suggestions:\n"
+        f"  - For arXiv papers, use the arXiv ID (e.g., '2408.08921')\n"
+        f"  - For other papers, use the DOI (e.g., '10.1038/nature12373')\n"
+        f"  - Use search_papers to find the paper first"
+    )
+
+
+class _DownloadSlot:
+    """Lets the sources of one paper look it up concurrently but download it once.
+
+    Cancelling a source's task does not stop a download already running in a
+    worker thread (arxiv's ``download_pdf``), so sources must not download in
+    parallel. Downloads through the slot run one at a time, and once one has
+    succeeded the others are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._downloaded = False
+
+    async def download(self, start: Callable[[], Awaitable["DownloadResult"]]) -> "DownloadResult":
+        """Run a download unless another source already downloaded the paper."""
+        from .utils.paper_types import DownloadResult
+
+        async with self._lock:
+            if self._downloaded:
+                return DownloadResult(success=False, error="Already downloaded from another source")
+            result = await start()
+            self._downloaded = result.success
+            return result
+
+
+async def _try_arxiv_download(
+    identifier: str, dest_dir: Path, *, slot: Optional[_DownloadSlot] = None
+) -> "DownloadResult":
+    """Try downloading from arXiv (through ``slot`` once the paper is found)."""
     from .utils.arxiv_client import ArxivClient, extract_arxiv_id
+    from .utils.paper_types import DownloadResult
 
     arxiv_id = extract_arxiv_id(identifier) or identifier
     client = ArxivClient()
-    return await client.download(arxiv_id, dest_dir)
+    if slot is None:
+        return await client.download(arxiv_id, dest_dir)
+
+    try:
+        result = await client.find(arxiv_id)
+    except Exception as e:
+        logger.error(f"arXiv lookup failed for {arxiv_id}: {e}")
+        return DownloadResult(success=False, error=str(e))
+    if result is None:
+        return DownloadResult(success=False, error=f"Paper {arxiv_id} not found on arXiv")
+    return await slot.download(lambda: client.download_result(arxiv_id, result, dest_dir))
 
 
-async def _try_unpaywall_download(doi: str, dest_dir: Path, *, proxy=None) -> "DownloadResult":
-    """Try downloading via Unpaywall."""
+async def _try_unpaywall_download(
+    doi: str, dest_dir: Path, *, proxy=None, slot: Optional[_DownloadSlot] = None
+) -> "DownloadResult":
+    """Try downloading via Unpaywall (through ``slot`` once an OA PDF is found)."""
     from .utils.paper_types import DownloadResult
     from .utils.unpaywall_client import UnpaywallClient
 
@@ -329,7 +595,19 @@ async def _try_unpaywall_download(doi: str, dest_dir: Path, *, proxy=None) -> "D
             success=False,
             error="UNPAYWALL_EMAIL not configured. Set it in .env to enable Unpaywall lookups.",
         )
-    return await client.download(doi, dest_dir)
+    if slot is None:
+        return await client.download(doi, dest_dir)
+
+    paper = await client.get_paper(doi)
+    if not paper:
+        return DownloadResult(success=False, error=f"DOI {doi} not found in Unpaywall")
+    if not paper.pdf_url:
+        return DownloadResult(
+            success=False,
+            error=f"No OA PDF available for {doi} (status: {paper.access_status.value})",
+            paper=paper,
+        )
+    return await slot.download(lambda: client.download_paper(doi, paper, dest_dir))
 
 
 async def _resolve_doi_url(doi: str, *, proxy=None) -> Optional[str]:
@@ -342,14 +620,16 @@ async def _resolve_doi_url(doi: str, *, proxy=None) -> Optional[str]:
     Returns:
         Publisher URL or None if resolution fails
     """
+    from .utils.fanout import get_source_limiter
     from .utils.network import research_request
 
     doi_url = f"https://doi.org/{doi}"
     try:
-        async with research_request(
-            "HEAD", doi_url, proxy=proxy, timeout=15, allow_redirects=True
-        ) as resp:
-            return str(resp.url)
+        async with get_source_limiter("doi"):
+            async with research_request(
+                "HEAD", doi_url, proxy=proxy, timeout=15, allow_redirects=True
+            ) as resp:
+                return str(resp.url)
     except Exception as e:
         logger.debug(f"DOI resolution failed for {doi}: {e}")
         return doi_url  # Fall back to doi.org URL
@@ -362,6 +642,7 @@ async def _try_browser_download(
     context: "ToolContext",
     *,
     proxy=None,
+    resolved_url: Optional[str] = None,
 ) -> Optional[str]:
     """Try downloading a paper using browser automation.
 
@@ -373,19 +654,27 @@ async def _try_browser_download(
         identifier_type: Type of identifier
         dest_dir: Download destination directory
         context: ToolContext for browser configuration
+        resolved_url: Publisher URL already resolved from the DOI (skips resolution)
 
     Returns:
         Success message string, or None if browser download failed/unavailable
     """
     try:
-        from .browser import _get_browser_config, _get_browser_llm, _find_new_files, _register_downloaded_file
-        from browser_use import Agent, Browser
+        from .browser import (
+            _collect_downloads,
+            _get_browser_llm,
+            _leased_browser,
+            _register_downloaded_file,
+        )
+        from browser_use import Agent
     except ImportError:
         logger.debug("browser-use not available for fallback download")
         return None
 
     # Resolve identifier to a URL
-    if identifier_type == "doi":
+    if resolved_url:
+        url = resolved_url
+    elif identifier_type == "doi":
         doi_match = DOI_PATTERN.search(identifier)
         if doi_match:
             url = await _resolve_doi_url(doi_match.group(), proxy=proxy)
@@ -402,29 +691,29 @@ async def _try_browser_download(
 
     logger.info(f"Trying browser download from: {url}")
 
-    browser = None
     try:
         llm = _get_browser_llm()
-        browser_kwargs = _get_browser_config(context, downloads_path=dest_dir)
-        browser = Browser(**browser_kwargs)
-
-        agent = Agent(
-            task=(
-                f"Go to {url} and download the PDF of this paper. "
-                f"Look for a 'Download PDF' button or link. "
-                f"Accept any cookie banners if needed. "
-                f"Wait for the download to complete."
-            ),
-            llm=llm,
-            browser=browser,
-            use_vision=False,
-            max_actions_per_step=4,
-        )
 
-        await agent.run()
+        started = time.time()
+        async with _leased_browser(context, downloads_path=dest_dir) as (browser, lease):
+            agent = Agent(
+                task=(
+                    f"Go to {url} and download the PDF of this paper. "
+                    f"Look for a 'Download PDF' button or link. "
+                    f"Accept any cookie banners if needed. "
+                    f"Wait for the download to complete."
+                ),
+                llm=llm,
+                browser=browser,
+                use_vision=False,
+                max_actions_per_step=4,
+            )
+
+            await agent.run()
+
+            # Check for downloaded files
+            downloaded_files = await _collect_downloads(lease, dest_dir, started)
 
-        # Check for downloaded files
-        downloaded_files = _find_new_files(dest_dir)
         if downloaded_files:
             downloaded_path = downloaded_files[0]
             _register_downloaded_file(context, downloaded_path)
@@ -440,12 +729,6 @@ async def _try_browser_download(
     except Exception as e:
         logger.debug(f"Browser download failed: {e}")
         return None
-    finally:
-        if browser is not None:
-            try:
-                await browser.stop()
-            except Exception:
-                pass
 
 
 async def _get_semantic_scholar_info(identifier: str, *, proxy=None) -> Optional[str]:
@@ -454,6 +737,8 @@ async def _get_semantic_scholar_info(identifier: str, *, proxy=None) -> Optional
 
     import aiohttp
 
+    from src.services.research_cache import get_research_cache
+
     from .utils.network import research_request
 
     api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
@@ -474,20 +759,29 @@ async def _get_semantic_scholar_info(identifier: str, *, proxy=None) -> Optional
         "fields": "title,authors,year,abstract,citationCount,referenceCount,openAccessPdf,externalIds,venue,publicationDate",
     }
 
-    try:
+    async def load() -> Optional[dict]:
         async with research_request(
             "GET", url, proxy=proxy, timeout=30, params=params, headers=headers
         ) as resp:
             if resp.status == 404:
                 return None
             if resp.status == 429:
-                return "Semantic Scholar rate limit hit. Try again in a few minutes."
+                raise _RateLimited()
             resp.raise_for_status()
-            data = await resp.json()
+            return await resp.json()
+
+    try:
+        data = await get_research_cache().fetch_async(
+            "semantic_scholar", {"op": "paper", "id": paper_id, **params}, load
+        )
+    except _RateLimited:
+        return "Semantic Scholar rate limit hit. Try again in a few minutes."
     except ConnectionError:
         return None
     except aiohttp.ClientError:
         return None
+    if data is None:
+        return None
 
     ext_ids = data.get("externalIds") or {}
     oa_pdf = data.get("openAccessPdf") or {}
@@ -5,7 +5,7 @@ import logging
 import re
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from .paper_types import AccessStatus, DownloadResult, Paper, PaperSource
 
@@ -31,43 +31,81 @@ class ArxivClient:
         self._last_request: float = 0
 
     async def search(self, query: str, max_results: int = 10) -> List[Paper]:
-        """Search arXiv for papers."""
-        import arxiv
+        """Search arXiv for papers.
 
-        await self._wait_rate_limit()
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.Relevance,
+        Results are served from the shared research cache when possible,
+        which also skips the rate-limit wait.
+        """
+        from src.services.research_cache import get_research_cache
+
+        async def load() -> List[dict]:
+            import arxiv
+
+            await self._wait_rate_limit()
+            search = arxiv.Search(
+                query=query,
+                max_results=max_results,
+                sort_by=arxiv.SortCriterion.Relevance,
+            )
+            results = await asyncio.to_thread(list, search.results())
+            return [self._to_paper(r).to_dict() for r in results]
+
+        rows = await get_research_cache().fetch_async(
+            "arxiv", {"op": "search", "query": query, "max_results": max_results}, load
         )
-        results = await asyncio.to_thread(list, search.results())
-        return [self._to_paper(r) for r in results]
+        return [Paper.from_dict(row) for row in rows]
 
     async def get_paper(self, arxiv_id: str) -> Optional[Paper]:
-        """Get a specific paper by arXiv ID."""
-        import arxiv
+        """Get a specific paper by arXiv ID (cached like search)."""
+        from src.services.research_cache import get_research_cache
 
         clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
-        await self._wait_rate_limit()
-        search = arxiv.Search(id_list=[clean_id])
-        results = await asyncio.to_thread(list, search.results())
-        return self._to_paper(results[0]) if results else None
+
+        async def load() -> Optional[dict]:
+            import arxiv
+
+            await self._wait_rate_limit()
+            search = arxiv.Search(id_list=[clean_id])
+            results = await asyncio.to_thread(list, search.results())
+            return self._to_paper(results[0]).to_dict() if results else None
+
+        row = await get_research_cache().fetch_async(
+            "arxiv", {"op": "get_paper", "id": clean_id}, load
+        )
+        return Paper.from_dict(row) if row else None
 
     async def download(self, arxiv_id: str, dest_dir: Path) -> DownloadResult:
         """Download paper PDF."""
+        clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
+        try:
+            result = await self.find(clean_id)
+        except Exception as e:
+            logger.error(f"arXiv download failed for {clean_id}: {e}")
+            return DownloadResult(success=False, error=str(e))
+        if result is None:
+            return DownloadResult(
+                success=False, error=f"Paper {clean_id} not found on arXiv"
+            )
+        return await self.download_result(clean_id, result, dest_dir)
+
+    async def find(self, arxiv_id: str) -> Optional[Any]:
+        """Look up the arxiv.Result of a paper without downloading it.
+
+        Returns:
+            arxiv.Result, or None if arXiv has no such paper
+        """
         import arxiv
 
         clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
         await self._wait_rate_limit()
-        try:
-            search = arxiv.Search(id_list=[clean_id])
-            results = await asyncio.to_thread(list, search.results())
-            if not results:
-                return DownloadResult(
-                    success=False, error=f"Paper {clean_id} not found on arXiv"
-                )
+        search = arxiv.Search(id_list=[clean_id])
+        results = await asyncio.to_thread(list, search.results())
+        return results[0] if results else None
 
-            result = results[0]
+    async def download_result(self, arxiv_id: str, result: Any, dest_dir: Path) -> DownloadResult:
+        """Download the PDF of an arxiv.Result returned by :meth:`find`."""
+        clean_id = extract_arxiv_id(arxiv_id) or arxiv_id
+        try:
             filename = f"{clean_id.replace('/', '_')}.pdf"
             dest_dir.mkdir(parents=True, exist_ok=True)
             await asyncio.to_thread(
@@ -98,9 +136,12 @@ class ArxivClient:
         )
 
     async def _wait_rate_limit(self):
-        """Respect arXiv rate limit."""
-        now = time.time()
-        elapsed = now - self._last_request
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
+        """Respect arXiv rate limit.
+
+        The spacing is shared by every client in the process (tools create a
+        new client per call, and searches and downloads may run concurrently).
+        """
+        from .fanout import get_source_limiter
+
+        await get_source_limiter("arxiv").wait(self.rate_limit)
         self._last_request = time.time()
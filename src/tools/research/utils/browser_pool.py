@@ -0,0 +1,416 @@
+"""Warm browser pool for the browser automation tools.
+
+Launching Chromium costs several seconds, which used to be paid by every
+``browse_website`` / ``download_from_website`` call. The pool keeps a few
+Chromium processes running (launched through Playwright with a CDP port so
+browser-use can attach to them) and gives each call its own isolated
+browser context, so cookies and storage never leak between calls.
+
+Downloads are captured from Playwright ``download`` events of the leased
+context and saved into the caller's directory, instead of scanning the
+directory for recently modified files afterwards.
+
+browser-use attaches to the whole browser over CDP and may open tabs
+outside the leased context (new targets land in the default context). After
+each lease the browser's page targets are checked, and a browser with pages
+outside the leased context is shut down instead of being reused, so state
+from one call can never reach the next.
+
+Browsers are keyed by launch settings (headless, proxy), one lease per
+browser at a time. Browsers idle for longer than the idle timeout are shut
+down, and Playwright stops once the pool is empty.
+
+Configuration (agent config ``browser`` section, env var fallback):
+    pool_size / BROWSER_POOL_SIZE: Max warm browsers (default 2)
+    idle_timeout / BROWSER_POOL_IDLE_SECONDS: Idle shutdown delay (default 300)
+"""
+
+import asyncio
+import logging
+import os
+import re
+import socket
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from .network import ProxyConfig
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_FILENAME = re.compile(r"[^\w.\- ]+")
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _unique_path(directory: Path, filename: str, reserved: Set[Path]) -> Path:
+    name = _UNSAFE_FILENAME.sub("_", Path(filename).name).strip() or "download"
+    path = directory / name
+    stem, suffix = path.stem, path.suffix
+    counter = 1
+    while path.exists() or path in reserved:
+        path = directory / f"{stem}_{counter}{suffix}"
+        counter += 1
+    return path
+
+
+class DownloadWatcher:
+    """Saves the downloads of a browser context into a directory.
+
+    Attach it to every page of the context; each Playwright ``download``
+    event is saved (under a unique, sanitized file name) as soon as it
+    completes.
+    """
+
+    def __init__(self, dest_dir: Path) -> None:
+        self.dest_dir = dest_dir
+        self.files: List[Path] = []
+        self.failures: List[str] = []
+        self._pending: Set[asyncio.Task] = set()
+        self._pages: Set[int] = set()
+        # Names taken by downloads still in flight
+        self._reserved: Set[Path] = set()
+
+    def attach(self, page: Any) -> None:
+        """Watch a page for downloads (idempotent)."""
+        if id(page) in self._pages:
+            return
+        self._pages.add(id(page))
+        page.on("download", self._on_download)
+
+    def _on_download(self, download: Any) -> None:
+        task = asyncio.ensure_future(self._save(download))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _save(self, download: Any) -> None:
+        path = _unique_path(self.dest_dir, download.suggested_filename, self._reserved)
+        self._reserved.add(path)
+        try:
+            # Resolves once the download has finished
+            await download.save_as(str(path))
+        except Exception as e:
+            self.failures.append(f"{download.suggested_filename}: {e}")
+            logger.debug(f"Browser download failed: {download.suggested_filename}: {e}")
+            return
+        finally:
+            self._reserved.discard(path)
+        self.files.append(path)
+        logger.info(f"Browser download saved: {path.name}")
+
+    async def wait(self, timeout: float = 30.0) -> List[Path]:
+        """Wait for in-flight downloads to finish.
+
+        Returns:
+            Saved files, in completion order
+        """
+        if self._pending:
+            await asyncio.wait(set(self._pending), timeout=timeout)
+        return list(self.files)
+
+
+@dataclass
+class _PooledBrowser:
+    """A warm Chromium process owned by the pool."""
+
+    key: Tuple[bool, Optional[str]]
+    browser: Any
+    cdp_url: str
+    in_use: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class BrowserLease:
+    """An isolated browser context on a pooled browser."""
+
+    cdp_url: str
+    context: Any
+    page: Any
+    downloads: DownloadWatcher
+
+
+class BrowserPool:
+    """Pool of warm Chromium browsers with per-lease isolated contexts.
+
+    Example:
+        ```python
+        pool = get_browser_pool(context.config.get("browser", {}))
+        async with pool.lease(headless=True, downloads_path=docs_dir) as lease:
+            browser = Browser(cdp_url=lease.cdp_url, keep_alive=True)
+            ...
+            files = await lease.downloads.wait()
+        ```
+    """
+
+    def __init__(self, pool_size: Optional[int] = None, idle_timeout: Optional[float] = None) -> None:
+        if pool_size is None:
+            pool_size = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        if idle_timeout is None:
+            idle_timeout = float(os.getenv("BROWSER_POOL_IDLE_SECONDS", "300"))
+        self.pool_size = max(1, pool_size)
+        self.idle_timeout = idle_timeout
+        self._browsers: List[_PooledBrowser] = []
+        self._playwright: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._available: Optional[asyncio.Condition] = None
+        self._reaper: Optional[asyncio.TimerHandle] = None
+        self._launches = 0
+        self._leases = 0
+
+    def _bind_loop(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._browsers:
+                # Playwright objects are bound to the loop that created them
+                logger.warning("Browser pool used from a new event loop, dropping warm browsers")
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+            self._browsers = []
+            self._playwright = None
+            self._loop = loop
+            self._available = asyncio.Condition()
+        return self._available
+
+    async def _launch(self, headless: bool, proxy: Optional[ProxyConfig]) -> Tuple[Any, str]:
+        """Launch Chromium with a CDP port; returns (browser, cdp_url)."""
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+        port = _free_port()
+        launch_kwargs: Dict[str, Any] = {
+            "headless": headless,
+            "args": [f"--remote-debugging-port={port}"],
+        }
+        playwright_proxy = proxy.to_playwright_proxy() if proxy else None
+        if playwright_proxy:
+            launch_kwargs["proxy"] = playwright_proxy
+        browser = await self._playwright.chromium.launch(**launch_kwargs)
+        return browser, f"http://127.0.0.1:{port}"
+
+    async def _acquire(self, key: Tuple[bool, Optional[str]], proxy: Optional[ProxyConfig]) -> _PooledBrowser:
+        available = self._bind_loop()
+        async with available:
+            while True:
+                for pooled in self._browsers:
+                    if pooled.key == key and not pooled.in_use and pooled.browser.is_connected():
+                        pooled.in_use = True
+                        return pooled
+
+                # Drop crashed browsers, then make room by retiring an idle one
+                self._browsers = [b for b in self._browsers if b.browser.is_connected()]
+                if len(self._browsers) >= self.pool_size:
+                    idle = [b for b in self._browsers if not b.in_use]
+                    if idle:
+                        oldest = min(idle, key=lambda b: b.last_used)
+                        self._browsers.remove(oldest)
+                        await self._close_browser(oldest)
+
+                if len(self._browsers) < self.pool_size:
+                    browser, cdp_url = await self._launch(key[0], proxy)
+                    pooled = _PooledBrowser(key=key, browser=browser, cdp_url=cdp_url, in_use=True)
+                    self._browsers.append(pooled)
+                    self._launches += 1
+                    return pooled
+
+                await available.wait()
+
+    async def _release(self, pooled: _PooledBrowser, retire: bool = False) -> None:
+        async with self._available:
+            pooled.in_use = False
+            pooled.last_used = time.monotonic()
+            if retire and pooled in self._browsers:
+                self._browsers.remove(pooled)
+                await self._close_browser(pooled)
+            self._available.notify()
+        self._schedule_reap()
+
+    async def _context_id(self, context: Any, page: Any) -> Optional[str]:
+        """CDP browserContextId of a leased context, None if unknown."""
+        try:
+            session = await context.new_cdp_session(page)
+            info = await session.send("Target.getTargetInfo")
+            await session.detach()
+            return info["targetInfo"].get("browserContextId")
+        except Exception as e:
+            logger.debug(f"Could not resolve browser context id: {e}")
+            return None
+
+    async def _has_stray_pages(self, pooled: _PooledBrowser, context_id: Optional[str]) -> bool:
+        """Whether the browser has pages outside the leased context.
+
+        Unknown (CDP errors, no context id) counts as stray, so isolation
+        is never assumed without checking.
+        """
+        if context_id is None:
+            return True
+        try:
+            session = await pooled.browser.new_browser_cdp_session()
+            targets = (await session.send("Target.getTargets"))["targetInfos"]
+            await session.detach()
+        except Exception as e:
+            logger.debug(f"Could not list browser targets: {e}")
+            return True
+        return any(
+            t.get("type") == "page" and t.get("browserContextId") != context_id
+            for t in targets
+        )
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        headless: bool = True,
+        proxy: Optional[ProxyConfig] = None,
+        downloads_path: Optional[Path] = None,
+    ) -> AsyncIterator[BrowserLease]:
+        """Lease a warm browser with a fresh, isolated context.
+
+        Args:
+            headless: Run without a window
+            proxy: Proxy the browser is launched with
+            downloads_path: Directory downloads are saved to
+
+        Yields:
+            BrowserLease with the CDP URL for browser-use and the context
+        """
+        proxy_url = proxy.url if proxy and proxy.is_configured else None
+        pooled = await self._acquire((headless, proxy_url), proxy)
+        self._leases += 1
+        context = None
+        context_id = None
+        retire = False
+        try:
+            context = await pooled.browser.new_context(accept_downloads=True)
+            downloads = DownloadWatcher(downloads_path or Path("./downloads"))
+            context.on("page", downloads.attach)
+            page = await context.new_page()
+            downloads.attach(page)
+            context_id = await self._context_id(context, page)
+            yield BrowserLease(cdp_url=pooled.cdp_url, context=context, page=page, downloads=downloads)
+        finally:
+            if context is not None:
+                retire = await self._has_stray_pages(pooled, context_id)
+                if retire:
+                    logger.info("Browser pool: pages opened outside the leased context, retiring browser")
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser context: {e}")
+            await self._release(pooled, retire=retire)
+
+    def _schedule_reap(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+        self._reaper = self._loop.call_later(
+            self.idle_timeout, lambda: asyncio.ensure_future(self.reap_idle())
+        )
+
+    async def reap_idle(self) -> int:
+        """Shut down browsers idle for longer than the idle timeout.
+
+        Holds the pool lock throughout, so a browser being shut down cannot
+        be leased in the meantime.
+
+        Returns:
+            Number of browsers closed
+        """
+        if self._available is None:
+            return 0
+        async with self._available:
+            now = time.monotonic()
+            expired = [
+                b for b in self._browsers
+                if not b.in_use and now - b.last_used >= self.idle_timeout
+            ]
+            self._browsers = [b for b in self._browsers if b not in expired]
+            for pooled in expired:
+                await self._close_browser(pooled)
+            if expired:
+                logger.info(f"Browser pool: closed {len(expired)} idle browser(s)")
+            if not self._browsers:
+                await self._stop_playwright()
+            elif any(not b.in_use for b in self._browsers):
+                self._schedule_reap()
+            return len(expired)
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser: {e}")
+
+    async def _stop_playwright(self) -> None:
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+            self._playwright = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size, warm/busy browsers and launch/lease counters."""
+        return {
+            "pool_size": self.pool_size,
+            "warm": len(self._browsers),
+            "in_use": sum(1 for b in self._browsers if b.in_use),
+            "launches": self._launches,
+            "leases": self._leases,
+        }
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._loop is not asyncio.get_running_loop():
+            self._browsers = []
+            self._playwright = None
+            return
+        browsers, self._browsers = self._browsers, []
+        for pooled in browsers:
+            await self._close_browser(pooled)
+        await self._stop_playwright()
+
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool(browser_config: Optional[Dict[str, Any]] = None) -> BrowserPool:
+    """Get the process-wide browser pool (created on first use).
+
+    Args:
+        browser_config: Agent config ``browser`` section (pool_size,
+            idle_timeout); only read when the pool is created
+    """
+    global _browser_pool
+    if _browser_pool is None:
+        browser_config = browser_config or {}
+        _browser_pool = BrowserPool(
+            pool_size=browser_config.get("pool_size"),
+            idle_timeout=browser_config.get("idle_timeout"),
+        )
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Close the browser pool (called on agent shutdown)."""
+    if _browser_pool is not None:
+        await _browser_pool.close()
+
+
+__all__ = [
+    "BrowserLease",
+    "BrowserPool",
+    "DownloadWatcher",
+    "close_browser_pool",
+    "get_browser_pool",
+]
@@ -0,0 +1,240 @@
+"""Concurrent fan-out helpers for paper search and download.
+
+Academic sources are independent of one another, so instead of trying them
+one after another the paper tools query them concurrently:
+
+- ``SourceLimiter`` bounds concurrency and spaces request starts per source
+  (arXiv asks for one request every 3 seconds), shared by every client in
+  the process.
+- ``first_success()`` runs several attempts at once, returns the first
+  successful one and cancels the slower attempts.
+- ``bounded_gather()`` runs a worker over many items with bounded
+  parallelism (batch downloads).
+- ``dedupe_papers()`` merges result lists by DOI/arXiv ID.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from .paper_types import Paper
+
+logger = logging.getLogger(__name__)
+
+_ARXIV_VERSION = re.compile(r"v\d+$")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default per-source limits: (max concurrent requests, seconds between request starts).
+# Only for sources not paced per host by the research session pool
+# (network.DEFAULT_HOST_RATE_LIMITS, which paces Semantic Scholar and Unpaywall):
+# arXiv goes through the arxiv library, and DOI resolution only needs a bound.
+DEFAULT_SOURCE_LIMITS: Dict[str, Tuple[int, float]] = {
+    "arxiv": (1, 3.0),
+    "doi": (8, 0.0),
+}
+
+
+class SourceLimiter:
+    """Per-source concurrency bound and request spacing.
+
+    Usable as an async context manager around a whole request, or via
+    ``wait()`` to only space request starts (for clients that manage their
+    own concurrency).
+
+    Example:
+        ```python
+        async with get_source_limiter("doi"):
+            async with research_request("HEAD", url) as resp:
+                ...
+        ```
+    """
+
+    def __init__(self, name: str, max_concurrent: int = 1, min_interval: float = 0.0) -> None:
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_interval = min_interval
+        self._last_start = 0.0
+        # asyncio primitives bind to the loop they are first used on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _primitives(self) -> Tuple[asyncio.Semaphore, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._lock = asyncio.Lock()
+        return self._semaphore, self._lock
+
+    async def wait(self, min_interval: Optional[float] = None) -> None:
+        """Wait until the next request to this source may start.
+
+        Args:
+            min_interval: Spacing override (defaults to the limiter's)
+        """
+        interval = self.min_interval if min_interval is None else min_interval
+        _, lock = self._primitives()
+        async with lock:
+            delay = self._last_start + interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_start = time.monotonic()
+
+    async def __aenter__(self) -> "SourceLimiter":
+        semaphore, _ = self._primitives()
+        await semaphore.acquire()
+        try:
+            await self.wait()
+        except BaseException:
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+_limiters: Dict[str, SourceLimiter] = {}
+
+
+def get_source_limiter(source: str) -> SourceLimiter:
+    """Get the process-wide limiter for a source (created on first use)."""
+    limiter = _limiters.get(source)
+    if limiter is None:
+        max_concurrent, min_interval = DEFAULT_SOURCE_LIMITS.get(source, (4, 0.0))
+        limiter = _limiters[source] = SourceLimiter(source, max_concurrent, min_interval)
+    return limiter
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of ``first_success``."""
+
+    winner: Optional[str]
+    result: Any = None
+    # Results of attempts that finished without succeeding, by name
+    failures: Dict[str, Any] = field(default_factory=dict)
+
+
+async def first_success(
+    attempts: Dict[str, Awaitable[T]],
+    is_success: Callable[[T], bool],
+) -> FanoutResult:
+    """Run attempts concurrently and return the first successful one.
+
+    Remaining attempts are cancelled as soon as one succeeds. Attempts that
+    raise count as failures (the exception is recorded).
+
+    Args:
+        attempts: Name -> awaitable
+        is_success: Predicate applied to each result
+
+    Returns:
+        FanoutResult with the winning name and result (winner is None if
+        every attempt failed) and the failed results by name
+    """
+    failures: Dict[str, Any] = {}
+    if not attempts:
+        return FanoutResult(winner=None, failures=failures)
+
+    tasks = {asyncio.ensure_future(aw): name for name, aw in attempts.items()}
+    pending: Set[asyncio.Future] = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks[task]
+                if task.exception() is not None:
+                    failures[name] = task.exception()
+                    logger.debug(f"Fan-out attempt {name} raised: {task.exception()}")
+                elif is_success(task.result()):
+                    return FanoutResult(winner=name, result=task.result(), failures=failures)
+                else:
+                    failures[name] = task.result()
+        return FanoutResult(winner=None, failures=failures)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def bounded_gather(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    limit: int,
+) -> List[Any]:
+    """Run ``worker`` over items with at most ``limit`` running at once.
+
+    Returns:
+        Results in item order; exceptions are returned in place of results
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+def paper_keys(paper: Paper) -> List[str]:
+    """Identity keys of a paper (normalized DOI and arXiv ID)."""
+    from .arxiv_client import extract_arxiv_id
+
+    keys = []
+    if paper.doi:
+        keys.append(f"doi:{paper.doi.lower()}")
+    if paper.arxiv_id:
+        arxiv_id = extract_arxiv_id(paper.arxiv_id) or paper.arxiv_id
+        # Versions of one preprint are the same paper
+        keys.append(f"arxiv:{_ARXIV_VERSION.sub('', arxiv_id)}")
+    return keys
+
+
+def dedupe_papers(*paper_lists: Iterable[Paper]) -> List[Paper]:
+    """Merge paper lists, dropping papers whose DOI or arXiv ID was seen.
+
+    Earlier lists win, so pass the source with the richest metadata first.
+    Papers without identifiers are always kept.
+    """
+    seen: Set[str] = set()
+    unique: List[Paper] = []
+    for papers in paper_lists:
+        for paper in papers:
+            keys = paper_keys(paper)
+            if any(key in seen for key in keys):
+                continue
+            seen.update(keys)
+            unique.append(paper)
+    return unique
+
+
+__all__ = [
+    "DEFAULT_SOURCE_LIMITS",
+    "FanoutResult",
+    "SourceLimiter",
+    "bounded_gather",
+    "dedupe_papers",
+    "first_success",
+    "get_source_limiter",
+    "paper_keys",
+]
@@ -5,15 +5,32 @@ networks (university VPN, SSH tunnels, HTTP proxies) to access paywalled content
 
 Also provides ``research_request()``, a proxy-aware HTTP client with automatic
 retry on connection failures (essential for VPN connections that drop periodically).
+Requests share pooled keep-alive sessions (one per proxy configuration and
+event loop) and are paced by a per-host token bucket, so repeated calls to
+the same API reuse connections instead of paying a TCP/TLS (and proxy)
+handshake each time.
+
+Configuration:
+    RESEARCH_HTTP_POOL_SIZE: Max open connections per session (default 100)
+    RESEARCH_HTTP_POOL_PER_HOST: Max open connections per host (default 10)
+    RESEARCH_HTTP_KEEPALIVE_SECONDS: Idle keep-alive time (default 30)
+    RESEARCH_HOST_RATE_LIMITS: Per-host overrides as
+        "host=rate[:burst],..." in requests per second, e.g.
+        "api.semanticscholar.org=1:1,api.unpaywall.org=10"
+    RESEARCH_HOST_RATE_DEFAULT: "rate[:burst]" for other hosts
+        (default "10:10", "0" disables pacing)
 """
 
 import asyncio
 import logging
 import os
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
 
@@ -167,9 +184,13 @@ class ProxyConfig:
             logger.debug("browser-use not installed, cannot create ProxySettings")
             return None
 
-    def to_aiohttp_connector(self) -> Optional[Any]:
+    def to_aiohttp_connector(self, **connector_kwargs: Any) -> Optional[Any]:
         """Create an aiohttp-socks ProxyConnector for this proxy config.
 
+        Args:
+            **connector_kwargs: Passed through to the underlying
+                TCPConnector (limit, keepalive_timeout, ...)
+
         Returns:
             ProxyConnector instance, or None if not configured or
             aiohttp-socks is not installed.
@@ -195,6 +216,7 @@ class ProxyConfig:
                 username=self.username,
                 password=self.password,
                 rdns=True,
+                **connector_kwargs,
             )
         except ImportError:
             logger.warning(
@@ -215,6 +237,285 @@ _RETRIABLE_ERRORS = (
 )
 
 
+# Default per-host pacing: (requests per second, burst)
+DEFAULT_HOST_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "api.semanticscholar.org": (1.0, 1.0),
+    "api.unpaywall.org": (10.0, 10.0),
+}
+
+
+def _parse_rate(value: str) -> Tuple[float, float]:
+    rate_str, _, burst_str = value.partition(":")
+    rate = float(rate_str)
+    burst = float(burst_str) if burst_str else max(1.0, rate)
+    return rate, burst
+
+
+def _load_host_rate_limits() -> Dict[str, Tuple[float, float]]:
+    limits = dict(DEFAULT_HOST_RATE_LIMITS)
+    for entry in os.getenv("RESEARCH_HOST_RATE_LIMITS", "").split(","):
+        host, sep, value = entry.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            limits[host.strip().lower()] = _parse_rate(value.strip())
+        except ValueError:
+            logger.warning(f"Ignoring invalid RESEARCH_HOST_RATE_LIMITS entry: {entry}")
+    return limits
+
+
+class TokenBucket:
+    """Token bucket pacing requests to one host.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. ``acquire()``
+    reserves a token immediately (the balance may go negative) and sleeps
+    until it is covered, so concurrent callers queue up in FIFO order
+    without needing a loop-bound lock.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting if the bucket is empty.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        await asyncio.sleep(delay)
+        return delay
+
+
+class _LatencyWindow:
+    """Running count/mean/max plus percentiles over recent samples."""
+
+    def __init__(self, size: int = 200) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def _percentile(self, fraction: float) -> Optional[float]:
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": self._percentile(0.5),
+            "p95": self._percentile(0.95),
+            "max": round(self.max, 3) if self.count else None,
+        }
+
+
+class _HostStats:
+    """Request, connection and latency counters for one host."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.rate_limit_wait_seconds = 0.0
+        self.latency = _LatencyWindow()
+
+    def summary(self) -> Dict[str, Any]:
+        connections = self.new_connections + self.reused_connections
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_ratio": round(self.reused_connections / connections, 3) if connections else None,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait_seconds, 3),
+            "latency_seconds": self.latency.summary(),
+        }
+
+
+class ResearchSessionPool:
+    """Process-wide pooled aiohttp sessions for research requests.
+
+    One keep-alive session is kept per proxy configuration and event loop
+    (aiohttp sessions cannot be shared across loops). Each host gets a
+    token bucket and connection-reuse/latency counters.
+
+    Example:
+        ```python
+        pool = get_session_pool()
+        session = await pool.get_session(proxy)
+        print(pool.get_stats()["hosts"])
+        await pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        host_rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        default_rate_limit: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        self.limit = limit or int(os.getenv("RESEARCH_HTTP_POOL_SIZE", "100"))
+        self.limit_per_host = limit_per_host or int(os.getenv("RESEARCH_HTTP_POOL_PER_HOST", "10"))
+        self.keepalive_timeout = keepalive_timeout or float(
+            os.getenv("RESEARCH_HTTP_KEEPALIVE_SECONDS", "30")
+        )
+        self.host_rate_limits = (
+            host_rate_limits if host_rate_limits is not None else _load_host_rate_limits()
+        )
+        if default_rate_limit is None:
+            try:
+                default_rate_limit = _parse_rate(os.getenv("RESEARCH_HOST_RATE_DEFAULT", "10:10"))
+            except ValueError:
+                logger.warning("Invalid RESEARCH_HOST_RATE_DEFAULT, using 10:10")
+                default_rate_limit = (10.0, 10.0)
+        self.default_rate_limit = default_rate_limit
+
+        self._sessions: Dict[Tuple[int, str], Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._hosts: Dict[str, _HostStats] = {}
+        self._sessions_created = 0
+
+    def _host_stats(self, host: str) -> _HostStats:
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = _HostStats()
+        return stats
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        async def on_create(session, ctx, params) -> None:
+            host = (ctx.trace_request_ctx or {}).get("host")
+            if host:
+                self._host_stats(host).new_connections += 1
+
+        async def on_reuse(session, ctx, params) -> None:
+            host = (ctx.trace_request_ctx or {}).get("host")
+            if host:
+                self._host_stats(host).reused_connections += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    async def get_session(self, proxy: Optional[ProxyConfig] = None) -> aiohttp.ClientSession:
+        """Get the pooled session for a proxy configuration on the running loop."""
+        loop = asyncio.get_running_loop()
+        # Sessions of loops that have since closed cannot be reused
+        for key, (owner, _) in list(self._sessions.items()):
+            if owner.is_closed():
+                del self._sessions[key]
+
+        connector_kwargs = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": 300,
+        }
+        proxy_url = proxy.url if proxy and proxy.is_configured else None
+        key = (id(loop), proxy_url or "direct")
+        entry = self._sessions.get(key)
+        if entry is not None and not entry[1].closed:
+            return entry[1]
+
+        if proxy_url:
+            connector = proxy.to_aiohttp_connector(**connector_kwargs)
+            if connector is None:
+                # aiohttp-socks missing: fall back to the direct session
+                return await self.get_session(None)
+            logger.debug(f"Research session via proxy: {proxy.type.value}://{proxy.host}:{proxy.port}")
+        else:
+            connector = aiohttp.TCPConnector(**connector_kwargs)
+
+        session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+        self._sessions[key] = (loop, session)
+        self._sessions_created += 1
+        return session
+
+    async def throttle(self, host: str) -> float:
+        """Wait for the host's token bucket; returns seconds waited."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.host_rate_limits.get(host, self.default_rate_limit)
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        waited = await bucket.acquire()
+        self._host_stats(host).rate_limit_wait_seconds += waited
+        return waited
+
+    def record_response(self, host: str, seconds: float) -> None:
+        """Record a request that got a response (time to headers)."""
+        stats = self._host_stats(host)
+        stats.requests += 1
+        stats.latency.add(seconds)
+
+    def record_error(self, host: str) -> None:
+        """Record a request that failed at the connection level."""
+        stats = self._host_stats(host)
+        stats.requests += 1
+        stats.errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool configuration plus per-host request/connection/latency stats."""
+        return {
+            "open_sessions": sum(1 for _, s in self._sessions.values() if not s.closed),
+            "sessions_created": self._sessions_created,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_seconds": self.keepalive_timeout,
+            "hosts": {host: stats.summary() for host, stats in sorted(self._hosts.items())},
+        }
+
+    async def close(self) -> None:
+        """Close the sessions owned by the running loop (others are dropped)."""
+        loop = asyncio.get_running_loop()
+        for key, (owner, session) in list(self._sessions.items()):
+            if owner is loop and not session.closed:
+                await session.close()
+            del self._sessions[key]
+
+
+_session_pool: Optional[ResearchSessionPool] = None
+
+
+def get_session_pool() -> ResearchSessionPool:
+    """Get the process-wide research session pool (created on first use)."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = ResearchSessionPool()
+    return _session_pool
+
+
+async def close_research_sessions() -> None:
+    """Close pooled research sessions (called on agent shutdown)."""
+    if _session_pool is not None:
+        await _session_pool.close()
+
+
 @asynccontextmanager
 async def research_request(
     method: str,
@@ -230,7 +531,8 @@ async def research_request(
     Standard way for research tools to make aiohttp requests.  Routes through
     the configured SOCKS5/HTTP proxy (if any) and retries on connection-level
     failures with exponential backoff — essential for VPN connections that may
-    drop periodically.
+    drop periodically.  Connections come from the shared session pool and
+    each request first waits for the host's token bucket.
 
     HTTP-level errors (429, 404, etc.) are NOT retried.  The response is
     yielded so callers keep their existing status-code handling.
@@ -259,36 +561,29 @@ async def research_request(
     """
     use_proxy = proxy and proxy.is_configured
     client_timeout = aiohttp.ClientTimeout(total=timeout)
+    pool = get_session_pool()
+    host = (urlsplit(url).hostname or "").lower()
     last_error: Optional[BaseException] = None
+    resp: Optional[aiohttp.ClientResponse] = None
 
     for attempt in range(1, max_retries + 1):
-        connector = None
-        session = None
-        if use_proxy:
-            connector = proxy.to_aiohttp_connector()
-            if connector and attempt == 1:
-                logger.debug(
-                    f"Research request via proxy: "
-                    f"{proxy.type.value}://{proxy.host}:{proxy.port}"
-                )
-
         try:
-            session = aiohttp.ClientSession(
-                connector=connector, timeout=client_timeout
+            session = await pool.get_session(proxy if use_proxy else None)
+            await pool.throttle(host)
+            started = time.monotonic()
+            resp = await session.request(
+                method,
+                url,
+                timeout=client_timeout,
+                trace_request_ctx={"host": host},
+                **request_kwargs,
             )
-            resp = await session.request(method, url, **request_kwargs)
-            # Connection succeeded — yield response to caller
-            try:
-                yield resp
-            finally:
-                resp.release()
-                await session.close()
-            return  # Caller consumed response successfully
+            pool.record_response(host, time.monotonic() - started)
+            break
 
         except _RETRIABLE_ERRORS as e:
             last_error = e
-            if session:
-                await session.close()
+            pool.record_error(host)
 
             if attempt < max_retries:
                 delay = min(2 ** (attempt - 1), 8)
@@ -304,10 +599,15 @@ async def research_request(
                     f"{max_retries} attempts: {type(e).__name__}: {e}"
                 )
 
-        except GeneratorExit:
-            if session:
-                await session.close()
-            return
+    if resp is not None:
+        # Connection succeeded — yield response to caller. Errors raised while
+        # the caller reads the body are not retried (the body may be half consumed).
+        try:
+            yield resp
+        finally:
+            # Returns the connection to the pool (or drops it if unread)
+            resp.release()
+        return
 
     # All retries exhausted
     proxy_hint = ""
@@ -1,9 +1,9 @@
 """Shared data types for academic paper tools."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class PaperSource(Enum):
@@ -35,6 +35,22 @@ class Paper:
     year: Optional[int] = None
     venue: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (enums as values)."""
+        data = asdict(self)
+        data["source"] = self.source.value
+        data["access_status"] = self.access_status.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Paper":
+        """Rebuild a Paper serialized with to_dict."""
+        return cls(**{
+            **data,
+            "source": PaperSource(data["source"]),
+            "access_status": AccessStatus(data["access_status"]),
+        })
+
     def format(self, index: Optional[int] = None) -> str:
         """Format paper for display."""
         prefix = f"{index}. " if index is not None else ""
@@ -45,11 +45,13 @@ class UnpaywallClient:
             logger.warning("UNPAYWALL_EMAIL not configured, skipping Unpaywall lookup")
             return None
 
+        from src.services.research_cache import get_research_cache
+
         from .network import research_request
 
         url = f"{self.BASE_URL}/{doi}?email={self.email}"
 
-        try:
+        async def load() -> Optional[dict]:
             async with research_request(
                 "GET", url, proxy=self.proxy, timeout=30
             ) as resp:
@@ -59,7 +61,10 @@ class UnpaywallClient:
                     logger.warning(f"Unpaywall: invalid DOI format: {doi}")
                     return None
                 resp.raise_for_status()
-                data = await resp.json()
+                return await resp.json()
+
+        try:
+            data = await get_research_cache().fetch_async("unpaywall", {"doi": doi}, load)
         except ConnectionError as e:
             logger.error(f"Unpaywall connection error for {doi}: {e}")
             return None
@@ -67,6 +72,8 @@ class UnpaywallClient:
             logger.error(f"Unpaywall API error for {doi}: {e}")
             return None
 
+        if data is None:
+            return None
         return self._to_paper(data)
 
     async def get_pdf_url(self, doi: str) -> Optional[str]:
@@ -103,7 +110,19 @@ class UnpaywallClient:
                 error=f"No OA PDF available for {doi} (status: {status})",
                 paper=paper,
             )
+        return await self.download_paper(doi, paper, dest_dir)
+
+    async def download_paper(self, doi: str, paper: Paper, dest_dir: Path) -> DownloadResult:
+        """Download the OA PDF of a paper returned by :meth:`get_paper`.
 
+        Args:
+            doi: The paper's DOI (names the file)
+            paper: Paper with a ``pdf_url``
+            dest_dir: Directory to save the PDF
+
+        Returns:
+            DownloadResult with path or error
+        """
         from .network import research_request
 
         try:
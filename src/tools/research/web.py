@@ -5,7 +5,7 @@ Supports search, extract, crawl, and map operations.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.tools import tool
 
@@ -61,6 +61,43 @@ def _get_tavily_api_key() -> Optional[str]:
     return os.getenv("TAVILY_API_KEY")
 
 
+def _missing_api_key(api_key: Optional[str]) -> bool:
+    """Whether to refuse for lack of a key (offline replay needs none)."""
+    from src.services.research_cache import get_research_cache
+    return not api_key and not get_research_cache().offline
+
+
+class _UncachedResponse(Exception):
+    """Carries a Tavily response that must not be cached."""
+
+    def __init__(self, response: Any) -> None:
+        super().__init__("uncached response")
+        self.response = response
+
+
+def _cached_tavily_call(
+    provider: str,
+    params: Dict[str, Any],
+    loader: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Run a Tavily request through the shared research cache.
+
+    Error payloads are returned but not cached.
+    """
+    from src.services.research_cache import get_research_cache
+
+    def load() -> Dict[str, Any]:
+        response = loader()
+        if not isinstance(response, dict) or response.get("error"):
+            raise _UncachedResponse(response)
+        return response
+
+    try:
+        return get_research_cache().fetch(provider, params, load)
+    except _UncachedResponse as e:
+        return e.response
+
+
 def _parse_comma_list(value: Optional[str]) -> Optional[List[str]]:
     """Parse a comma-separated string into a list, or return None."""
     if not value:
@@ -77,6 +114,58 @@ def _truncate_content(content: str, max_words: int = MAX_RAW_CONTENT_WORDS) -> s
     return content
 
 
+def _archive_web_results(
+    context: ToolContext,
+    results: List[Dict[str, Any]],
+    min_saved_chars: int = 0,
+) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """Register Tavily results as citation sources and save their content.
+
+    Pages are registered in one batch with their ``raw_content`` handed to
+    the citation layer, so it does not fetch them again. Page content is then
+    written to documents/external/ in one batch.
+
+    Args:
+        context: ToolContext for source registration and disk persistence
+        results: Tavily result dicts (url, title, raw_content, content)
+        min_saved_chars: Content must be longer than this to be saved to disk
+
+    Returns:
+        Tuple of (url -> source_id, url -> fetch_error for inaccessible sources)
+    """
+    pages = [
+        {"url": r["url"], "title": r.get("title"), "content": r.get("raw_content") or None}
+        for r in results
+        if r.get("url")
+    ]
+
+    registered: Dict[str, int] = {}
+    inaccessible: Dict[str, str] = {}
+    try:
+        for url, (source_id, fetch_error) in context.register_web_sources(pages).items():
+            registered[url] = source_id
+            if fetch_error:
+                inaccessible[url] = fetch_error
+    except Exception as e:
+        logger.warning(f"Could not register web sources: {e}")
+
+    # Save web content to disk for persistence (before truncation)
+    to_save = []
+    for r in results:
+        url = r.get("url")
+        content = r.get("raw_content") or r.get("content", "")
+        if url and content and len(content) > min_saved_chars:
+            to_save.append({
+                "url": url,
+                "content": content,
+                "title": r.get("title"),
+                "source_id": registered.get(url),
+            })
+    context.save_web_contents_to_disk(to_save)
+
+    return registered, inaccessible
+
+
 def create_web_tools(context: ToolContext) -> List[Any]:
     """Create web search tools with injected context.
 
@@ -243,17 +332,14 @@ def _direct_web_search(
         Search results with snippets, URLs, and source IDs (if context provided)
     """
     api_key = _get_tavily_api_key()
-    if not api_key:
+    if _missing_api_key(api_key):
         return "Error: TAVILY_API_KEY not configured"
 
     try:
-        from langchain_tavily import TavilySearch
-
         # include_raw_content must be set at construction time
         constructor_kwargs = {"api_key": api_key, "max_results": max_results}
         if include_raw_content:
             constructor_kwargs["include_raw_content"] = True
-        search = TavilySearch(**constructor_kwargs)
 
         # Runtime parameters passed at invoke time
         invoke_kwargs: Dict[str, Any] = {"query": query}
@@ -271,38 +357,27 @@ def _direct_web_search(
         if parsed_exclude:
             invoke_kwargs["exclude_domains"] = parsed_exclude
 
-        response = search.invoke(invoke_kwargs)
+        def search() -> Dict[str, Any]:
+            from langchain_tavily import TavilySearch
+            return TavilySearch(**constructor_kwargs).invoke(invoke_kwargs)
+
+        response = _cached_tavily_call(
+            "tavily_search",
+            {**invoke_kwargs, "max_results": max_results, "include_raw_content": include_raw_content},
+            search,
+        )
 
         results = response.get("results", [])
         if not results:
             return f"No web results found for: {query}"
 
-        # Register each result as a citation source if context available
-        registered_sources = []
-        inaccessible_sources = []
-        if context is not None:
-            for r in results:
-                url = r.get('url', '')
-                title = r.get('title', 'Untitled')
-                if url:
-                    try:
-                        source_id, fetch_error = context.get_or_register_web_source(url, name=title)
-                        registered_sources.append((url, source_id))
-                        if fetch_error:
-                            inaccessible_sources.append((url, source_id))
-                    except Exception as e:
-                        logger.warning(f"Could not register web source {url}: {e}")
-
-        # Save web content to disk for persistence
+        # Register each result as a citation source and save its content
+        registered_sources: Dict[str, int] = {}
+        inaccessible_sources: Dict[str, str] = {}
         if context is not None:
-            for r in results:
-                url = r.get('url', '')
-                if url:
-                    content = r.get('raw_content', r.get('content', ''))
-                    if content and len(content) > 50:
-                        title = r.get('title', 'Untitled')
-                        source_id = next((sid for u, sid in registered_sources if u == url), None)
-                        context.save_web_content_to_disk(url, content, title=title, source_id=source_id)
+            registered_sources, inaccessible_sources = _archive_web_results(
+                context, results, min_saved_chars=50
+            )
 
         # Format output
         result = f"Web Search Results for: {query}\n"
@@ -313,8 +388,8 @@ def _direct_web_search(
 
         for i, r in enumerate(results, 1):
             url = r.get('url', 'N/A')
-            source_id = next((sid for u, sid in registered_sources if u == url), None)
-            is_inaccessible = any(u == url for u, _ in inaccessible_sources)
+            source_id = registered_sources.get(url)
+            is_inaccessible = url in inaccessible_sources
             result += f"{i}. {r.get('title', 'Untitled')}\n"
             result += f"   URL: {url}\n"
             if source_id and is_inaccessible:
@@ -334,7 +409,7 @@ def _direct_web_search(
                 f"(HTTP 403 or similar). Use the browser tool to manually download content from these URLs "
                 f"if you need to cite them:\n"
             )
-            for url, _ in inaccessible_sources:
+            for url in inaccessible_sources:
                 result += f"  - {url}\n"
             result += "\n"
 
@@ -369,7 +444,7 @@ def _extract_webpage(
         Extracted content from each URL
     """
     api_key = _get_tavily_api_key()
-    if not api_key:
+    if _missing_api_key(api_key):
         return "Error: TAVILY_API_KEY not configured"
 
     url_list = [u.strip() for u in urls.split(",") if u.strip()]
@@ -379,41 +454,27 @@ def _extract_webpage(
         return "Error: Maximum 20 URLs allowed per request"
 
     try:
-        from langchain_tavily import TavilyExtract
-
-        extract = TavilyExtract(api_key=api_key, extract_depth=extract_depth)
-
         invoke_kwargs: Dict[str, Any] = {"urls": url_list}
         if query:
             invoke_kwargs["query"] = query
 
-        response = extract.invoke(invoke_kwargs)
+        def extract() -> Dict[str, Any]:
+            from langchain_tavily import TavilyExtract
+            return TavilyExtract(api_key=api_key, extract_depth=extract_depth).invoke(invoke_kwargs)
+
+        response = _cached_tavily_call(
+            "tavily_extract", {**invoke_kwargs, "extract_depth": extract_depth}, extract
+        )
         results = response.get("results", [])
         failed = response.get("failed_results", [])
 
         if not results and not failed:
             return "No content could be extracted from the provided URL(s)."
 
-        # Register extracted URLs as citation sources
-        registered = []
-        if context is not None:
-            for r in results:
-                url = r.get("url", "")
-                if url:
-                    try:
-                        source_id, fetch_error = context.get_or_register_web_source(url)
-                        registered.append((url, source_id))
-                    except Exception as e:
-                        logger.warning(f"Could not register source {url}: {e}")
-
-        # Save web content to disk for persistence (before truncation)
+        # Register extracted URLs as citation sources and save their content
+        registered: Dict[str, int] = {}
         if context is not None:
-            for r in results:
-                url = r.get("url", "")
-                raw = r.get("raw_content", "")
-                if url and raw:
-                    source_id = next((sid for u, sid in registered if u == url), None)
-                    context.save_web_content_to_disk(url, raw, source_id=source_id)
+            registered, _ = _archive_web_results(context, results)
 
         # Format output
         output = f"Extracted Content from {len(results)} URL(s)"
@@ -424,7 +485,7 @@ def _extract_webpage(
         for i, r in enumerate(results, 1):
             url = r.get("url", "N/A")
             content = r.get("raw_content", "")
-            source_id = next((sid for u, sid in registered if u == url), None)
+            source_id = registered.get(url)
 
             word_count = len(content.split())
             content = _truncate_content(content)
@@ -478,7 +539,7 @@ def _crawl_website(
         Crawled content from each page
     """
     api_key = _get_tavily_api_key()
-    if not api_key:
+    if _missing_api_key(api_key):
         return "Error: TAVILY_API_KEY not configured"
 
     # Clamp parameters
@@ -487,10 +548,6 @@ def _crawl_website(
     limit = max(1, limit)
 
     try:
-        from langchain_tavily import TavilyCrawl
-
-        crawl = TavilyCrawl(api_key=api_key)
-
         invoke_kwargs: Dict[str, Any] = {
             "url": url,
             "max_depth": max_depth,
@@ -506,32 +563,20 @@ def _crawl_website(
         if parsed_exclude:
             invoke_kwargs["exclude_paths"] = parsed_exclude
 
-        response = crawl.invoke(invoke_kwargs)
+        def crawl() -> Dict[str, Any]:
+            from langchain_tavily import TavilyCrawl
+            return TavilyCrawl(api_key=api_key).invoke(invoke_kwargs)
+
+        response = _cached_tavily_call("tavily_crawl", invoke_kwargs, crawl)
         results = response.get("results", [])
 
         if not results:
             return f"No pages could be crawled from: {url}"
 
-        # Register crawled URLs as citation sources
-        registered = []
-        if context is not None:
-            for r in results:
-                page_url = r.get("url", "")
-                if page_url:
-                    try:
-                        source_id, fetch_error = context.get_or_register_web_source(page_url)
-                        registered.append((page_url, source_id))
-                    except Exception as e:
-                        logger.warning(f"Could not register source {page_url}: {e}")
-
-        # Save web content to disk for persistence (before truncation)
+        # Register crawled URLs as citation sources and save their content
+        registered: Dict[str, int] = {}
         if context is not None:
-            for r in results:
-                page_url = r.get("url", "")
-                raw = r.get("raw_content", "")
-                if page_url and raw:
-                    source_id = next((sid for u, sid in registered if u == page_url), None)
-                    context.save_web_content_to_disk(page_url, raw, source_id=source_id)
+            registered, _ = _archive_web_results(context, results)
 
         # Format output
         output = f"Website Crawl Results for: {url}\n"
@@ -540,7 +585,7 @@ def _crawl_website(
         for i, r in enumerate(results, 1):
             page_url = r.get("url", "N/A")
             content = r.get("raw_content", "")
-            source_id = next((sid for u, sid in registered if u == page_url), None)
+            source_id = registered.get(page_url)
 
             word_count = len(content.split())
             content = _truncate_content(content)
@@ -584,17 +629,13 @@ def _map_website(
         List of discovered URLs
     """
     api_key = _get_tavily_api_key()
-    if not api_key:
+    if _missing_api_key(api_key):
         return "Error: TAVILY_API_KEY not configured"
 
     max_depth = max(1, min(5, max_depth))
     limit = max(1, limit)
 
     try:
-        from langchain_tavily import TavilyMap
-
-        mapper = TavilyMap(api_key=api_key)
-
         invoke_kwargs: Dict[str, Any] = {
             "url": url,
             "max_depth": max_depth,
@@ -609,7 +650,11 @@ def _map_website(
         if parsed_exclude:
             invoke_kwargs["exclude_paths"] = parsed_exclude
 
-        response = mapper.invoke(invoke_kwargs)
+        def map_site() -> Dict[str, Any]:
+            from langchain_tavily import TavilyMap
+            return TavilyMap(api_key=api_key).invoke(invoke_kwargs)
+
+        response = _cached_tavily_call("tavily_map", invoke_kwargs, map_site)
         results = response.get("results", [])
 
         if not results:
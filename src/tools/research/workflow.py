@@ -7,7 +7,7 @@ databases, deduplicate results, and download available papers.
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from langchain_core.tools import tool
 
@@ -128,50 +128,9 @@ async def _search_arxiv_raw(query: str, max_results: int):
 
 async def _search_semantic_scholar_raw(query: str, max_results: int, *, proxy=None):
     """Search Semantic Scholar and return Paper objects."""
-    import os
+    from .papers import _search_semantic_scholar_papers
 
-    from .utils.network import research_request
-    from .utils.paper_types import AccessStatus, Paper, PaperSource
-
-    api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
-    headers = {}
-    if api_key:
-        headers["x-api-key"] = api_key
-
-    url = "https://api.semanticscholar.org/graph/v1/paper/search"
-    params = {
-        "query": query,
-        "limit": max_results,
-        "fields": "title,authors,year,abstract,citationCount,openAccessPdf,externalIds,venue",
-    }
-
-    async with research_request(
-        "GET", url, proxy=proxy, timeout=30, params=params, headers=headers
-    ) as resp:
-        if resp.status == 429:
-            raise Exception("Semantic Scholar rate limit hit")
-        resp.raise_for_status()
-        data = await resp.json()
-
-    results = data.get("data", [])
-    papers = []
-    for r in results:
-        ext_ids = r.get("externalIds") or {}
-        oa_pdf = r.get("openAccessPdf") or {}
-        papers.append(Paper(
-            title=r.get("title", "Unknown"),
-            authors=[a.get("name", "") for a in r.get("authors", [])],
-            abstract=r.get("abstract"),
-            doi=ext_ids.get("DOI"),
-            arxiv_id=ext_ids.get("ArXiv"),
-            url=f"https://api.semanticscholar.org/graph/v1/paper/{r.get('paperId', '')}",
-            pdf_url=oa_pdf.get("url"),
-            source=PaperSource.SEMANTIC_SCHOLAR,
-            access_status=AccessStatus.OPEN_ACCESS if oa_pdf else AccessStatus.UNKNOWN,
-            citation_count=r.get("citationCount"),
-            year=r.get("year"),
-            venue=r.get("venue"),
-        ))
+    papers, _ = await _search_semantic_scholar_papers(query, max_results, proxy=proxy)
     return papers
 
 
@@ -181,48 +140,10 @@ def _deduplicate_papers(arxiv_papers, s2_papers):
     When duplicates exist, prefer the version with richer metadata
     (more citation info, access status, etc.).
     """
-    from .utils.paper_types import Paper
-
-    seen_dois: Set[str] = set()
-    seen_arxiv_ids: Set[str] = set()
-    unique: List[Paper] = []
-
-    def _paper_key(paper: Paper) -> Optional[str]:
-        """Get a deduplication key for a paper."""
-        if paper.doi:
-            return f"doi:{paper.doi.lower()}"
-        if paper.arxiv_id:
-            return f"arxiv:{paper.arxiv_id}"
-        return None
-
-    def _is_duplicate(paper: Paper) -> bool:
-        """Check if paper is a duplicate of one already seen."""
-        if paper.doi and paper.doi.lower() in seen_dois:
-            return True
-        if paper.arxiv_id and paper.arxiv_id in seen_arxiv_ids:
-            return True
-        return False
-
-    def _register(paper: Paper):
-        """Register paper identifiers as seen."""
-        if paper.doi:
-            seen_dois.add(paper.doi.lower())
-        if paper.arxiv_id:
-            seen_arxiv_ids.add(paper.arxiv_id)
+    from .utils.fanout import dedupe_papers
 
-    # Process Semantic Scholar first (generally richer metadata with citations)
-    for paper in s2_papers:
-        if not _is_duplicate(paper):
-            unique.append(paper)
-            _register(paper)
-
-    # Add arXiv papers that aren't duplicates
-    for paper in arxiv_papers:
-        if not _is_duplicate(paper):
-            unique.append(paper)
-            _register(paper)
-
-    return unique
+    # Semantic Scholar first (generally richer metadata with citations)
+    return dedupe_papers(s2_papers, arxiv_papers)
 
 
 async def _download_available_papers(
@@ -234,11 +155,13 @@ async def _download_available_papers(
     """Download open access papers to workspace.
 
     Only attempts download for papers with known PDF URLs or arXiv IDs.
-    Limits concurrent downloads to avoid rate limiting.
+    Downloads run concurrently up to ``research.max_parallel_downloads``;
+    arXiv requests are additionally spaced by the shared arXiv limiter.
 
     Returns:
         List of result messages for each download attempt
     """
+    from .utils.fanout import bounded_gather
     from .utils.paper_types import AccessStatus
 
     results = []
@@ -255,14 +178,14 @@ async def _download_available_papers(
     if not downloadable:
         return ["No open access papers available for download."]
 
-    for paper in downloadable[:5]:  # Limit to 5 downloads per research call
+    async def download(paper) -> str:
         try:
             if paper.arxiv_id:
                 result = await _download_single_arxiv(paper.arxiv_id, dest_dir)
             elif paper.pdf_url:
                 result = await _download_single_url(paper.pdf_url, paper.title, dest_dir, proxy=proxy)
             else:
-                continue
+                return ""
 
             if result:
                 # Register as citation source
@@ -272,13 +195,17 @@ async def _download_available_papers(
                     )
                 except Exception:
                     pass
-                results.append(f"  Downloaded: {paper.title} -> {result.name}")
-            else:
-                results.append(f"  Failed: {paper.title}")
+                return f"  Downloaded: {paper.title} -> {result.name}"
+            return f"  Failed: {paper.title}"
 
         except Exception as e:
             logger.debug(f"Download failed for {paper.title}: {e}")
-            results.append(f"  Failed: {paper.title} ({e})")
+            return f"  Failed: {paper.title} ({e})"
+
+    # Limit to 5 downloads per research call, run concurrently
+    limit = context.config.get("research", {}).get("max_parallel_downloads", 4)
+    outcomes = await bounded_gather(downloadable[:5], download, limit)
+    results.extend(line for line in outcomes if line)
 
     return results
 
@@ -28,6 +28,7 @@ SQL_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "sql_query",
         "description": "Execute a read-only SQL query against the PostgreSQL datasource",
         "category": "sql",
+        "reads": ["sql"],
         "defer_to_workspace": True,
         "short_description": "Execute read-only SQL query against PostgreSQL datasource.",
         "phases": ["tactical"],
@@ -37,6 +38,8 @@ SQL_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "sql_schema",
         "description": "Inspect the PostgreSQL datasource schema (tables, columns, types)",
         "category": "sql",
+        "reads": ["sql"],
+        "read_only": True,
         "defer_to_workspace": True,
         "short_description": "Inspect PostgreSQL datasource schema (tables, columns, types).",
         "phases": ["tactical"],
@@ -46,6 +49,7 @@ SQL_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "sql_execute",
         "description": "Execute a write SQL statement (INSERT, UPDATE, DELETE, DDL) against the PostgreSQL datasource",
         "category": "sql",
+        "writes": ["sql"],
         "defer_to_workspace": True,
         "short_description": "Execute write SQL (INSERT/UPDATE/DELETE/DDL) against PostgreSQL datasource.",
         "phases": ["tactical"],
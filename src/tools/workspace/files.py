@@ -30,12 +30,16 @@ VISUAL_DOCUMENT_EXTENSIONS = {".pdf", ".pptx", ".docx"}
 
 # Tool metadata for registry
 # Phase availability: file tools are available in both strategic and tactical modes
+# reads/writes: workspace paths a call touches, so parallel calls on the same
+# path keep their order (see core.tool_executor)
 FILE_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
     "read_file": {
         "module": "workspace.files",
         "function": "read_file",
         "description": "Read content from a file in the workspace",
         "category": "workspace",
+        "reads": ["file:{path}"],
+        "read_only": True,
         "phases": ["strategic", "tactical"],
     },
     "write_file": {
@@ -43,6 +47,7 @@ FILE_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "write_file",
         "description": "Write content to a file (requires read_file first for existing files)",
         "category": "workspace",
+        "writes": ["file:{path}"],
         "phases": ["strategic", "tactical"],
     },
     "edit_file": {
@@ -50,6 +55,7 @@ FILE_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "edit_file",
         "description": "Edit a file: replace text, or use position='end'/'start' to append/prepend (requires read_file first)",
         "category": "workspace",
+        "writes": ["file:{path}"],
         "phases": ["strategic", "tactical"],
     },
 }
@@ -212,16 +218,31 @@ def create_file_tools(context: ToolContext) -> List[Any]:
                 logger.error(f"Error describing image {full_path}: {e}")
                 return f"[IMAGE: {full_path.name}]\n(Error generating description: {str(e)})"
 
-    def _get_visual_content(
+    def _format_page_description(page_num: int, description: str, describe: Optional[str]) -> str:
+        """Format a page description block for text-only models."""
+        if describe:
+            return f"\n[PAGE {page_num} - VISUAL CONTENT (Query: \"{describe[:50]}...\")]\n{description}"
+        return f"\n[PAGE {page_num} - VISUAL CONTENT]\n{description}"
+
+    def _get_visual_contents(
         full_path: Path,
-        page_num: int,
+        page_nums: List[int],
         describe: Optional[str],
-    ) -> str:
-        """Get visual content description for a document page.
+    ) -> Dict[int, str]:
+        """Get visual content for a range of document pages.
 
-        For multimodal models: Returns base64-encoded page screenshot.
-        For text-only models: Returns AI-generated description.
+        For multimodal models: Returns base64-encoded page screenshots.
+        For text-only models: Returns AI-generated descriptions.
+
+        Pages run through a pipeline: cached descriptions are looked up
+        first, only the missing pages are rendered (in the renderer's
+        process pool), and those are described concurrently by the vision
+        helper. Pages without visual content are omitted from the result;
+        callers assemble the rest in page order.
         """
+        if not page_nums:
+            return {}
+
         try:
             from src.services.document_renderer import get_document_renderer
             from src.services.vision_helper import get_vision_helper
@@ -229,53 +250,55 @@ def create_file_tools(context: ToolContext) -> List[Any]:
 
             renderer = get_document_renderer()
 
-            # Render the page as PNG
-            try:
-                page_image = renderer.render_page(full_path, page_num)
-            except Exception as e:
-                logger.warning(f"Could not render page {page_num} of {full_path.name}: {e}")
-                return ""  # No visual content available
-
             if context.get_phase_multimodal():
-                # Return base64 image for multimodal model
-                base64_image = base64.b64encode(page_image).decode()
-                return (
-                    f"\n<page_image page=\"{page_num}\" mime_type=\"image/png\">\n"
-                    f"{base64_image}\n"
-                    f"</page_image>"
-                )
-            else:
-                # Get AI description for text-only model
-                cache = get_description_cache()
-                vision = get_vision_helper()
-
-                # Check cache first
-                cached = cache.get(full_path, page=page_num, query=describe)
-                if cached:
-                    logger.debug(f"Cache hit for page {page_num} of {full_path.name}")
-                    return f"\n[PAGE {page_num} - VISUAL CONTENT]\n{cached}"
-
-                # Generate description
-                description = vision.describe_document_page_sync(
-                    page_image,
-                    page_num=page_num,
-                    query=describe,
-                )
-
-                # Cache for future use
-                cache.set(full_path, description, page=page_num, query=describe)
-
-                if describe:
-                    return f"\n[PAGE {page_num} - VISUAL CONTENT (Query: \"{describe[:50]}...\")]\n{description}"
-                else:
-                    return f"\n[PAGE {page_num} - VISUAL CONTENT]\n{description}"
+                # Return base64 images for multimodal model
+                page_images = renderer.render_pages(full_path, page_nums)
+                return {
+                    page_num: (
+                        f"\n<page_image page=\"{page_num}\" mime_type=\"image/png\">\n"
+                        f"{base64.b64encode(image).decode()}\n"
+                        f"</page_image>"
+                    )
+                    for page_num, image in page_images.items()
+                }
+
+            # Get AI descriptions for text-only model, checking the cache first
+            cache = get_description_cache()
+            descriptions = cache.get_many(full_path, page_nums, query=describe)
+            if descriptions:
+                logger.debug(f"Cache hit for {len(descriptions)} page(s) of {full_path.name}")
+
+            missing = [page_num for page_num in page_nums if page_num not in descriptions]
+            if missing:
+                page_images = renderer.render_pages(full_path, missing)
+                if page_images:
+                    vision = get_vision_helper()
+                    generated = vision.describe_document_pages_sync(page_images, query=describe)
+
+                    # Cache for future use (failed descriptions are retried next read)
+                    cache.set_many(
+                        full_path,
+                        {
+                            page_num: description
+                            for page_num, description in generated.items()
+                            if not description.startswith("[Error analyzing")
+                        },
+                        query=describe,
+                    )
+                    descriptions.update(generated)
+
+            return {
+                page_num: _format_page_description(page_num, descriptions[page_num], describe)
+                for page_num in page_nums
+                if page_num in descriptions
+            }
 
         except ImportError as e:
             logger.debug(f"Vision services not available: {e}")
-            return ""  # Silently skip visual content if services not available
+            return {}  # Silently skip visual content if services not available
         except Exception as e:
-            logger.warning(f"Error getting visual content for page {page_num}: {e}")
-            return ""
+            logger.warning(f"Error getting visual content for {full_path.name}: {e}")
+            return {}
 
     def _read_visual_document(
         full_path: Path,
@@ -307,12 +330,10 @@ def create_file_tools(context: ToolContext) -> List[Any]:
                 start = page_start or 1
                 end = min(page_end or total_pages, total_pages)
 
-                # Add visual content for each page read
-                visual_parts = []
-                for page_num in range(start, end + 1):
-                    visual_content = _get_visual_content(full_path, page_num, describe)
-                    if visual_content:
-                        visual_parts.append(visual_content)
+                # Add visual content for each page read, in page order
+                page_nums = list(range(start, end + 1))
+                visual_contents = _get_visual_contents(full_path, page_nums, describe)
+                visual_parts = [visual_contents[p] for p in page_nums if p in visual_contents]
 
                 if visual_parts:
                     return text_result + "\n" + "\n".join(visual_parts)
@@ -352,6 +373,11 @@ def create_file_tools(context: ToolContext) -> List[Any]:
 
             result_parts = [f"[Slides {start}-{end} of {total_slides}]", ""]
 
+            # Visual content for the whole range is produced up front
+            visual_contents = _get_visual_contents(
+                full_path, list(range(start, end + 1)), describe
+            )
+
             for slide_num in range(start, end + 1):
                 slide = prs.slides[slide_num - 1]
 
@@ -368,9 +394,8 @@ def create_file_tools(context: ToolContext) -> List[Any]:
                     result_parts.append("(No text content)")
 
                 # Add visual content
-                visual_content = _get_visual_content(full_path, slide_num, describe)
-                if visual_content:
-                    result_parts.append(visual_content)
+                if slide_num in visual_contents:
+                    result_parts.append(visual_contents[slide_num])
 
                 result_parts.append("")  # Blank line between slides
 
@@ -421,12 +446,10 @@ def create_file_tools(context: ToolContext) -> List[Any]:
 
                 result_parts = [f"[Pages {start}-{end} of {total_pages}]", "", text_content]
 
-                # Add visual content for requested pages
-                visual_parts = []
-                for page_num in range(start, end + 1):
-                    visual_content = _get_visual_content(full_path, page_num, describe)
-                    if visual_content:
-                        visual_parts.append(visual_content)
+                # Add visual content for requested pages, in page order
+                page_nums = list(range(start, end + 1))
+                visual_contents = _get_visual_contents(full_path, page_nums, describe)
+                visual_parts = [visual_contents[p] for p in page_nums if p in visual_contents]
 
                 if visual_parts:
                     result_parts.append("\n" + "\n".join(visual_parts))
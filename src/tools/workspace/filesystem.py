@@ -68,12 +68,16 @@ def _infer_file_purpose(filename: str) -> str:
 
 # Tool metadata for registry
 # Phase availability: filesystem tools are available in both strategic and tactical modes
+# reads/writes: workspace paths a call touches, so parallel calls on the same
+# path keep their order (see core.tool_executor)
 FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
     "list_files": {
         "module": "workspace.filesystem",
         "function": "list_files",
         "description": "List files and directories in the workspace",
         "category": "workspace",
+        "reads": ["file:{path}"],
+        "read_only": True,
         "phases": ["strategic", "tactical"],
     },
     "delete_file": {
@@ -81,6 +85,7 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "delete_file",
         "description": "Delete a file or empty directory",
         "category": "workspace",
+        "writes": ["file:{path}"],
         "phases": ["strategic", "tactical"],
     },
     "search_files": {
@@ -88,6 +93,8 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "search_files",
         "description": "Search for text content in workspace files",
         "category": "workspace",
+        "reads": ["file:{path}"],
+        "read_only": True,
         "phases": ["strategic", "tactical"],
     },
     "file_exists": {
@@ -95,6 +102,8 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "file_exists",
         "description": "Check if a file or directory exists",
         "category": "workspace",
+        "reads": ["file:{path}"],
+        "read_only": True,
         "phases": ["strategic", "tactical"],
     },
     "move_file": {
@@ -102,6 +111,7 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "move_file",
         "description": "Move or rename a file/directory in the workspace",
         "category": "workspace",
+        "writes": ["file:{source}", "file:{dest}"],
         "phases": ["strategic", "tactical"],
     },
     "rename_file": {
@@ -109,6 +119,7 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "rename_file",
         "description": "Rename a file or directory (keeps it in the same location)",
         "category": "workspace",
+        "writes": ["file:{path}", "file:{path}/../{new_name}"],
         "phases": ["strategic", "tactical"],
     },
     "copy_file": {
@@ -116,6 +127,8 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "copy_file",
         "description": "Copy a file within the workspace",
         "category": "workspace",
+        "reads": ["file:{source}"],
+        "writes": ["file:{dest}"],
         "phases": ["strategic", "tactical"],
     },
     "get_workspace_summary": {
@@ -123,6 +136,8 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "get_workspace_summary",
         "description": "Get a summary of workspace contents",
         "category": "workspace",
+        "reads": ["file:"],
+        "read_only": True,
         "phases": ["strategic", "tactical"],
     },
     "get_document_info": {
@@ -130,6 +145,8 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "get_document_info",
         "description": "Get document metadata (page count, size) for planning access",
         "category": "workspace",
+        "reads": ["file:{path}"],
+        "read_only": True,
         "defer_to_workspace": True,
         "short_description": "Get PDF/document metadata (pages, size) for planning access.",
         "phases": ["strategic", "tactical"],
@@ -139,6 +156,7 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "create_directory",
         "description": "Create a directory (and parents) in the workspace",
         "category": "workspace",
+        "writes": ["file:{path}"],
         "phases": ["strategic", "tactical"],
     },
     "delete_directory": {
@@ -146,6 +164,7 @@ FILESYSTEM_TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         "function": "delete_directory",
         "description": "Delete a directory and all its contents",
         "category": "workspace",
+        "writes": ["file:{path}"],
         "phases": ["strategic", "tactical"],
     },
 }
@@ -1,59 +1,51 @@
 """
 Core utilities for data processing and validation.
+
+Exports are resolved on first access: importing a single utility module
+(e.g. ``src.utils.pdf`` from the workspace tools) no longer pulls in the
+document processing stack and the citation engine.
 """
 
-from .document_processor import (
-    DocumentProcessor,
-    DocumentExtractor,
-    DocumentChunker,
-)
-from .document_models import (
-    DocumentChunk,
-    DocumentMetadata,
-    RequirementCandidate,
-    ValidatedRequirement,
-    ProcessingOptions,
-    PipelineReport,
-)
-from .config import load_config, load_prompt, get_project_root
-
-# Citation utilities (optional - requires citation_engine)
-try:
-    from .citation_utils import (  # noqa: F401
-        CitationHelper,
-        create_citation_engine,
-        is_citation_engine_available,
-        get_citation_engine_config,
-        create_citation_tools,
-    )
-    _citation_available = True
-except ImportError:
-    _citation_available = False
-
-__all__ = [
+import importlib
+from typing import Any
+
+# Exported name -> submodule defining it
+_EXPORTS = {
     # Document Processing
-    'DocumentProcessor',
-    'DocumentExtractor',
-    'DocumentChunker',
+    'DocumentProcessor': 'document_processor',
+    'DocumentExtractor': 'document_processor',
+    'DocumentChunker': 'document_processor',
     # Document Models
-    'DocumentChunk',
-    'DocumentMetadata',
-    'RequirementCandidate',
-    'ValidatedRequirement',
-    'ProcessingOptions',
-    'PipelineReport',
+    'DocumentChunk': 'document_models',
+    'DocumentMetadata': 'document_models',
+    'RequirementCandidate': 'document_models',
+    'ValidatedRequirement': 'document_models',
+    'ProcessingOptions': 'document_models',
+    'PipelineReport': 'document_models',
     # Configuration
-    'load_config',
-    'load_prompt',
-    'get_project_root',
-]
-
-# Add citation exports if available
-if _citation_available:
-    __all__.extend([
-        'CitationHelper',
-        'create_citation_engine',
-        'is_citation_engine_available',
-        'get_citation_engine_config',
-        'create_citation_tools',
-    ])
+    'load_config': 'config',
+    'load_prompt': 'config',
+    'get_project_root': 'config',
+    # Citation utilities (stub mode if citation_engine is not installed)
+    'CitationHelper': 'citation_utils',
+    'create_citation_engine': 'citation_utils',
+    'is_citation_engine_available': 'citation_utils',
+    'get_citation_engine_config': 'citation_utils',
+    'create_citation_tools': 'citation_utils',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -5,6 +5,7 @@ Handles text extraction from various document formats (PDF, DOCX, PPTX, XLSX, TX
 and applies intelligent chunking strategies for legal and technical documents.
 """
 
+import importlib.util
 import re
 import uuid
 from pathlib import Path
@@ -17,41 +18,14 @@ from .document_models import (
     DocumentCategory,
 )
 
-# Optional imports for document processing
-try:
-    import pdfplumber
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    pdfplumber = None
-
-try:
-    from docx import Document as DocxDocument
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    DocxDocument = None
-
-try:
-    from bs4 import BeautifulSoup
-    HTML_AVAILABLE = True
-except ImportError:
-    HTML_AVAILABLE = False
-    BeautifulSoup = None
-
-try:
-    from pptx import Presentation
-    PPTX_AVAILABLE = True
-except ImportError:
-    PPTX_AVAILABLE = False
-    Presentation = None
-
-try:
-    from openpyxl import load_workbook
-    XLSX_AVAILABLE = True
-except ImportError:
-    XLSX_AVAILABLE = False
-    load_workbook = None
+# Optional document libraries are imported by the extractor that needs them,
+# so importing this module stays cheap (python-docx, python-pptx and openpyxl
+# alone take several hundred milliseconds to import)
+PDF_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+HTML_AVAILABLE = importlib.util.find_spec("bs4") is not None
+PPTX_AVAILABLE = importlib.util.find_spec("pptx") is not None
+XLSX_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
 
 
 # =============================================================================
@@ -276,6 +250,8 @@ class DocumentExtractor:
         page_count = 0
         info = {}
 
+        import pdfplumber
+
         with pdfplumber.open(path) as pdf:
             page_count = len(pdf.pages)
             info["page_count"] = page_count
@@ -300,6 +276,8 @@ class DocumentExtractor:
                 "DOCX extraction requires python-docx. Install with: pip install python-docx"
             )
 
+        from docx import Document as DocxDocument
+
         doc = DocxDocument(path)
         text_parts = []
         info = {}
@@ -399,6 +377,8 @@ class DocumentExtractor:
         with open(path, "r", encoding="utf-8", errors="replace") as f:
             html = f.read()
 
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, "html.parser")
 
         # Remove script and style elements
@@ -425,6 +405,8 @@ class DocumentExtractor:
                 "PPTX extraction requires python-pptx. Install with: pip install python-pptx"
             )
 
+        from pptx import Presentation
+
         prs = Presentation(path)
         text_parts = []
         info = {}
@@ -465,6 +447,8 @@ class DocumentExtractor:
                 "XLSX extraction requires openpyxl. Install with: pip install openpyxl"
             )
 
+        from openpyxl import load_workbook
+
         wb = load_workbook(path, data_only=True)
         text_parts = []
         info = {}
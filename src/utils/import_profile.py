@@ -0,0 +1,117 @@
+"""
+Startup import profile.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+and condenses the per-module timings into a report: total import time,
+self time summed per top-level package, and the slowest modules.
+
+Usage:
+    python -m src.utils.import_profile agent src.api.app
+    python agent.py --startup-profile
+"""
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List
+
+from src.utils.config import get_project_root
+
+
+@dataclass
+class ImportTiming:
+    """Timing of a single module import, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """Top-level package of the module (``src.tools`` for first-party code)."""
+        parts = self.module.split(".")
+        if parts[0] == "src" and len(parts) > 1:
+            return ".".join(parts[:2])
+        return parts[0]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the stderr of ``python -X importtime``.
+
+    Lines look like ``import time:   self [us] | cumulative | imported package``,
+    with the module name indented two spaces per nesting level.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        try:
+            self_value, cumulative_value = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # header line
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        timings.append(
+            ImportTiming(stripped.strip(), self_value, cumulative_value, max(depth, 0))
+        )
+    return timings
+
+
+def profile_imports(module: str) -> List[ImportTiming]:
+    """Import ``module`` in a fresh interpreter and return its import timings.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=get_project_root(),
+        capture_output=True,
+        text=True,
+    )
+    timings = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines()
+                  if not line.startswith("import time:")]
+        raise RuntimeError(f"import {module} failed: {' '.join(errors[-3:])}")
+    return timings
+
+
+def format_startup_report(module: str, timings: List[ImportTiming], top: int = 25) -> str:
+    """Format import timings as a plain-text report."""
+    total_us = sum(t.self_us for t in timings)
+    by_package: Dict[str, int] = {}
+    for timing in timings:
+        by_package[timing.package] = by_package.get(timing.package, 0) + timing.self_us
+
+    lines = [
+        f"Startup import profile: {module}",
+        f"  {len(timings)} modules, {total_us / 1000:.0f} ms total",
+        "",
+        "  Self time by package:",
+    ]
+    for package, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"    {self_us / 1000:8.1f} ms  {package}")
+
+    lines += ["", "  Slowest modules (cumulative):"]
+    for timing in sorted(timings, key=lambda t: -t.cumulative_us)[:top]:
+        lines.append(
+            f"    {timing.cumulative_us / 1000:8.1f} ms  {timing.module}"
+            f"  (self {timing.self_us / 1000:.1f} ms)"
+        )
+    return "\n".join(lines)
+
+
+def print_startup_report(modules: List[str], top: int = 25) -> None:
+    """Profile each module and print its report."""
+    for module in modules:
+        print(format_startup_report(module, profile_imports(module), top=top))
+        print()
+
+
+if __name__ == "__main__":
+    print_startup_report(sys.argv[1:] or ["agent", "src.api.app"])
@@ -4,18 +4,15 @@ Provides page-based PDF reading capabilities using pdfplumber.
 Designed for intelligent partial reading that respects context window limits.
 """
 
+import importlib.util
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-try:
-    import pdfplumber
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    pdfplumber = None
+# pdfplumber (and pdfminer) are imported on first read
+PDF_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
 
 
 class PDFReader:
@@ -75,6 +72,8 @@ class PDFReader:
             "creation_date": None,
         }
 
+        import pdfplumber
+
         with pdfplumber.open(path) as pdf:
             info["page_count"] = len(pdf.pages)
 
@@ -158,6 +157,8 @@ class PDFReader:
         text_parts: List[str] = []
         total_words = 0
 
+        import pdfplumber
+
         with pdfplumber.open(path) as pdf:
             total_pages = len(pdf.pages)
             read_info["total_pages"] = total_pages
@@ -6,3 +6,17 @@ from pathlib import Path
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_research_cache(tmp_path, monkeypatch):
+    """Give every test its own research cache so responses never leak between tests."""
+    from src.services import research_cache
+
+    cache = research_cache.ResearchCache(path=tmp_path / "research_cache.db", mode="on")
+    monkeypatch.setattr(research_cache, "_research_cache", cache)
+    yield cache
+    cache.close()
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.job_slots import JobSlots
 
 
 class TestJobStartEndpoint:
@@ -28,6 +29,7 @@ class TestJobStartEndpoint:
         agent.initialize = AsyncMock()
         agent.shutdown = AsyncMock()
         agent.process_job = AsyncMock(return_value={"should_stop": True})
+        agent.create_job_context.return_value = agent
         return agent
 
     @pytest.fixture
@@ -37,12 +39,12 @@ class TestJobStartEndpoint:
 
         # Save original state
         original_agent = app_module._agent
-        original_job_id = app_module._current_job_id
+        original_slots = app_module._job_slots
         original_orchestrator = app_module._orchestrator_client
 
         # Set up mocks
         app_module._agent = mock_agent
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
         app_module._orchestrator_client = None
 
         # Create app without lifespan (we're mocking the agent)
@@ -60,7 +62,7 @@ class TestJobStartEndpoint:
 
         # Restore original state
         app_module._agent = original_agent
-        app_module._current_job_id = original_job_id
+        app_module._job_slots = original_slots
         app_module._orchestrator_client = original_orchestrator
 
     def test_job_start_accepts_and_returns_202(self, test_client, mock_agent):
@@ -68,7 +70,7 @@ class TestJobStartEndpoint:
         import src.api.app as app_module
 
         # Ensure no job is running
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
         app_module._agent = mock_agent
 
         response = test_client.post(
@@ -89,7 +91,8 @@ class TestJobStartEndpoint:
         import src.api.app as app_module
 
         # Simulate a job already running
-        app_module._current_job_id = "existing-job-456"
+        app_module._job_slots = JobSlots(max_jobs=1)
+        app_module._job_slots.reserve("existing-job-456")
         app_module._agent = mock_agent
 
         response = test_client.post(
@@ -104,7 +107,7 @@ class TestJobStartEndpoint:
         assert "busy" in response.json()["detail"].lower()
 
         # Reset
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
 
 
 class TestJobCancelEndpoint:
@@ -135,10 +138,10 @@ class TestJobCancelEndpoint:
         import src.api.app as app_module
 
         original_agent = app_module._agent
-        original_job_id = app_module._current_job_id
+        original_slots = app_module._job_slots
 
         app_module._agent = mock_agent
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
 
         test_app = create_app_for_testing()
 
@@ -149,13 +152,13 @@ class TestJobCancelEndpoint:
         yield client
 
         app_module._agent = original_agent
-        app_module._current_job_id = original_job_id
+        app_module._job_slots = original_slots
 
     def test_job_cancel_no_job_returns_404(self, test_client, mock_agent):
         """Test that /job/cancel returns 404 when no job is running."""
         import src.api.app as app_module
 
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
         app_module._agent = mock_agent
 
         response = test_client.post(
@@ -187,6 +190,7 @@ class TestJobResumeEndpoint:
         agent.initialize = AsyncMock()
         agent.shutdown = AsyncMock()
         agent.process_job = AsyncMock(return_value={"should_stop": True})
+        agent.create_job_context.return_value = agent
         return agent
 
     @pytest.fixture
@@ -195,10 +199,10 @@ class TestJobResumeEndpoint:
         import src.api.app as app_module
 
         original_agent = app_module._agent
-        original_job_id = app_module._current_job_id
+        original_slots = app_module._job_slots
 
         app_module._agent = mock_agent
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
 
         test_app = create_app_for_testing()
 
@@ -209,13 +213,13 @@ class TestJobResumeEndpoint:
         yield client
 
         app_module._agent = original_agent
-        app_module._current_job_id = original_job_id
+        app_module._job_slots = original_slots
 
     def test_job_resume_works(self, test_client, mock_agent):
         """Test that /job/resume accepts a resume request."""
         import src.api.app as app_module
 
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
         app_module._agent = mock_agent
 
         response = test_client.post(
@@ -260,7 +264,7 @@ class TestGetCurrentJobEndpoint:
         import src.api.app as app_module
 
         original_agent = app_module._agent
-        original_job_id = app_module._current_job_id
+        original_slots = app_module._job_slots
 
         app_module._agent = mock_agent
 
@@ -271,13 +275,13 @@ class TestGetCurrentJobEndpoint:
         yield client
 
         app_module._agent = original_agent
-        app_module._current_job_id = original_job_id
+        app_module._job_slots = original_slots
 
     def test_get_current_job_when_idle(self, test_client, mock_agent):
         """Test /job/current returns no job when idle."""
         import src.api.app as app_module
 
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
         app_module._agent = mock_agent
 
         response = test_client.get("/job/current")
@@ -291,7 +295,8 @@ class TestGetCurrentJobEndpoint:
         """Test /job/current returns job info when busy."""
         import src.api.app as app_module
 
-        app_module._current_job_id = "active-job-123"
+        app_module._job_slots = JobSlots(max_jobs=1)
+        app_module._job_slots.reserve("active-job-123")
         app_module._agent = mock_agent
 
         response = test_client.get("/job/current")
@@ -302,7 +307,159 @@ class TestGetCurrentJobEndpoint:
         assert data["is_busy"] is True
 
         # Reset
-        app_module._current_job_id = None
+        app_module._job_slots = JobSlots(max_jobs=1)
+
+
+class TestConcurrentJobSlots:
+    """Tests for running several jobs in one agent process."""
+
+    @pytest.fixture
+    def mock_agent(self):
+        """Create a mock agent."""
+        agent = MagicMock()
+        agent.config.agent_id = "test-agent"
+        agent.get_status.return_value = {"initialized": True}
+        agent.process_job = AsyncMock(return_value={"should_stop": True})
+        agent.create_job_context.return_value = agent
+        return agent
+
+    @pytest.fixture
+    def test_client(self, mock_agent):
+        """Create a test client with two job slots."""
+        import src.api.app as app_module
+
+        original_agent = app_module._agent
+        original_slots = app_module._job_slots
+        original_orchestrator = app_module._orchestrator_client
+
+        app_module._agent = mock_agent
+        app_module._job_slots = JobSlots(max_jobs=2)
+        app_module._orchestrator_client = None
+
+        yield TestClient(create_app_for_testing(), raise_server_exceptions=False)
+
+        app_module._agent = original_agent
+        app_module._job_slots = original_slots
+        app_module._orchestrator_client = original_orchestrator
+
+    def test_start_uses_free_slot_and_rejects_when_full(self, test_client):
+        """A second job starts while one runs; a third is rejected."""
+        import src.api.app as app_module
+
+        app_module._job_slots.reserve("running-job")
+        assert app_module._get_agent_status_for_heartbeat() == "ready"
+
+        response = test_client.post("/job/start", json={"job_id": "job-2", "description": "x"})
+        assert response.status_code == 202
+
+        app_module._job_slots.reserve("job-2")  # keep the slot taken even if the mock job already ended
+        response = test_client.post("/job/start", json={"job_id": "job-3", "description": "x"})
+        assert response.status_code == 409
+        assert "busy" in response.json()["detail"].lower()
+        assert app_module._get_agent_status_for_heartbeat() == "working"
+
+        metrics = app_module._get_agent_metrics()
+        assert metrics["job_slots"] == 2
+        assert metrics["active_jobs"] == ["running-job", "job-2"]
+
+    def test_same_job_cannot_start_twice(self, test_client):
+        """A job already holding a slot is rejected with 409."""
+        import src.api.app as app_module
+
+        app_module._job_slots.reserve("job-1")
+        response = test_client.post("/job/start", json={"job_id": "job-1", "description": "x"})
+
+        assert response.status_code == 409
+        assert "already running" in response.json()["detail"]
+
+    def test_cancel_targets_one_job(self, test_client):
+        """Cancel needs job_id when several jobs run and leaves others alone."""
+        import src.api.app as app_module
+
+        app_module._job_slots.reserve("job-a")
+        app_module._job_slots.reserve("job-b")
+
+        response = test_client.post("/job/cancel", json={"reason": "stop"})
+        assert response.status_code == 400
+
+        response = test_client.post("/job/cancel", json={"job_id": "job-a"})
+        assert response.status_code == 200
+        assert response.json()["job_id"] == "job-a"
+        assert app_module._job_slots.active_job_ids == ["job-b"]
+
+        response = test_client.get("/job/current")
+        assert response.json()["active_jobs"] == ["job-b"]
+        assert response.json()["job_slots_free"] == 1
+
+        response = test_client.post("/job/cancel", json={"job_id": "job-a"})
+        assert response.status_code == 404
+
+
+class TestJobSlots:
+    """Tests for the JobSlots registry."""
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_task_finishes(self):
+        import asyncio
+
+        slots = JobSlots(max_jobs=1)
+        assert slots.reserve("job-1")
+        assert not slots.reserve("job-2")
+
+        task = asyncio.create_task(asyncio.sleep(0))
+        slots.attach("job-1", task)
+        await task
+        await asyncio.sleep(0)
+
+        assert slots.active_job_ids == []
+        assert slots.reserve("job-2")
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_only_that_job(self):
+        import asyncio
+
+        slots = JobSlots(max_jobs=2)
+        tasks = {}
+        for job_id in ("job-1", "job-2"):
+            slots.reserve(job_id)
+            tasks[job_id] = asyncio.create_task(asyncio.sleep(10))
+            slots.attach(job_id, tasks[job_id])
+
+        assert await slots.cancel("job-1")
+        assert tasks["job-1"].cancelled()
+        assert not tasks["job-2"].done()
+        assert slots.latest_job_id() == "job-2"
+
+        await slots.cancel_all()
+        assert slots.busy == 0
+
+
+class TestJobContexts:
+    """Tests for UniversalAgent per-job execution contexts."""
+
+    def test_job_context_isolates_state_and_reports_to_owner(self):
+        from src.agent import UniversalAgent
+        from src.core.loader import load_agent_config_from_dict
+
+        agent = UniversalAgent(load_agent_config_from_dict({"agent_id": "t", "display_name": "T"}))
+        agent.postgres_conn = MagicMock()
+        first = agent.create_job_context()
+        second = agent.create_job_context()
+
+        first._workspace_manager = MagicMock()
+        first._datasource_connections["neo4j"] = MagicMock()
+        assert second._workspace_manager is None
+        assert second._datasource_connections == {}
+        assert first.postgres_conn is agent.postgres_conn
+
+        first._job_started("job-1")
+        second._job_started("job-2")
+        assert agent.get_status()["active_jobs"] == ["job-1", "job-2"]
+
+        first._job_finished("job-1", processed=True)
+        status = agent.get_status()
+        assert status["active_jobs"] == ["job-2"]
+        assert status["jobs_processed"] == 1
 
 
 def create_app_for_testing():
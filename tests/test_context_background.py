@@ -0,0 +1,214 @@
+"""Tests for background (speculative) context summarization."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langgraph.graph.message import add_messages
+
+from src.core.context import (
+    JOB_DIGEST,
+    PHASE_SUMMARY,
+    ContextConfig,
+    ContextManager,
+    ConversationSummary,
+    make_summary_message,
+    summary_tier,
+)
+
+
+class GatedLLM:
+    """Summarization LLM whose responses wait until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await self.release.wait()
+        return ConversationSummary(
+            summary="Short summary.",
+            tasks_completed="- Task 1",
+            key_decisions="",
+            current_state="Working",
+        )
+
+
+@pytest.fixture
+def context_manager():
+    config = ContextConfig(
+        summarization_threshold_tokens=2000,
+        message_count_threshold=1000,
+        keep_recent_messages=4,
+        background_summarization_ratio=0.5,
+    )
+    return ContextManager(config=config, model="gpt-4")
+
+
+def history(num_messages: int, chars: int = 400) -> list:
+    messages = [SystemMessage(content="System prompt", id="sys")]
+    for i in range(num_messages):
+        cls = HumanMessage if i % 2 == 0 else AIMessage
+        messages.append(cls(content=f"message {i} " + "x" * chars, id=f"m{i}"))
+    return messages
+
+
+class TestStartBackgroundSummary:
+
+    def test_not_started_below_soft_threshold(self, context_manager):
+        assert not context_manager.start_background_summary("job", history(2), GatedLLM())
+
+    def test_disabled_with_zero_ratio(self):
+        manager = ContextManager(config=ContextConfig(summarization_threshold_tokens=100))
+        assert not manager.should_start_background_summary(history(20))
+
+    @pytest.mark.asyncio
+    async def test_one_task_per_key(self, context_manager):
+        llm = GatedLLM()
+        assert context_manager.start_background_summary("job", history(20), llm)
+        assert not context_manager.start_background_summary("job", history(20), llm)
+        assert context_manager.start_background_summary("other", history(20), llm)
+        llm.release.set()
+        context_manager.cancel_background_summary("job")
+        context_manager.cancel_background_summary("other")
+
+
+class TestTakeBackgroundSummary:
+
+    @pytest.mark.asyncio
+    async def test_swaps_in_summary_for_summarized_range_only(self, context_manager):
+        messages = history(20)
+        llm = GatedLLM()
+        assert context_manager.start_background_summary("job", messages, llm)
+
+        # Still running: the agent keeps going without waiting
+        assert await context_manager.take_background_summary("job", messages) == []
+
+        llm.release.set()
+        await asyncio.sleep(0)
+        update = await context_manager.take_background_summary("job", messages, wait=True)
+        compacted = add_messages(messages, update)
+
+        assert [m.id for m in compacted] == ["sys", "m0", "m16", "m17", "m18", "m19"]
+        summary = compacted[1]
+        assert isinstance(summary, SystemMessage)
+        assert summary.content.startswith("[Summary of prior work]\n**Summary:**\nShort summary.")
+        # Recent messages are untouched
+        assert compacted[2:] == messages[-4:]
+
+    @pytest.mark.asyncio
+    async def test_phase_summary_is_merged(self, context_manager):
+        messages = history(20)
+        messages.insert(1, make_summary_message("Old", PHASE_SUMMARY, 2, id="old"))
+        llm = GatedLLM()
+        llm.release.set()
+        assert context_manager.start_background_summary("job", messages, llm, phase_number=2)
+
+        update = await context_manager.take_background_summary("job", messages, wait=True)
+        compacted = add_messages(messages, update)
+
+        assert [m.id for m in compacted][:2] == ["sys", "old"]
+        assert "Old" not in compacted[1].content
+        assert [m.id for m in compacted][2:] == ["m16", "m17", "m18", "m19"]
+
+    @pytest.mark.asyncio
+    async def test_other_phase_summaries_are_kept(self, context_manager):
+        messages = history(20)
+        messages.insert(1, make_summary_message("Phase one", PHASE_SUMMARY, 1, id="phase1"))
+        llm = GatedLLM()
+        llm.release.set()
+        assert context_manager.start_background_summary("job", messages, llm, phase_number=2)
+
+        update = await context_manager.take_background_summary("job", messages, wait=True)
+        compacted = add_messages(messages, update)
+
+        assert [m.id for m in compacted][:3] == ["sys", "phase1", "m0"]
+        assert compacted[1].content.endswith("Phase one")
+        assert summary_tier(compacted[2]) == (PHASE_SUMMARY, 2)
+
+    @pytest.mark.asyncio
+    async def test_discarded_when_history_was_compacted(self, context_manager):
+        messages = history(20)
+        llm = GatedLLM()
+        llm.release.set()
+        context_manager.start_background_summary("job", messages, llm)
+
+        # An inline compaction replaced the summarized messages meanwhile
+        update = await context_manager.take_background_summary("job", messages[:1] + messages[-4:], wait=True)
+        assert update == []
+        assert not context_manager._background
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_is_ignored(self, context_manager):
+        llm = MagicMock()
+        llm.with_structured_output.return_value.ainvoke.side_effect = RuntimeError("down")
+        messages = history(20)
+        context_manager.start_background_summary("job", messages, llm)
+
+        assert await context_manager.take_background_summary("job", messages, wait=True) == []
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, context_manager):
+        messages = history(20)
+        llm = GatedLLM()
+        context_manager.start_background_summary("job", messages, llm)
+        task = context_manager._background["job"].task
+
+        context_manager.cancel_background_summary("job")
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert await context_manager.take_background_summary("job", messages, wait=True) == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_when_job_ends(self, context_manager):
+        from types import SimpleNamespace
+
+        from src.agent import UniversalAgent
+        from src.core.loader import load_agent_config_from_dict
+
+        job = UniversalAgent(load_agent_config_from_dict({"agent_id": "t", "display_name": "T"})).create_job_context()
+        job._job_bindings = SimpleNamespace(context_mgr=context_manager)
+        context_manager.start_background_summary("job", history(20), GatedLLM())
+        task = context_manager._background["job"].task
+
+        job._release_graph("job")
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert not context_manager._background
+        assert job._job_bindings is None
+
+    @pytest.mark.asyncio
+    async def test_overflowing_summaries_fold_into_digest(self):
+        manager = ContextManager(
+            config=ContextConfig(
+                summarization_threshold_tokens=2000,
+                message_count_threshold=1000,
+                keep_recent_messages=4,
+                background_summarization_ratio=0.5,
+                summary_digest_tokens=50,
+            ),
+            model="gpt-4",
+        )
+        messages = history(20)
+        messages[1:1] = [
+            make_summary_message("Phase one " * 20, PHASE_SUMMARY, 1, id="phase1"),
+            make_summary_message("Phase two " * 20, PHASE_SUMMARY, 2, id="phase2"),
+        ]
+        llm = GatedLLM()
+        llm.release.set()
+        assert manager.start_background_summary("job", messages, llm, phase_number=3)
+
+        update = await manager.take_background_summary("job", messages, wait=True)
+        compacted = add_messages(messages, update)
+
+        assert llm.calls == 2
+        assert [m.id for m in compacted] == ["sys", "phase1", "m0", "m16", "m17", "m18", "m19"]
+        assert summary_tier(compacted[1]) == (JOB_DIGEST, None)
+        assert summary_tier(compacted[2]) == (PHASE_SUMMARY, 3)
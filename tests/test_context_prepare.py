@@ -0,0 +1,132 @@
+"""Tests for single-pass history preparation and cached token counting."""
+
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from src.core.context import (
+    ContextConfig,
+    ContextManager,
+    count_tokens_approximate,
+    count_tokens_tiktoken,
+    is_summary_message,
+    sanitize_message_history,
+)
+
+
+def history(turns: int) -> list:
+    messages = [
+        SystemMessage(content="System prompt", id="sys"),
+        SystemMessage(content="[Summary of prior work]\nEarlier work", id="summary"),
+        HumanMessage(content="Start", id="h0"),
+    ]
+    for i in range(turns):
+        messages.append(AIMessage(
+            content=f"step {i}",
+            tool_calls=[{"name": "search", "args": {"q": str(i)}, "id": f"c{i}"}],
+            id=f"a{i}",
+        ))
+        messages.append(ToolMessage(content=f"result {i} " * 50, tool_call_id=f"c{i}", id=f"t{i}"))
+    # Orphaned result (its AIMessage was compacted away)
+    messages.insert(5, ToolMessage(content="orphan", tool_call_id="gone", id="orphan"))
+    return messages
+
+
+def legacy_prepare(manager: ContextManager, messages: list):
+    """The multi-pass preparation the execute node used to do."""
+    remove_markers = [m for m in messages if isinstance(m, RemoveMessage)]
+    messages = [m for m in messages if not isinstance(m, RemoveMessage)]
+    messages = manager.clear_old_tool_results(messages)
+    messages = sanitize_message_history(messages)
+    summaries = [
+        m for m in messages
+        if isinstance(m, SystemMessage) and "[Summary of prior work]" in m.content
+    ]
+    conversation = [m for m in messages if not isinstance(m, SystemMessage)]
+    return remove_markers, messages, summaries, conversation
+
+
+def as_tuples(messages: list) -> list:
+    return [(type(m).__name__, m.id, m.content) for m in messages]
+
+
+@pytest.fixture
+def manager():
+    return ContextManager(config=ContextConfig(keep_recent_tool_results=5))
+
+
+class TestPrepareHistory:
+
+    @pytest.mark.parametrize("turns", [3, 200, 5000])
+    def test_matches_multi_pass_preparation(self, manager, turns):
+        messages = history(turns) + [RemoveMessage(id="h0")]
+        remove_markers, cleaned, summaries, conversation = legacy_prepare(manager, messages)
+
+        prepared = manager.prepare_history(messages)
+
+        assert [m.id for m in prepared.remove_markers] == [m.id for m in remove_markers]
+        assert as_tuples(prepared.messages) == as_tuples(cleaned)
+        assert as_tuples(prepared.summaries) == as_tuples(summaries)
+        assert as_tuples(prepared.conversation) == as_tuples(conversation)
+        assert prepared.history == [m for m in messages if not isinstance(m, RemoveMessage)]
+
+    def test_cleared_copies_are_reused(self, manager):
+        messages = history(20)
+        first = manager.prepare_history(messages)
+        second = manager.prepare_history(messages + [HumanMessage(content="next", id="h1")])
+
+        # The oldest result is cleared in both; the same copy is handed out
+        assert first.conversation[2] is second.conversation[2]
+        assert first.conversation[2].content == manager.config.placeholder_text
+
+    def test_replaced_message_gets_new_copy(self, manager):
+        messages = history(20)
+        first = manager.prepare_history(messages)
+        messages[4] = ToolMessage(content="changed", tool_call_id="c0", id="t0")
+        second = manager.prepare_history(messages)
+
+        assert first.conversation[2] is not second.conversation[2]
+
+    def test_tool_result_answered_by_later_call_is_kept(self, manager):
+        messages = [
+            ToolMessage(content="early", tool_call_id="c1", id="t1"),
+            AIMessage(content="", tool_calls=[{"name": "x", "args": {}, "id": "c1"}], id="a1"),
+        ]
+        assert manager.prepare_history(messages).conversation == messages
+
+
+class TestCachedTokenCount:
+
+    def test_matches_uncached_count(self, manager):
+        messages = history(50)
+        expected = (
+            count_tokens_approximate(messages) if manager._encoding is None
+            else count_tokens_tiktoken(messages, "gpt-4")
+        )
+        assert manager.get_token_count(messages) == expected
+        # Second count is served from the cache
+        cached_entries = len(manager._token_cache)
+        assert manager.get_token_count(messages) == expected
+        assert len(manager._token_cache) == cached_entries
+
+    def test_changed_content_is_recounted(self, manager):
+        message = AIMessage(content="short", id="a")
+        before = manager.get_token_count([message])
+        after = manager.get_token_count([AIMessage(content="much longer " * 100, id="a")])
+        assert after > before
+
+    def test_tool_calls_are_counted(self, manager):
+        plain = AIMessage(content="x")
+        with_calls = AIMessage(content="x", tool_calls=[{"name": "search", "args": {"q": "y" * 200}, "id": "c"}])
+        assert manager.get_token_count([with_calls]) > manager.get_token_count([plain])
+
+
+def test_is_summary_message():
+    assert is_summary_message(SystemMessage(content="[Summary of prior work]\nText"))
+    assert not is_summary_message(SystemMessage(content="System prompt"))
+    assert not is_summary_message(HumanMessage(content="[Summary of prior work]"))
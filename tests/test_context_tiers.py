@@ -0,0 +1,159 @@
+"""Tests for the tiered summary hierarchy of context compaction."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage
+from langgraph.graph.message import add_messages
+
+from src.core.context import (
+    JOB_DIGEST,
+    PHASE_SUMMARY,
+    ContextConfig,
+    ContextManager,
+    ConversationSummary,
+    make_summary_message,
+    summary_tier,
+)
+
+
+class RecordingLLM:
+    """Summarization LLM that records its prompts and numbers its summaries."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        self.prompts.append(messages[0].content)
+        return ConversationSummary(
+            summary=f"Summary {len(self.prompts)}.",
+            tasks_completed="",
+            key_decisions="",
+            current_state="Working",
+        )
+
+
+def turns(phase: int, count: int, chars: int = 400) -> list:
+    messages = []
+    for i in range(count):
+        cls = HumanMessage if i % 2 == 0 else AIMessage
+        messages.append(cls(content=f"phase {phase} turn {i} " + "x" * chars, id=f"p{phase}m{i}"))
+    return messages
+
+
+def phase_summary(phase: int, text: str) -> SystemMessage:
+    return make_summary_message(text, PHASE_SUMMARY, phase, id=f"summary{phase}")
+
+
+def apply(messages: list, update: list) -> list:
+    return add_messages(messages, update)
+
+
+@pytest.fixture
+def manager():
+    return ContextManager(config=ContextConfig(keep_recent_messages=4), model="gpt-4")
+
+
+class TestSummaryMessages:
+
+    def test_tiers_round_trip(self):
+        phase = make_summary_message("text", PHASE_SUMMARY, 3)
+        digest = make_summary_message("text", JOB_DIGEST)
+
+        assert summary_tier(phase) == (PHASE_SUMMARY, 3)
+        assert summary_tier(digest) == (JOB_DIGEST, None)
+        assert phase.content == "[Summary of prior work] (phase 3)\ntext"
+
+    def test_untiered_summary_is_digest(self):
+        legacy = SystemMessage(content="[Summary of prior work]\nOld rolling summary")
+        assert summary_tier(legacy) == (JOB_DIGEST, None)
+
+
+class TestTieredCompaction:
+
+    @pytest.mark.asyncio
+    async def test_earlier_phase_summary_is_reused(self, manager):
+        llm = RecordingLLM()
+        messages = [SystemMessage(content="System prompt", id="sys"), phase_summary(1, "Phase one work")]
+        messages += turns(2, 12)
+
+        update = await manager.summarize_and_compact(messages, llm, phase_number=2)
+
+        removed = {m.id for m in update if isinstance(m, RemoveMessage)}
+        assert "summary1" not in removed
+        assert "Phase one work" not in llm.prompts[0]
+
+        state = apply(messages, update)
+        assert [m.id for m in state[:2]] == ["sys", "summary1"]
+        assert summary_tier(state[2]) == (PHASE_SUMMARY, 2)
+        assert state[2].content.startswith("[Summary of prior work] (phase 2)\n**Summary:**\nSummary 1.")
+        assert [m.content for m in state[3:]] == [m.content for m in messages[-4:]]
+
+    @pytest.mark.asyncio
+    async def test_current_phase_summary_is_extended(self, manager):
+        llm = RecordingLLM()
+        messages = [phase_summary(1, "Phase one work")] + turns(2, 12)
+        state = apply(messages, await manager.summarize_and_compact(messages, llm, phase_number=2))
+
+        state = apply(state, turns(3, 10))
+        state = apply(state, await manager.summarize_and_compact(state, llm, phase_number=2))
+
+        summaries = [m for m in state if isinstance(m, SystemMessage)]
+        assert [summary_tier(m) for m in summaries] == [(PHASE_SUMMARY, 1), (PHASE_SUMMARY, 2)]
+        assert "Summary 2." in summaries[1].content
+        # The phase's own summary is carried over, the earlier phase is not
+        assert "Prior Summary: [Summary of prior work] (phase 2)" in llm.prompts[1]
+        assert "Phase one work" not in llm.prompts[1]
+
+    @pytest.mark.asyncio
+    async def test_summary_input_does_not_grow_with_job_length(self, manager):
+        llm = RecordingLLM()
+        state = []
+        for phase in range(1, 8):
+            state = apply(state, turns(phase, 12))
+            state = apply(state, await manager.summarize_and_compact(state, llm, phase_number=phase))
+
+        # Every later phase summarizes its own turns plus the carried-over recent ones
+        assert len(llm.prompts) == 7
+        assert len({len(p) for p in llm.prompts[1:]}) == 1
+        assert len([m for m in state if isinstance(m, SystemMessage)]) == 7
+
+    @pytest.mark.asyncio
+    async def test_overflowing_summaries_fold_into_digest(self):
+        manager = ContextManager(
+            config=ContextConfig(keep_recent_messages=4, summary_digest_tokens=50),
+            model="gpt-4",
+        )
+        llm = RecordingLLM()
+        messages = [
+            make_summary_message("Early work " * 10, JOB_DIGEST, id="digest"),
+            phase_summary(1, "Phase one work " * 10),
+            phase_summary(2, "Phase two work " * 10),
+        ] + turns(3, 12)
+
+        update = await manager.summarize_and_compact(messages, llm, phase_number=3)
+
+        removed = {m.id for m in update if isinstance(m, RemoveMessage)}
+        assert {"digest", "summary1", "summary2"} <= removed
+        assert "Phase two work" in llm.prompts[1]
+
+        state = apply(messages, update)
+        summaries = [m for m in state if isinstance(m, SystemMessage)]
+        assert [summary_tier(m) for m in summaries] == [(JOB_DIGEST, None), (PHASE_SUMMARY, 3)]
+        assert "Summary 2." in summaries[0].content
+
+    @pytest.mark.asyncio
+    async def test_digest_alone_is_not_resummarized(self):
+        manager = ContextManager(
+            config=ContextConfig(keep_recent_messages=4, summary_digest_tokens=10),
+            model="gpt-4",
+        )
+        llm = RecordingLLM()
+        legacy = SystemMessage(content="[Summary of prior work]\n" + "Old work " * 50, id="legacy")
+        messages = [legacy] + turns(1, 12)
+
+        update = await manager.summarize_and_compact(messages, llm, phase_number=1)
+
+        assert len(llm.prompts) == 1
+        assert "legacy" not in {m.id for m in update if isinstance(m, RemoveMessage)}
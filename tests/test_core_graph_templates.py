@@ -0,0 +1,163 @@
+"""Tests for graph templates and LLMs shared across jobs."""
+
+from types import SimpleNamespace
+from typing import Annotated, Any, Dict, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.core.graph_templates import (
+    JOB_BINDINGS_KEY,
+    GraphTemplate,
+    GraphTemplatePool,
+    JobBindings,
+    JobBound,
+    template_key,
+)
+from src.core.loader import LLMConfig, clear_llm_pool, get_llm, load_agent_config_from_dict
+from src.core.state import UniversalAgentState
+from src.graph import create_audited_tool_node
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+    job_id: str
+    phase_number: int
+    seen: str
+
+
+def bindings(workspace: Any = None, tools: Dict[str, Any] = None) -> JobBindings:
+    return JobBindings(
+        workspace=workspace,
+        todo_manager=SimpleNamespace(is_strategic_phase=True),
+        tool_context=None,
+        context_mgr=None,
+        retry_manager=None,
+        tools=tools or {},
+    )
+
+
+def run_config(job: JobBindings) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": "t", JOB_BINDINGS_KEY: job}}
+
+
+def make_tool(label: str):
+    @tool
+    def whoami() -> str:
+        """Name the job this tool belongs to."""
+        return label
+
+    return whoami
+
+
+class TestJobBound:
+
+    @pytest.mark.asyncio
+    async def test_one_graph_serves_several_jobs(self):
+        workspace = JobBound("workspace")
+        todo_manager = JobBound("todo_manager")
+
+        def node(state: State) -> Dict[str, Any]:
+            todo_manager.is_strategic_phase = False
+            return {"seen": workspace.name}
+
+        graph = StateGraph(State)
+        graph.add_node("node", node)
+        graph.add_edge(START, "node")
+        graph.add_edge("node", END)
+        compiled = graph.compile()
+
+        first = bindings(SimpleNamespace(name="first"))
+        second = bindings(SimpleNamespace(name="second"))
+        assert (await compiled.ainvoke({"messages": []}, run_config(first)))["seen"] == "first"
+        assert (await compiled.ainvoke({"messages": []}, run_config(second)))["seen"] == "second"
+        assert first.todo_manager.is_strategic_phase is False
+
+    def test_unbound_access_fails_clearly(self):
+        with pytest.raises(RuntimeError, match="workspace"):
+            JobBound("workspace").path
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_the_jobs_tools(self):
+        config = load_agent_config_from_dict({"agent_id": "t", "display_name": "T"})
+        node = create_audited_tool_node(
+            [make_tool("template")], config,
+            workspace=JobBound("workspace"), tool_context=JobBound("tool_context"),
+        )
+        graph = StateGraph(UniversalAgentState)
+        graph.add_node("tools", node)
+        graph.add_edge(START, "tools")
+        graph.add_edge("tools", END)
+        compiled = graph.compile()
+
+        call = {"name": "whoami", "args": {}, "id": "call_1", "type": "tool_call"}
+        for label in ("job-a", "job-b"):
+            job = bindings(tools={"whoami": make_tool(label)})
+            state = {"messages": [AIMessage(content="", tool_calls=[call])], "job_id": label}
+            result = await compiled.ainvoke(state, run_config(job))
+            assert result["messages"][-1].content == label
+
+
+class TestGraphTemplatePool:
+
+    @staticmethod
+    def template(key: str) -> GraphTemplate:
+        return GraphTemplate(key=key, graph=object(), strategic_llm_with_tools=None,
+                             tactical_llm_with_tools=None)
+
+    def test_released_template_is_reused(self):
+        pool = GraphTemplatePool()
+        first = pool.acquire("k", lambda: self.template("k"))
+        pool.release(first)
+
+        assert pool.acquire("k", lambda: self.template("k")) is first
+
+    def test_checked_out_template_is_not_shared(self):
+        pool = GraphTemplatePool()
+        first = pool.acquire("k", lambda: self.template("k"))
+        second = pool.acquire("k", lambda: self.template("k"))
+
+        assert second is not first
+
+    def test_idle_templates_are_capped(self):
+        pool = GraphTemplatePool(max_idle=2)
+        for key in ("a", "b", "c"):
+            pool.release(self.template(key))
+
+        assert pool.idle_count() == 2
+        fresh = self.template("a")
+        assert pool.acquire("a", lambda: fresh) is fresh
+
+    def test_key_follows_config_and_tools(self):
+        config = load_agent_config_from_dict({"agent_id": "t", "display_name": "T"})
+        other = load_agent_config_from_dict(
+            {"agent_id": "t", "display_name": "T", "llm": {"temperature": 0.5}}
+        )
+
+        key = template_key(config, ["read_file", "write_file"])
+        assert template_key(config, ["write_file", "read_file"]) == key
+        assert template_key(config, ["read_file"]) != key
+        assert template_key(other, ["read_file", "write_file"]) != key
+
+
+class TestSharedLLMs:
+
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        clear_llm_pool()
+        yield
+        clear_llm_pool()
+
+    def test_same_settings_share_an_instance(self):
+        config = LLMConfig(model="gpt-4o", base_url="http://localhost:8000/v1", api_key="k")
+
+        assert get_llm(config) is get_llm(LLMConfig(**vars(config)))
+
+    def test_different_settings_get_their_own(self):
+        config = LLMConfig(model="gpt-4o", base_url="http://localhost:8000/v1", api_key="k")
+
+        assert get_llm(config) is not get_llm(LLMConfig(**{**vars(config), "temperature": 0.7}))
+        assert get_llm(config) is not get_llm(LLMConfig(**{**vars(config), "model": "gpt-4o-mini"}))
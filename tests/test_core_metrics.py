@@ -0,0 +1,151 @@
+"""Tests for the in-process Prometheus metrics registry."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import metrics
+from src.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    metrics.REGISTRY.clear()
+    yield
+    metrics.REGISTRY.clear()
+
+
+class TestMetricTypes:
+    """Tests for Counter, Gauge and Histogram rendering."""
+
+    def test_counter_renders_labelled_samples(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("tool",))
+        counter.inc(tool="read_file")
+        counter.inc(2, tool='say "hi"')
+
+        text = registry.render()
+
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="read_file"} 1' in text
+        assert 'calls_total{tool="say \\"hi\\""} 2' in text
+        with pytest.raises(ValueError):
+            counter.inc(-1, tool="read_file")
+        with pytest.raises(ValueError):
+            counter.inc(model="x")
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        lines = histogram.render().splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+        assert "latency_seconds_sum 6.25" in lines
+
+    def test_histogram_time_observes_on_error(self):
+        histogram = Histogram("op_seconds", "Op", ("op",))
+        with pytest.raises(RuntimeError):
+            with histogram.time(op="write"):
+                raise RuntimeError("boom")
+        assert histogram.summary(op="write")["count"] == 1
+
+    def test_gauge_set_remove_and_function(self):
+        gauge = Gauge("iteration", "Iteration", ("job_id",))
+        gauge.set(3, job_id="a")
+        gauge.set(5, job_id="b")
+        gauge.remove(job_id="a")
+        assert gauge.values() == {("b",): 5.0}
+
+        depth = Gauge("depth", "Depth")
+        depth.set_function(lambda: 7)
+        assert "depth 7" in depth.render()
+
+    def test_duplicate_names_rejected(self):
+        registry = MetricsRegistry()
+        registry.register(Counter("x_total", "X"))
+        with pytest.raises(ValueError):
+            registry.counter("x_total", "X again")
+
+
+class TestRecordLlmUsage:
+    """Tests for token accounting from LLM responses."""
+
+    def test_usage_metadata(self):
+        response = SimpleNamespace(
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "input_token_details": {"cache_read": 100},
+            },
+            response_metadata={},
+        )
+        metrics.record_llm_usage(response, phase="tactical", model="m")
+
+        assert metrics.LLM_TOKENS.value(phase="tactical", model="m", kind="prompt") == 120
+        assert metrics.LLM_TOKENS.value(phase="tactical", model="m", kind="completion") == 30
+        assert metrics.LLM_TOKENS.value(phase="tactical", model="m", kind="cached") == 100
+
+    def test_openai_token_usage_fallback(self):
+        response = SimpleNamespace(
+            usage_metadata=None,
+            response_metadata={"token_usage": {
+                "prompt_tokens": 10,
+                "completion_tokens": 4,
+                "prompt_tokens_details": {"cached_tokens": 8},
+            }},
+        )
+        metrics.record_llm_usage(response, phase="strategic", model="m")
+
+        assert metrics.LLM_TOKENS.total() == 22
+
+
+class TestInstrumentation:
+    """Hot paths feed the registry."""
+
+    def test_git_commit_is_timed(self, tmp_path):
+        from src.managers.git_manager import GitManager
+
+        manager = GitManager(tmp_path)
+        if not manager.init_repository():
+            pytest.skip("git not available")
+        (tmp_path / "a.txt").write_text("a")
+        assert manager.commit("add a")
+
+        assert metrics.GIT_COMMIT_SECONDS.totals()["count"] >= 1
+
+    def test_job_outcomes_and_iteration_gauge(self):
+        from src.agent import UniversalAgent
+        from src.core.loader import load_agent_config_from_dict
+
+        agent = UniversalAgent(load_agent_config_from_dict({"agent_id": "t", "display_name": "T"}))
+        job = agent.create_job_context()
+
+        job._job_started("job-1")
+        metrics.JOB_ITERATION.set(4, job_id="job-1")
+        job._job_finished("job-1", processed=True)
+        job._job_started("job-2")
+        job._job_finished("job-2", cancelled=True)
+
+        assert metrics.JOBS.value(outcome="completed") == 1
+        assert metrics.JOBS.value(outcome="cancelled") == 1
+        assert metrics.JOB_SECONDS.totals()["count"] == 2
+        assert metrics.JOB_ITERATION.values() == {}
+
+    def test_metrics_endpoint_renders_prometheus_text(self):
+        from fastapi.testclient import TestClient
+
+        from src.api.app import create_app
+
+        metrics.TOOL_SECONDS.observe(0.2, tool="web_search")
+        client = TestClient(create_app())
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'agent_tool_duration_seconds_count{tool="web_search"} 1' in response.text
@@ -0,0 +1,134 @@
+"""Tests for the append-only message log of the agent state."""
+
+from typing import Annotated, List
+
+import aiosqlite
+import pytest
+from typing_extensions import TypedDict
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+from src.agent import _AiosqliteConnectionWrapper
+from src.core.state import UniversalAgentState, append_message_log
+
+CONFIG = {"configurable": {"thread_id": "job"}, "recursion_limit": 200}
+
+
+class LegacyState(TypedDict):
+    """Agent state as checkpointed before the message log."""
+
+    messages: Annotated[List[BaseMessage], add_messages]
+    iteration: int
+
+
+def _build(state_schema, checkpointer, steps: int = 20):
+    """Graph appending a response and tool result per step, compacting every 5."""
+
+    def step(state):
+        new = [
+            AIMessage(content="r" * 2000),
+            ToolMessage(content="t" * 2000, tool_call_id="call"),
+        ]
+        if state["iteration"] % 5 == 4:
+            # Compaction drops the oldest messages (tombstones in the log)
+            new = [RemoveMessage(id=m.id) for m in state["messages"][1:6]] + new
+        return {"messages": new, "iteration": state["iteration"] + 1}
+
+    graph = StateGraph(state_schema)
+    graph.add_node("step", step)
+    graph.add_edge(START, "step")
+    graph.add_conditional_edges("step", lambda s: END if s["iteration"] >= steps else "step")
+    return graph.compile(checkpointer=checkpointer)
+
+
+async def _run(path, state_schema, steps: int = 20):
+    conn = await aiosqlite.connect(path)
+    try:
+        graph = _build(state_schema, AsyncSqliteSaver(_AiosqliteConnectionWrapper(conn)), steps)
+        result = await graph.ainvoke({"messages": [HumanMessage(content="go")], "iteration": 0}, CONFIG)
+        async with conn.execute("SELECT MAX(LENGTH(checkpoint)) FROM checkpoints") as cursor:
+            (largest_checkpoint,) = await cursor.fetchone()
+    finally:
+        await conn.close()
+    return result, largest_checkpoint
+
+
+async def _load(path, state_schema):
+    conn = await aiosqlite.connect(path)
+    try:
+        graph = _build(state_schema, AsyncSqliteSaver(_AiosqliteConnectionWrapper(conn)))
+        return (await graph.aget_state(CONFIG)).values
+    finally:
+        await conn.close()
+
+
+class TestAppendMessageLog:
+
+    def test_batching_invariant(self):
+        writes = [
+            [HumanMessage(content="a")],
+            AIMessage(content="b"),
+            [ToolMessage(content="c", tool_call_id="1"), AIMessage(content="d")],
+        ]
+        stepwise = []
+        for write in writes:
+            stepwise = append_message_log(stepwise, [write])
+
+        # Fresh copies: the reducer assigns IDs in place
+        replayed = append_message_log([], [
+            [HumanMessage(content="a")],
+            AIMessage(content="b"),
+            [ToolMessage(content="c", tool_call_id="1"), AIMessage(content="d")],
+        ])
+
+        assert [m.id for m in stepwise] == [m.id for m in replayed]
+        assert len({m.id for m in replayed}) == 4
+
+    def test_repeated_content_gets_distinct_ids(self):
+        messages = append_message_log([], [[AIMessage(content="same")], [AIMessage(content="same")]])
+        assert len(messages) == 2
+        assert messages[0].id != messages[1].id
+
+    def test_explicit_ids_and_tombstones(self):
+        messages = append_message_log([], [[HumanMessage(content="a", id="a"), AIMessage(content="b", id="b")]])
+        messages = append_message_log(messages, [[RemoveMessage(id="a"), AIMessage(content="c", id="b")]])
+        assert [(m.id, m.content) for m in messages] == [("b", "c")]
+
+
+class TestCheckpoints:
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_do_not_store_history(self, tmp_path):
+        path = tmp_path / "job.db"
+        result, largest_checkpoint = await _run(path, UniversalAgentState)
+
+        # 20 steps of ~4KB each, minus compaction, would be far larger
+        assert len(result["messages"]) > 10
+        assert largest_checkpoint < 4000
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_writes_and_tombstones(self, tmp_path):
+        path = tmp_path / "job.db"
+        result, _ = await _run(path, UniversalAgentState)
+
+        restored = await _load(path, UniversalAgentState)
+
+        assert [m.id for m in restored["messages"]] == [m.id for m in result["messages"]]
+        assert restored["iteration"] == 20
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_checkpoints(self, tmp_path):
+        path = tmp_path / "job.db"
+        result, _ = await _run(path, LegacyState)
+
+        restored = await _load(path, UniversalAgentState)
+
+        assert [m.id for m in restored["messages"]] == [m.id for m in result["messages"]]
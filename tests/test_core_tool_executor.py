@@ -0,0 +1,216 @@
+"""Tests for parallel tool call scheduling and the sync tool thread pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from src.core.tool_executor import (
+    ToolCallScheduler,
+    get_tool_thread_pool,
+    offload_sync_tools,
+    resolve_resources,
+    resources_overlap,
+    tool_access,
+)
+from src.core.tool_profile import ToolCallProfiler, instrument_tools
+from src.tools.registry import get_available_tools
+
+EVENTS: list = []
+
+
+@tool
+async def write_file(path: str, delay: float = 0.05) -> str:
+    """Write a file slowly."""
+    EVENTS.append(("start", "write", path))
+    await asyncio.sleep(delay)
+    EVENTS.append(("end", "write", path))
+    return f"wrote {path}"
+
+
+@tool
+async def read_file(path: str) -> str:
+    """Read a file."""
+    EVENTS.append(("start", "read", path))
+    await asyncio.sleep(0.01)
+    EVENTS.append(("end", "read", path))
+    return f"read {path}"
+
+
+@tool
+async def git_status(delay: float = 0.05) -> str:
+    """Run git."""
+    EVENTS.append(("start", "git", ""))
+    await asyncio.sleep(delay)
+    EVENTS.append(("end", "git", ""))
+    return "clean"
+
+
+@tool
+def sync_work(seconds: float) -> str:
+    """Block a thread."""
+    time.sleep(seconds)
+    return threading.current_thread().name
+
+
+DECLARATIONS = {
+    "write_file": {"category": "workspace", "writes": ["file:{path}"]},
+    "read_file": {"category": "workspace", "reads": ["file:{path}"]},
+    "git_status": {"category": "git", "reads": ["git"]},
+}
+
+
+def _state(*calls):
+    tool_calls = [
+        {"name": name, "args": args, "id": f"c{i}", "type": "tool_call"}
+        for i, (name, args) in enumerate(calls)
+    ]
+    return {"messages": [AIMessage(content="", tool_calls=tool_calls)]}
+
+
+def _graph(scheduler, tools):
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", ToolNode(tools, awrap_tool_call=scheduler))
+    graph.add_edge(START, "tools")
+    graph.add_edge("tools", END)
+    return graph.compile()
+
+
+async def _run(scheduler, tools, state):
+    scheduler.plan(state["messages"][-1].tool_calls)
+    return await _graph(scheduler, tools).ainvoke(state)
+
+
+def _span(kind, path=""):
+    start = EVENTS.index(("start", kind, path))
+    end = EVENTS.index(("end", kind, path))
+    return start, end
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    EVENTS.clear()
+
+
+class TestResources:
+
+    def test_templates_are_filled_from_arguments(self):
+        assert resolve_resources(["file:{path}", "todos"], {"path": "./docs//a.md"}) == [
+            ("file", "docs/a.md"),
+            ("todos", None),
+        ]
+
+    def test_missing_argument_is_whole_kind(self):
+        assert resolve_resources(["file:{path}"], {}) == [("file", "")]
+
+    def test_rename_target_is_resolved(self):
+        assert resolve_resources(
+            ["file:{path}/../{new_name}"], {"path": "docs/a.md", "new_name": "b.md"}
+        ) == [("file", "docs/b.md")]
+
+    def test_paths_overlap_hierarchically(self):
+        assert resources_overlap(("file", "docs"), ("file", "docs/a.md"))
+        assert resources_overlap(("file", ""), ("file", "notes.md"))
+        assert not resources_overlap(("file", "docs"), ("file", "docs2/a.md"))
+        assert not resources_overlap(("file", "a.md"), ("todos", None))
+
+    def test_reads_do_not_conflict_with_each_other(self):
+        meta = get_available_tools()
+        read_a = tool_access(meta["read_file"], {"path": "a.md"})
+        read_b = tool_access(meta["read_file"], {"path": "a.md"})
+        write_a = tool_access(meta["write_file"], {"path": "a.md", "content": ""})
+        delete_dir = tool_access(meta["delete_directory"], {"path": "docs"})
+
+        assert not read_a.conflicts_with(read_b)
+        assert write_a.conflicts_with(read_a)
+        assert delete_dir.conflicts_with(tool_access(meta["read_file"], {"path": "docs/x.md"}))
+        assert tool_access(meta["todo_complete"], {}).conflicts_with(tool_access(meta["todo_list"], {}))
+
+
+class TestToolCallScheduler:
+
+    @pytest.mark.asyncio
+    async def test_independent_calls_run_in_parallel(self):
+        scheduler = ToolCallScheduler(DECLARATIONS)
+        await _run(scheduler, [write_file], _state(
+            ("write_file", {"path": "a.md"}),
+            ("write_file", {"path": "b.md"}),
+        ))
+
+        a_start, a_end = _span("write", "a.md")
+        b_start, _ = _span("write", "b.md")
+        assert b_start < a_end
+
+    @pytest.mark.asyncio
+    async def test_conflicting_calls_keep_call_order(self):
+        scheduler = ToolCallScheduler(DECLARATIONS)
+        result = await _run(scheduler, [write_file, read_file], _state(
+            ("write_file", {"path": "a.md", "delay": 0.1}),
+            ("read_file", {"path": "a.md"}),
+            ("read_file", {"path": "b.md"}),
+        ))
+
+        _, write_end = _span("write", "a.md")
+        read_start, _ = _span("read", "a.md")
+        other_start, _ = _span("read", "b.md")
+        assert read_start > write_end
+        assert other_start < write_end
+        # Results come back in call order
+        assert [m.content for m in result["messages"][1:]] == ["wrote a.md", "read a.md", "read b.md"]
+
+    @pytest.mark.asyncio
+    async def test_category_limit(self):
+        scheduler = ToolCallScheduler(
+            {"git_status": {"category": "git"}}, category_limits={"git": 1}
+        )
+        await _run(scheduler, [git_status], _state(("git_status", {}), ("git_status", {})))
+
+        assert [kind for kind, _, _ in EVENTS] == ["start", "end", "start", "end"]
+
+    @pytest.mark.asyncio
+    async def test_inner_hook_excludes_waiting(self):
+        profiler = ToolCallProfiler()
+        scheduler = ToolCallScheduler(DECLARATIONS, inner=profiler)
+        await _run(scheduler, [write_file], _state(
+            ("write_file", {"path": "a.md", "delay": 0.2}),
+            ("write_file", {"path": "a.md", "delay": 0.01}),
+        ))
+
+        assert profiler.pop("c1").wall_seconds < 0.1
+
+    @pytest.mark.asyncio
+    async def test_failed_call_releases_dependents(self):
+        scheduler = ToolCallScheduler(DECLARATIONS)
+        result = await asyncio.wait_for(_run(scheduler, [read_file], _state(
+            ("write_file", {"path": "a.md"}),  # not bound: ToolNode reports an error
+            ("read_file", {"path": "a.md"}),
+        )), timeout=5)
+
+        assert result["messages"][-1].content == "read a.md"
+
+
+class TestSyncToolPool:
+
+    @pytest.mark.asyncio
+    async def test_sync_tools_run_in_tool_pool(self):
+        tools = offload_sync_tools(instrument_tools([sync_work]), get_tool_thread_pool(4))
+        scheduler = ToolCallScheduler({})
+
+        start = time.perf_counter()
+        result = await _run(scheduler, tools, _state(
+            ("sync_work", {"seconds": 0.2}),
+            ("sync_work", {"seconds": 0.2}),
+        ))
+
+        assert time.perf_counter() - start < 0.35
+        assert all(m.content.startswith("tool") for m in result["messages"][1:])
+
+    def test_signature_is_preserved(self):
+        offloaded = offload_sync_tools([sync_work], get_tool_thread_pool())[0]
+        assert offloaded.coroutine is not None
+        assert offloaded.args == sync_work.args
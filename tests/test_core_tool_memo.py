@@ -0,0 +1,171 @@
+"""Tests for memoization of repeated read-only tool calls."""
+
+from typing import Annotated, Any, List, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode
+
+from src.core.context import ContextConfig, ContextManager
+from src.core.tool_memo import ToolResultMemo
+
+CALLS: List[str] = []
+
+
+class State(TypedDict):
+    messages: Annotated[list, add_messages]
+    job_id: str
+    phase_number: int
+
+
+def make_tools(root):
+    @tool
+    def read_file(path: str) -> str:
+        """Read a file."""
+        CALLS.append(f"read {path}")
+        if not (root / path).exists():
+            return f"Error: File not found: {path}"
+        return (root / path).read_text()
+
+    @tool
+    def write_file(path: str, content: str) -> str:
+        """Write a file."""
+        CALLS.append(f"write {path}")
+        (root / path).write_text(content)
+        return f"Wrote {path}"
+
+    @tool
+    def sql_schema() -> str:
+        """Describe the database."""
+        CALLS.append("schema")
+        return "users(id, name)"
+
+    @tool
+    def sql_execute(statement: str) -> str:
+        """Change the database."""
+        CALLS.append("execute")
+        return "1 row affected"
+
+    return [read_file, write_file, sql_schema, sql_execute]
+
+
+DECLARATIONS = {
+    "read_file": {"read_only": True, "reads": ["file:{path}"]},
+    "write_file": {"writes": ["file:{path}"]},
+    "sql_schema": {"read_only": True, "reads": ["sql"]},
+    "sql_execute": {"writes": ["sql"]},
+}
+
+
+class Agent:
+    """Runs one tool call per turn and keeps the conversation."""
+
+    def __init__(self, root, keep_recent: int = 10):
+        self.memo = ToolResultMemo(
+            DECLARATIONS, keep_recent_tool_results=keep_recent, workspace_root=lambda job_id: root
+        )
+        graph = StateGraph(State)
+        graph.add_node("tools", ToolNode(make_tools(root), awrap_tool_call=self.memo))
+        graph.add_edge(START, "tools")
+        graph.add_edge("tools", END)
+        self.graph = graph.compile()
+        self.messages: List[Any] = []
+        self.turn = 0
+
+    async def call(self, name: str, phase: int = 1, **args) -> str:
+        self.turn += 1
+        call = {"name": name, "args": args, "id": f"call_{self.turn}", "type": "tool_call"}
+        self.messages.append(AIMessage(content="", tool_calls=[call]))
+        result = await self.graph.ainvoke(
+            {"messages": self.messages, "job_id": "job", "phase_number": phase}
+        )
+        self.messages = result["messages"]
+        return self.messages[-1].content
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / "notes.md").write_text("hello")
+    return Agent(tmp_path)
+
+
+class TestToolResultMemo:
+
+    @pytest.mark.asyncio
+    async def test_repeat_is_answered_from_memo(self, agent):
+        assert await agent.call("read_file", path="notes.md") == "hello"
+        repeat = await agent.call("read_file", path="notes.md")
+
+        assert repeat.startswith("Unchanged since call call_1")
+        assert CALLS == ["read notes.md"]
+
+    @pytest.mark.asyncio
+    async def test_declared_write_invalidates(self, agent):
+        await agent.call("read_file", path="notes.md")
+        await agent.call("write_file", path="notes.md", content="hello")
+
+        assert await agent.call("read_file", path="notes.md") == "hello"
+        assert CALLS.count("read notes.md") == 2
+
+    @pytest.mark.asyncio
+    async def test_file_change_outside_tools_invalidates(self, agent, tmp_path):
+        await agent.call("read_file", path="notes.md")
+        (tmp_path / "notes.md").write_text("changed elsewhere")
+
+        assert await agent.call("read_file", path="notes.md") == "changed elsewhere"
+
+    @pytest.mark.asyncio
+    async def test_datasource_write_counter(self, agent):
+        await agent.call("sql_schema")
+        assert (await agent.call("sql_schema")).startswith("Unchanged")
+
+        await agent.call("sql_execute", statement="ALTER TABLE users ADD email text")
+        assert await agent.call("sql_schema") == "users(id, name)"
+        assert CALLS == ["schema", "execute", "schema"]
+
+    @pytest.mark.asyncio
+    async def test_new_phase_starts_empty(self, agent):
+        await agent.call("read_file", path="notes.md", phase=1)
+        assert await agent.call("read_file", path="notes.md", phase=2) == "hello"
+
+    @pytest.mark.asyncio
+    async def test_result_out_of_view_is_rerun(self, tmp_path):
+        (tmp_path / "notes.md").write_text("hello")
+        agent = Agent(tmp_path, keep_recent=2)
+        await agent.call("read_file", path="notes.md")
+        await agent.call("sql_schema")
+        await agent.call("sql_schema")
+
+        assert await agent.call("read_file", path="notes.md") == "hello"
+
+    @pytest.mark.asyncio
+    async def test_referenced_result_survives_clearing(self, tmp_path):
+        (tmp_path / "notes.md").write_text("hello")
+        agent = Agent(tmp_path, keep_recent=3)
+        context = ContextManager(config=ContextConfig(keep_recent_tool_results=3))
+
+        await agent.call("read_file", path="notes.md")
+        for between in (2, 1, 0):
+            for _ in range(between):
+                await agent.call("sql_execute", statement="UPDATE users SET name = name")
+            result = await agent.call("read_file", path="notes.md")
+
+            prepared = context.clear_old_tool_results(agent.messages)
+            shown = {m.tool_call_id: m.content for m in prepared if isinstance(m, ToolMessage)}
+            if result.startswith("Unchanged since call "):
+                assert shown[result.split()[3].rstrip(":")] == "hello"
+        assert CALLS.count("read notes.md") == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_memoized(self, agent):
+        await agent.call("read_file", path="missing.md")
+        await agent.call("read_file", path="missing.md")
+        assert CALLS == ["read missing.md", "read missing.md"]
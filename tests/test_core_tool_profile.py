@@ -0,0 +1,136 @@
+"""Tests for per-call tool profiling."""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from src.core.tool_profile import (
+    TOOL_ERROR,
+    ToolCallProfiler,
+    instrument_tools,
+    is_error_content,
+)
+
+
+def _spin(seconds: float) -> None:
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+@tool
+async def slow_io(delay: float) -> str:
+    """Wait without using CPU."""
+    await asyncio.sleep(delay)
+    return "waited"
+
+
+@tool
+def busy(seconds: float) -> str:
+    """Burn CPU in a sync tool."""
+    _spin(seconds)
+    return "x" * 1000
+
+
+@tool
+async def reports_error() -> str:
+    """Report a failure in the result text."""
+    return "Error: document not found"
+
+
+@tool
+async def explodes() -> str:
+    """Raise."""
+    raise KeyError("boom")
+
+
+def _state(*calls):
+    tool_calls = [
+        {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+        for name, args, call_id in calls
+    ]
+    return {"messages": [AIMessage(content="", tool_calls=tool_calls)]}
+
+
+@pytest.fixture
+def node():
+    """Profiled ToolNode, run inside a graph (ToolNode needs a graph runtime)."""
+    profiler = ToolCallProfiler()
+    tools = [slow_io, busy, reports_error, explodes]
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", ToolNode(instrument_tools(tools), awrap_tool_call=profiler))
+    graph.add_edge(START, "tools")
+    graph.add_edge("tools", END)
+    return graph.compile(), profiler
+
+
+class TestToolCallProfiler:
+    """Each concurrent call gets its own measurements."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_timed_individually(self, node):
+        tool_node, profiler = node
+        await tool_node.ainvoke(_state(
+            ("slow_io", {"delay": 0.3}, "c1"),
+            ("busy", {"seconds": 0.05}, "c2"),
+        ))
+
+        io_profile = profiler.pop("c1")
+        cpu_profile = profiler.pop("c2")
+        assert io_profile.tool == "slow_io"
+        assert io_profile.wall_seconds >= 0.3
+        # Sleeping is not CPU time
+        assert io_profile.cpu_seconds < 0.05
+        assert cpu_profile.wall_seconds < io_profile.wall_seconds
+        # Sync tool CPU is measured on the executor thread
+        assert cpu_profile.cpu_seconds >= 0.05
+        assert cpu_profile.result_bytes == 1000
+        assert cpu_profile.success
+
+    @pytest.mark.asyncio
+    async def test_reported_error(self, node):
+        tool_node, profiler = node
+        await tool_node.ainvoke(_state(("reports_error", {}, "c1")))
+
+        profile = profiler.pop("c1")
+        assert profile.error_class == TOOL_ERROR
+        assert not profile.success
+        assert profile.result_bytes == len("Error: document not found")
+
+    @pytest.mark.asyncio
+    async def test_raised_error_class(self, node):
+        tool_node, profiler = node
+        with pytest.raises(KeyError):
+            await tool_node.ainvoke(_state(("explodes", {}, "c1")))
+
+        assert profiler.pop("c1").error_class == "KeyError"
+
+    @pytest.mark.asyncio
+    async def test_pop_removes_profile(self, node):
+        tool_node, profiler = node
+        await tool_node.ainvoke(_state(("reports_error", {}, "c1")))
+
+        assert profiler.pop("c1") is not None
+        assert profiler.pop("c1") is None
+
+
+class TestInstrumentTools:
+
+    def test_only_sync_tools_are_copied(self):
+        instrumented = instrument_tools([slow_io, busy])
+        assert instrumented[0] is slow_io
+        assert instrumented[1] is not busy
+        assert instrumented[1].name == "busy"
+        assert busy.invoke({"seconds": 0}) == instrumented[1].invoke({"seconds": 0})
+
+
+def test_is_error_content():
+    assert is_error_content("Error: nope")
+    assert is_error_content("Download failed: 404")
+    assert not is_error_content("All good")
+    assert not is_error_content("")
@@ -0,0 +1,146 @@
+"""Tests for the tool result spill store and recall_tool_result."""
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+
+from src.core.context import ContextConfig, ContextManager
+from src.core.tool_results import (
+    HANDLE_KEY,
+    ToolResultStore,
+    get_result_handle,
+    result_handle,
+    spill_tool_message,
+)
+from src.tools.context import ToolContext
+from src.tools.core.results import create_result_tools
+
+
+@pytest.fixture(autouse=True)
+def workspace_base(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORKSPACE_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def store():
+    return ToolResultStore("job-1")
+
+
+def tool_message(content: str, call_id: str = "c1") -> ToolMessage:
+    return ToolMessage(content=content, tool_call_id=call_id, name="web_search")
+
+
+class TestToolResultStore:
+
+    def test_put_and_read(self, store, workspace_base):
+        content = "".join(str(i % 10) for i in range(10000))
+        handle = store.put(content)
+
+        assert handle == result_handle(content)
+        assert (workspace_base / "tool_results" / "job_job-1" / f"{handle}.txt").exists()
+        assert store.get(handle) == content
+        assert store.read(handle, start=5000, length=10) == content[5000:5010]
+        assert store.read(handle, start=9995) == content[9995:]
+
+    def test_identical_content_shares_handle(self, store):
+        assert store.put("same" * 1000) == store.put("same" * 1000)
+        assert store.put("same" * 1000) != store.put("other" * 1000)
+
+    def test_unknown_handle(self, store):
+        assert store.get("tr_0000000000000000") is None
+
+    def test_invalid_handle_rejected(self, store):
+        with pytest.raises(ValueError):
+            store.get("../../etc/passwd")
+
+
+class TestSpillToolMessage:
+
+    def test_spills_large_results(self, store):
+        message = tool_message("x" * 3000)
+        handle = spill_tool_message(message, store, min_chars=2000)
+
+        assert handle is not None
+        assert get_result_handle(message) == handle
+        assert message.content == "x" * 3000
+        assert store.get(handle) == "x" * 3000
+
+    def test_small_and_multimodal_results_are_kept(self, store):
+        small = tool_message("short")
+        image = ToolMessage(content=[{"type": "image_url", "image_url": {"url": "data:"}}], tool_call_id="c2")
+
+        assert spill_tool_message(small, store, min_chars=2000) is None
+        assert spill_tool_message(image, store, min_chars=1) is None
+        assert HANDLE_KEY not in small.additional_kwargs
+
+
+class TestCompactionKeepsHandles:
+
+    @pytest.fixture
+    def manager(self):
+        return ContextManager(config=ContextConfig(
+            keep_recent_tool_results=1,
+            max_tool_result_length=100,
+            spilled_preview_chars=20,
+        ))
+
+    def _history(self, store):
+        spilled = tool_message("a" * 3000, "c1")
+        spill_tool_message(spilled, store, min_chars=2000)
+        return [
+            AIMessage(content="", tool_calls=[{"name": "web_search", "args": {}, "id": "c1"}]),
+            spilled,
+            AIMessage(content="", tool_calls=[{"name": "web_search", "args": {}, "id": "c2"}]),
+            tool_message("b" * 3000, "c2"),
+        ], get_result_handle(spilled)
+
+    def test_cleared_result_keeps_handle_and_preview(self, manager, store):
+        messages, handle = self._history(store)
+        cleared = manager.clear_old_tool_results(messages)[1]
+
+        assert handle in cleared.content
+        assert "recall_tool_result" in cleared.content
+        assert "a" * 20 + "..." in cleared.content
+        assert len(cleared.content) < 200
+
+    def test_unspilled_result_uses_placeholder(self, manager):
+        messages = [tool_message("a" * 3000, "c1"), tool_message("b", "c2")]
+        cleared = manager.clear_old_tool_results(messages)[0]
+        assert cleared.content == manager.config.placeholder_text
+
+    def test_truncated_result_points_at_rest(self, manager, store):
+        messages, handle = self._history(store)
+        truncated = manager.truncate_long_tool_results(messages)[1]
+
+        assert truncated.content.startswith("a" * 100)
+        assert f'recall_tool_result(handle="{handle}", start=100)' in truncated.content
+
+
+class TestRecallToolResult:
+
+    @pytest.fixture
+    def recall(self):
+        context = ToolContext()
+        context.job_id = "job-1"
+        return create_result_tools(context)[0]
+
+    def test_returns_slice(self, recall, store):
+        content = "".join(str(i % 10) for i in range(12000))
+        handle = store.put(content)
+
+        result = recall.invoke({"handle": handle, "start": 100, "length": 50})
+
+        assert result.splitlines()[0] == f"[{handle}: chars 100-150 of 12000]"
+        assert content[100:150] in result
+        assert "start=150" in result
+
+    def test_reads_to_end(self, recall, store):
+        handle = store.put("tail" * 1000)
+        result = recall.invoke({"handle": handle, "start": 3990})
+        assert result == f"[{handle}: chars 3990-4000 of 4000]\niltailtail"
+
+    def test_errors(self, recall, store):
+        handle = store.put("x" * 3000)
+        assert recall.invoke({"handle": "tr_0000000000000000"}).startswith("Error")
+        assert recall.invoke({"handle": "bogus"}).startswith("Error")
+        assert recall.invoke({"handle": handle, "start": 5000}).startswith("Error")
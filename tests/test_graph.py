@@ -1394,3 +1394,52 @@ class TestEnsureWithinLimits:
 
         # Should return same messages since there's nothing to summarize
         assert result == messages
+
+
+# =============================================================================
+# EXECUTE NODE ERROR PATH TESTS
+# =============================================================================
+
+
+class TestExecuteNodeErrors:
+    """Tests for execute node returns when the LLM call fails."""
+
+    @staticmethod
+    def build_execute(managers, llm, context_mgr):
+        from src.core.context import ToolRetryManager
+        from src.core.loader import load_agent_config_from_dict
+        from src.graph import create_execute_node
+
+        config = load_agent_config_from_dict({"agent_id": "test", "display_name": "Test"})
+        return create_execute_node(
+            strategic_llm_with_tools=llm,
+            tactical_llm_with_tools=llm,
+            todo_manager=managers["todo"],
+            memory_manager=managers["memory"],
+            workspace_manager=managers["workspace"],
+            config=config,
+            context_mgr=context_mgr,
+            retry_manager=ToolRetryManager(max_retries=0),
+            summarization_llm=MagicMock(),
+            summarization_prompt="",
+        )
+
+    @pytest.mark.asyncio
+    async def test_llm_error_keeps_taken_background_summary(self, managers, monkeypatch):
+        """A background summary taken before a failed LLM call is still persisted."""
+        from langchain_core.messages import HumanMessage, RemoveMessage, SystemMessage
+        from src.core.context import ContextManager
+
+        history = [HumanMessage(content=f"message {i}", id=f"m{i}") for i in range(4)]
+        update = [RemoveMessage(id="m1"), SystemMessage(content="summary", id="m0")]
+        context_mgr = ContextManager()
+        monkeypatch.setattr(context_mgr, "take_background_summary", AsyncMock(return_value=update))
+
+        llm = MagicMock()
+        llm.invoke.side_effect = RuntimeError("upstream unavailable")
+        execute = self.build_execute(managers, llm, context_mgr)
+
+        result = await execute({"job_id": "test-job-123", "messages": history, "iteration": 0})
+
+        assert result["error"]["type"] == "llm_error"
+        assert result["messages"] == update
@@ -0,0 +1,118 @@
+"""Tests for the tool schema registry and cached tool token counts."""
+
+import pytest
+
+from src.llm import reasoning_chat
+from src.llm.reasoning_chat import count_request_tokens
+from src.llm.tool_schemas import ToolSchemaRegistry, get_tool_schema_registry
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "read_file",
+            "description": "Read a file from the workspace",
+            "parameters": {"type": "object", "properties": {"path": {"type": "string"}}},
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "web_search",
+            "description": "Search the web",
+            "parameters": {"type": "object", "properties": {"query": {"type": "string"}}},
+        },
+    },
+]
+
+
+class CountingEncoding:
+    """Stand-in tiktoken encoding (one token per 4 chars) counting encode() calls."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return [0] * (len(text) // 4 + 1)
+
+
+class TestToolSchemaRegistry:
+
+    def test_same_tool_set_registered_once(self):
+        registry = ToolSchemaRegistry()
+        reordered = [
+            {"function": dict(reversed(list(t["function"].items()))), "type": t["type"]} for t in TOOLS
+        ]
+
+        first = registry.register(TOOLS, phase="tactical")
+        assert registry.register(reordered) is first
+        assert first.schema_hash.startswith("ts_")
+        assert first.tool_count == 2
+        assert registry.get(first.schema_hash) is first
+        assert len(registry) == 1
+
+    def test_different_tool_sets_differ(self):
+        registry = ToolSchemaRegistry()
+        assert registry.register(TOOLS).schema_hash != registry.register(TOOLS[:1]).schema_hash
+
+    def test_least_recently_used_set_evicted(self):
+        registry = ToolSchemaRegistry(max_sets=1)
+        first = registry.register(TOOLS)
+        registry.register(TOOLS[:1])
+        assert registry.get(first.schema_hash) is None
+
+    def test_lookup_by_tool_names_skips_serialization(self, monkeypatch):
+        from src.llm import tool_schemas
+
+        registry = ToolSchemaRegistry()
+        registered = registry.register(TOOLS, phase="tactical")
+
+        def fail(schemas):
+            raise AssertionError("tool set serialized again")
+
+        monkeypatch.setattr(tool_schemas, "serialize_tool_schemas", fail)
+        request_tools = [dict(t) for t in TOOLS]
+        assert registry.lookup(request_tools) is registered
+
+    def test_lookup_registers_unknown_tool_set(self):
+        registry = ToolSchemaRegistry(max_sets=1)
+        registry.register(TOOLS)
+        registry.register(TOOLS[1:])
+
+        tool_set = registry.lookup(TOOLS)
+        assert tool_set.tool_count == 2
+        assert registry.get(tool_set.schema_hash) is tool_set
+
+    def test_token_count_encoded_once(self):
+        tool_set = ToolSchemaRegistry().register(TOOLS)
+        encoding = CountingEncoding()
+
+        count = tool_set.token_count(encoding)
+        assert count == tool_set.token_count(encoding)
+        assert encoding.calls == len(TOOLS)
+
+
+class TestCountRequestTokens:
+
+    @pytest.fixture
+    def encoding(self, monkeypatch):
+        encoding = CountingEncoding()
+        monkeypatch.setattr(reasoning_chat, "TIKTOKEN_AVAILABLE", True)
+        monkeypatch.setattr(reasoning_chat, "_get_encoding", lambda model: encoding)
+        return encoding
+
+    def test_tool_definitions_counted_once_per_tool_set(self, encoding):
+        body = {"messages": [{"role": "user", "content": "hi"}], "tools": TOOLS}
+
+        first = count_request_tokens(body)
+        calls_after_first = encoding.calls
+        assert count_request_tokens(body) == first
+        # Only the message is encoded again (role and content)
+        assert encoding.calls - calls_after_first == 2
+
+        tool_set = get_tool_schema_registry().register(TOOLS)
+        without_tools = count_request_tokens({"messages": body["messages"]})
+        assert first - without_tools == tool_set.token_count(encoding)
@@ -16,7 +16,7 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.managers.git_manager import GitManager  # noqa: E402
+from src.managers.git_manager import GitCommitWorker, GitManager  # noqa: E402
 
 
 @pytest.fixture
@@ -174,6 +174,36 @@ class TestGitManagerCommit:
         result = git_manager.commit("Test")
         assert result is False
 
+    def test_commit_stages_only_given_paths(self, initialized_git, temp_workspace):
+        """Test that paths= limits staging to the reported files."""
+        (temp_workspace / "reported.txt").write_text("reported")
+        (temp_workspace / "unreported.txt").write_text("unreported")
+
+        assert initialized_git.commit("Selective", paths=["reported.txt"]) is True
+
+        show = initialized_git.show(stat_only=True)
+        assert "reported.txt" in show
+        assert "unreported.txt" not in show
+        assert initialized_git.has_uncommitted_changes() is True
+
+    def test_commit_paths_handles_deleted_and_vanished_files(self, initialized_git, temp_workspace):
+        """Test that deleted tracked files are staged and vanished ones ignored."""
+        (temp_workspace / "gone.txt").write_text("x")
+        initialized_git.commit("Add gone.txt")
+        (temp_workspace / "gone.txt").unlink()
+
+        result = initialized_git.commit("Delete", paths=["gone.txt", "never-existed.txt"])
+        assert result is True
+        assert initialized_git.has_uncommitted_changes() is False
+
+    def test_commit_paths_falls_back_for_ignored_files(self, initialized_git, temp_workspace):
+        """Test that an explicitly named ignored file does not fail the commit."""
+        (temp_workspace / "debug.log").write_text("ignored")
+        (temp_workspace / "kept.txt").write_text("kept")
+
+        assert initialized_git.commit("Mixed", paths=["debug.log", "kept.txt"]) is True
+        assert "kept.txt" in initialized_git.show(stat_only=True)
+
 
 class TestGitManagerLog:
     """Tests for log functionality."""
@@ -628,3 +658,61 @@ class TestGitManagerExistingRepo:
         # Should still see existing commit
         log = gm.log()
         assert "Existing commit" in log
+
+
+class TestGitCommitWorker:
+    """Tests for background commit coalescing."""
+
+    def _subjects(self, gm):
+        return gm._run_git(["log", "--format=%s"]).stdout.splitlines()
+
+    def test_rapid_submissions_coalesce(self, initialized_git, temp_workspace):
+        """Test that submissions within the window become one commit."""
+        worker = GitCommitWorker(initialized_git, batch_seconds=0.5)
+        for i in range(3):
+            (temp_workspace / f"f{i}.txt").write_text(str(i))
+            worker.submit(f"todo_{i}: task {i}", paths=[f"f{i}.txt"])
+
+        assert worker.flush(timeout=10) is True
+        subjects = self._subjects(initialized_git)
+        assert subjects[0] == "todo_0: task 0 (+2 more)"
+        assert "Initialize workspace" in subjects[1]
+        assert initialized_git.has_uncommitted_changes() is False
+
+        body = initialized_git._run_git(["log", "-1", "--format=%b"]).stdout
+        assert "todo_2: task 2" in body
+        assert worker.get_stats()["commits"] == 1
+        worker.close()
+
+    def test_flush_is_a_barrier_for_tags(self, initialized_git, temp_workspace):
+        """Test that a tag placed after flush() covers submitted commits."""
+        worker = GitCommitWorker(initialized_git, batch_seconds=5)
+        (temp_workspace / "work.txt").write_text("done")
+        worker.submit("todo_1: work", paths=["work.txt"])
+
+        # flush() must not wait out the 5s window
+        assert worker.flush(timeout=3) is True
+        initialized_git.tag("phase-1-tactical-complete")
+
+        tagged = initialized_git._run_git(["show", "--stat", "phase-1-tactical-complete"]).stdout
+        assert "work.txt" in tagged
+        worker.close()
+
+    def test_submission_without_paths_stages_everything(self, initialized_git, temp_workspace):
+        """Test that paths=None in a batch stages the whole workspace."""
+        worker = GitCommitWorker(initialized_git, batch_seconds=0.2)
+        (temp_workspace / "a.txt").write_text("a")
+        (temp_workspace / "b.txt").write_text("b")
+        worker.submit("todo_1", paths=["a.txt"])
+        worker.submit("todo_2", paths=None)
+
+        worker.flush(timeout=10)
+        assert initialized_git.has_uncommitted_changes() is False
+        worker.close()
+
+    def test_zero_window_commits_synchronously(self, initialized_git):
+        """Test that batch_seconds=0 commits inside submit()."""
+        worker = GitCommitWorker(initialized_git, batch_seconds=0)
+        worker.submit("Synchronous commit")
+        assert self._subjects(initialized_git)[0] == "Synchronous commit"
+        assert worker.pending_count == 0
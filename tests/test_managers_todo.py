@@ -911,6 +911,7 @@ class TestTodoManagerAutoCommit:
         todo_manager.is_strategic_phase = False
 
         todo_manager.complete("todo_1")
+        workspace_manager.flush_commits()
 
         # Verify commit was called with correct message format
         mock_git.commit.assert_called_once()
@@ -936,6 +937,7 @@ class TestTodoManagerAutoCommit:
 
         todo_manager.add("Process data")
         todo_manager.complete("todo_1", notes=["Found 10 items"])
+        workspace_manager.flush_commits()
 
         message = mock_git.commit.call_args[0][0]
         assert "Notes:" in message
@@ -955,6 +957,7 @@ class TestTodoManagerAutoCommit:
 
         todo_manager.add("Review document")
         todo_manager.complete("todo_1")
+        workspace_manager.flush_commits()
 
         # Verify allow_empty=True was passed
         call_kwargs = mock_git.commit.call_args[1]
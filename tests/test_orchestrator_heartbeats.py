@@ -0,0 +1,143 @@
+"""Tests for the orchestrator in-memory heartbeat table."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.services.heartbeats import HeartbeatTable
+
+
+class FakePostgres:
+    """Records the writes the heartbeat table issues."""
+
+    def __init__(self, agents=None):
+        self.agents = {a["id"]: dict(a) for a in (agents or [])}
+        self.heartbeat_calls = []
+        self.flushes = []
+        self.offline_calls = []
+
+    async def list_agents(self, limit=100):
+        return list(self.agents.values())
+
+    async def heartbeat(self, agent_id, status, current_job_id=None, metrics=None):
+        self.heartbeat_calls.append((agent_id, status, current_job_id))
+        if agent_id not in self.agents:
+            return False
+        self.agents[agent_id].update(status=status, current_job_id=current_job_id)
+        return True
+
+    async def flush_heartbeats(self, heartbeats):
+        self.flushes.append(heartbeats)
+        return len(heartbeats)
+
+    async def mark_agents_offline(self, agent_ids):
+        self.offline_calls.append(list(agent_ids))
+        marked = []
+        for agent_id in agent_ids:
+            if self.agents.get(agent_id, {}).get("status") not in (None, "offline", "failed"):
+                self.agents[agent_id]["status"] = "offline"
+                marked.append(agent_id)
+        return marked
+
+
+def _agent(agent_id, status="ready"):
+    return {"id": agent_id, "status": status, "current_job_id": None, "last_heartbeat": None}
+
+
+class TestHeartbeatTable:
+    """Tests for HeartbeatTable."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_beats_are_batched(self):
+        db = FakePostgres([_agent("a1"), _agent("a2")])
+        table = HeartbeatTable(db, timeout_seconds=60, flush_seconds=60)
+        await table.load()
+
+        for _ in range(5):
+            assert await table.record("a1", "ready", metrics={"cpu_percent": 1})
+            assert await table.record("a2", "ready")
+
+        assert db.heartbeat_calls == []
+        assert await table.flush() == 2
+        assert len(db.flushes) == 1
+        assert {hb["agent_id"] for hb in db.flushes[0]} == {"a1", "a2"}
+        assert await table.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_transitions_write_through_and_notify(self):
+        changes = []
+        db = FakePostgres([_agent("a1")])
+        table = HeartbeatTable(
+            db, timeout_seconds=60, on_change=lambda *args: changes.append(args)
+        )
+        await table.load()
+
+        await table.record("a1", "working", "job-1")
+        await table.record("a1", "working", "job-1")
+
+        assert db.heartbeat_calls == [("a1", "working", "job-1")]
+        assert changes == [("a1", ("ready", None), ("working", "job-1"))]
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent_returns_false(self):
+        table = HeartbeatTable(FakePostgres(), timeout_seconds=60)
+        assert await table.record("missing", "ready") is False
+
+    @pytest.mark.asyncio
+    async def test_missed_deadline_marks_offline_promptly(self):
+        changes = []
+        db = FakePostgres([_agent("a1"), _agent("a2")])
+        table = HeartbeatTable(
+            db, timeout_seconds=0.2, flush_seconds=60,
+            on_change=lambda *args: changes.append(args),
+        )
+        await table.load()
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(table.run(shutdown))
+
+        # a2 keeps beating, a1 goes silent
+        for _ in range(4):
+            await asyncio.sleep(0.1)
+            await table.record("a2", "ready")
+
+        assert db.agents["a1"]["status"] == "offline"
+        assert db.agents["a2"]["status"] == "ready"
+        assert ("a1", ("ready", None), ("offline", None)) in changes
+        assert not table.is_alive("a1")
+        assert table.is_alive("a2")
+
+        shutdown.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_offline_agent_recovers_on_next_beat(self):
+        db = FakePostgres([_agent("a1", status="offline")])
+        table = HeartbeatTable(db, timeout_seconds=60)
+        await table.load()
+
+        assert await table.record("a1", "ready")
+        assert db.agents["a1"]["status"] == "ready"
+        assert table.is_alive("a1")
+
+    @pytest.mark.asyncio
+    async def test_failed_offline_write_is_retried(self):
+        class FlakyPostgres(FakePostgres):
+            failures = 1
+
+            async def mark_agents_offline(self, agent_ids):
+                if self.failures:
+                    self.failures -= 1
+                    raise ConnectionError("database unavailable")
+                return await super().mark_agents_offline(agent_ids)
+
+        db = FlakyPostgres([_agent("a1")])
+        table = HeartbeatTable(db, timeout_seconds=0.05, flush_seconds=60)
+        await table.load()
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(ConnectionError):
+            await table.expire_due()
+        assert db.agents["a1"]["status"] == "ready"
+
+        assert await table.expire_due() == ["a1"]
+        assert db.agents["a1"]["status"] == "offline"
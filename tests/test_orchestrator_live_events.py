@@ -0,0 +1,173 @@
+"""Tests for the orchestrator live event broker."""
+
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from orchestrator.services.live_events import (
+    JobEventBroker,
+    decode_event_id,
+    encode_event_id,
+)
+
+
+class FakeMongo:
+    """In-memory stand-in for the MongoDB methods used by the broker."""
+
+    is_available = True
+
+    def __init__(self):
+        self.collections = {"agent_audit": [], "chat_history": []}
+        self.tail_queries = 0
+
+    def insert(self, collection, job_id, sort_value):
+        sort_field = "step_number" if collection == "agent_audit" else "sequence_number"
+        doc_id = f"{len(self.collections[collection]) + 1:024x}"
+        self.collections[collection].append({"_id": doc_id, "job_id": job_id, sort_field: sort_value})
+
+    async def supports_change_streams(self):
+        return False
+
+    async def get_last_position(self, collection, job_id, sort_field):
+        docs = [d for d in self.collections[collection] if d["job_id"] == job_id]
+        if not docs:
+            return None
+        return (docs[-1][sort_field], docs[-1]["_id"])
+
+    async def get_entries_after(self, collection, job_id, sort_field, after, limit):
+        self.tail_queries += 1
+        if after is not None:
+            ObjectId(after[1])  # raises InvalidId like the real query
+        docs = [
+            dict(d) for d in self.collections[collection]
+            if d["job_id"] == job_id and (after is None or (d[sort_field], d["_id"]) > after)
+        ]
+        return docs[:limit]
+
+
+async def _next_event(events):
+    """Next non-keepalive event from a subscription iterator."""
+    while True:
+        event = await asyncio.wait_for(events.__anext__(), timeout=2)
+        if event is not None:
+            return event
+
+
+class TestEventIds:
+    """Tests for resume token encoding."""
+
+    def test_round_trip(self):
+        token = encode_event_id({"audit": (5, "a" * 24), "chat": None})
+        assert decode_event_id(token) == {"audit": (5, "a" * 24), "chat": None}
+
+    def test_malformed_token_starts_live(self):
+        assert decode_event_id("%%%") == {"audit": None, "chat": None}
+
+    def test_invalid_positions_are_dropped(self):
+        token = encode_event_id({"audit": (1, "zzz"), "chat": ("x", "a" * 24)})
+        assert decode_event_id(token) == {"audit": None, "chat": None}
+
+        token = encode_event_id({"audit": (True, "a" * 24), "chat": (3, "b" * 24)})
+        assert decode_event_id(token) == {"audit": None, "chat": (3, "b" * 24)}
+
+
+class TestJobEventBroker:
+    """Tests for fan-out and resume in tail mode."""
+
+    @pytest.mark.asyncio
+    async def test_viewers_share_one_upstream(self):
+        mongo = FakeMongo()
+        mongo.insert("agent_audit", "job-1", 1)
+        broker = JobEventBroker(mongo, poll_interval=0.01)
+        await broker.start()
+        assert broker.mode == "tail"
+
+        async with broker.subscribe("job-1") as first, broker.subscribe("job-1") as second:
+            assert broker.get_stats()["upstream_subscriptions"] == 1
+            assert broker.get_stats()["viewers"] == 2
+
+            first_events = first.events(keepalive=0.05)
+            second_events = second.events(keepalive=0.05)
+            await asyncio.sleep(0.05)
+            mongo.insert("agent_audit", "job-1", 2)
+            mongo.insert("chat_history", "job-1", 1)
+            mongo.insert("agent_audit", "job-2", 1)
+
+            for events in (first_events, second_events):
+                audit = await _next_event(events)
+                chat = await _next_event(events)
+                assert (audit["event"], audit["data"]["step_number"]) == ("audit", 2)
+                assert (chat["event"], chat["data"]["sequence_number"]) == ("chat", 1)
+
+            await first_events.aclose()
+            await second_events.aclose()
+
+        assert broker.get_stats()["watched_jobs"] == 0
+        await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_resume_backfills_missed_entries(self):
+        mongo = FakeMongo()
+        for step in range(1, 4):
+            mongo.insert("agent_audit", "job-1", step)
+        broker = JobEventBroker(mongo, poll_interval=0.01)
+        await broker.start()
+
+        resume_id = encode_event_id({"audit": (1, f"{1:024x}")})
+        async with broker.subscribe("job-1", last_event_id=resume_id) as sub:
+            events = sub.events(keepalive=0.05)
+            steps = [(await _next_event(events))["data"]["step_number"] for _ in range(2)]
+            assert steps == [2, 3]
+
+            mongo.insert("agent_audit", "job-1", 4)
+            event = await _next_event(events)
+            assert event["data"]["step_number"] == 4
+            assert decode_event_id(event["id"])["audit"] == (4, f"{4:024x}")
+            await events.aclose()
+
+        await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_bad_last_event_id_starts_live(self):
+        mongo = FakeMongo()
+        mongo.insert("agent_audit", "job-1", 1)
+        broker = JobEventBroker(mongo, poll_interval=0.01)
+        await broker.start()
+
+        bad_id = encode_event_id({"audit": (1, "zzz")})
+        async with broker.subscribe("job-1", last_event_id=bad_id) as sub:
+            events = sub.events(keepalive=0.05)
+            await asyncio.sleep(0.05)
+            mongo.insert("agent_audit", "job-1", 2)
+            event = await _next_event(events)
+            assert event["data"]["step_number"] == 2
+            await events.aclose()
+
+        await broker.stop()
+
+    @pytest.mark.asyncio
+    async def test_every_stream_resumes_after_reconnect(self):
+        mongo = FakeMongo()
+        mongo.insert("agent_audit", "job-1", 1)
+        broker = JobEventBroker(mongo, poll_interval=0.01)
+        await broker.start()
+
+        async with broker.subscribe("job-1") as sub:
+            events = sub.events(keepalive=0.05)
+            await asyncio.sleep(0.05)
+            mongo.insert("agent_audit", "job-1", 2)
+            last_id = (await _next_event(events))["id"]
+            await events.aclose()
+
+        # Chat entries written while disconnected, though the viewer never saw one
+        mongo.insert("chat_history", "job-1", 1)
+        mongo.insert("chat_history", "job-1", 2)
+
+        async with broker.subscribe("job-1", last_event_id=last_id) as sub:
+            events = sub.events(keepalive=0.05)
+            chats = [(await _next_event(events))["data"]["sequence_number"] for _ in range(2)]
+            assert chats == [1, 2]
+            await events.aclose()
+
+        await broker.stop()
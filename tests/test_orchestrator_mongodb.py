@@ -0,0 +1,254 @@
+"""Tests for keyset pagination in the orchestrator MongoDB layer."""
+
+import pytest
+from bson import ObjectId
+
+from orchestrator.database.mongodb import (
+    InvalidCursorError,
+    MongoDB,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _matches(doc, query):
+    """Evaluate the subset of MongoDB query syntax used by the bulk queries."""
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = doc
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if isinstance(cond, dict) and "$gt" in cond:
+            if value is None or not value > cond["$gt"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeCursor:
+    """Minimal async cursor supporting sort/skip/limit/to_list."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, keys):
+        for field, _ in reversed(keys):
+            self._docs = sorted(self._docs, key=lambda d: d[field])
+        return self
+
+    def skip(self, n):
+        self._docs = self._docs[n:]
+        return self
+
+    def limit(self, n):
+        self._docs = self._docs[:n]
+        return self
+
+    async def to_list(self, length):
+        return [dict(d) for d in self._docs[:length]]
+
+
+class FakeCollection:
+    """In-memory collection recording how many documents each find() returns."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.count_calls = 0
+
+    def find(self, query, projection=None):
+        return FakeCursor([d for d in self.docs if _matches(d, query)])
+
+    async def count_documents(self, query):
+        self.count_calls += 1
+        return sum(1 for d in self.docs if _matches(d, query))
+
+    async def find_one(self, query, projection=None, sort=None):
+        return next((dict(d) for d in self.docs if _matches(d, query)), None)
+
+
+@pytest.fixture
+def audit_db():
+    """MongoDB instance backed by a fake agent_audit collection."""
+    docs = []
+    for step in range(12):
+        doc = {"_id": ObjectId(), "job_id": "job-1", "step_number": step, "step_type": "llm"}
+        if step % 3 == 0:
+            doc["step_type"] = "tool"
+            doc["tool"] = {"name": "execute_cypher_query", "arguments": {"query": f"Q{step}"}}
+        docs.append(doc)
+    # Duplicate step number to exercise the _id tiebreaker
+    docs.append({"_id": ObjectId(), "job_id": "job-1", "step_number": 5, "step_type": "llm"})
+    docs.append({"_id": ObjectId(), "job_id": "job-2", "step_number": 0, "step_type": "llm"})
+
+    db = MongoDB(url="mongodb://unused")
+    db._available = True
+    db._db = {"agent_audit": FakeCollection(docs), "chat_history": FakeCollection([])}
+    return db
+
+
+class TestCursorEncoding:
+    """Tests for continuation token helpers."""
+
+    def test_round_trip(self):
+        oid = ObjectId()
+        token = encode_cursor("job-1", 42, oid, 100)
+        position = decode_cursor(token, "job-1")
+        assert position == {"j": "job-1", "k": 42, "id": str(oid), "i": 100}
+
+    def test_rejects_other_job(self):
+        token = encode_cursor("job-1", 1, ObjectId(), 1)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "job-2")
+
+    def test_rejects_garbage(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor!!", "job-1")
+
+
+class TestKeysetPagination:
+    """Tests for cursor-based bulk queries."""
+
+    @pytest.mark.asyncio
+    async def test_walks_all_entries_once(self, audit_db):
+        seen = []
+        result = await audit_db.get_job_audit_bulk("job-1", limit=5)
+        assert result["total"] == 13
+        seen.extend(result["entries"])
+
+        while result["hasMore"]:
+            result = await audit_db.get_job_audit_bulk(
+                "job-1", limit=5, cursor=result["nextCursor"], include_total=False
+            )
+            assert result["total"] is None
+            seen.extend(result["entries"])
+
+        assert len(seen) == 13
+        assert len({e["_id"] for e in seen}) == 13
+        assert [e["step_number"] for e in seen] == sorted(e["step_number"] for e in seen)
+        assert result["nextCursor"] is None
+        assert audit_db._db["agent_audit"].count_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_graph_delta_index_continues_across_pages(self, audit_db):
+        first = await audit_db.get_graph_deltas_bulk("job-1", limit=2)
+        second = await audit_db.get_graph_deltas_bulk(
+            "job-1", limit=2, cursor=first["nextCursor"], include_total=False
+        )
+
+        assert [d["toolCallIndex"] for d in first["deltas"]] == [0, 1]
+        assert [d["toolCallIndex"] for d in second["deltas"]] == [2, 3]
+        assert second["deltas"][0]["cypherQuery"] == "Q6"
+        assert second["hasMore"] is False
+
+    @pytest.mark.asyncio
+    async def test_offset_still_supported(self, audit_db):
+        result = await audit_db.get_job_audit_bulk("job-1", offset=10, limit=5)
+        assert len(result["entries"]) == 3
+        assert result["offset"] == 10
+        assert result["hasMore"] is False
+
+
+def _tool_doc(step, name, latency_ms, cpu_ms=0, success=True, error_class=None):
+    return {
+        "_id": ObjectId(),
+        "job_id": "job-1",
+        "step_number": step,
+        "step_type": "tool",
+        "latency_ms": latency_ms,
+        "tool": {
+            "name": name,
+            "call_id": f"call-{step}",
+            "success": success,
+            "error_class": error_class,
+            "cpu_ms": cpu_ms,
+            "result_size_bytes": 100,
+        },
+    }
+
+
+class TestToolProfile:
+    """Tests for the per-job tool profile aggregation."""
+
+    @pytest.fixture
+    def profile_db(self):
+        docs = [_tool_doc(i, "web_search", latency) for i, latency in enumerate(range(100, 2100, 100))]
+        docs += [
+            _tool_doc(20, "read_file", 5, cpu_ms=4),
+            _tool_doc(21, "read_file", 7, cpu_ms=6, success=False, error_class="ToolError"),
+            _tool_doc(22, "read_file", 3000, success=False, error_class="TimeoutError"),
+            # Still running
+            {**_tool_doc(23, "read_file", None), "latency_ms": None},
+            {"_id": ObjectId(), "job_id": "job-1", "step_number": 24, "step_type": "llm"},
+        ]
+        db = MongoDB(url="mongodb://unused")
+        db._available = True
+        db._db = {"agent_audit": FakeCollection(docs)}
+        return db
+
+    @pytest.mark.asyncio
+    async def test_per_tool_stats(self, profile_db):
+        profile = await profile_db.get_tool_profile("job-1", top=3)
+
+        assert profile["calls"] == 23
+        assert profile["errors"] == 2
+        tools = {t["name"]: t for t in profile["tools"]}
+        search = tools["web_search"]
+        assert search["calls"] == 20
+        assert search["p50Ms"] == 1100
+        assert search["p95Ms"] == 2000
+        assert search["resultBytes"] == 2000
+        read = tools["read_file"]
+        assert read["errorClasses"] == {"ToolError": 1, "TimeoutError": 1}
+        assert read["cpuMs"] == 10
+        # Slowest p95 first
+        assert profile["tools"][0]["name"] == "read_file"
+
+    @pytest.mark.asyncio
+    async def test_slowest_calls(self, profile_db):
+        profile = await profile_db.get_tool_profile("job-1", top=3)
+
+        assert [c["latencyMs"] for c in profile["slowest"]] == [3000, 2000, 1900]
+        assert profile["slowest"][0]["errorClass"] == "TimeoutError"
+        assert profile["slowest"][0]["callId"] == "call-22"
+
+    @pytest.mark.asyncio
+    async def test_unavailable(self):
+        profile = await MongoDB(url="mongodb://unused").get_tool_profile("job-1")
+        assert profile["calls"] == 0
+        assert profile["tools"] == []
+
+
+class TestGetRequest:
+    """Tests for resolving referenced tool schemas in LLM request documents."""
+
+    TOOLS = [{"type": "function", "function": {"name": "read_file"}}]
+
+    @pytest.fixture
+    def request_db(self):
+        self.by_hash = {"_id": ObjectId(), "request": {"tool_schema_hash": "ts_1", "tool_count": 1}}
+        self.embedded = {"_id": ObjectId(), "request": {"tools": self.TOOLS, "tool_count": 1}}
+        self.missing = {"_id": ObjectId(), "request": {"tool_schema_hash": "ts_2", "tool_count": 1}}
+        db = MongoDB(url="mongodb://unused")
+        db._available = True
+        db._db = {
+            "llm_requests": FakeCollection([self.by_hash, self.embedded, self.missing]),
+            "tool_schemas": FakeCollection([{"_id": "ts_1", "tools": self.TOOLS}]),
+        }
+        return db
+
+    @pytest.mark.asyncio
+    async def test_resolves_schema_hash(self, request_db):
+        doc = await request_db.get_request(str(self.by_hash["_id"]))
+        assert doc["request"]["tools"] == self.TOOLS
+        assert doc["request"]["tool_schema_hash"] == "ts_1"
+
+    @pytest.mark.asyncio
+    async def test_embedded_and_unknown_schemas(self, request_db):
+        embedded = await request_db.get_request(str(self.embedded["_id"]))
+        missing = await request_db.get_request(str(self.missing["_id"]))
+        assert embedded["request"]["tools"] == self.TOOLS
+        assert "tools" not in missing["request"]
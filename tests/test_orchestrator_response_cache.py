@@ -0,0 +1,179 @@
+"""Tests for the orchestrator response cache."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.services.response_cache import InMemoryCacheBackend, ResponseCache
+
+
+class Backend:
+    """Counts backend queries and lets tests control when they finish."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def query(self, value="result"):
+        self.calls += 1
+        await self.release.wait()
+        return {"value": value, "call": self.calls}
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesce(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+
+        tasks = [
+            asyncio.create_task(cache.get_or_compute("route", (), backend.query, ttl=60))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        backend.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert backend.calls == 1
+        assert all(r == {"value": "result", "call": 1} for r in results)
+        stats = cache.get_stats()["routes"]["route"]
+        assert stats == {"hits": 0, "misses": 1, "coalesced": 9, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_hits_return_copies(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+        backend.release.set()
+
+        first = await cache.get_or_compute("route", (), backend.query, ttl=60)
+        first["value"] = "mutated"
+        second = await cache.get_or_compute("route", (), backend.query, ttl=60)
+
+        assert backend.calls == 1
+        assert second["value"] == "result"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_tag(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+        backend.release.set()
+
+        await cache.get_or_compute("jobs", (), backend.query, ttl=60, tags=["jobs"])
+        await cache.get_or_compute("agents", (), backend.query, ttl=60, tags=["agents"])
+        assert cache.invalidate("jobs") == 1
+
+        await cache.get_or_compute("jobs", (), backend.query, ttl=60, tags=["jobs"])
+        await cache.get_or_compute("agents", (), backend.query, ttl=60, tags=["agents"])
+        assert backend.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_flight_skips_store(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+
+        task = asyncio.create_task(
+            cache.get_or_compute("jobs", (), backend.query, ttl=60, tags=["jobs"])
+        )
+        await asyncio.sleep(0)
+        cache.invalidate("jobs")
+        backend.release.set()
+        await task
+
+        await cache.get_or_compute("jobs", (), backend.query, ttl=60, tags=["jobs"])
+        assert backend.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+
+        leader = asyncio.create_task(cache.get_or_compute("route", (), backend.query, ttl=60))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_compute("route", (), backend.query, ttl=60))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        backend.release.set()
+
+        assert await follower == {"value": "result", "call": 1}
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await cache.get_or_compute("route", (), backend.query, ttl=60) == {"value": "result", "call": 1}
+        assert backend.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        cache = ResponseCache(enabled=True)
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("backend down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.get_or_compute("route", (), failing, ttl=60)
+        assert calls == 2
+        assert cache.get_stats()["routes"]["route"]["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_decorator_keys_on_arguments(self):
+        cache = ResponseCache(enabled=True)
+        backend = Backend()
+        backend.release.set()
+
+        @cache.cached("daily", ttl=60, tags=lambda days: [f"days:{days}"])
+        async def endpoint(days: int):
+            return await backend.query(days)
+
+        assert (await endpoint(days=7))["value"] == 7
+        assert (await endpoint(days=7))["value"] == 7
+        assert (await endpoint(days=3))["value"] == 3
+        assert backend.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_computes(self):
+        cache = ResponseCache(enabled=False)
+        backend = Backend()
+        backend.release.set()
+
+        await cache.get_or_compute("route", (), backend.query, ttl=60)
+        await cache.get_or_compute("route", (), backend.query, ttl=60)
+        assert backend.calls == 2
+
+
+    @pytest.mark.asyncio
+    async def test_evicted_keys_leave_their_tags(self):
+        cache = ResponseCache(backend=InMemoryCacheBackend(max_entries=2), enabled=True)
+        backend = Backend()
+        backend.release.set()
+
+        for job in range(5):
+            await cache.get_or_compute("job", (job,), backend.query, ttl=60, tags=[f"job:{job}", "jobs"])
+
+        assert cache._tag_keys["jobs"] == {("job", 3), ("job", 4)}
+        assert set(cache._tag_keys) == {"job:3", "job:4", "jobs"}
+        assert cache.invalidate("jobs") == 2
+        assert not cache._tag_keys and not cache._key_tags
+
+
+class TestInMemoryCacheBackend:
+    """Tests for the LRU backend."""
+
+    def test_lru_eviction(self):
+        backend = InMemoryCacheBackend(max_entries=2)
+        backend.set(("a",), 1, ttl=60)
+        backend.set(("b",), 2, ttl=60)
+        backend.get(("a",))
+        backend.set(("c",), 3, ttl=60)
+
+        assert backend.get(("a",)) == (True, 1)
+        assert backend.get(("b",)) == (False, None)
+
+    def test_expiry(self):
+        backend = InMemoryCacheBackend()
+        backend.set(("a",), 1, ttl=0)
+        assert backend.get(("a",)) == (False, None)
@@ -0,0 +1,188 @@
+"""Tests for the orchestrator job scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from orchestrator.services.scheduler import JobDispatchError, JobScheduler
+
+
+class FakePostgres:
+    """In-memory queue implementing the claim/release contract."""
+
+    def __init__(self, jobs=(), agents=()):
+        now = datetime.now(timezone.utc)
+        self.jobs = {}
+        for i, job in enumerate(jobs):
+            self.jobs[job["id"]] = {
+                "status": "created",
+                "config_name": "default",
+                "priority": 0,
+                "submitted_by": None,
+                "queued_at": now + timedelta(seconds=i),
+                "dispatch_attempts": 0,
+                "next_dispatch_at": None,
+                "assigned_agent_id": None,
+                **job,
+            }
+        self.agents = {a["id"]: {"status": "ready", "config_name": "default", **a} for a in agents}
+        self.releases = []
+
+    async def claim_next_job(self, exclude_agent_ids=None, allow_any_config=False):
+        excluded = set(exclude_agent_ids or [])
+        ready = [a for a_id, a in self.agents.items() if a["status"] == "ready" and a_id not in excluded]
+        configs = {a["config_name"] for a in ready}
+        now = datetime.now(timezone.utc)
+        running = {}
+        for job in self.jobs.values():
+            if job["status"] == "processing":
+                running[job["submitted_by"]] = running.get(job["submitted_by"], 0) + 1
+
+        candidates = [
+            (job_id, job) for job_id, job in self.jobs.items()
+            if job["status"] == "created" and job["queued_at"] is not None
+            and (job["next_dispatch_at"] is None or job["next_dispatch_at"] <= now)
+            and (allow_any_config or job["config_name"] in configs)
+        ]
+        if not candidates:
+            return None
+        job_id, job = min(
+            candidates,
+            key=lambda c: (-c[1]["priority"], running.get(c[1]["submitted_by"], 0), c[1]["queued_at"]),
+        )
+        agent = next(
+            a for a in ready if allow_any_config or a["config_name"] == job["config_name"]
+        )
+        queued_at = job["queued_at"]
+        job.update(status="processing", assigned_agent_id=agent["id"], queued_at=None)
+        job["dispatch_attempts"] += 1
+        agent["status"] = "working"
+        return {
+            "job_id": job_id,
+            "agent_id": agent["id"],
+            "config_name": job["config_name"],
+            "priority": job["priority"],
+            "submitted_by": job["submitted_by"],
+            "queued_at": queued_at,
+            "dispatch_attempts": job["dispatch_attempts"],
+            "agent": dict(agent),
+        }
+
+    async def release_job_claim(self, job_id, agent_id, queued_at, retry_at=None, error_message=None):
+        self.releases.append((job_id, agent_id, retry_at, error_message))
+        job = self.jobs[job_id]
+        if retry_at is None:
+            job.update(status="failed", error_message=error_message)
+        else:
+            job.update(status="created", assigned_agent_id=None, queued_at=queued_at, next_dispatch_at=retry_at)
+        self.agents[agent_id]["status"] = "ready"
+        return True
+
+
+class Dispatcher:
+    """Records dispatches and rejects for selected agents."""
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.dispatched = []
+
+    async def __call__(self, claim):
+        if claim["agent_id"] in self.reject:
+            raise JobDispatchError("Agent rejected job: busy")
+        self.dispatched.append((claim["job_id"], claim["agent_id"]))
+
+
+async def _drain(scheduler):
+    await scheduler.schedule_once()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestJobScheduler:
+    """Tests for JobScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_by_priority_and_config(self):
+        db = FakePostgres(
+            jobs=[
+                {"id": "low"},
+                {"id": "high", "priority": 5},
+                {"id": "other-config", "config_name": "validator"},
+            ],
+            agents=[{"id": "a1"}, {"id": "a2"}],
+        )
+        dispatch = Dispatcher()
+        scheduler = JobScheduler(db, dispatch, enabled=True)
+
+        await _drain(scheduler)
+
+        assert [job for job, _ in dispatch.dispatched] == ["high", "low"]
+        assert db.jobs["other-config"]["status"] == "created"
+        stats = scheduler.get_stats()
+        assert stats["dispatched"] == 2
+        assert stats["queue_wait_seconds"]["count"] == 2
+        assert stats["dispatch_latency_seconds"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fair_share_across_submitters(self):
+        db = FakePostgres(
+            jobs=[
+                {"id": "alice-running", "submitted_by": "alice", "status": "processing"},
+                {"id": "alice-2", "submitted_by": "alice"},
+                {"id": "bob-1", "submitted_by": "bob"},
+            ],
+            agents=[{"id": "a1"}],
+        )
+        dispatch = Dispatcher()
+        await _drain(JobScheduler(db, dispatch, enabled=True))
+
+        assert dispatch.dispatched == [("bob-1", "a1")]
+
+    @pytest.mark.asyncio
+    async def test_rejection_requeues_with_backoff_and_cools_agent(self):
+        db = FakePostgres(jobs=[{"id": "j1"}], agents=[{"id": "a1"}, {"id": "a2"}])
+        dispatch = Dispatcher(reject={"a1"})
+        changed = []
+        scheduler = JobScheduler(
+            db, dispatch, enabled=True, retry_base_seconds=10, on_job_change=changed.append
+        )
+
+        # Force the first claim onto a1
+        db.agents["a2"]["status"] = "working"
+        await _drain(scheduler)
+        db.agents["a2"]["status"] = "ready"
+
+        job = db.jobs["j1"]
+        assert job["status"] == "created"
+        assert job["next_dispatch_at"] > datetime.now(timezone.utc) + timedelta(seconds=5)
+        assert scheduler.get_stats()["cooling_down_agents"] == 1
+        assert changed == ["j1", "j1"]
+
+        # Backoff elapsed: the job goes to a2, a1 is still cooling down
+        job["next_dispatch_at"] = None
+        await _drain(scheduler)
+        assert dispatch.dispatched == [("j1", "a2")]
+
+    @pytest.mark.asyncio
+    async def test_job_fails_after_max_attempts(self):
+        db = FakePostgres(jobs=[{"id": "j1"}], agents=[{"id": "a1"}])
+        scheduler = JobScheduler(
+            db, Dispatcher(reject={"a1"}), enabled=True,
+            max_attempts=2, agent_cooldown_seconds=0.001,
+        )
+
+        for _ in range(2):
+            db.jobs["j1"]["next_dispatch_at"] = None
+            await asyncio.sleep(0.002)
+            await _drain(scheduler)
+
+        assert db.jobs["j1"]["status"] == "failed"
+        assert "after 2 attempt(s)" in db.jobs["j1"]["error_message"]
+        assert scheduler.get_stats()["failed"] == 1
+
+    def test_retry_delay_is_capped(self):
+        scheduler = JobScheduler(
+            FakePostgres(), Dispatcher(), retry_base_seconds=5, retry_max_seconds=60
+        )
+        assert [scheduler.retry_delay(n) for n in (1, 2, 3, 5)] == [5, 10, 20, 60]
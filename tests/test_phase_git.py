@@ -107,6 +107,26 @@ class TestCompletePhaseWithGit:
         assert "Complete" in log
         assert "8 todos" in log
 
+    def test_tag_covers_queued_todo_commits(self, workspace_with_git, todo_manager):
+        """Test that queued background todo commits land before the phase tag."""
+        workspace_with_git.config.git_commit_batch_seconds = 30
+        todo_manager.add("Write notes")
+        workspace_with_git.write_file("notes.md", "# Notes")
+        todo_manager.complete("todo_1")
+
+        _complete_phase_with_git(
+            workspace=workspace_with_git,
+            phase_number=1,
+            phase_type="tactical",
+            todos_archived=1,
+        )
+
+        git_mgr = workspace_with_git.git_manager
+        tagged = git_mgr._run_git(["log", "--format=%s", "phase-1-tactical-complete"]).stdout
+        assert tagged.splitlines()[0].startswith("[Phase 1")
+        assert "todo_1: Write notes" in tagged
+        assert git_mgr.has_uncommitted_changes() is False
+
     def test_handles_missing_git_manager(self, workspace_with_git):
         """Test that function handles workspace without git gracefully."""
         workspace_with_git._git_manager = None
@@ -0,0 +1,172 @@
+"""Tests for the shared research response cache."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.services.research_cache import ResearchCache, ResearchCacheMiss  # noqa: E402
+
+
+class Loader:
+    """Counts calls and returns a fresh value each time."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"results": [self.calls]}
+
+
+class TestResearchCache:
+    """Tests for ResearchCache."""
+
+    def test_hit_after_miss_with_normalized_params(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on")
+        load = Loader()
+
+        first = cache.fetch("tavily_search", {"query": "graph  rag ", "topic": None}, load)
+        second = cache.fetch("tavily_search", {"query": "graph rag"}, load)
+
+        assert first == second == {"results": [1]}
+        assert load.calls == 1
+        assert cache.get_stats()["entries_by_provider"] == {"tavily_search": 1}
+
+    def test_stale_entry_served_and_refreshed(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on", ttls={"arxiv": 10}, stale_seconds=100)
+        load = Loader()
+        cache.fetch("arxiv", {"q": "x"}, load)
+
+        # Age the entry past its TTL but inside the stale window
+        with cache._lock:
+            cache._conn.execute("UPDATE responses SET created_at = ?", (time.time() - 50,))
+            cache._conn.commit()
+
+        assert cache.fetch("arxiv", {"q": "x"}, load) == {"results": [1]}
+        cache._refresh_pool.shutdown(wait=True)
+        cache._refresh_pool = None
+        assert load.calls == 2
+        assert cache.fetch("arxiv", {"q": "x"}, load) == {"results": [2]}
+        assert cache.get_stats()["stale_hits"] == 1
+
+    def test_expired_past_stale_window_reloads(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on", ttls={"arxiv": 10}, stale_seconds=0)
+        load = Loader()
+        cache.fetch("arxiv", {"q": "x"}, load)
+        with cache._lock:
+            cache._conn.execute("UPDATE responses SET created_at = ?", (time.time() - 50,))
+            cache._conn.commit()
+
+        assert cache.fetch("arxiv", {"q": "x"}, load) == {"results": [2]}
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on", max_bytes=250)
+        for i in range(3):
+            cache.set("tavily_extract", {"url": i}, {"content": "x" * 60})
+            time.sleep(0.01)
+        cache.get("tavily_extract", {"url": 0})  # touch the oldest entry
+        cache.set("tavily_extract", {"url": 3}, {"content": "x" * 60})
+
+        assert cache.get("tavily_extract", {"url": 0})[0] is not None
+        assert cache.get("tavily_extract", {"url": 1})[0] is None
+        assert cache.get_stats()["evictions"] >= 1
+
+    def test_offline_replays_and_raises_on_miss(self, tmp_path):
+        path = tmp_path / "c.db"
+        ResearchCache(path=path, mode="on", ttls={"unpaywall": 0}).set("unpaywall", {"doi": "10.1/x"}, {"ok": 1})
+
+        offline = ResearchCache(path=path, mode="offline", stale_seconds=0)
+        load = MagicMock()
+        assert offline.fetch("unpaywall", {"doi": "10.1/x"}, load) == {"ok": 1}
+        with pytest.raises(ResearchCacheMiss):
+            offline.fetch("unpaywall", {"doi": "10.1/y"}, load)
+        load.assert_not_called()
+
+    def test_none_and_errors_not_cached(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on")
+        assert cache.fetch("unpaywall", {"doi": "a"}, lambda: None) is None
+        with pytest.raises(RuntimeError):
+            cache.fetch("unpaywall", {"doi": "b"}, MagicMock(side_effect=RuntimeError("boom")))
+        assert cache.get_stats()["entry_count"] == 0
+
+    def test_off_mode_bypasses(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="off")
+        load = Loader()
+        cache.fetch("arxiv", {"q": "x"}, load)
+        cache.fetch("arxiv", {"q": "x"}, load)
+        assert load.calls == 2
+        assert not (tmp_path / "c.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_fetch_async(self, tmp_path):
+        cache = ResearchCache(path=tmp_path / "c.db", mode="on")
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return [{"title": "Paper"}]
+
+        assert await cache.fetch_async("arxiv", {"q": "x"}, load) == [{"title": "Paper"}]
+        assert await cache.fetch_async("arxiv", {"q": "x"}, load) == [{"title": "Paper"}]
+        assert len(calls) == 1
+
+
+class TestResearchToolsUseCache:
+    """Research tools go through the shared cache."""
+
+    def test_web_search_served_from_cache(self, isolated_research_cache, monkeypatch):
+        from src.tools.research import web
+
+        monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+        invoke = MagicMock(return_value={"results": [{"url": "https://a.com", "title": "A", "content": "x"}]})
+        monkeypatch.setitem(
+            sys.modules, "langchain_tavily",
+            MagicMock(TavilySearch=MagicMock(return_value=MagicMock(invoke=invoke))),
+        )
+
+        first = web._direct_web_search("graph rag", 5)
+        second = web._direct_web_search("graph rag", 5)
+
+        assert first == second
+        assert invoke.call_count == 1
+
+    def test_web_search_offline_needs_no_key(self, isolated_research_cache, monkeypatch):
+        from src.tools.research import web
+
+        isolated_research_cache.set(
+            "tavily_search",
+            {"query": "q", "max_results": 5, "include_raw_content": False},
+            {"results": [{"url": "https://a.com", "title": "Cached", "content": "x"}]},
+        )
+        isolated_research_cache.mode = "offline"
+        monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+
+        assert "Cached" in web._direct_web_search("q", 5)
+        assert "offline mode" in web._direct_web_search("other", 5)
+
+    @pytest.mark.asyncio
+    async def test_arxiv_search_round_trips_papers(self, isolated_research_cache):
+        from src.tools.research.utils.arxiv_client import ArxivClient
+        from src.tools.research.utils.paper_types import AccessStatus, Paper, PaperSource
+
+        paper = Paper(
+            title="Cached", authors=["A"], url="u", source=PaperSource.ARXIV,
+            access_status=AccessStatus.OPEN_ACCESS, arxiv_id="2401.00001",
+        )
+        isolated_research_cache.set(
+            "arxiv", {"op": "search", "query": "q", "max_results": 3}, [paper.to_dict()]
+        )
+
+        client = ArxivClient(rate_limit_seconds=60)
+        assert await client.search("q", max_results=3) == [paper]
+        assert client._last_request == 0  # no rate-limit wait on a hit
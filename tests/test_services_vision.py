@@ -0,0 +1,172 @@
+"""Tests for the visual page pipeline (rendering, descriptions, cache)."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.workspace import WorkspaceManager  # noqa: E402
+from src.services import description_cache, document_renderer, vision_helper  # noqa: E402
+from src.services.description_cache import DescriptionCache  # noqa: E402
+from src.services.document_renderer import DocumentRenderer  # noqa: E402
+from src.services.vision_helper import VisionHelper  # noqa: E402
+from src.tools.context import ToolContext  # noqa: E402
+from src.tools.workspace import create_workspace_tools  # noqa: E402
+
+
+class FakeCompletions:
+    """Chat completions stub that tracks concurrent requests."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def create(self, model, messages, max_tokens):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        prompt = messages[0]["content"][0]["text"]
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"described: {prompt[:20]}"))]
+        )
+
+
+@pytest.fixture
+def fake_vision(monkeypatch):
+    """VisionHelper with a stubbed client and a concurrency limit of 2."""
+    monkeypatch.setenv("VISION_API_KEY", "test-key")
+    monkeypatch.setenv("VISION_MAX_CONCURRENCY", "2")
+    helper = VisionHelper()
+    completions = FakeCompletions()
+    helper.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    yield helper, completions
+    helper.close()
+
+
+class TestVisionHelperBatch:
+    """Tests for concurrent page descriptions."""
+
+    def test_describe_pages_bounded_and_ordered(self, fake_vision):
+        helper, completions = fake_vision
+        pages = {3: b"c", 1: b"a", 2: b"b", 4: b"d", 5: b"e"}
+
+        result = helper.describe_document_pages_sync(pages)
+
+        assert list(result) == [1, 2, 3, 4, 5]
+        assert result[2].startswith("described: Analyze page 2")
+        assert completions.calls == 5
+        assert 1 < completions.max_in_flight <= 2
+
+    def test_sync_wrappers_reuse_one_loop(self, fake_vision):
+        helper, _ = fake_vision
+        helper.describe_image_sync(b"x")
+        loop = helper._loop
+        helper.describe_document_page_sync(b"y", page_num=1)
+        assert helper._loop is loop and loop.is_running()
+
+
+class TestDocumentRendererBatch:
+    """Tests for DocumentRenderer.render_pages."""
+
+    def test_render_pages_inline_skips_failures(self, tmp_path, monkeypatch):
+        rendered = []
+
+        def fake_rasterize(pdf_path, page_num, dpi):
+            rendered.append(page_num)
+            if page_num == 2:
+                raise RuntimeError("bad page")
+            return f"png-{page_num}".encode()
+
+        monkeypatch.setattr(document_renderer, "_rasterize_pdf_page", fake_rasterize)
+        renderer = DocumentRenderer(max_pages=3, libreoffice_path="soffice", render_workers=1)
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF")
+
+        result = renderer.render_pages(pdf, [3, 1, 2, 4, 1])
+
+        assert rendered == [1, 2, 3]
+        assert result == {1: b"png-1", 3: b"png-3"}
+
+    def test_render_pages_rejects_unknown_type(self, tmp_path):
+        renderer = DocumentRenderer(libreoffice_path="soffice", render_workers=1)
+        with pytest.raises(ValueError):
+            renderer.render_pages(tmp_path / "notes.txt", [1])
+
+
+class TestDescriptionCacheBatch:
+    """Tests for batch cache lookups."""
+
+    def test_get_many_and_set_many(self, tmp_path):
+        cache = DescriptionCache(cache_dir=tmp_path / "cache")
+        doc = tmp_path / "doc.pdf"
+        doc.write_bytes(b"content")
+
+        assert cache.set_many(doc, {1: "one", 3: "three"}, query="q") == 2
+
+        assert cache.get_many(doc, [1, 2, 3], query="q") == {1: "one", 3: "three"}
+        assert cache.get_many(doc, [1], query="other") == {}
+        assert cache.get(doc, page=3, query="q") == "three"
+
+
+class TestReadFileVisualPipeline:
+    """Tests for the cache-first page pipeline behind read_file."""
+
+    @pytest.fixture
+    def read_file(self, tmp_path):
+        ws = WorkspaceManager(job_id="vision-job", base_path=tmp_path / "ws")
+        ws.initialize()
+        tools = {t.name: t for t in create_workspace_tools(ToolContext(workspace_manager=ws))}
+
+        from pptx import Presentation
+        prs = Presentation()
+        for i in range(4):
+            slide = prs.slides.add_slide(prs.slide_layouts[5])
+            slide.shapes.title.text = f"Slide text {i + 1}"
+        prs.save(str(ws.get_path("deck.pptx")))
+        return tools["read_file"], ws.get_path("deck.pptx")
+
+    def test_only_uncached_pages_are_rendered(self, tmp_path, monkeypatch, read_file):
+        tool, deck = read_file
+        cache = DescriptionCache(cache_dir=tmp_path / "cache")
+        cache.set_many(deck, {2: "cached two", 4: "cached four"})
+
+        rendered = []
+        described = []
+
+        class FakeRenderer:
+            def render_pages(self, file_path, page_nums):
+                rendered.append(list(page_nums))
+                return {p: f"png-{p}".encode() for p in page_nums}
+
+        class FakeVision:
+            def describe_document_pages_sync(self, page_images, query=None):
+                described.append(sorted(page_images))
+                return {p: f"fresh {p}" for p in page_images}
+
+        monkeypatch.setattr(description_cache, "_description_cache", cache)
+        monkeypatch.setattr(document_renderer, "_document_renderer", FakeRenderer())
+        monkeypatch.setattr(vision_helper, "_vision_helper", FakeVision())
+
+        result = tool.invoke({"path": "deck.pptx"})
+
+        assert rendered == [[1, 3]]
+        assert described == [[1, 3]]
+        positions = [result.index(text) for text in
+                     ("fresh 1", "cached two", "fresh 3", "cached four")]
+        assert positions == sorted(positions)
+        assert cache.get_many(deck, [1, 3]) == {1: "fresh 1", 3: "fresh 3"}
+
+        # Second read is served entirely from the cache
+        rendered.clear()
+        tool.invoke({"path": "deck.pptx"})
+        assert rendered == []
@@ -0,0 +1,49 @@
+"""Tests for the startup import profile and lazy package exports."""
+
+import subprocess
+import sys
+
+from src.utils.config import get_project_root
+from src.utils.import_profile import format_startup_report, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     neo4j._codec
+import time:       500 |        800 |   neo4j
+import time:        40 |         40 |     src.tools.workspace
+import time:        60 |        100 |   src.tools
+import time:        10 |        910 | agent
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [t.module for t in timings] == [
+        "_io", "neo4j._codec", "neo4j", "src.tools.workspace", "src.tools", "agent",
+    ]
+    assert timings[1].self_us == 300 and timings[1].depth == 2
+    assert timings[-1].cumulative_us == 910 and timings[-1].depth == 0
+    assert timings[3].package == "src.tools"
+
+
+def test_report_groups_by_package():
+    report = format_startup_report("agent", parse_importtime(IMPORTTIME_OUTPUT), top=2)
+
+    assert "6 modules, 1 ms total" in report
+    assert "0.8 ms  neo4j" in report
+    assert "0.9 ms  agent" in report
+
+
+def test_tools_import_skips_heavy_stacks():
+    code = (
+        "import sys, src.tools, src.database.postgres_db; "
+        "print(' '.join(m for m in ('neo4j', 'pdfplumber', 'docx', 'pptx', "
+        "'langchain_openai', 'fastapi', 'langgraph') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=get_project_root(), capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == ""
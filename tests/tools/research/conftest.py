@@ -112,3 +112,33 @@ def mock_arxiv_result():
     result.published.year = 2017
     result.download_pdf = MagicMock()
     return result
+
+
+@pytest.fixture(autouse=True)
+def reset_source_limiters():
+    """Give every test fresh per-source rate limiters."""
+    from src.tools.research.utils import fanout
+
+    fanout._limiters.clear()
+    yield
+    fanout._limiters.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_session_pool():
+    """Give every test a fresh research HTTP session pool."""
+    from src.tools.research.utils import network
+
+    network._session_pool = None
+    yield
+    network._session_pool = None
+
+
+@pytest.fixture(autouse=True)
+def reset_browser_pool():
+    """Give every test a fresh browser pool."""
+    from src.tools.research.utils import browser_pool
+
+    browser_pool._browser_pool = None
+    yield
+    browser_pool._browser_pool = None
@@ -0,0 +1,301 @@
+"""Tests for the warm browser pool and browser download capture."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from src.tools.research.utils import browser_pool
+from src.tools.research.utils.browser_pool import BrowserPool, DownloadWatcher
+
+
+class FakeDownload:
+    """Playwright Download stand-in that writes its content on save."""
+
+    def __init__(self, filename, content=b"%PDF-1.4", fail=False):
+        self.suggested_filename = filename
+        self.content = content
+        self.fail = fail
+
+    async def save_as(self, path):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("download canceled")
+        with open(path, "wb") as f:
+            f.write(self.content)
+
+
+class FakePage:
+    last = None
+
+    def __init__(self):
+        self.handlers = []
+        FakePage.last = self
+
+    def on(self, event, handler):
+        assert event == "download"
+        self.handlers.append(handler)
+
+    def emit_download(self, download):
+        for handler in self.handlers:
+            handler(download)
+
+
+class FakeCDPSession:
+    def __init__(self, responses):
+        self.responses = responses
+
+    async def send(self, method):
+        return self.responses[method]()
+
+    async def detach(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser, context_id):
+        self.browser = browser
+        self.context_id = context_id
+        self.closed = False
+        self.page_handlers = []
+
+    def on(self, event, handler):
+        self.page_handlers.append(handler)
+
+    async def new_page(self):
+        page = FakePage()
+        self.browser.targets.append({"type": "page", "browserContextId": self.context_id})
+        # Playwright also emits "page" for pages opened with new_page()
+        for handler in self.page_handlers:
+            handler(page)
+        return page
+
+    async def new_cdp_session(self, page):
+        info = {"targetInfo": {"type": "page", "browserContextId": self.context_id}}
+        return FakeCDPSession({"Target.getTargetInfo": lambda: info})
+
+    async def close(self):
+        self.closed = True
+        self.browser.targets = [t for t in self.browser.targets if t["browserContextId"] != self.context_id]
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.targets = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, accept_downloads):
+        assert accept_downloads
+        context = FakeContext(self, f"ctx-{len(self.contexts)}")
+        self.contexts.append(context)
+        return context
+
+    async def new_browser_cdp_session(self):
+        return FakeCDPSession({"Target.getTargets": lambda: {"targetInfos": list(self.targets)}})
+
+    def open_default_page(self):
+        """A tab opened over CDP without a browser context (as browser-use does)."""
+        self.targets.append({"type": "page", "browserContextId": "default"})
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_launch(monkeypatch):
+    """Replace Chromium launches with fake browsers; returns the launch log."""
+    launched = []
+
+    async def launch(self, headless, proxy):
+        browser = FakeBrowser()
+        launched.append((headless, browser))
+        return browser, f"http://127.0.0.1:{9000 + len(launched)}"
+
+    monkeypatch.setattr(BrowserPool, "_launch", launch)
+    return launched
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_warm_browser_with_fresh_contexts(self, fake_launch, tmp_path):
+        pool = BrowserPool(pool_size=2, idle_timeout=60)
+
+        async with pool.lease(downloads_path=tmp_path) as first:
+            pass
+        async with pool.lease(downloads_path=tmp_path) as second:
+            pass
+
+        assert len(fake_launch) == 1
+        assert first.cdp_url == second.cdp_url
+        assert first.context is not second.context
+        assert first.context.closed and second.context.closed
+        assert pool.get_stats() == {"pool_size": 2, "warm": 1, "in_use": 0, "launches": 1, "leases": 2}
+        await pool.close()
+        assert fake_launch[0][1].closed
+
+    @pytest.mark.asyncio
+    async def test_browser_with_pages_outside_lease_is_retired(self, fake_launch, tmp_path):
+        pool = BrowserPool(pool_size=2, idle_timeout=60)
+
+        async with pool.lease(downloads_path=tmp_path):
+            fake_launch[0][1].open_default_page()
+        async with pool.lease(downloads_path=tmp_path):
+            pass
+
+        assert len(fake_launch) == 2
+        assert fake_launch[0][1].closed
+        assert not fake_launch[1][1].closed
+        assert pool.get_stats()["warm"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_bounded_by_pool_size(self, fake_launch, tmp_path):
+        pool = BrowserPool(pool_size=2, idle_timeout=60)
+        in_use = []
+
+        async def use():
+            async with pool.lease(downloads_path=tmp_path):
+                in_use.append(pool.get_stats()["in_use"])
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(use() for _ in range(5)))
+
+        assert len(fake_launch) == 2
+        assert max(in_use) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_launch_settings_key_the_pool(self, fake_launch, tmp_path):
+        pool = BrowserPool(pool_size=1, idle_timeout=60)
+
+        async with pool.lease(headless=True, downloads_path=tmp_path):
+            pass
+        async with pool.lease(headless=False, downloads_path=tmp_path):
+            pass
+
+        # The idle headless browser was retired to make room
+        assert [headless for headless, _ in fake_launch] == [True, False]
+        assert fake_launch[0][1].closed
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_browsers_are_shut_down(self, fake_launch, tmp_path):
+        pool = BrowserPool(pool_size=2, idle_timeout=0.01)
+
+        async with pool.lease(downloads_path=tmp_path):
+            pass
+        await asyncio.sleep(0.05)
+
+        assert pool.get_stats()["warm"] == 0
+        assert fake_launch[0][1].closed
+
+    @pytest.mark.asyncio
+    async def test_reaper_does_not_close_leased_browser(self, fake_launch, tmp_path, monkeypatch):
+        pool = BrowserPool(pool_size=2, idle_timeout=60)
+        async with pool.lease(headless=True, downloads_path=tmp_path):
+            async with pool.lease(headless=False, downloads_path=tmp_path):
+                pass
+        for pooled in pool._browsers:
+            pooled.last_used -= 120
+
+        async def slow_close(self):
+            await asyncio.sleep(0.02)
+            self.closed = True
+
+        monkeypatch.setattr(FakeBrowser, "close", slow_close)
+        reap = asyncio.ensure_future(pool.reap_idle())
+        await asyncio.sleep(0)  # reaper is now closing its first browser
+
+        async with pool.lease(headless=False, downloads_path=tmp_path) as lease:
+            await reap
+            leased = next(b for b in pool._browsers if b.cdp_url == lease.cdp_url)
+            assert not leased.browser.closed
+        await pool.close()
+
+
+class TestDownloadWatcher:
+    """Tests for download capture through download events."""
+
+    @pytest.mark.asyncio
+    async def test_saves_downloads_with_unique_names(self, tmp_path):
+        watcher = DownloadWatcher(tmp_path)
+        page = FakePage()
+        watcher.attach(page)
+        watcher.attach(page)  # idempotent
+
+        page.emit_download(FakeDownload("paper.pdf", b"one"))
+        page.emit_download(FakeDownload("paper.pdf", b"two"))
+        page.emit_download(FakeDownload("../bad name?.pdf"))
+        page.emit_download(FakeDownload("broken.pdf", fail=True))
+
+        files = await watcher.wait(timeout=1)
+
+        assert sorted(p.name for p in files) == ["bad name_.pdf", "paper.pdf", "paper_1.pdf"]
+        assert all(p.parent == tmp_path for p in files)
+        assert len(watcher.failures) == 1
+
+
+class TestDownloadFromWebsitePooled:
+    """download_from_website on a pooled browser."""
+
+    @pytest.mark.asyncio
+    async def test_download_detected_from_event(self, fake_launch, mock_tool_context, temp_docs_dir, monkeypatch):
+        created = []
+
+        class FakeBrowserUse:
+            def __init__(self, **kwargs):
+                created.append(kwargs)
+
+            async def stop(self):
+                pass
+
+        class FakeAgent:
+            def __init__(self, task, llm, browser, use_vision, max_actions_per_step):
+                pass
+
+            async def run(self):
+                FakePage.last.emit_download(FakeDownload("article.pdf"))
+                return None
+
+        monkeypatch.setitem(sys.modules, "browser_use", types.SimpleNamespace(Agent=FakeAgent, Browser=FakeBrowserUse))
+        monkeypatch.setattr("src.tools.research.browser._get_browser_llm", lambda: object())
+        mock_tool_context.config = {"browser": {"pool_size": 1}, "research": {"proxy": {}}}
+        mock_tool_context.workspace_manager.get_path.return_value = temp_docs_dir
+
+        from src.tools.research.browser import create_browser_tools
+
+        download = next(t for t in create_browser_tools(mock_tool_context) if t.name == "download_from_website")
+        result = await download.ainvoke({"url": "https://example.com/article"})
+
+        assert "Downloaded file: article.pdf" in result
+        assert (temp_docs_dir / "article.pdf").read_bytes() == b"%PDF-1.4"
+        assert created[0]["cdp_url"] == "http://127.0.0.1:9001"
+        assert created[0]["keep_alive"] is True
+        assert "headless" not in created[0]
+        assert browser_pool.get_browser_pool().pool_size == 1
+        mock_tool_context.get_or_register_doc_source.assert_called_once()
+        await browser_pool.close_browser_pool()
+
+    @pytest.mark.asyncio
+    async def test_downloads_outside_leased_context_are_collected(self, fake_launch, tmp_path):
+        import time
+
+        from src.tools.research.browser import _collect_downloads
+
+        pool = BrowserPool(pool_size=1, idle_timeout=60)
+        started = time.time()
+        async with pool.lease(downloads_path=tmp_path) as lease:
+            lease.page.emit_download(FakeDownload("event.pdf"))
+            # Written by browser-use from a tab in the default context
+            (tmp_path / "other.pdf").write_bytes(b"%PDF-1.4")
+            files = await _collect_downloads(lease, tmp_path, started)
+
+        assert [f.name for f in files] == ["event.pdf", "other.pdf"]
+        await pool.close()
@@ -0,0 +1,146 @@
+"""Tests for the concurrent fan-out helpers (utils/fanout.py)."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.tools.research.utils.fanout import (
+    SourceLimiter,
+    bounded_gather,
+    dedupe_papers,
+    first_success,
+)
+from src.tools.research.utils.paper_types import AccessStatus, Paper, PaperSource
+
+
+def _paper(title, doi=None, arxiv_id=None):
+    return Paper(
+        title=title, authors=[], url="", source=PaperSource.ARXIV,
+        access_status=AccessStatus.UNKNOWN, doi=doi, arxiv_id=arxiv_id,
+    )
+
+
+class TestFirstSuccess:
+    """Tests for first_success."""
+
+    @pytest.mark.asyncio
+    async def test_fast_success_cancels_slow_attempt(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            return "slow"
+
+        async def fast():
+            await asyncio.sleep(0.01)
+            return "fast"
+
+        start = time.monotonic()
+        outcome = await first_success({"slow": slow(), "fast": fast()}, lambda r: r is not None)
+
+        assert outcome.winner == "fast"
+        assert outcome.result == "fast"
+        assert cancelled == ["slow"]
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_all_fail_reports_failures(self):
+        async def miss():
+            return None
+
+        async def boom():
+            raise RuntimeError("down")
+
+        outcome = await first_success({"a": miss(), "b": boom()}, lambda r: r is not None)
+
+        assert outcome.winner is None
+        assert outcome.failures["a"] is None
+        assert isinstance(outcome.failures["b"], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_no_attempts(self):
+        outcome = await first_success({}, bool)
+        assert outcome.winner is None and outcome.failures == {}
+
+
+class TestBoundedGather:
+    """Tests for bounded_gather."""
+
+    @pytest.mark.asyncio
+    async def test_respects_limit_and_order(self):
+        running = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if i == 3:
+                raise ValueError("bad")
+            return i * 10
+
+        results = await bounded_gather(list(range(6)), work, limit=2)
+
+        assert peak == 2
+        assert results[:3] == [0, 10, 20]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == [40, 50]
+
+
+class TestSourceLimiter:
+    """Tests for SourceLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_request_starts(self):
+        limiter = SourceLimiter("test", max_concurrent=4, min_interval=0.05)
+        starts = []
+
+        async def request():
+            async with limiter:
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        limiter = SourceLimiter("test", max_concurrent=2)
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+        assert peak == 2
+
+
+class TestDedupePapers:
+    """Tests for dedupe_papers."""
+
+    def test_merges_by_doi_case_insensitive_and_arxiv_version(self):
+        first = [_paper("S2", doi="10.1/ABC", arxiv_id="2401.00001")]
+        second = [
+            _paper("arXiv v2", arxiv_id="2401.00001v2"),
+            _paper("Same DOI", doi="10.1/abc"),
+            _paper("Other", arxiv_id="2401.00002"),
+            _paper("No ids"),
+        ]
+
+        result = dedupe_papers(first, second)
+
+        assert [p.title for p in result] == ["S2", "Other", "No ids"]
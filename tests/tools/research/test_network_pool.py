@@ -0,0 +1,121 @@
+"""Tests for pooled research sessions and per-host pacing."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.tools.research.utils import network
+from src.tools.research.utils.network import (
+    ResearchSessionPool,
+    TokenBucket,
+    close_research_sessions,
+    get_session_pool,
+    research_request,
+)
+
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Local HTTP server counting the requests it receives."""
+    hits = []
+
+    async def handler(request):
+        hits.append(request.path)
+        return web.json_response({"path": request.path})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await close_research_sessions()
+    await runner.cleanup()
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        started = time.monotonic()
+        waits = [await bucket.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(w > 0 for w in waits[2:])
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_pacing(self):
+        bucket = TokenBucket(rate=0)
+        assert [await bucket.acquire() for _ in range(5)] == [0.0] * 5
+
+
+class TestResearchRequestPool:
+    """Tests for research_request over the shared session pool."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, local_server):
+        base_url, hits = local_server
+        for path in ("/a", "/b", "/c"):
+            async with research_request("GET", base_url + path) as resp:
+                assert (await resp.json())["path"] == path
+
+        stats = get_session_pool().get_stats()
+        host = stats["hosts"]["127.0.0.1"]
+        assert hits == ["/a", "/b", "/c"]
+        assert stats["sessions_created"] == 1
+        assert host["requests"] == 3
+        assert host["new_connections"] == 1
+        assert host["reused_connections"] == 2
+        assert host["latency_seconds"]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_caller_errors_are_not_retried(self, local_server):
+        base_url, hits = local_server
+        with pytest.raises(OSError):
+            async with research_request("GET", base_url + "/x"):
+                raise OSError("disk full")
+        assert hits == ["/x"]
+
+    @pytest.mark.asyncio
+    async def test_connection_failure_raises_connection_error(self, local_server):
+        base_url, _ = local_server
+        # Port 9 (discard) is closed on loopback
+        with pytest.raises(ConnectionError, match="after 1 attempts"):
+            async with research_request("GET", "http://127.0.0.1:9/", max_retries=1):
+                pass
+        assert get_session_pool().get_stats()["hosts"]["127.0.0.1"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_host_rate_limit_paces_requests(self, local_server):
+        base_url, hits = local_server
+        network._session_pool = ResearchSessionPool(host_rate_limits={"127.0.0.1": (20.0, 1.0)})
+
+        started = time.monotonic()
+        await asyncio.gather(*(self._get(base_url) for _ in range(3)))
+
+        assert len(hits) == 3
+        assert time.monotonic() - started >= 0.09
+        assert get_session_pool().get_stats()["hosts"]["127.0.0.1"]["rate_limit_wait_seconds"] > 0
+
+    @staticmethod
+    async def _get(base_url):
+        async with research_request("GET", base_url + "/p") as resp:
+            await resp.read()
+
+
+def test_host_rate_limits_from_env(monkeypatch):
+    monkeypatch.setenv("RESEARCH_HOST_RATE_LIMITS", "example.org=2:5, bad, api.unpaywall.org=1")
+    limits = network._load_host_rate_limits()
+
+    assert limits["example.org"] == (2.0, 5.0)
+    assert limits["api.unpaywall.org"] == (1.0, 1.0)
+    assert limits["api.semanticscholar.org"] == network.DEFAULT_HOST_RATE_LIMITS["api.semanticscholar.org"]
@@ -1,4 +1,4 @@
-"""Tests for paper tools (search_papers, download_paper, get_paper_info)."""
+"""Tests for paper tools (search_papers, download_paper, download_papers, get_paper_info)."""
 
 from unittest.mock import AsyncMock, patch
 
@@ -69,11 +69,11 @@ class TestArxivPattern:
 class TestCreatePaperTools:
     """Tests for create_paper_tools factory function."""
 
-    def test_creates_three_tools(self, mock_tool_context):
+    def test_creates_four_tools(self, mock_tool_context):
         tools = create_paper_tools(mock_tool_context)
-        assert len(tools) == 3
+        assert len(tools) == 4
         names = {t.name for t in tools}
-        assert names == {"search_papers", "download_paper", "get_paper_info"}
+        assert names == {"search_papers", "download_paper", "download_papers", "get_paper_info"}
 
 
 class TestSearchPapers:
@@ -205,6 +205,11 @@ class TestDownloadPaper:
         download_paper = next(t for t in tools if t.name == "download_paper")
 
         with patch(
+            # DOI resolution is prefetched for the browser fallback
+            "src.tools.research.papers._resolve_doi_url",
+            new_callable=AsyncMock,
+            return_value=None,
+        ), patch(
             "src.tools.research.papers._try_arxiv_download",
             new_callable=AsyncMock,
             return_value=DownloadResult(success=False, error="Not found"),
@@ -238,6 +243,11 @@ class TestDownloadPaper:
         )
 
         with patch(
+            # DOI resolution is prefetched for the browser fallback
+            "src.tools.research.papers._resolve_doi_url",
+            new_callable=AsyncMock,
+            return_value=None,
+        ), patch(
             "src.tools.research.papers._try_unpaywall_download",
             new_callable=AsyncMock,
             return_value=DownloadResult(
@@ -286,6 +296,11 @@ class TestDownloadPaper:
         download_paper = next(t for t in tools if t.name == "download_paper")
 
         with patch(
+            # DOI resolution is prefetched for the browser fallback
+            "src.tools.research.papers._resolve_doi_url",
+            new_callable=AsyncMock,
+            return_value=None,
+        ), patch(
             "src.tools.research.papers._try_unpaywall_download",
             new_callable=AsyncMock,
             return_value=DownloadResult(success=False, error="No OA"),
@@ -405,3 +420,180 @@ class TestPaperToolsMetadata:
         for name, meta in PAPER_TOOLS_METADATA.items():
             assert "phases" in meta, f"{name} missing phases"
             assert "tactical" in meta["phases"], f"{name} not in tactical phase"
+
+
+class TestConcurrentDownloads:
+    """Tests for the concurrent download fan-out and download_papers."""
+
+    @pytest.mark.asyncio
+    async def test_arxiv_and_unpaywall_race(self, mock_tool_context, sample_paper, temp_docs_dir):
+        import asyncio
+
+        tools = create_paper_tools(mock_tool_context)
+        download_paper = next(t for t in tools if t.name == "download_paper")
+        arxiv_cancelled = []
+
+        async def slow_arxiv(identifier, dest_dir, slot=None):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                arxiv_cancelled.append(identifier)
+                raise
+
+        async def fast_unpaywall(doi, dest_dir, proxy=None, slot=None):
+            return DownloadResult(
+                success=True, path=temp_docs_dir / "paper.pdf",
+                source=PaperSource.UNPAYWALL, paper=sample_paper,
+            )
+
+        with patch("src.tools.research.papers._try_arxiv_download", slow_arxiv), patch(
+            "src.tools.research.papers._try_unpaywall_download", fast_unpaywall
+        ):
+            result = await download_paper.ainvoke(
+                {"identifier": "10.48550/arXiv.1706.03762", "identifier_type": "doi"}
+            )
+
+        assert "Source: Unpaywall" in result
+        assert arxiv_cancelled
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arxiv_delay, unpaywall_delay, winner", [
+        (0.2, 0.0, "unpaywall"),
+        (0.0, 0.05, "arxiv"),
+    ])
+    async def test_race_downloads_the_pdf_once(
+        self, mock_tool_context, sample_paper, temp_docs_dir, arxiv_delay, unpaywall_delay, winner
+    ):
+        import asyncio
+
+        tools = create_paper_tools(mock_tool_context)
+        download_paper = next(t for t in tools if t.name == "download_paper")
+        downloads = []
+
+        async def find(self, arxiv_id):
+            await asyncio.sleep(arxiv_delay)
+            return object()
+
+        async def get_paper(self, doi):
+            await asyncio.sleep(unpaywall_delay)
+            return sample_paper
+
+        def download(source):
+            async def run(self, *args):
+                downloads.append(source)
+                await asyncio.sleep(0.1)  # still running when the other lookup finishes
+                return DownloadResult(
+                    success=True, path=temp_docs_dir / f"{source}.pdf",
+                    source=PaperSource.ARXIV, paper=sample_paper,
+                )
+            return run
+
+        client = "src.tools.research.utils.{}_client.{}Client.{}"
+        with patch(client.format("arxiv", "Arxiv", "find"), find), patch(
+            client.format("arxiv", "Arxiv", "download_result"), download("arxiv")
+        ), patch(client.format("unpaywall", "Unpaywall", "get_paper"), get_paper), patch(
+            client.format("unpaywall", "Unpaywall", "download_paper"), download("unpaywall")
+        ), patch(client.format("unpaywall", "Unpaywall", "is_configured"), lambda self: True):
+            result = await download_paper.ainvoke(
+                {"identifier": "10.48550/arXiv.1706.03762", "identifier_type": "doi"}
+            )
+
+        assert "Downloaded" in result
+        assert downloads == [winner]
+
+    @pytest.mark.asyncio
+    async def test_browser_fallback_gets_prefetched_doi_url(self, mock_tool_context):
+        tools = create_paper_tools(mock_tool_context)
+        download_paper = next(t for t in tools if t.name == "download_paper")
+
+        with patch(
+            "src.tools.research.papers._try_unpaywall_download",
+            new_callable=AsyncMock,
+            return_value=DownloadResult(success=False, error="No OA"),
+        ), patch(
+            "src.tools.research.papers._browser_available", return_value=True
+        ), patch(
+            "src.tools.research.papers._resolve_doi_url",
+            new_callable=AsyncMock,
+            return_value="https://publisher.example/paper",
+        ), patch(
+            "src.tools.research.papers._try_browser_download",
+            new_callable=AsyncMock,
+            return_value="Downloaded via browser: paper.pdf",
+        ) as mock_browser:
+            await download_paper.ainvoke({"identifier": "10.1038/test"})
+
+        assert mock_browser.call_args.kwargs["resolved_url"] == "https://publisher.example/paper"
+
+    @pytest.mark.asyncio
+    async def test_download_papers_batch(self, mock_tool_context, sample_paper, temp_docs_dir):
+        tools = create_paper_tools(mock_tool_context)
+        download_papers = next(t for t in tools if t.name == "download_papers")
+        downloaded = []
+
+        async def fake_arxiv(identifier, dest_dir, slot=None):
+            downloaded.append(identifier)
+            if identifier.startswith("9999"):
+                return DownloadResult(success=False, error="Not found")
+            return DownloadResult(
+                success=True, path=temp_docs_dir / f"{identifier}.pdf",
+                source=PaperSource.ARXIV, paper=sample_paper,
+            )
+
+        with patch("src.tools.research.papers._try_arxiv_download", fake_arxiv):
+            result = await download_papers.ainvoke(
+                {"identifiers": "1706.03762, 1706.03762v2\n9999.99999"}
+            )
+
+        assert sorted(downloaded) == ["1706.03762", "9999.99999"]
+        assert "1/2 papers downloaded" in result
+        assert "[OK] 1706.03762" in result
+        assert "[FAILED] 9999.99999" in result
+
+    @pytest.mark.asyncio
+    async def test_download_papers_rejects_empty(self, mock_tool_context):
+        tools = create_paper_tools(mock_tool_context)
+        download_papers = next(t for t in tools if t.name == "download_papers")
+        assert "No identifiers" in await download_papers.ainvoke({"identifiers": " , "})
+
+
+class TestSearchAll:
+    """Tests for search_papers(source="all")."""
+
+    @pytest.mark.asyncio
+    async def test_merges_sources_and_survives_failure(self, mock_tool_context, sample_paper, sample_paper_s2):
+        tools = create_paper_tools(mock_tool_context)
+        search_papers = next(t for t in tools if t.name == "search_papers")
+
+        duplicate = Paper(
+            title="Attention (S2)", authors=[], url="", source=PaperSource.SEMANTIC_SCHOLAR,
+            access_status=AccessStatus.OPEN_ACCESS, arxiv_id="1706.03762",
+        )
+        with patch(
+            "src.tools.research.utils.arxiv_client.ArxivClient.search",
+            new_callable=AsyncMock,
+            return_value=[sample_paper],
+        ), patch(
+            "src.tools.research.papers._search_semantic_scholar_papers",
+            new_callable=AsyncMock,
+            return_value=([duplicate, sample_paper_s2], 2),
+        ):
+            result = await search_papers.ainvoke({"query": "transformers", "source": "all"})
+
+        assert "Combined Search Results" in result
+        assert "duplicates merged: 1" in result
+        assert "Attention (S2)" in result and "Attention Is All You Need" not in result
+
+        with patch(
+            "src.tools.research.utils.arxiv_client.ArxivClient.search",
+            new_callable=AsyncMock,
+            return_value=[sample_paper],
+        ), patch(
+            "src.tools.research.papers._search_semantic_scholar_papers",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("offline"),
+        ):
+            result = await search_papers.ainvoke({"query": "transformers", "source": "all"})
+
+        assert "Attention Is All You Need" in result
+        assert "Semantic Scholar unavailable: offline" in result
@@ -1,6 +1,8 @@
 """Tests for web search tools (Tavily Search, Extract, Crawl, Map)."""
 
 import sys
+import threading
+import time
 from types import ModuleType
 from unittest.mock import MagicMock, patch
 
@@ -267,13 +269,17 @@ class TestWebSearch:
         mock_instance = MagicMock()
         mock_instance.invoke.return_value = self._make_search_response()
         mock_langchain_tavily.TavilySearch.return_value = mock_instance
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", None)
+        mock_tool_context.register_web_sources.return_value = {
+            "https://example0.com": ("src-1", None),
+        }
 
         tools = create_web_tools(mock_tool_context)
         ws = next(t for t in tools if t.name == "web_search")
         result = ws.invoke({"query": "test"})
 
-        assert mock_tool_context.get_or_register_web_source.called
+        mock_tool_context.register_web_sources.assert_called_once()
+        pages = mock_tool_context.register_web_sources.call_args[0][0]
+        assert [p["url"] for p in pages] == ["https://example0.com", "https://example1.com"]
         assert "archived" in result
 
     def test_inaccessible_sources_warning(self, mock_tool_context, mock_langchain_tavily, monkeypatch):
@@ -281,7 +287,9 @@ class TestWebSearch:
         mock_instance = MagicMock()
         mock_instance.invoke.return_value = self._make_search_response()
         mock_langchain_tavily.TavilySearch.return_value = mock_instance
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", "HTTP 403")
+        mock_tool_context.register_web_sources.return_value = {
+            "https://example0.com": ("src-1", "HTTP 403"),
+        }
 
         tools = create_web_tools(mock_tool_context)
         ws = next(t for t in tools if t.name == "web_search")
@@ -313,7 +321,7 @@ class TestExtractWebpage:
     def test_single_url(self, mock_tool_context, mock_langchain_tavily, monkeypatch):
         monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
         self._setup_extract(mock_langchain_tavily)
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", None)
+        mock_tool_context.register_web_sources.return_value = {}
 
         tools = create_web_tools(mock_tool_context)
         t = next(t for t in tools if t.name == "extract_webpage")
@@ -365,13 +373,18 @@ class TestExtractWebpage:
     def test_citation_registration(self, mock_tool_context, mock_langchain_tavily, monkeypatch):
         monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
         self._setup_extract(mock_langchain_tavily)
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", None)
+        mock_tool_context.register_web_sources.return_value = {
+            "https://example.com/page1": ("src-1", None),
+        }
 
         tools = create_web_tools(mock_tool_context)
         t = next(t for t in tools if t.name == "extract_webpage")
         result = t.invoke({"urls": "https://example.com/page1"})
 
-        mock_tool_context.get_or_register_web_source.assert_called()
+        # The extracted text is handed over so the page is not fetched again
+        pages = mock_tool_context.register_web_sources.call_args[0][0]
+        assert pages[0]["content"] == "Full page content here"
+        mock_tool_context.save_web_contents_to_disk.assert_called_once()
         assert "archived" in result
 
     def test_missing_api_key(self, mock_tool_context, monkeypatch):
@@ -447,7 +460,7 @@ class TestCrawlWebsite:
     def test_basic_crawl(self, mock_tool_context, mock_langchain_tavily, monkeypatch):
         monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
         self._setup_crawl(mock_langchain_tavily)
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", None)
+        mock_tool_context.register_web_sources.return_value = {}
 
         tools = create_web_tools(mock_tool_context)
         t = next(t for t in tools if t.name == "crawl_website")
@@ -509,13 +522,18 @@ class TestCrawlWebsite:
     def test_citation_registration(self, mock_tool_context, mock_langchain_tavily, monkeypatch):
         monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
         self._setup_crawl(mock_langchain_tavily)
-        mock_tool_context.get_or_register_web_source.return_value = ("src-1", None)
+        mock_tool_context.register_web_sources.return_value = {
+            "https://docs.example.com/": ("src-1", None),
+            "https://docs.example.com/page2": ("src-2", None),
+        }
 
         tools = create_web_tools(mock_tool_context)
         t = next(t for t in tools if t.name == "crawl_website")
         result = t.invoke({"url": "https://docs.example.com/"})
 
-        assert mock_tool_context.get_or_register_web_source.call_count == 2
+        # Both pages are registered in a single batch
+        mock_tool_context.register_web_sources.assert_called_once()
+        assert len(mock_tool_context.register_web_sources.call_args[0][0]) == 2
         assert "archived" in result
 
     def test_missing_api_key(self, mock_tool_context, monkeypatch):
@@ -616,7 +634,7 @@ class TestMapWebsite:
         t = next(t for t in tools if t.name == "map_website")
         t.invoke({"url": "https://example.com"})
 
-        mock_tool_context.get_or_register_web_source.assert_not_called()
+        mock_tool_context.register_web_sources.assert_not_called()
 
     def test_missing_api_key(self, mock_tool_context, monkeypatch):
         monkeypatch.delenv("TAVILY_API_KEY", raising=False)
@@ -673,3 +691,123 @@ class TestMapWebsite:
 
         call_kwargs = mock_instance.invoke.call_args[0][0]
         assert call_kwargs["max_depth"] == 5
+
+
+# ── ToolContext web source batching ────────────────────────────────
+
+
+class _Source:
+    def __init__(self, source_id, fetch_error=None):
+        self.id = source_id
+        self.metadata = {"fetch_error": fetch_error} if fetch_error else {}
+
+
+class _ContentEngine:
+    """CitationEngine stand-in whose add_web_source accepts prefetched content.
+
+    Like the real engine it holds one connection, so it fails if two threads
+    use it at once.
+    """
+
+    def __init__(self, calls=None):
+        self.calls = [] if calls is None else calls
+        self.busy = threading.Lock()
+        self.closed = False
+
+    def add_web_source(self, url, name=None, content=None):
+        assert self.busy.acquire(blocking=False), "engine used by two threads at once"
+        try:
+            time.sleep(0.01)
+            self.calls.append((url, content))
+            return _Source(len(self.calls), "HTTP 403" if "blocked" in url else None)
+        finally:
+            self.busy.release()
+
+    def close(self):
+        self.closed = True
+
+
+class _FetchingEngine:
+    """Older CitationEngine stand-in that always fetches the URL itself."""
+
+    def __init__(self):
+        self.calls = []
+
+    def add_web_source(self, url, name=None):
+        self.calls.append(url)
+        return _Source(len(self.calls))
+
+
+class TestToolContextWebSources:
+    """Tests for ToolContext.register_web_sources and batched disk saves."""
+
+    def test_registers_with_prefetched_content(self, monkeypatch):
+        from src.tools.context import ToolContext
+
+        engine = _ContentEngine()
+        ctx = ToolContext(citation_engine=engine)
+        monkeypatch.setattr(ctx, "_create_citation_engine", lambda: _ContentEngine(engine.calls))
+        result = ctx.register_web_sources([
+            {"url": "https://a.com", "content": "A text"},
+            {"url": "https://blocked.com", "content": None},
+            {"url": "https://a.com", "content": "duplicate"},
+        ])
+
+        assert sorted(engine.calls) == [("https://a.com", "A text"), ("https://blocked.com", None)]
+        assert result["https://blocked.com"][1] == "HTTP 403"
+        assert ctx._inaccessible_sources == {"https://blocked.com": "HTTP 403"}
+
+        # Already registered URLs are answered without calling the engine
+        again = ctx.register_web_sources([{"url": "https://a.com", "content": "A text"}])
+        assert again == {"https://a.com": result["https://a.com"]}
+        assert len(engine.calls) == 2
+
+    def test_parallel_workers_use_their_own_engines(self, monkeypatch):
+        from src.tools.context import ToolContext
+
+        shared = _ContentEngine()
+        created = []
+
+        def create():
+            created.append(_ContentEngine())
+            return created[-1]
+
+        ctx = ToolContext(citation_engine=shared, config={"web_source_workers": 4})
+        monkeypatch.setattr(ctx, "_create_citation_engine", create)
+        pages = [{"url": f"https://a.com/{i}", "content": "text"} for i in range(12)]
+        result = ctx.register_web_sources(pages)
+
+        assert set(result) == {page["url"] for page in pages}
+        assert shared.calls == []
+        assert 1 <= len(created) <= 4
+        assert sum(len(engine.calls) for engine in created) == 12
+        assert all(engine.closed for engine in created)
+
+    def test_falls_back_when_engine_has_no_content_param(self):
+        from src.tools.context import ToolContext
+
+        engine = _FetchingEngine()
+        ctx = ToolContext(citation_engine=engine, config={"web_source_workers": 1})
+        result = ctx.register_web_sources([{"url": "https://a.com", "content": "A text"}])
+
+        assert engine.calls == ["https://a.com"]
+        assert result == {"https://a.com": (1, None)}
+
+    def test_save_web_contents_batch(self, tmp_path):
+        from src.core.workspace import WorkspaceManager
+        from src.tools.context import ToolContext
+
+        ws = WorkspaceManager(job_id="web-job", base_path=tmp_path)
+        ws.initialize()
+        ctx = ToolContext(workspace_manager=ws)
+
+        saved = ctx.save_web_contents_to_disk([
+            {"url": "https://a.com/x", "content": "first", "title": "A"},
+            {"url": "https://b.com/y", "content": "second", "source_id": 7},
+        ])
+        assert set(saved) == {"https://a.com/x", "https://b.com/y"}
+        assert "source_id: 7" in ws.read_file(saved["https://b.com/y"])
+
+        # First save wins
+        ctx.save_web_contents_to_disk([{"url": "https://a.com/x", "content": "changed"}])
+        assert "first" in ws.read_file(saved["https://a.com/x"])